@@ -4,6 +4,7 @@
 # Opt-in env knobs (UMD inherits the parent env, so set these before running
 # the tt-metal program):
 #   TT_SIM_RECORD=<path>      record every wire message to this file
+#                             (binary if <path> ends in .ttrace)
 #   TT_SIM_LOG_PROTOCOL=1     print every wire message to stderr
 #   TT_SIM_CYCLES_PER_POLL=N  cycles to run after each message (default 100)
 #   TT_SIM_MOCK_TENSIX=1      skip building Wormhole; every core is NullCore
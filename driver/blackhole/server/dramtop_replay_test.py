@@ -29,7 +29,7 @@ from pathlib import Path
 from types import SimpleNamespace
 
 from tt_sim.bridge import DramCore, Fabric, TensixCore, Transport
-from tt_sim.bridge.trace import parse_trace_line
+from tt_sim.bridge.trace import read_trace
 
 from .bh_device import make_device
 from .coords import DRAM_COORD_MAP, TENSIX_COORD_MAP
@@ -66,20 +66,16 @@ def main():
     transport = Transport(addr=None)
 
     n_msgs = 0
-    with TRACE.open() as f:
-        for line in f:
-            parsed = parse_trace_line(line)
-            if parsed is None:
-                continue
-            req = SimpleNamespace(
-                cmd=parsed["cmd"],
-                core=parsed["core"],
-                address=parsed["address"],
-                size=parsed["size"],
-                data=parsed["data"],
-            )
-            transport._handle(fabric, req)
-            n_msgs += 1
+    for parsed in read_trace(TRACE):
+        req = SimpleNamespace(
+            cmd=parsed["cmd"],
+            core=parsed["core"],
+            address=parsed["address"],
+            size=parsed["size"],
+            data=parsed["data"],
+        )
+        transport._handle(fabric, req)
+        n_msgs += 1
     # No kernel runs, so there is no go-message to pump on: the buffer is
     # written and read by the host over the wire.
 
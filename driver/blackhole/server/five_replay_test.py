@@ -28,7 +28,7 @@ from types import SimpleNamespace
 
 from tt_sim.bridge import DramCore, Fabric, TensixCore, Transport
 from tt_sim.bridge import protocol as proto
-from tt_sim.bridge.trace import parse_trace_line
+from tt_sim.bridge.trace import read_trace
 
 from .bh_device import make_device
 from .coords import DRAM_COORD_MAP, TENSIX_COORD_MAP
@@ -74,33 +74,28 @@ def main():
     transport = Transport(addr=None)
 
     n_msgs = 0
-    with TRACE.open() as f:
-        for line in f:
-            parsed = parse_trace_line(line)
-            if parsed is None:
-                continue
-            req = SimpleNamespace(
-                cmd=parsed["cmd"],
-                core=parsed["core"],
-                address=parsed["address"],
-                size=parsed["size"],
-                data=parsed["data"],
-            )
-            transport._handle(fabric, req)
-            n_msgs += 1
-            if (
-                parsed["cmd"] == proto.CMD_READ
-                and parsed["core"] in TENSIX_POOL
-                and parsed["address"] == GO_MSG_ADDR
-                and _go_signal(device, parsed["core"]) == RUN_MSG_GO
+    for parsed in read_trace(TRACE):
+        req = SimpleNamespace(
+            cmd=parsed["cmd"],
+            core=parsed["core"],
+            address=parsed["address"],
+            size=parsed["size"],
+            data=parsed["data"],
+        )
+        transport._handle(fabric, req)
+        n_msgs += 1
+        if (
+            parsed["cmd"] == proto.CMD_READ
+            and parsed["core"] in TENSIX_POOL
+            and parsed["address"] == GO_MSG_ADDR
+            and _go_signal(device, parsed["core"]) == RUN_MSG_GO
+        ):
+            pumped = 0
+            while (
+                _go_signal(device, parsed["core"]) != RUN_MSG_DONE and pumped < PUMP_CAP
             ):
-                pumped = 0
-                while (
-                    _go_signal(device, parsed["core"]) != RUN_MSG_DONE
-                    and pumped < PUMP_CAP
-                ):
-                    device.tt_device.run(PUMP_CHUNK)
-                    pumped += PUMP_CHUNK
+                device.tt_device.run(PUMP_CHUNK)
+                pumped += PUMP_CHUNK
 
     result = device.read(DST_DRAM_COORD, DST_ADDR, DATA_SIZE * 4)
     values = [
@@ -21,7 +21,7 @@ from types import SimpleNamespace
 
 from tt_sim.bridge import DramCore, Fabric, TensixCore, Transport
 from tt_sim.bridge import protocol as proto
-from tt_sim.bridge.trace import parse_trace_line
+from tt_sim.bridge.trace import read_trace
 
 from .bh_device import make_device
 from .coords import DRAM_COORD_MAP, TENSIX_COORD_MAP
@@ -51,32 +51,28 @@ def main():
     transport = Transport(addr=None)  # never connects; only _handle is used
 
     n_msgs = n_reads = mismatches = 0
-    with TRACE.open() as f:
-        for lineno, line in enumerate(f, 1):
-            parsed = parse_trace_line(line)
-            if parsed is None:
-                continue
-            req = SimpleNamespace(
-                cmd=parsed["cmd"],
-                core=parsed["core"],
-                address=parsed["address"],
-                size=parsed["size"],
-                data=parsed["data"],
-            )
-            reply = transport._handle(fabric, req)
-            n_msgs += 1
-            if parsed["cmd"] != proto.CMD_READ or parsed["reply"] is None:
-                continue
-            n_reads += 1
-            if bytes(reply) != bytes(parsed["reply"]):
-                mismatches += 1
-                if mismatches <= 5:
-                    print(
-                        f"  line {lineno} READ {parsed['core']} "
-                        f"@0x{parsed['address']:x}: expected "
-                        f"{parsed['reply'].hex()} got {bytes(reply).hex()}",
-                        file=sys.stderr,
-                    )
+    for lineno, parsed in enumerate(read_trace(TRACE), 1):
+        req = SimpleNamespace(
+            cmd=parsed["cmd"],
+            core=parsed["core"],
+            address=parsed["address"],
+            size=parsed["size"],
+            data=parsed["data"],
+        )
+        reply = transport._handle(fabric, req)
+        n_msgs += 1
+        if parsed["cmd"] != proto.CMD_READ or parsed["reply"] is None:
+            continue
+        n_reads += 1
+        if bytes(reply) != bytes(parsed["reply"]):
+            mismatches += 1
+            if mismatches <= 5:
+                print(
+                    f"  message {lineno} READ {parsed['core']} "
+                    f"@0x{parsed['address']:x}: expected "
+                    f"{parsed['reply'].hex()} got {bytes(reply).hex()}",
+                    file=sys.stderr,
+                )
 
     device.tt_device.shutdown()
     if mismatches:
@@ -87,6 +87,13 @@ Running it
     python3 -m driver.tests.cost_model_gate --list     # the classification only
     python3 -m driver.tests.cost_model_gate --stage value six two
     python3 -m driver.tests.cost_model_gate --model-off # the same set, model off
+    python3 -m driver.tests.cost_model_gate --jobs 32 --json gate.json
+
+Stages 2 and 3 run each guard in a worker forked from the gate once it has
+loaded the YAML and cost tables (``driver/tests/sweep_runner.py``), ``--jobs``
+at a time — by default one per CPU, so on a many-core box the gate takes about
+as long as its slowest guard. ``--json`` writes every guard's verdict and
+wall-clock to a file as well.
 
 Exit status is 0 only if every stage passed. The guard *list* is discovered by
 glob, not hardcoded, so a guard added by anyone else is picked up automatically;
@@ -97,16 +104,18 @@ runs that check in milliseconds as part of the normal ``pytest driver``).
 """
 
 import argparse
+import importlib
 import os
 import re
 import subprocess
 import sys
 import time
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
+from driver.tests.sweep_runner import Job, run_jobs, warm, write_summary
+
 REPO = Path(__file__).resolve().parents[2]
 
 #: A guard that asserts recorded READ replies bit-for-bit. Correctness *and*
@@ -327,12 +336,11 @@ SPIN_POLL_READS = 8
 def _spin_polled(trace):
     """The ``(core, address)`` pairs the host spin-polls in ``trace``."""
     from tt_sim.bridge import protocol as proto
-    from tt_sim.bridge.trace import parse_trace_line
+    from tt_sim.bridge.trace import read_trace
 
     counts = Counter()
-    for line in trace.open():
-        p = parse_trace_line(line)
-        if p is not None and p["cmd"] == proto.CMD_READ:
+    for p in read_trace(trace):
+        if p["cmd"] == proto.CMD_READ:
             counts[(p["core"], p["address"])] += 1
     return {k for k, n in counts.items() if n >= SPIN_POLL_READS}
 
@@ -341,7 +349,7 @@ def _prove_trace(label, trace, build, tolerated):
     """Replay ``trace`` at each rung of the ladder until it is byte-identical."""
     from tt_sim.bridge import Transport
     from tt_sim.bridge import protocol as proto
-    from tt_sim.bridge.trace import parse_trace_line
+    from tt_sim.bridge.trace import read_trace
 
     polled = _spin_polled(trace)
     attempts = []
@@ -352,38 +360,34 @@ def _prove_trace(label, trace, build, tolerated):
             {k: 0 for k in ("reads", "verified", "tolerated", "poll", "bad")}
         )
         failures = []
-        with trace.open() as f:
-            for lineno, line in enumerate(f, 1):
-                p = parse_trace_line(line)
-                if p is None:
-                    continue
-                reply = transport._handle(
-                    fabric,
-                    SimpleNamespace(
-                        cmd=p["cmd"],
-                        core=p["core"],
-                        address=p["address"],
-                        size=p["size"],
-                        data=p["data"],
-                    ),
-                )
-                if p["cmd"] != proto.CMD_READ or p["reply"] is None:
-                    continue
-                stats["reads"] += 1
-                want = bytes(p["reply"])
-                if bytes(reply) == want:
-                    stats["verified"] += 1
-                elif (p["core"], p["address"]) in polled:
-                    stats["poll"] += 1
-                elif tolerated(p):
-                    stats["tolerated"] += 1
-                else:
-                    stats["bad"] += 1
-                    if len(failures) < 5:
-                        failures.append(
-                            f"line {lineno} READ {p['core']}@0x{p['address']:x}: "
-                            f"expected {want.hex()} got {bytes(reply).hex()}"
-                        )
+        for lineno, p in enumerate(read_trace(trace), 1):
+            reply = transport._handle(
+                fabric,
+                SimpleNamespace(
+                    cmd=p["cmd"],
+                    core=p["core"],
+                    address=p["address"],
+                    size=p["size"],
+                    data=p["data"],
+                ),
+            )
+            if p["cmd"] != proto.CMD_READ or p["reply"] is None:
+                continue
+            stats["reads"] += 1
+            want = bytes(p["reply"])
+            if bytes(reply) == want:
+                stats["verified"] += 1
+            elif (p["core"], p["address"]) in polled:
+                stats["poll"] += 1
+            elif tolerated(p):
+                stats["tolerated"] += 1
+            else:
+                stats["bad"] += 1
+                if len(failures) < 5:
+                    failures.append(
+                        f"message {lineno} READ {p['core']}@0x{p['address']:x}: "
+                        f"expected {want.hex()} got {bytes(reply).hex()}"
+                    )
         device.tt_device.shutdown()
         attempts.append(mult)
         if not stats["bad"]:
@@ -567,54 +571,76 @@ def stage_unit(model_on):
     return p.returncode == 0
 
 
-def stage_value(guards, model_on, jobs):
-    """Every budget-independent guard, run as its own process under the model."""
+#: Per-guard wall-clock limit in the forked stages; the slowest guard takes a
+#: few minutes, and the unit stage's subprocess already allowed this much.
+GUARD_TIMEOUT = 1800
+
+
+def _run_guard(module):
+    """A guard's ``main()``, as ``python -m <module>`` would have run it."""
+    os.chdir(REPO)
+    return importlib.import_module(module).main()
+
 
-    def one(g):
-        p, secs = _run([sys.executable, "-m", g.module], model_on)
-        return g, p, secs
+def _prove(key):
+    """The ``--prove`` worker, in-process: print the report, return the status."""
+    ok, lines = run_prover(key)
+    print("\n".join(lines))
+    return 0 if ok else 1
+
+
+def _forked(guards, fn, model_on, jobs, results):
+    """Run ``fn(guard)`` for each guard in a worker forked from this process.
+
+    The workers come from :mod:`driver.tests.sweep_runner`, forked after
+    ``main`` has warmed the YAML and cost tables, so none of them pays the
+    interpreter and table start-up a fresh ``python -m`` did. Yields each
+    :class:`~driver.tests.sweep_runner.JobResult` as it lands, and keeps it in
+    ``results`` for the ``--json`` summary.
+    """
+    env = {key: _env(model_on).get(key) for key in ("PYTHONPATH", "TT_SIM_COST_MODEL")}
+    landed = []
+    run_jobs(
+        [Job(g.key, fn, (arg,), timeout=GUARD_TIMEOUT, env=env) for g, arg in guards],
+        workers=jobs,
+        on_result=landed.append,
+    )
+    results.extend(landed)
+    return landed
 
+
+def stage_value(guards, model_on, jobs, results):
+    """Every budget-independent guard, each in its own forked worker."""
     ok = True
-    with ThreadPoolExecutor(max_workers=jobs) as pool:
-        for g, p, secs in pool.map(one, guards):
-            out = (p.stdout + p.stderr).strip().splitlines()
-            last = out[-1] if out else "(no output)"
-            if p.returncode:
-                ok = False
-                print(f"  FAIL {g.key:<24} [{secs:.0f}s]")
-                print("\n".join(f"       {ln}" for ln in out[-12:]))
-            else:
-                print(f"  ok   {g.key:<24} [{secs:.0f}s] {last[:90]}")
+    for r in _forked(
+        [(g, g.module) for g in guards], _run_guard, model_on, jobs, results
+    ):
+        out = r.output.strip().splitlines()
+        last = out[-1] if out else "(no output)"
+        if not r.ok:
+            ok = False
+            print(f"  {r.status:<4} {r.key:<24} [{r.seconds:.0f}s] {r.detail}")
+            print("\n".join(f"       {ln}" for ln in out[-12:]))
+        else:
+            print(f"  ok   {r.key:<24} [{r.seconds:.0f}s] {last[:90]}")
     return ok
 
 
-def stage_proof(guards, model_on, jobs):
+def stage_proof(guards, model_on, jobs, results):
     """Budget-dependent guards: re-run at a larger poll budget until clean."""
-
-    def one(g):
-        if g.key in UNPROVABLE:
-            return g, None, 0.0
-        p, secs = _run(
-            [sys.executable, "-m", "driver.tests.cost_model_gate", "--prove", g.key],
-            model_on,
-        )
-        return g, p, secs
-
     ok = True
-    with ThreadPoolExecutor(max_workers=jobs) as pool:
-        for g, p, secs in pool.map(one, guards):
-            if p is None:
-                print(f"  EXCL {g.key:<24} not provable in place:")
-                print(f"       {UNPROVABLE[g.key]}")
-                continue
-            if p.returncode:
-                ok = False
-                print(f"  FAIL {g.key:<24} [{secs:.0f}s]")
-            else:
-                print(f"  ok   {g.key:<24} [{secs:.0f}s]")
-            print(p.stdout.rstrip())
-            if p.returncode and p.stderr.strip():
-                print("\n".join(f"       {ln}" for ln in p.stderr.splitlines()[-15:]))
+    for g in guards:
+        if g.key in UNPROVABLE:
+            print(f"  EXCL {g.key:<24} not provable in place:")
+            print(f"       {UNPROVABLE[g.key]}")
+    provable = [(g, g.key) for g in guards if g.key not in UNPROVABLE]
+    for r in _forked(provable, _prove, model_on, jobs, results):
+        if not r.ok:
+            ok = False
+            print(f"  FAIL {r.key:<24} [{r.seconds:.0f}s] {r.detail}")
+        else:
+            print(f"  ok   {r.key:<24} [{r.seconds:.0f}s]")
+        print(r.output.rstrip())
     return ok
 
 
@@ -650,13 +676,20 @@ def main(argv=None):
         choices=("all", "unit", "value", "proof"),
         help="run only one stage",
     )
-    ap.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1))
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="guards run at once, each in a forked worker (default: CPU count)",
+    )
+    ap.add_argument("--json", help="also write a JSON summary of every guard here")
     ap.add_argument(
         "--model-off",
         action="store_true",
         help="run the same set with the model OFF (the A/B baseline)",
     )
-    ap.add_argument("--prove", help=argparse.SUPPRESS)  # internal worker
+    # Prove one guard in this process; the gate itself forks _prove instead.
+    ap.add_argument("--prove", help=argparse.SUPPRESS)
     args = ap.parse_args(argv)
     # A stage takes minutes; stream its progress even when redirected to a file.
     sys.stdout.reconfigure(line_buffering=True)
@@ -690,18 +723,34 @@ def main(argv=None):
     value = [g for g in guards if g.kind in BUDGET_INDEPENDENT]
     pinned = [g for g in guards if g.kind in POLL_BUDGET_DEPENDENT]
     ok = True
+    results = []
 
     if args.stage in ("all", "unit"):
         print("\n[1] simulator unit tests under the model")
         ok &= stage_unit(model_on)
 
+    if args.stage in ("all", "value", "proof"):
+        # Once, before the first fork: every guard worker inherits the parsed
+        # tables instead of loading its own.
+        warm()
+
     if args.stage in ("all", "value"):
         print(f"\n[2] budget-independent value guards — {len(value)}")
-        ok &= stage_value(value, model_on, args.jobs)
+        ok &= stage_value(value, model_on, args.jobs, results)
 
     if args.stage in ("all", "proof"):
         print(f"\n[3] budget-dependent guards — poll-budget proof — {len(pinned)}")
-        ok &= stage_proof(pinned, model_on, args.jobs)
+        ok &= stage_proof(pinned, model_on, args.jobs, results)
+
+    if args.json:
+        write_summary(
+            args.json,
+            results,
+            gate="cost_model_gate",
+            model_on=model_on,
+            stage=args.stage,
+            jobs=args.jobs,
+        )
 
     print(f"\nRESULT: {'PASS' if ok else 'FAIL'}")
     if model_on:
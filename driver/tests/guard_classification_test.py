@@ -74,16 +74,12 @@ def test_the_prover_never_pumps_after_the_replay(guards):
 def test_every_trace_really_does_end_in_reset_then_exit(guards):
     """The premise the poll-budget proof rests on, checked rather than assumed."""
     from tt_sim.bridge import protocol as proto
-    from tt_sim.bridge.trace import parse_trace_line
+    from tt_sim.bridge.trace import read_trace
 
     traces = sorted((gate.REPO / "driver/blackhole/server/traces").glob("*.trace"))
     assert traces, "no traces to check"
     for trace in traces[:4]:
-        cmds = [
-            p["cmd"]
-            for p in (parse_trace_line(ln) for ln in trace.open())
-            if p is not None
-        ]
+        cmds = [p["cmd"] for p in read_trace(trace)]
         assert cmds[-1] == proto.CMD_EXIT, f"{trace.name} does not end with EXIT"
         assert proto.CMD_RESET_ASSERT in cmds[-30:], (
             f"{trace.name} does not assert reset before exiting"
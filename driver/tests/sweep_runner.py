@@ -0,0 +1,410 @@
+"""Fan a sweep's workloads out across forked worker processes.
+
+Why this exists
+---------------
+
+The gates in this directory — ``upstream_sweep``, the replay guards
+``cost_model_gate`` drives — used to run their workloads one after another,
+and where they did fan out it was a thread per workload spawning a fresh
+``python -m`` interpreter. Each of those interpreters then paid the same
+start-up bill before simulating a single cycle: importing numpy and the
+simulator, parsing (or un-pickling) the Tensix instruction and config YAML,
+resolving the cost tables, and, on a matmul guard, importing numba and loading
+the fused MVMUL kernel. That is seconds per workload, times forty-odd guards.
+
+:func:`run_jobs` pays it once. :func:`warm` loads all of that in the parent,
+and every job then runs in a child **forked** from the warm parent, so the
+tables are shared copy-on-write and a child's first instruction is simulated
+as soon as it starts. With ``workers`` set to the core count, a gate finishes
+in roughly its longest single workload rather than the sum of them.
+
+What a job gets
+---------------
+
+* **A process of its own.** A job that crashes, deadlocks or leaks global state
+  (the config-register layout is process-wide, for one) takes nothing else
+  with it. It is also the process-group leader, so a timeout kills whatever
+  servers or binaries it spawned along with it.
+* **Its own output file.** The child's stdout and stderr — at the file
+  descriptor level, so a subprocess it spawns is captured too — go to a
+  temporary file the parent reads back into :attr:`JobResult.output`. Nothing
+  interleaves on the terminal, and a job that prints megabytes cannot block
+  on a pipe nobody is draining.
+* **A timeout.** Past ``Job.timeout`` seconds the job's process group is sent
+  ``SIGTERM``, then ``SIGKILL`` a second later, and the result is ``TIMEOUT``.
+* **Environment overrides.** ``Job.env`` is applied in the child after the
+  fork. Only knobs read when a device is *built* (``TT_SIM_COST_MODEL``, the
+  ``TT_SIM_NUMBA*`` pair, ``TT_SIM_RV_BLOCKS``…) can be set this way; one that
+  a module snapshots at import time was already read by the parent.
+
+A job's verdict comes from what its callable does, in the convention the gates
+and guards here already use for ``main()``: returning a non-zero exit status or
+``False``, raising a non-zero ``SystemExit`` or an ``AssertionError`` is
+``FAIL``; any other exception is ``ERROR``; anything else is ``PASS``. Whatever
+the callable returns is kept on the result when it pickles, so a gate that
+scores its workloads itself (``upstream_sweep`` compares each verdict with a
+recorded one) can hand back a report and read it from :attr:`JobResult.value`.
+
+Needs ``fork``, so POSIX only — which is already true of everything that
+drives the simulator server.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from multiprocessing.connection import wait
+
+PASS = "PASS"
+FAIL = "FAIL"
+TIMEOUT = "TIMEOUT"
+ERROR = "ERROR"
+
+#: Grace between SIGTERM and SIGKILL for a job past its timeout.
+KILL_GRACE = 1.0
+
+
+class Job:
+    """One workload: ``fn(*args)`` in a forked child.
+
+    ``key`` names it in the results and must be unique within a sweep.
+    ``timeout`` is in seconds, ``None`` for none; ``env`` maps variable names
+    to values (``None`` unsets one) and is applied in the child only.
+    """
+
+    def __init__(self, key, fn, args=(), *, timeout=None, env=None):
+        self.key = key
+        self.fn = fn
+        self.args = tuple(args)
+        self.timeout = timeout
+        self.env = dict(env or {})
+
+    def __repr__(self):
+        return f"<Job {self.key}>"
+
+
+class JobResult:
+    """What one :class:`Job` came to. ``value`` is the callable's return value,
+    or ``None`` when it raised, timed out, or returned something unpicklable."""
+
+    def __init__(self, key, status, seconds, *, value=None, detail="", output=""):
+        self.key = key
+        self.status = status
+        self.seconds = seconds
+        self.value = value
+        self.detail = detail
+        self.output = output
+
+    @property
+    def ok(self):
+        return self.status == PASS
+
+    def to_json(self):
+        return {
+            "key": self.key,
+            "status": self.status,
+            "seconds": round(self.seconds, 3),
+            "detail": self.detail,
+            "value": self.value if _jsonable(self.value) else repr(self.value),
+        }
+
+    def __repr__(self):
+        return f"<JobResult {self.key} {self.status} {self.seconds:.1f}s>"
+
+
+def warm(arches=("wormhole", "blackhole")):
+    """Load everything a simulated device needs that is the same in every job.
+
+    Building one device per architecture is the simplest complete answer: it
+    imports the simulator, parses the instruction and config YAML and selects
+    the decoder tables, so nothing a job does first is left to do. They are
+    built with ``TT_SIM_COST_MODEL`` on, so the cost models (cached per arch,
+    read-only) are resolved too, for the jobs that turn the model on through
+    ``Job.env``; the parent's own environment is left as it was. numba, when
+    installed and not disabled, is imported and its kernel's compiled form
+    loaded here too — that is ~800 ms per process
+    (``tt_sim/pe/tensix/backends/fpu_jit.py``), the largest single item on the
+    bill.
+    """
+    classes = []
+    if "wormhole" in arches:
+        from tt_sim.device.wormhole import Wormhole
+
+        classes.append(Wormhole)
+    if "blackhole" in arches:
+        from tt_sim.device.blackhole import Blackhole
+
+        classes.append(Blackhole)
+    saved = os.environ.get("TT_SIM_COST_MODEL")
+    os.environ["TT_SIM_COST_MODEL"] = "1"
+    try:
+        for cls in classes:
+            cls()
+    finally:
+        if saved is None:
+            del os.environ["TT_SIM_COST_MODEL"]
+        else:
+            os.environ["TT_SIM_COST_MODEL"] = saved
+    if os.environ.get("TT_SIM_NUMBA", "").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    ):
+        try:
+            from tt_sim.pe.tensix.backends import fpu_jit_kernel
+        except Exception:
+            # Optional, exactly as in fpu_jit: no numba is not an error.
+            return
+        _warm_numba_kernel(fpu_jit_kernel)
+
+
+def _warm_numba_kernel(module):
+    """Load the kernel's cached object code with one throwaway call.
+
+    numba defers both its target-context initialisation and the ``.nbc`` load
+    to the first call, so an import alone leaves most of the cost to every
+    child. The arguments have the types ``MatrixUnit.perform_mvmul_exact``
+    passes. Any failure leaves the children to resolve the kernel themselves.
+    """
+    import numpy as np
+
+    try:
+        module.mvmul_fused(
+            np.zeros((16, 16), dtype=np.int64),
+            np.zeros((16, 1), dtype=np.int64),
+            np.zeros((1, 16), dtype=np.int64),
+            0,
+            0,
+            False,
+            False,
+        )
+    except Exception:
+        pass
+
+
+def run_jobs(jobs, *, workers=None, on_result=None):
+    """Run ``jobs`` in forked children, at most ``workers`` at a time.
+
+    ``workers`` defaults to the CPU count. ``on_result`` is called with each
+    :class:`JobResult` in completion order, as it lands, so a gate can stream
+    progress; the return value is the results in *job* order.
+    """
+    jobs = list(jobs)
+    keys = [job.key for job in jobs]
+    if len(set(keys)) != len(keys):
+        raise ValueError("job keys must be unique")
+    workers = max(1, workers or os.cpu_count() or 1)
+    context = multiprocessing.get_context("fork")
+    pending = list(reversed(jobs))
+    running = {}  # sentinel -> [job, process, connection, output file, start, sent]
+    results = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            job = pending.pop()
+            reader, writer = context.Pipe(duplex=False)
+            output = tempfile.TemporaryFile()
+            process = context.Process(
+                target=_child, args=(job, writer, output.fileno()), daemon=False
+            )
+            process.start()
+            writer.close()
+            running[process.sentinel] = [
+                job,
+                process,
+                reader,
+                output,
+                time.monotonic(),
+                None,
+            ]
+        now = time.monotonic()
+        deadlines = [
+            start + job.timeout
+            for job, _, _, _, start, _ in running.values()
+            if job.timeout is not None
+        ]
+        timeout = max(0.0, min(deadlines) - now) if deadlines else None
+        # Wait on the pipes too: a child cannot exit until what it sends has
+        # been read, and a result bigger than the pipe buffer is only read
+        # once the parent asks for it.
+        readers = {entry[2]: entry for entry in running.values() if entry[5] is None}
+        ready = wait(list(running) + list(readers), timeout=timeout)
+        for connection in ready:
+            if connection in readers:
+                readers[connection][5] = _receive(connection)
+        now = time.monotonic()
+        for sentinel in list(running):
+            job, process, reader, output, start, sent = running[sentinel]
+            if sentinel in ready:
+                if sent is None:
+                    sent = _receive(reader)
+                result = _collect(job, process, sent, output, now - start)
+            elif job.timeout is not None and now - start >= job.timeout:
+                _kill_group(process)
+                result = JobResult(
+                    job.key,
+                    TIMEOUT,
+                    now - start,
+                    detail=f"no result within {job.timeout}s",
+                    output=_read_output(output),
+                )
+            else:
+                continue
+            reader.close()
+            output.close()
+            del running[sentinel]
+            results[job.key] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[key] for key in keys]
+
+
+def summary(results, ok=None, **extra):
+    """The JSON-ready summary of a sweep: counts, wall-clock, and every result.
+
+    ``ok`` defaults to "every job passed"; a gate that scores the jobs itself
+    passes its own verdict. ``extra`` keys (the gate's name, its arguments…)
+    are copied in verbatim.
+    """
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    return {
+        **extra,
+        "ok": all(result.ok for result in results) if ok is None else ok,
+        "counts": counts,
+        "job_seconds": round(sum(result.seconds for result in results), 3),
+        "longest": max(results, key=lambda r: r.seconds).key if results else None,
+        "results": [result.to_json() for result in results],
+    }
+
+
+def write_summary(path, results, ok=None, **extra):
+    """Write :func:`summary` to ``path`` as indented JSON; returns the dict."""
+    data = summary(results, ok, **extra)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    return data
+
+
+# --- the child ----------------------------------------------------------------
+
+
+def _child(job, writer, output_fd):
+    # Lead a process group of our own, so a timeout can take down whatever the
+    # job spawned (a simulator server, a tt-metal binary) along with it.
+    os.setpgid(0, 0)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(output_fd, 1)
+    os.dup2(output_fd, 2)
+    # The parent's sys.stdout may not be fd 1 at all (pytest's capture, a
+    # redirect_stdout); the job's prints go to the file regardless.
+    sys.stdout = open(1, "w", buffering=1, errors="replace", closefd=False)
+    sys.stderr = open(2, "w", buffering=1, errors="replace", closefd=False)
+    for name, value in job.env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = str(value)
+    value = None
+    try:
+        value = job.fn(*job.args)
+        status, detail = _verdict(value)
+    except SystemExit as exc:
+        status, detail = _verdict(exc.code if exc.code is not None else 0)
+    except AssertionError as exc:
+        status, detail = FAIL, f"AssertionError: {exc}".strip()
+    except BaseException as exc:
+        traceback.print_exc()
+        status, detail = ERROR, f"{type(exc).__name__}: {exc}"
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        writer.send((status, detail, value))
+    except Exception:
+        writer.send((status, detail, None))
+    writer.close()
+
+
+def _verdict(value):
+    if value is False:
+        return FAIL, "returned False"
+    if isinstance(value, int) and not isinstance(value, bool) and value != 0:
+        return FAIL, f"exit {value}"
+    if isinstance(value, str) and not isinstance(value, bool):
+        # ``SystemExit("message")`` — sys.exit's way of failing with a reason.
+        return FAIL, value
+    return PASS, ""
+
+
+# --- the parent ---------------------------------------------------------------
+
+
+#: What :func:`_receive` returns for a pipe that closed without a result.
+_NOTHING = ()
+
+
+def _receive(reader):
+    """The child's ``(status, detail, value)``, or :data:`_NOTHING` if it
+    closed the pipe without sending one (it died)."""
+    if not reader.poll():
+        return _NOTHING
+    try:
+        return reader.recv()
+    except EOFError:
+        return _NOTHING
+
+
+def _collect(job, process, sent, output, seconds):
+    process.join()
+    text = _read_output(output)
+    if sent is not _NOTHING:
+        status, detail, value = sent
+        return JobResult(
+            job.key, status, seconds, value=value, detail=detail, output=text
+        )
+    return JobResult(
+        job.key,
+        ERROR,
+        seconds,
+        detail=f"worker died with exit code {process.exitcode}",
+        output=text,
+    )
+
+
+def _kill_group(process):
+    for sig, grace in ((signal.SIGTERM, KILL_GRACE), (signal.SIGKILL, None)):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            break
+        process.join(grace)
+        if grace is not None and process.exitcode is not None:
+            # The leader is gone; anything it spawned still gets the SIGKILL.
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            break
+    process.join()
+
+
+def _read_output(output):
+    output.seek(0)
+    return output.read().decode("utf-8", errors="replace")
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
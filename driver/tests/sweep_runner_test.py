@@ -0,0 +1,184 @@
+"""Unit tests for the forked sweep runner (``driver/tests/sweep_runner.py``).
+
+Everything here runs trivial callables, so it checks the runner's own
+contract in well under the gates' time: verdicts from return values and
+exceptions, per-job output capture down to a spawned subprocess, environment
+overrides that stay in the child, timeouts that take the job's whole process
+group with them, results bigger than a pipe's buffer, results in job order,
+and the JSON summary.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from driver.tests import sweep_runner as runner
+
+#: Set in the parent before the fork; a child must see it without re-importing.
+_WARMED = {}
+
+
+def _returns(value):
+    return value
+
+
+def _raises(exc):
+    raise exc
+
+
+def _prints_everywhere():
+    print("from python")
+    sys.stdout.flush()
+    subprocess.run(["sh", "-c", "echo from a subprocess >&2"], check=True)
+
+
+def _reads(name):
+    return [os.environ.get(name), _WARMED.get("tables")]
+
+
+def _spawns_and_hangs(pidfile):
+    child = subprocess.Popen(["sleep", "60"])
+    with open(pidfile, "w") as f:
+        f.write(str(child.pid))
+    time.sleep(60)
+
+
+def _one(job, **kwargs):
+    (result,) = runner.run_jobs([job], **kwargs)
+    return result
+
+
+@pytest.mark.parametrize(
+    ("value", "status"),
+    [
+        (None, runner.PASS),
+        (0, runner.PASS),
+        (True, runner.PASS),
+        (["PASS", 1.0, ""], runner.PASS),
+        (3, runner.FAIL),
+        (False, runner.FAIL),
+    ],
+)
+def test_return_value_verdicts(value, status):
+    result = _one(runner.Job("j", _returns, (value,)))
+    assert result.status == status
+    assert result.value == value
+
+
+@pytest.mark.parametrize(
+    ("exc", "status", "detail"),
+    [
+        (SystemExit(0), runner.PASS, ""),
+        (SystemExit(2), runner.FAIL, "exit 2"),
+        (SystemExit("went wrong"), runner.FAIL, "went wrong"),
+        (AssertionError("mismatch"), runner.FAIL, "AssertionError: mismatch"),
+        (KeyError("x"), runner.ERROR, "KeyError: 'x'"),
+    ],
+)
+def test_exception_verdicts(exc, status, detail):
+    result = _one(runner.Job("j", _raises, (exc,)))
+    assert result.status == status
+    assert result.detail == detail
+    if status == runner.ERROR:
+        assert "Traceback" in result.output
+
+
+def test_output_is_captured_per_job_including_subprocesses():
+    result = _one(runner.Job("j", _prints_everywhere))
+    assert result.ok
+    assert "from python" in result.output
+    assert "from a subprocess" in result.output
+
+
+def test_env_applies_in_the_child_and_parent_state_is_inherited(monkeypatch):
+    monkeypatch.setenv("TT_SIM_SWEEP_RUNNER_TEST", "parent")
+    monkeypatch.setitem(_WARMED, "tables", "loaded before the fork")
+    set_, unset = runner.run_jobs(
+        [
+            runner.Job(
+                "set",
+                _reads,
+                ("TT_SIM_SWEEP_RUNNER_TEST",),
+                env={"TT_SIM_SWEEP_RUNNER_TEST": "child"},
+            ),
+            runner.Job(
+                "unset",
+                _reads,
+                ("TT_SIM_SWEEP_RUNNER_TEST",),
+                env={"TT_SIM_SWEEP_RUNNER_TEST": None},
+            ),
+        ]
+    )
+    assert set_.value == ["child", "loaded before the fork"]
+    assert unset.value == [None, "loaded before the fork"]
+    assert os.environ["TT_SIM_SWEEP_RUNNER_TEST"] == "parent"
+
+
+def test_timeout_kills_the_process_group(tmp_path):
+    pidfile = tmp_path / "grandchild.pid"
+    result = _one(runner.Job("slow", _spawns_and_hangs, (str(pidfile),), timeout=0.5))
+    assert result.status == runner.TIMEOUT
+    assert result.seconds < 10
+    grandchild = int(pidfile.read_text())
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(grandchild, 0)
+        except ProcessLookupError:
+            break
+        # A killed child of our own would linger as a zombie; it is not ours.
+        time.sleep(0.05)
+    else:
+        pytest.fail("the job's subprocess outlived its timeout")
+
+
+def test_jobs_run_concurrently_and_results_come_back_in_job_order():
+    landed = []
+    jobs = [runner.Job(f"sleep{n}", time.sleep, (0.6 - 0.1 * n,)) for n in range(4)]
+    started = time.monotonic()
+    results = runner.run_jobs(jobs, workers=4, on_result=landed.append)
+    assert time.monotonic() - started < 1.8  # serially: 1.8 s of sleeping
+    assert [r.key for r in results] == [job.key for job in jobs]
+    assert [r.key for r in landed] != [job.key for job in jobs]
+    assert all(r.ok for r in results)
+
+
+def test_a_result_bigger_than_the_pipe_buffer_comes_back():
+    # Pickled, well past a 64 KiB pipe: the child blocks in ``send`` until the
+    # parent reads, so a parent that waited for it to exit first never would.
+    value = list(range(200_000))
+    result = _one(runner.Job("big", _returns, (value,), timeout=10))
+    assert result.status == runner.PASS
+    assert result.value == value
+    assert result.seconds < 10
+
+
+def test_duplicate_keys_are_refused():
+    with pytest.raises(ValueError, match="unique"):
+        runner.run_jobs([runner.Job("a", _returns), runner.Job("a", _returns)])
+
+
+def test_json_summary(tmp_path):
+    results = runner.run_jobs(
+        [
+            runner.Job("good", _returns, (None,)),
+            runner.Job("bad", _returns, (1,)),
+            runner.Job("object", _returns, (object(),)),
+        ]
+    )
+    path = tmp_path / "summary.json"
+    runner.write_summary(path, results, gate="test")
+    data = json.loads(path.read_text())
+    assert data["gate"] == "test"
+    assert data["ok"] is False
+    assert data["counts"] == {"PASS": 2, "FAIL": 1}
+    assert [r["key"] for r in data["results"]] == ["good", "bad", "object"]
+    assert data["results"][1]["detail"] == "exit 1"
+    assert data["results"][2]["value"].startswith("<object object")
+    assert runner.summary(results, ok=True)["ok"] is True
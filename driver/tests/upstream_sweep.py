@@ -40,6 +40,13 @@ Running it
     python3 -m driver.tests.upstream_sweep --tier full   # + the heavy matmuls
     python3 -m driver.tests.upstream_sweep --list        # the table, run nothing
     python3 -m driver.tests.upstream_sweep --arch wormhole eltwise sfpu
+    python3 -m driver.tests.upstream_sweep --jobs 16 --json sweep.json
+
+Every run is a worker forked from the gate (``driver/tests/sweep_runner.py``),
+``--jobs`` of them at a time — one per CPU by default. The server cleanup needs
+no extra care for it: a run's tag carries the pid of the process that started
+it, and that is now the worker, so each worker reaps exactly its own servers.
+``--json`` writes every run's verdict, expectation and wall-clock to a file.
 
 Two tiers, because a gate that takes an hour is not a gate:
 
@@ -86,6 +93,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 # blanket pkill corrupts a concurrent run) is written out once, in
 # examples/examples_test.py and driver/sim_procs.sh. ``_run_tag`` and
 # ``_kill_own_servers`` take a runner label so this gate reaps only its own.
+from driver.tests.sweep_runner import Job, run_jobs, write_summary  # noqa: E402
 from examples.examples_test import (  # noqa: E402
     _build_dir,
     _kill_own_servers,
@@ -437,6 +445,18 @@ def run_one(arch, prog, home, translated=False):
     return "PASS", secs, noted.group(0) if noted else ""
 
 
+#: Slack on top of a program's own timeout before its worker is killed:
+#: ``run_one`` enforces ``Program.timeout`` itself and this only catches a
+#: worker wedged in the server cleanup around it.
+WORKER_SLACK = 120
+
+
+def _run_job(arch, name, home, translated):
+    """One forked ``(arch, program)`` run: ``run_one``'s answer, as a list."""
+    prog = next(p for p in PROGRAMS if p.name == name)
+    return list(run_one(arch, prog, home, translated))
+
+
 def select(tier, filters):
     progs = [p for p in PROGRAMS if tier == "full" or p.tier == "fast"]
     if filters:
@@ -488,6 +508,13 @@ def main(argv=None):
         action="store_true",
         help="print the EXPECTED table the run would need, instead of a verdict",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="programs run at once, each in a forked worker (default: CPU count)",
+    )
+    ap.add_argument("--json", help="also write a JSON summary of every run here")
     ap.add_argument(
         "--translated",
         action="store_true",
@@ -521,19 +548,52 @@ def main(argv=None):
     )
     _reap_orphans()
 
+    runs = {f"{arch}/{prog.name}": (arch, prog) for arch in arches for prog in progs}
+    jobs = [
+        Job(
+            key,
+            _run_job,
+            (arch, prog.name, home, args.translated),
+            timeout=prog.timeout + WORKER_SLACK,
+        )
+        for key, (arch, prog) in runs.items()
+    ]
     results, ok = {}, True
-    for arch in arches:
-        print(f"\n[{arch}]")
-        for prog in progs:
-            verdict, secs, detail = run_one(arch, prog, home, args.translated)
-            results[(arch, prog.name)] = verdict
-            want = expected(arch, prog)
-            mark = "ok  " if verdict == want else "BAD "
-            if verdict != want:
-                ok = False
-            print(f"  {mark} {verdict:<8} {prog.name:<34} [{secs:5.0f}s] {detail}")
-            if verdict != want:
-                print(f"       ^ expected {want} at {BASELINE_TREE}")
+
+    def report(r):
+        # Called as each run lands, so with --jobs above 1 the rows are in
+        # completion order; the arch column says which device each was.
+        nonlocal ok
+        arch, prog = runs[r.key]
+        if r.ok:
+            verdict, secs, detail = r.value
+        else:
+            verdict, secs, detail = r.status, r.seconds, r.detail
+        results[(arch, prog.name)] = verdict
+        want = expected(arch, prog)
+        mark = "ok  " if verdict == want else "BAD "
+        if verdict != want:
+            ok = False
+        print(
+            f"  {mark} {verdict:<8} {arch:<9} {prog.name:<34} [{secs:5.0f}s] {detail}"
+        )
+        if verdict != want:
+            print(f"       ^ expected {want} at {BASELINE_TREE}")
+
+    print()
+    landed = run_jobs(jobs, workers=args.jobs, on_result=report)
+
+    if args.json:
+        write_summary(
+            args.json,
+            landed,
+            ok,
+            gate="upstream_sweep",
+            tier=args.tier,
+            translated=args.translated,
+            jobs=args.jobs,
+            verdicts={f"{a}/{n}": v for (a, n), v in sorted(results.items())},
+        )
 
     if args.record:
         print("\nEXPECTED = {")
@@ -41,7 +41,7 @@ if _REPO not in sys.path:
     sys.path.insert(0, _REPO)
 
 from tt_sim.bridge import protocol as proto  # noqa: E402
-from tt_sim.bridge.trace import parse_trace_line  # noqa: E402
+from tt_sim.bridge.trace import read_trace  # noqa: E402
 
 #: READs from the same core at the same address, this many times or more, are a
 #: spin-poll (matching driver/tests/cost_model_gate.py: in the captured traces
@@ -64,16 +64,14 @@ def _spin_poll_finals(trace_path):
     """
     finals = {}
     counts = {}
-    with open(trace_path) as f:
-        for raw in f:
-            entry = parse_trace_line(raw)
-            if entry is None or entry["cmd"] != proto.CMD_READ:
-                continue
-            if entry["reply"] is None:
-                continue
-            key = (entry["core"], entry["address"])
-            counts[key] = counts.get(key, 0) + 1
-            finals[key] = entry["reply"]
+    for entry in read_trace(trace_path):
+        if entry["cmd"] != proto.CMD_READ:
+            continue
+        if entry["reply"] is None:
+            continue
+        key = (entry["core"], entry["address"])
+        counts[key] = counts.get(key, 0) + 1
+        finals[key] = entry["reply"]
     return {k: v for k, v in finals.items() if counts[k] >= SPIN_POLL_READS}
 
 
@@ -144,75 +142,69 @@ def main(argv=None):
         finals = _spin_poll_finals(args.trace)
         sent = 0
         mismatches = 0
-        with open(args.trace) as f:
-            for lineno, raw in enumerate(f, start=1):
-                if args.limit is not None and sent >= args.limit:
-                    break
-                entry = parse_trace_line(raw)
-                if entry is None:
+        for lineno, entry in enumerate(read_trace(args.trace), start=1):
+            if args.limit is not None and sent >= args.limit:
+                break
+
+            msg = proto.build_msg(
+                entry["cmd"],
+                data=entry["data"] or None,
+                core=entry["core"],
+                address=entry["address"],
+                size=entry["size"],
+            )
+            sock.send(msg)
+            sent += 1
+
+            if entry["cmd"] == proto.CMD_READ:
+                reply = proto.parse(sock.recv())
+                key = (entry["core"], entry["address"])
+                final = finals.get(key)
+                if final is not None:
+                    # A spin-polled location: poll like a live host would,
+                    # until the reply reaches the recording's final value
+                    # (bounded). Intermediate values are timing, not data.
+                    polls = 0
+                    while reply.data[: len(final)] != final and polls < POLL_RETRY_CAP:
+                        sock.send(msg)
+                        reply = proto.parse(sock.recv())
+                        polls += 1
+                    if reply.data[: len(final)] != final:
+                        mismatches += 1
+                        if not args.quiet:
+                            print(
+                                f"[replay] message {lineno}: spin-polled READ "
+                                f"core={entry['core']} "
+                                f"addr=0x{entry['address']:x} never reached "
+                                f"its final recorded value {final.hex()} "
+                                f"after {polls} extra polls "
+                                f"(last {reply.data[: len(final)].hex()})",
+                                file=sys.stderr,
+                            )
                     continue
-
-                msg = proto.build_msg(
-                    entry["cmd"],
-                    data=entry["data"] or None,
-                    core=entry["core"],
-                    address=entry["address"],
-                    size=entry["size"],
-                )
-                sock.send(msg)
-                sent += 1
-
-                if entry["cmd"] == proto.CMD_READ:
-                    reply = proto.parse(sock.recv())
-                    key = (entry["core"], entry["address"])
-                    final = finals.get(key)
-                    if final is not None:
-                        # A spin-polled location: poll like a live host would,
-                        # until the reply reaches the recording's final value
-                        # (bounded). Intermediate values are timing, not data.
-                        polls = 0
-                        while (
-                            reply.data[: len(final)] != final and polls < POLL_RETRY_CAP
-                        ):
-                            sock.send(msg)
-                            reply = proto.parse(sock.recv())
-                            polls += 1
-                        if reply.data[: len(final)] != final:
-                            mismatches += 1
-                            if not args.quiet:
-                                print(
-                                    f"[replay] line {lineno}: spin-polled READ "
-                                    f"core={entry['core']} "
-                                    f"addr=0x{entry['address']:x} never reached "
-                                    f"its final recorded value {final.hex()} "
-                                    f"after {polls} extra polls "
-                                    f"(last {reply.data[: len(final)].hex()})",
-                                    file=sys.stderr,
-                                )
-                        continue
-                    expected = entry["reply"]
-                    if expected is not None and not args.no_verify:
-                        actual = reply.data[: len(expected)]
-                        if actual != expected:
-                            mismatches += 1
-                            if not args.quiet:
-                                print(
-                                    f"[replay] line {lineno}: READ "
-                                    f"core={entry['core']} addr=0x{entry['address']:x} "
-                                    f"size={entry['size']}: reply mismatch",
-                                    file=sys.stderr,
-                                )
-                                print(
-                                    f"           expected {expected.hex()}",
-                                    file=sys.stderr,
-                                )
-                                print(
-                                    f"           got      {actual.hex()}",
-                                    file=sys.stderr,
-                                )
-
-                if entry["cmd"] == proto.CMD_EXIT:
-                    break
+                expected = entry["reply"]
+                if expected is not None and not args.no_verify:
+                    actual = reply.data[: len(expected)]
+                    if actual != expected:
+                        mismatches += 1
+                        if not args.quiet:
+                            print(
+                                f"[replay] message {lineno}: READ "
+                                f"core={entry['core']} addr=0x{entry['address']:x} "
+                                f"size={entry['size']}: reply mismatch",
+                                file=sys.stderr,
+                            )
+                            print(
+                                f"           expected {expected.hex()}",
+                                file=sys.stderr,
+                            )
+                            print(
+                                f"           got      {actual.hex()}",
+                                file=sys.stderr,
+                            )
+
+            if entry["cmd"] == proto.CMD_EXIT:
+                break
 
         if not args.quiet:
             print(f"[replay] sent {sent} messages, {mismatches} READ mismatches")
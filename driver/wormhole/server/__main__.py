@@ -16,6 +16,7 @@ from tt_sim.bridge import (
     host_not_stranded,
     link_contention_summary,
     profiler_flush_summary,
+    upload_summary,
 )
 
 
@@ -284,6 +285,11 @@ def main(argv=None):
     flush = profiler_flush_summary(device)
     if flush:
         extra += f", {flush}"
+    uploads = upload_summary(device)
+    if uploads:
+        extra += f", {uploads}"
+    if transport.batches:
+        extra += f", {transport.batched_writes} writes in {transport.batches} batches"
     print(
         f"[server] shutdown after {transport.msg_count} messages{extra}",
         file=sys.stderr,
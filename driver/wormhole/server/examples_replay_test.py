@@ -34,7 +34,7 @@ from types import SimpleNamespace
 
 from tt_sim.bridge import DramCore, EthCore, Fabric, TensixCore, Transport
 from tt_sim.bridge import protocol as proto
-from tt_sim.bridge.trace import parse_trace_line
+from tt_sim.bridge.trace import read_trace
 
 from .coords import DRAM_COORD_MAP, ETH_COORD_MAP, TENSIX_COORD_MAP
 from .wh_device import make_device
@@ -78,9 +78,8 @@ def _discover_pool(trace):
     (one tile for single-core examples, two for ``nine``).
     """
     counts = Counter()
-    for line in trace.open():
-        p = parse_trace_line(line)
-        if p and p["cmd"] == proto.CMD_READ and p["address"] == GO_MSG_ADDR:
+    for p in read_trace(trace):
+        if p["cmd"] == proto.CMD_READ and p["address"] == GO_MSG_ADDR:
             counts[p["core"]] += 1
     return sorted(core for core, n in counts.items() if n > 1)
 
@@ -124,46 +123,42 @@ def replay(name):
     eth = set(ETH_COORD_MAP)
     reads = verified = tolerated = mismatches = 0
     first = []
-    with trace.open() as f:
-        for lineno, line in enumerate(f, 1):
-            p = parse_trace_line(line)
-            if p is None:
-                continue
-            reply = transport._handle(
-                fabric,
-                SimpleNamespace(
-                    cmd=p["cmd"],
-                    core=p["core"],
-                    address=p["address"],
-                    size=p["size"],
-                    data=p["data"],
-                ),
-            )
-            if p["cmd"] != proto.CMD_READ or p["reply"] is None:
-                continue
-            # Pump the worker until its go-message reports DONE (bounded):
-            # this is where the recorded poll budget stops mattering.
-            if (
-                p["address"] == GO_MSG_ADDR
-                and p["core"] in pool
-                and _go_signal(device, p["core"]) == RUN_MSG_GO
-            ):
-                _pump_until_done(device, p["core"], name)
-            reads += 1
-            # Compare first: an exempt read that happens to match still counts
-            # as verified (model off, everything reproduces). The exemption
-            # only decides what a mismatch means.
-            if bytes(reply) == bytes(p["reply"]):
-                verified += 1
-            elif p["core"] in eth or p["address"] in _TRANSIENT_ADDRS:
-                tolerated += 1
-            else:
-                mismatches += 1
-                if len(first) < 5:
-                    first.append(
-                        f"line {lineno} READ {p['core']}@0x{p['address']:x}: "
-                        f"expected {p['reply'].hex()} got {bytes(reply).hex()}"
-                    )
+    for lineno, p in enumerate(read_trace(trace), 1):
+        reply = transport._handle(
+            fabric,
+            SimpleNamespace(
+                cmd=p["cmd"],
+                core=p["core"],
+                address=p["address"],
+                size=p["size"],
+                data=p["data"],
+            ),
+        )
+        if p["cmd"] != proto.CMD_READ or p["reply"] is None:
+            continue
+        # Pump the worker until its go-message reports DONE (bounded):
+        # this is where the recorded poll budget stops mattering.
+        if (
+            p["address"] == GO_MSG_ADDR
+            and p["core"] in pool
+            and _go_signal(device, p["core"]) == RUN_MSG_GO
+        ):
+            _pump_until_done(device, p["core"], name)
+        reads += 1
+        # Compare first: an exempt read that happens to match still counts
+        # as verified (model off, everything reproduces). The exemption
+        # only decides what a mismatch means.
+        if bytes(reply) == bytes(p["reply"]):
+            verified += 1
+        elif p["core"] in eth or p["address"] in _TRANSIENT_ADDRS:
+            tolerated += 1
+        else:
+            mismatches += 1
+            if len(first) < 5:
+                first.append(
+                    f"message {lineno} READ {p['core']}@0x{p['address']:x}: "
+                    f"expected {p['reply'].hex()} got {bytes(reply).hex()}"
+                )
     device.tt_device.shutdown()
     return {
         "reads": reads,
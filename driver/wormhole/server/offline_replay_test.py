@@ -31,7 +31,7 @@ from tt_sim.bridge import (
     Fabric,
     TensixCore,
     Transport,
-    parse_trace_line,
+    read_trace,
 )
 from tt_sim.bridge import protocol as proto
 
@@ -78,64 +78,59 @@ def main():
     eth_coords = set(ETH_COORD_MAP)
 
     n_msgs = n_reads = verified = tolerated = mismatches = 0
-    with TRACE.open() as f:
-        for lineno, line in enumerate(f, 1):
-            parsed = parse_trace_line(line)
-            if parsed is None:
-                continue
-            req = SimpleNamespace(
-                cmd=parsed["cmd"],
-                core=parsed["core"],
-                address=parsed["address"],
-                size=parsed["size"],
-                data=parsed["data"],
-            )
-            reply = transport._handle(fabric, req)
-            n_msgs += 1
-            if parsed["cmd"] != proto.CMD_READ or parsed["reply"] is None:
-                continue
-            # Pump the worker until its go-message reports DONE (bounded):
-            # this is where the recorded poll budget stops mattering.
-            if (
-                parsed["address"] == GO_MSG_ADDR
-                and parsed["core"] in TENSIX_POOL
-                and _go_signal(device, parsed["core"]) == RUN_MSG_GO
-            ):
-                pumped = 0
-                while (
-                    _go_signal(device, parsed["core"]) != RUN_MSG_DONE
-                    and pumped < PUMP_CAP
-                ):
-                    device.tt_device.run(PUMP_CHUNK)
-                    pumped += PUMP_CHUNK
-                if _go_signal(device, parsed["core"]) != RUN_MSG_DONE:
-                    raise AssertionError(
-                        f"worker {parsed['core']} go-message never reached "
-                        f"RUN_MSG_DONE within {PUMP_CAP} pumped cycles replaying "
-                        f"{TRACE.name}"
-                    )
-            n_reads += 1
-            # Compare first: an exempt read that happens to match still counts
-            # as verified (model off, everything reproduces). A mismatch is
-            # tolerated only for the worker's go-message polls (timing, not
-            # data) and eth reads (the trace predates EthTile); everything
-            # else must reproduce bit-for-bit.
-            if bytes(reply) == bytes(parsed["reply"]):
-                verified += 1
-                continue
-            if parsed["core"] in eth_coords or (
-                parsed["address"] == GO_MSG_ADDR and parsed["core"] in TENSIX_POOL
+    for lineno, parsed in enumerate(read_trace(TRACE), 1):
+        req = SimpleNamespace(
+            cmd=parsed["cmd"],
+            core=parsed["core"],
+            address=parsed["address"],
+            size=parsed["size"],
+            data=parsed["data"],
+        )
+        reply = transport._handle(fabric, req)
+        n_msgs += 1
+        if parsed["cmd"] != proto.CMD_READ or parsed["reply"] is None:
+            continue
+        # Pump the worker until its go-message reports DONE (bounded):
+        # this is where the recorded poll budget stops mattering.
+        if (
+            parsed["address"] == GO_MSG_ADDR
+            and parsed["core"] in TENSIX_POOL
+            and _go_signal(device, parsed["core"]) == RUN_MSG_GO
+        ):
+            pumped = 0
+            while (
+                _go_signal(device, parsed["core"]) != RUN_MSG_DONE and pumped < PUMP_CAP
             ):
-                tolerated += 1
-                continue
-            mismatches += 1
-            if mismatches <= 5:
-                print(
-                    f"  line {lineno} READ {parsed['core']} "
-                    f"@0x{parsed['address']:x}: expected "
-                    f"{parsed['reply'].hex()} got {bytes(reply).hex()}",
-                    file=sys.stderr,
+                device.tt_device.run(PUMP_CHUNK)
+                pumped += PUMP_CHUNK
+            if _go_signal(device, parsed["core"]) != RUN_MSG_DONE:
+                raise AssertionError(
+                    f"worker {parsed['core']} go-message never reached "
+                    f"RUN_MSG_DONE within {PUMP_CAP} pumped cycles replaying "
+                    f"{TRACE.name}"
                 )
+        n_reads += 1
+        # Compare first: an exempt read that happens to match still counts
+        # as verified (model off, everything reproduces). A mismatch is
+        # tolerated only for the worker's go-message polls (timing, not
+        # data) and eth reads (the trace predates EthTile); everything
+        # else must reproduce bit-for-bit.
+        if bytes(reply) == bytes(parsed["reply"]):
+            verified += 1
+            continue
+        if parsed["core"] in eth_coords or (
+            parsed["address"] == GO_MSG_ADDR and parsed["core"] in TENSIX_POOL
+        ):
+            tolerated += 1
+            continue
+        mismatches += 1
+        if mismatches <= 5:
+            print(
+                f"  message {lineno} READ {parsed['core']} "
+                f"@0x{parsed['address']:x}: expected "
+                f"{parsed['reply'].hex()} got {bytes(reply).hex()}",
+                file=sys.stderr,
+            )
 
     device.tt_device.shutdown()
     if mismatches:
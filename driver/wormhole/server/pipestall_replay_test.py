@@ -49,7 +49,7 @@ from types import SimpleNamespace
 
 from tt_sim.bridge import DramCore, EthCore, Fabric, TensixCore, Transport
 from tt_sim.bridge import protocol as proto
-from tt_sim.bridge.trace import parse_trace_line
+from tt_sim.bridge.trace import read_trace
 from tt_sim.device.deadlock import DEFAULT_UNIT_STALL_THRESHOLD
 
 from .coords import DRAM_COORD_MAP, ETH_COORD_MAP
@@ -163,37 +163,33 @@ def main():
     transport = Transport(addr=None)
 
     n_msgs = 0
-    with TRACE.open() as f:
-        for line in f:
-            parsed = parse_trace_line(line)
-            if parsed is None:
-                continue
-            req = SimpleNamespace(
-                cmd=parsed["cmd"],
-                core=parsed["core"],
-                address=parsed["address"],
-                size=parsed["size"],
-                data=parsed["data"],
-            )
-            transport._handle(fabric, req)
-            n_msgs += 1
-            # Each launched tile flips its own go-message; pump the one being
-            # polled until it reports DONE (bounded).
-            if (
-                parsed["cmd"] == proto.CMD_READ
-                and parsed["core"] in unified_of
-                and parsed["address"] == GO_MSG_ADDR
-            ):
-                core = unified_of[parsed["core"]]
-
-                def go(core=core):
-                    return device.tt_device.read(core, GO_MSG_ADDR, 4)[3]
-
-                if go() == RUN_MSG_GO:
-                    pumped = 0
-                    while go() != RUN_MSG_DONE and pumped < PUMP_CAP:
-                        device.tt_device.run(PUMP_CHUNK)
-                        pumped += PUMP_CHUNK
+    for parsed in read_trace(TRACE):
+        req = SimpleNamespace(
+            cmd=parsed["cmd"],
+            core=parsed["core"],
+            address=parsed["address"],
+            size=parsed["size"],
+            data=parsed["data"],
+        )
+        transport._handle(fabric, req)
+        n_msgs += 1
+        # Each launched tile flips its own go-message; pump the one being
+        # polled until it reports DONE (bounded).
+        if (
+            parsed["cmd"] == proto.CMD_READ
+            and parsed["core"] in unified_of
+            and parsed["address"] == GO_MSG_ADDR
+        ):
+            core = unified_of[parsed["core"]]
+
+            def go(core=core):
+                return device.tt_device.read(core, GO_MSG_ADDR, 4)[3]
+
+            if go() == RUN_MSG_GO:
+                pumped = 0
+                while go() != RUN_MSG_DONE and pumped < PUMP_CAP:
+                    device.tt_device.run(PUMP_CHUNK)
+                    pumped += PUMP_CHUNK
 
     tracker.finish(device.tt_device.clocks[0].clock_tick_num)
     result = device.read(DRAM_COORD_MAP[DST_DRAM_COORD], DST_ADDR, DATA_SIZE * 4)
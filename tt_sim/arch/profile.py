@@ -118,7 +118,7 @@ class ArchProfile:
     #: Whether the Tensix coprocessor uses Blackhole semantics: the backend
     #: config-register layout (``tensix_backend_cfg_blackhole.yaml``) and the
     #: STALLWAIT/SEMWAIT condition-mask bit assignments, both of which differ
-    #: from Wormhole's. See ``TensixConfigurationConstants`` and ``WaitGate``.
+    #: from Wormhole's. See :attr:`tensix_config` and ``WaitGate``.
     tensix_blackhole: bool = False
 
     #: Congruence modulus a NoC **read whose source is DRAM** must satisfy:
@@ -294,3 +294,15 @@ class ArchProfile:
             "noc_id_logical_cfg_index": self.noc_id_logical_cfg_index,
             "noc_id_logical_mirrored_on_noc1": self.noc_id_logical_mirrored_on_noc1,
         }
+
+    @property
+    def tensix_config(self):
+        """This architecture's Tensix config-register layout, the
+        :class:`~tt_sim.pe.tensix.util.TensixConfigLayout` a tile hands its
+        coprocessor. Shared between every device of the architecture, and
+        owned per device rather than switched process-wide, so devices of
+        different architectures can share one interpreter. Imported here, not
+        at the top, to keep this module free of ``pe`` imports."""
+        from tt_sim.pe.tensix.util import TensixConfigLayout
+
+        return TensixConfigLayout.for_arch(self.tensix_blackhole)
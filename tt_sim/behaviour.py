@@ -310,6 +310,10 @@ _NOT_A_GUARANTEE = MappingProxyType(
             "a real CSR tt-sim does not implement. Same objection as "
             "UnmodelledTileRegisterError: the covered set is not stable"
         ),
+        "_BlockExit": (
+            "control flow inside the RV basic-block runner; caught before it "
+            "leaves tt_sim/pe/rv/blocks.py"
+        ),
         "PlanError": (
             "a malformed congestion-sweep plan; an offline analysis tool's "
             "input validation, nowhere near the simulated device"
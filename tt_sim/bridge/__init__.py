@@ -13,8 +13,9 @@ Modules:
 - ``grid`` — tt-metal's compute grid and the order it fills workers in.
 - ``cores`` — DRAM / eth / Tensix / deferred / null endpoints over the device.
 - ``materialise`` — building exactly the workers a program launches on.
-- ``trace`` — record/replay of wire conversations.
-- ``device`` — the cycle-pumping ``Device`` wrapper + diagnostics-from-env.
+- ``trace`` — record/replay of wire conversations, text or binary.
+- ``device`` — the cycle-pumping ``Device`` wrapper, its upload cache, and
+  diagnostics-from-env.
 - ``hostlink`` — ending a host the simulator can no longer answer.
 """
 
@@ -31,6 +32,7 @@ from tt_sim.bridge.device import (
     enabled_diagnostic_names,
     link_contention_summary,
     profiler_flush_summary,
+    upload_summary,
 )
 from tt_sim.bridge.fabric import (
     Fabric,
@@ -40,10 +42,17 @@ from tt_sim.bridge.fabric import (
 from tt_sim.bridge.grid import compute_grid, fill_order
 from tt_sim.bridge.hostlink import find_wire_peer, host_not_stranded, stop_host
 from tt_sim.bridge.materialise import LazyTensixPool
-from tt_sim.bridge.trace import TraceWriter, parse_trace_line
+from tt_sim.bridge.trace import (
+    BinaryTraceReader,
+    TraceWriter,
+    convert_trace,
+    parse_trace_line,
+    read_trace,
+)
 from tt_sim.bridge.transport import Transport
 
 __all__ = [
+    "BinaryTraceReader",
     "DeferredTensixCore",
     "Device",
     "DramCore",
@@ -55,6 +64,7 @@ __all__ = [
     "TraceWriter",
     "Transport",
     "compute_grid",
+    "convert_trace",
     "diagnostics_from_env",
     "enabled_diagnostic_names",
     "fill_order",
@@ -65,5 +75,7 @@ __all__ = [
     "link_contention_summary",
     "parse_trace_line",
     "profiler_flush_summary",
+    "read_trace",
     "stop_host",
+    "upload_summary",
 ]
@@ -0,0 +1,197 @@
+"""Bulk host transfers (``Device.write_many`` / ``read_many`` and the
+transport's WRITE batches).
+
+Runs standalone (``python3 -m tt_sim.bridge.bulk_transfer_test``) or under
+pytest.
+
+1. ``TT_Device.write_many`` / ``read_many`` are ``write`` / ``read`` by another
+   road: same bytes in L1 and DRAM, and the ordinary path — trace events included — while the bus is on.
+2. The bridge's ``write_many`` pumps once, for as many cycles as its writes
+   would have pumped one by one; ``read_many`` reads, then does the same.
+3. ``Fabric.write_many`` keeps the host's order across cores that cannot be
+   batched, and a core's own rewrite of what it is sent (the eth go message).
+4. The transport takes only the WRITEs already queued, and ends a batch at a
+   go message and at anything that is not a WRITE.
+"""
+
+import pynng
+import pytest
+
+from tt_sim.bridge import protocol as proto
+from tt_sim.bridge.cores import EthCore, NullCore, TensixCore
+from tt_sim.bridge.fabric import Fabric
+from tt_sim.bridge.transport import Transport, batch_writes_from_env
+from tt_sim.bridge.upload_cache_test import (
+    CYCLES_PER_POLL,
+    KERNEL,
+    KERNEL_ADDR,
+    _running,
+)
+from tt_sim.device.wormhole import Wormhole
+from tt_sim.trace.bus import get_bus
+from tt_sim.trace.events import EventCategory
+
+#: A go message: ``RUN_MSG_GO`` in the signal byte.
+GO = b"\x00\x00\x00\x80"
+
+
+def _chunks(payload, n):
+    step = len(payload) // n
+    return [payload[i : i + step] for i in range(0, len(payload), step)]
+
+
+def test_write_many_and_read_many_are_write_and_read():
+    device = Wormhole()
+    worker = next(c for c, tile in device.tile_directory.items() if tile.is_tensix)
+    dram = device.dram_tiles[0].get_coord_pair()
+    writes = [
+        (coord, KERNEL_ADDR + i * 512, chunk)
+        for coord in (worker, dram)
+        for i, chunk in enumerate(_chunks(KERNEL, 4))
+    ]
+    device.write_many(writes)
+    for coord in (worker, dram):
+        assert device.read(coord, KERNEL_ADDR, len(KERNEL)) == KERNEL
+    reads = [(coord, addr, len(data)) for coord, addr, data in writes]
+    assert device.read_many(reads) == [data for _, _, data in writes]
+
+    bus = get_bus()
+    events = []
+    bus.subscribe(EventCategory.MEM, events.append)
+    bus.enabled = True
+    try:
+        device.write_many([(worker, KERNEL_ADDR + 0x1000, KERNEL[:64])])
+        assert device.read_many([(worker, KERNEL_ADDR + 0x1000, 64)]) == [KERNEL[:64]]
+    finally:
+        bus.reset()
+    assert [(e.op, e.address, e.size) for e in events] == [
+        ("write", KERNEL_ADDR + 0x1000, 64),
+        ("read", KERNEL_ADDR + 0x1000, 64),
+    ]
+    device.shutdown()
+
+
+def test_the_bridge_pumps_once_for_the_batch():
+    device, unified, runs = _running(upload_cache=False)
+    start = device.tt_device.clocks[0].clock_tick_num
+    writes = [
+        (coord, KERNEL_ADDR + i * 512, chunk)
+        for coord in unified
+        for i, chunk in enumerate(_chunks(KERNEL, 4))
+    ]
+    device.write_many(writes)
+    assert runs == [len(writes) * CYCLES_PER_POLL]
+
+    reads = [(coord, KERNEL_ADDR, len(KERNEL)) for coord in unified]
+    assert device.read_many(reads) == [KERNEL] * len(unified)
+    assert runs == [len(writes) * CYCLES_PER_POLL, len(reads) * CYCLES_PER_POLL]
+    elapsed = device.tt_device.clocks[0].clock_tick_num - start
+    assert elapsed == (len(writes) + len(reads)) * CYCLES_PER_POLL
+    assert device.write_many([]) is None
+    assert device.read_many([]) == []
+    assert len(runs) == 2
+    device.tt_device.shutdown()
+
+
+class _Recorder:
+    """Stands in for the bridge ``Device``: records what it is handed."""
+
+    def __init__(self, log):
+        self.log = log
+
+    def register_tensix(self, unified):
+        pass
+
+    def write_many(self, writes):
+        self.log.append(("batch", list(writes)))
+
+
+def test_fabric_batches_in_host_order():
+    log = []
+    device = _Recorder(log)
+    fabric = Fabric()
+    fabric.register((1, 1), TensixCore(device, (18, 18)))
+    fabric.register((0, 0), EthCore(device, (25, 16)))
+    null = NullCore((9, 9))
+    null.write = lambda addr, data: log.append(("null", addr, data))
+    fabric.register((9, 9), null)
+
+    fabric.write_many(
+        [
+            ((1, 1), 0x100, b"a"),
+            ((0, 0), 0x200, GO),
+            ((9, 9), 0x300, b"n"),
+            ((1, 1), 0x400, b"b"),
+        ]
+    )
+    assert log == [
+        ("batch", [((18, 18), 0x100, b"a"), ((25, 16), 0x200, b"\x00\x00\x00\x00")]),
+        ("null", 0x300, b"n"),
+        ("batch", [((18, 18), 0x400, b"b")]),
+    ]
+
+
+class _Socket:
+    """The socket after the first ``recv``: what is queued, then nothing."""
+
+    def __init__(self, requests):
+        self._queued = [
+            proto.build_msg(cmd, data=data, core=(1, 1), address=addr, size=size)
+            for cmd, addr, data, size in requests
+        ]
+
+    def recv(self, block=True):
+        assert not block
+        if not self._queued:
+            raise pynng.exceptions.TryAgain(-1, "queue empty")
+        return self._queued.pop(0)
+
+
+def _write(addr, data=b"\x01\x02\x03\x04\x05"):
+    return proto.CMD_WRITE, addr, data, 0
+
+
+def _first(addr, data=b"\x01\x02\x03\x04\x05"):
+    return proto.Request(proto.CMD_WRITE, (1, 1), addr, 0, data)
+
+
+@pytest.mark.parametrize(
+    ("first", "queued", "taken", "pending"),
+    [
+        # Everything queued, and no more.
+        (_first(0x0), [_write(0x10), _write(0x20)], 3, None),
+        # Up to the first message that is not a WRITE, which is handed back.
+        (_first(0x0), [_write(0x10), (proto.CMD_READ, 0x30, None, 4)], 2, "READ"),
+        # Up to and including a go message.
+        (_first(0x0), [_write(0x10, GO), _write(0x20)], 2, None),
+        # A go message on its own is a batch of one.
+        (_first(0x0, GO), [_write(0x10)], 1, None),
+    ],
+)
+def test_the_transport_takes_what_is_queued(first, queued, taken, pending):
+    transport = Transport(addr=None, batch_writes=True)
+    batch, held = transport._next_batch(_Socket(queued), first)
+    assert len(batch) == taken
+    assert [req.cmd for req in batch] == [proto.CMD_WRITE] * taken
+    assert (held and proto.CMD_NAMES[held.cmd]) == pending
+
+
+def test_the_batch_size_is_bounded(monkeypatch):
+    monkeypatch.setattr(Transport, "MAX_BATCH", 4)
+    transport = Transport(addr=None, batch_writes=True)
+    sock = _Socket([_write(0x10 * i) for i in range(1, 10)])
+    batch, held = transport._next_batch(sock, _first(0x0))
+    assert len(batch) == 4
+    assert held is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "on"), [(None, True), ("1", True), ("0", False), ("off", False)]
+)
+def test_the_batch_knob(raw, on):
+    env = {} if raw is None else {"TT_SIM_BATCH_WRITES": raw}
+    assert batch_writes_from_env(env) is on
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
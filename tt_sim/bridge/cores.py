@@ -290,6 +290,10 @@ class TensixCore:
     def write(self, addr, data):
         self.device.write(self.unified, addr, data)
 
+    def staged_write(self, addr, data):
+        """``(device, write)`` for ``Fabric.write_many`` to batch."""
+        return self.device, (self.unified, addr, data)
+
     def read(self, addr, size):
         return self.device.read(self.unified, addr, size)
 
@@ -342,12 +346,19 @@ class EthCore:
         self.unified = unified_coord
 
     def write(self, addr, data):
+        self.device.write(self.unified, addr, self._completed(data))
+
+    def staged_write(self, addr, data):
+        """``(device, write)`` for ``Fabric.write_many`` to batch."""
+        return self.device, (self.unified, addr, self._completed(data))
+
+    def _completed(self, data):
         if (
             len(data) == self._GO_MSG_SIZE
             and data[self._GO_MSG_SIZE - 1] in self._LAUNCH_SIGNALS
         ):
             data = data[: self._GO_MSG_SIZE - 1] + bytes([self._RUN_MSG_DONE])
-        self.device.write(self.unified, addr, data)
+        return data
 
     def read(self, addr, size):
         return self.device.read(self.unified, addr, size)
@@ -377,6 +388,10 @@ class DramCore:
     def write(self, addr, data):
         self.device.write(self.unified, addr, data)
 
+    def staged_write(self, addr, data):
+        """``(device, write)`` for ``Fabric.write_many`` to batch."""
+        return self.device, (self.unified, addr, data)
+
     def read(self, addr, size):
         return self.device.read(self.unified, addr, size)
 
@@ -11,12 +11,19 @@ closes it — see its docstring: the device profiler's readback is the one host
 transaction whose answer is still being *written* at the moment the host asks
 for it.
 
+The rule is relaxed in one place, :class:`UploadCache`: a large payload the
+host has already sent once — the firmware and kernel binaries it writes to
+every worker — is copied straight into the tile's RAM and its pump is owed
+rather than run, the debt being paid in one ``run`` before the next message
+that is anything else. Every host read still sees every cycle it would have.
+
 The underlying tt-sim device (Wormhole / Blackhole) and its coord map are
 injected by the driver, so nothing here is architecture-specific.
 """
 
 import os
 import sys
+from collections import OrderedDict
 
 from tt_sim.device.tt_device import DeviceTileDiagnostics
 from tt_sim.pe.rv.babyriscv import BabyRISCVCoreType
@@ -47,6 +54,14 @@ def _truthy(val):
     return val is not None and val.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def upload_cache_enabled_from_env(env=None):
+    """``TT_SIM_UPLOAD_CACHE`` (default on; ``0`` pumps after every upload)."""
+    if env is None:
+        env = os.environ
+    val = env.get("TT_SIM_UPLOAD_CACHE")
+    return val is None or _truthy(val)
+
+
 def diagnostics_from_env(env=None):
     """Build a DeviceTileDiagnostics from TT_SIM_DIAG_* env vars.
 
@@ -151,6 +166,23 @@ def link_contention_summary(device):
     )
 
 
+def upload_summary(device):
+    """One line about the upload cache, or ``""`` when it never hit.
+
+    Says how many host writes repeated a payload already seen, how many bytes
+    that was, and how many per-message pumps were folded into a later one.
+    """
+    if not isinstance(device, Device) or device.upload_cache is None:
+        return ""
+    cache = device.upload_cache
+    if not cache.hits:
+        return ""
+    return (
+        f"upload cache: {cache.hits} repeated uploads "
+        f"({cache.hit_bytes} bytes), {device.pumps_coalesced} pumps coalesced"
+    )
+
+
 def profiler_flush_summary(device):
     """One line about the device-profiler readback, or ``""`` when it never ran.
 
@@ -172,6 +204,58 @@ def profiler_flush_summary(device):
     return line
 
 
+class UploadCache:
+    """The large payloads the host has written, keyed by their content.
+
+    tt-metal writes the same firmware and kernel binaries into every worker it
+    uses — on a replay-guard trace, 956 of the ~970 writes of 256 bytes or more
+    repeat one already sent, a megabyte in all — and each of those writes used
+    to pay a full ``cycles_per_poll`` pump of the whole grid on its own. A
+    repeat is recognised here by a dict lookup on the ``bytes`` itself (hashed,
+    then compared, so two payloads that merely collide are never confused),
+    and :meth:`Device.write` then applies it as one copy into the tile's RAM
+    (``TT_Device.write_bulk``) and defers its pump; see :meth:`Device.write`.
+
+    Only payloads of at least :attr:`MIN_BYTES` are considered: the go message,
+    the launch message and the profiler's control vector are all far smaller,
+    and are exactly the writes whose timing the host is waiting on. The store
+    is bounded at :attr:`MAX_BYTES`, least recently repeated evicted first; a
+    payload is held once however many workers it was sent to.
+    """
+
+    MIN_BYTES = 256
+    MAX_BYTES = 64 << 20
+
+    def __init__(self):
+        #: ``payload -> payload``: the key *is* the value, kept so a repeat
+        #: resolves to the one copy already held.
+        self._payloads: OrderedDict[bytes, bytes] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.hit_bytes = 0
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def intern(self, data):
+        """``(payload, repeated)``: the held copy of ``data``, and whether it
+        had been seen before. A first sighting is remembered and answered
+        ``False``."""
+        held = self._payloads.get(data)
+        if held is not None:
+            self._payloads.move_to_end(held)
+            self.hits += 1
+            self.hit_bytes += len(held)
+            return held, True
+        held = bytes(data)
+        self._payloads[held] = held
+        self._bytes += len(held)
+        while self._bytes > UploadCache.MAX_BYTES and len(self._payloads) > 1:
+            _, evicted = self._payloads.popitem(last=False)
+            self._bytes -= len(evicted)
+        return held, False
+
+
 class Device:
     """Wire-bridge wrapper around a tt-sim device (cycle pump + reset tracking).
 
@@ -210,6 +294,7 @@ class Device:
         cycles_per_poll: int = 100,
         diagnostics=None,
         launch_enables_offset=None,
+        upload_cache=None,
     ):
         self.tt_device = device_factory(diagnostics or DeviceTileDiagnostics())
         self.tensix_coord_map = tensix_coord_map
@@ -230,6 +315,15 @@ class Device:
         self.profiler_flush_settles = 0
         self.profiler_flush_cycles = 0
         self.profiler_flush_timeouts = 0
+        # Repeated large uploads (see UploadCache); None when turned off, which
+        # is the per-message pump exactly as before. ``_pump_owed`` is the
+        # cycles those writes deferred, paid by _settle_pump.
+        if upload_cache is None:
+            upload_cache = upload_cache_enabled_from_env()
+        self.upload_cache = UploadCache() if upload_cache else None
+        self._pump_owed = 0
+        #: Diagnostics for ``upload_summary``.
+        self.pumps_coalesced = 0
 
     def ensure_tensix_tile(self, translated):
         """Lazily materialise the TensixTile addressed by a translated coord.
@@ -251,11 +345,34 @@ class Device:
         self._brisc_running.setdefault(unified, False)
 
     def write(self, unified, addr, data):
+        """A host write, then the pump.
+
+        A repeated upload (:class:`UploadCache`) is the exception: it is copied
+        in with ``write_bulk`` and its pump is *owed*, not run. Consecutive
+        uploads — a binary going out to each of a program's workers — therefore
+        cost one ``run`` between them instead of one each, and the debt is
+        paid at the start of the next message of any other kind, before it
+        touches the device. The cycles run are the same in number; what moves
+        is that an upload lands up to a few polls earlier than it would have,
+        into L1 no running firmware reads until the launch message that the
+        host, by construction, sends after it.
+        """
+        cache = self.upload_cache
+        if cache is not None and len(data) >= UploadCache.MIN_BYTES:
+            data, repeated = cache.intern(data)
+            if repeated:
+                self.tt_device.write_bulk(unified, addr, data)
+                if any(self._brisc_running.values()):
+                    self._pump_owed += self.cycles_per_poll
+                    self.pumps_coalesced += 1
+                return
+        self._settle_pump()
         self._note_profiler_write(unified, addr, data)
         self.tt_device.write(unified, addr, data)
         self._maybe_pump()
 
     def read(self, unified, addr, size):
+        self._settle_pump()
         if (
             size == Device._PROFILER_CTRL_BYTES
             and unified in self._profiler_flush_pending
@@ -266,11 +383,70 @@ class Device:
         self._maybe_pump()
         return result
 
+    def write_many(self, writes):
+        """Host writes — ``(unified, addr, data)``, in order — then one pump.
+
+        The bulk form of :meth:`write`, for a host pushing a tensor or a set of
+        binaries out as many writes with nothing to read in between: each
+        destination is resolved once (``TT_Device.write_many``) and copied into
+        directly, and the ``cycles_per_poll`` each write would have pumped is
+        run as one ``run`` at the end, so the device sees the same number of
+        cycles as it would have message by message. What moves is that every
+        write of the batch lands before any of those cycles run — the same
+        latitude :class:`UploadCache` takes for repeats, and the caller's to
+        bound: the wire transport ends a batch at the go message, so a launch
+        still gets its poll before the host's next message.
+
+        The profiler's control-vector and launch tracking sees every write, as
+        it does on :meth:`write`; the upload cache is not consulted, because
+        every write here is already a single copy with its pump deferred.
+        """
+        writes = list(writes)
+        if not writes:
+            return
+        self._settle_pump()
+        for unified, addr, data in writes:
+            self._note_profiler_write(unified, addr, data)
+        self.tt_device.write_many(writes)
+        if any(self._brisc_running.values()):
+            self._pump_owed += self.cycles_per_poll * len(writes)
+        self._settle_pump()
+
+    def read_many(self, reads):
+        """Host reads — ``(unified, addr, size)`` — as a list of ``bytes``,
+        then one pump.
+
+        The bulk form of :meth:`read`, for reading a result back once the host
+        already knows it is final (the program has reported done): every read
+        sees the device at the same cycle, and the polls the reads would have
+        pumped one by one run afterwards, as one ``run``. A read that consumes
+        the profiler's control vector is still settled first, exactly as on
+        :meth:`read`.
+        """
+        reads = list(reads)
+        if not reads:
+            return []
+        self._settle_pump()
+        for unified, addr, size in reads:
+            if (
+                size == Device._PROFILER_CTRL_BYTES
+                and unified in self._profiler_flush_pending
+                and self._profiler_ctrl_addr.get(unified) == addr
+            ):
+                self.settle_profiler_flush(unified, addr)
+        result = self.tt_device.read_many(reads)
+        if any(self._brisc_running.values()):
+            self._pump_owed += self.cycles_per_poll * len(reads)
+        self._settle_pump()
+        return result
+
     def assert_reset(self, unified):
+        self._settle_pump()
         self._brisc_running[unified] = False
         self.tt_device.assert_soft_reset(unified)
 
     def deassert_reset(self, unified):
+        self._settle_pump()
         self.deassert_reset_without_pump(unified)
         self._maybe_pump()
 
@@ -317,6 +493,7 @@ class Device:
 
         Returns the number of cycles spent, ``None`` if it never settled.
         """
+        self._settle_pump()
         spent = 0
         while self.tt_device.read(unified, addr, 4)[3] != 0x00:
             if spent >= Device._SETTLE_CAP:
@@ -332,8 +509,15 @@ class Device:
         reset sibling): that replay can be triggered from *inside*
         ``tt_device.run`` — a peer's NoC packet resolving to a worker that
         does not exist yet — and pumping there would re-enter the clock while
-        a tile is mid-cycle.
+        a tile is mid-cycle. For the same reason it never pays a pump owed
+        by :meth:`write`; a repeated upload is still a single copy.
         """
+        cache = self.upload_cache
+        if cache is not None and len(data) >= UploadCache.MIN_BYTES:
+            data, repeated = cache.intern(data)
+            if repeated:
+                self.tt_device.write_bulk(unified, addr, data)
+                return
         self._note_profiler_write(unified, addr, data)
         self.tt_device.write(unified, addr, data)
 
@@ -517,3 +701,10 @@ class Device:
     def _maybe_pump(self):
         if any(self._brisc_running.values()):
             self.tt_device.run(self.cycles_per_poll)
+
+    def _settle_pump(self):
+        """Run the cycles repeated uploads deferred, as one ``run``."""
+        owed = self._pump_owed
+        if owed:
+            self._pump_owed = 0
+            self.tt_device.run(owed)
@@ -85,6 +85,37 @@ class Fabric:
     def write(self, coord, addr, data):
         self._core(coord).write(addr, data)
 
+    def write_many(self, writes):
+        """``write`` for each ``(coord, addr, data)`` of ``writes``, in order,
+        with runs of them bound for one device applied as one
+        ``Device.write_many`` — one resolve per destination and one pump.
+
+        A core backed by the device says so by offering ``staged_write``; any
+        other (a stand-in that journals, a NullCore), and a device-backed core
+        that answers ``None`` because it has something to do first, is written
+        to on its own, after the run before it has been flushed, so the order
+        the host sent is the order the device sees.
+        """
+        device, batch = None, []
+        for coord, addr, data in writes:
+            core = self._core(coord)
+            staged_write = getattr(core, "staged_write", None)
+            staged = None if staged_write is None else staged_write(addr, data)
+            if staged is None:
+                if batch:
+                    device.write_many(batch)
+                    batch = []
+                core.write(addr, data)
+                continue
+            target, write = staged
+            if batch and target is not device:
+                device.write_many(batch)
+                batch = []
+            device = target
+            batch.append(write)
+        if batch:
+            device.write_many(batch)
+
     def read(self, coord, addr, size):
         return self._core(coord).read(addr, size)
 
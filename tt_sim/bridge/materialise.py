@@ -101,6 +101,13 @@ class _CatchUpTensixCore(TensixCore):
         self._catch_up()
         super().write(addr, data)
 
+    def staged_write(self, addr, data):
+        # Owing the settle, this write is not batched: the settle runs cycles,
+        # and the batch ahead of it has to have landed before they do.
+        if self._go_addr is not None:
+            return None
+        return super().staged_write(addr, data)
+
     def read(self, addr, size):
         self._catch_up()
         return super().read(addr, size)
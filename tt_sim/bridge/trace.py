@@ -1,7 +1,7 @@
-"""Line-oriented trace format and recorder.
+"""Wire-trace formats and recorder.
 
-Each line records one host->sim message; whitespace-separated, ASCII so it's
-diff-able. Fields:
+**Text** (``*.trace``, the default). Each line records one host->sim message;
+whitespace-separated, ASCII so it's diff-able. Fields:
 
     <CMD> core=<x>,<y> addr=0x<hex> size=<n> data=<hex|-> [reply=<hex|->]
 
@@ -10,8 +10,42 @@ lowercase with no leading ``0x``; ``-`` means "no data". ``reply=`` is only
 present on READ lines and records the bytes the server returned.
 
 Comment lines (``#``) and blank lines are skipped on parse.
+
+**Binary** (``*.ttrace``). The same messages as length-prefixed records with
+raw payload bytes, grouped into independently compressed frames, with an
+index at the end. A captured tt-metal run is ~2.4 MB of text, almost all of
+it the same firmware image hex-encoded over and over; as binary it is a
+fraction of that on disk and parses without a hex decode per byte. The
+index's per-record command column lets a reader find a launch (say, the
+first ``RESET_DEASSERT``) and seek straight to it without decompressing the
+upload in front of it. The layout, all little-endian::
+
+    header   b"TTWTRACE" | version:u16 | codec:u8 | reserved:u8*5
+    frame *  compressed length:u32 | raw length:u32 | records:u32 | bytes
+    index    (frame offset:u64 | first record:u64 | records:u32) * frames
+             | command:u8 * records
+    trailer  index offset:u64 | frames:u32 | records:u64 | b"TTWTRIDX"
+
+and inside a frame's raw bytes, per record::
+
+    cmd:u8 | has reply:u8 | x:u16 | y:u16 | address:u64 | size:u32
+    | data length:u32 | reply length:u32 | data | reply
+
+The codec is ``zstd`` when the ``zstandard`` package imports and ``zlib``
+otherwise (or ``none``); it is recorded in the header, so a reader needs
+whichever one wrote the file. A file cut short — a server killed mid-run —
+has no trailer, and is read by walking its complete frames instead.
+
+:func:`read_trace` reads either format, telling them apart by the first bytes
+of the file, so everything that replays a trace takes both. ``TraceWriter``
+writes binary when the path ends in ``.ttrace``. ``python3 -m
+tt_sim.bridge.trace_convert IN OUT`` converts between the two, in either
+direction.
 """
 
+import struct
+import zlib
+
 from . import protocol as proto
 
 _NAME_TO_CMD = {v: k for k, v in proto.CMD_NAMES.items()}
@@ -25,25 +59,92 @@ def _parse_hex(s: str) -> bytes:
     return b"" if s == "-" else bytes.fromhex(s)
 
 
+try:
+    import zstandard as _zstd
+except ImportError:  # optional: zlib is always there
+    _zstd = None
+
+#: Suffix that makes ``TraceWriter`` write the binary format.
+BINARY_SUFFIX = ".ttrace"
+BINARY_MAGIC = b"TTWTRACE"
+BINARY_VERSION = 1
+_INDEX_MAGIC = b"TTWTRIDX"
+_FILE_HEADER = struct.Struct("<8sHB5x")
+_FRAME_HEADER = struct.Struct("<III")
+_RECORD = struct.Struct("<BBHHQIII")
+_FRAME_INDEX = struct.Struct("<QQI")
+_TRAILER = struct.Struct("<QIQ8s")
+
+CODECS = {"none": 0, "zlib": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in CODECS.items()}
+#: Raw bytes a frame collects before it is compressed and written. Big enough
+#: that a firmware image and its repeats share a frame for the compressor to
+#: find, small enough that seeking decompresses little it does not need.
+FRAME_BYTES = 1 << 20
+
+
+def default_codec():
+    return "zstd" if _zstd is not None else "zlib"
+
+
+def _compress(codec, raw):
+    if codec == CODECS["zlib"]:
+        return zlib.compress(raw, 6)
+    if codec == CODECS["zstd"]:
+        return _zstd.ZstdCompressor(level=10).compress(raw)
+    return raw
+
+
+def _decompress(codec, blob, raw_length):
+    if codec == CODECS["zlib"]:
+        return zlib.decompress(blob)
+    if codec == CODECS["zstd"]:
+        if _zstd is None:
+            raise ValueError("trace is zstd-compressed; install zstandard to read it")
+        return _zstd.ZstdDecompressor().decompress(blob, max_output_size=raw_length)
+    return blob
+
+
 class TraceWriter:
-    """Append-style trace recorder. Use as a context manager."""
+    """Append-style trace recorder. Use as a context manager.
 
-    def __init__(self, path):
+    Writes the text format unless ``path`` ends in :data:`BINARY_SUFFIX` or
+    ``binary=True``. A text trace is flushed line by line; a binary one frame
+    by frame, with the index written on exit.
+    """
+
+    def __init__(self, path, *, binary=None, codec=None):
         self.path = path
+        self.binary = str(path).endswith(BINARY_SUFFIX) if binary is None else binary
+        self.codec = CODECS[codec or default_codec()]
         self._f = None
 
     def __enter__(self):
-        self._f = open(self.path, "w")  # noqa: SIM115 — released in __exit__
+        if self.binary:
+            self._f = open(self.path, "wb")  # noqa: SIM115 — released in __exit__
+            self._f.write(_FILE_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, self.codec))
+            self._frame = []
+            self._frame_bytes = 0
+            self._frames = []
+            self._commands = bytearray()
+        else:
+            self._f = open(self.path, "w")  # noqa: SIM115 — released in __exit__
         return self
 
     def __exit__(self, exc_type, exc, tb):
         if self._f is not None:
+            if self.binary:
+                self._flush_frame()
+                self._write_index()
             self._f.close()
             self._f = None
 
     def record(self, req, reply_data=None):
         if self._f is None:
             raise RuntimeError("TraceWriter used outside its context")
+        if self.binary:
+            self._record_binary(req, reply_data)
+            return
         name = proto.CMD_NAMES.get(req.cmd, f"CMD{req.cmd}")
         parts = [
             name,
@@ -57,6 +158,56 @@ class TraceWriter:
         self._f.write(" ".join(parts) + "\n")
         self._f.flush()
 
+    def _record_binary(self, req, reply_data):
+        data = bytes(req.data or b"")
+        reply = (
+            bytes(reply_data)
+            if req.cmd == proto.CMD_READ and reply_data is not None
+            else None
+        )
+        self._frame.append(
+            _RECORD.pack(
+                req.cmd,
+                reply is not None,
+                req.core[0],
+                req.core[1],
+                req.address,
+                req.size,
+                len(data),
+                len(reply or b""),
+            )
+        )
+        self._frame.append(data)
+        if reply:
+            self._frame.append(reply)
+        self._frame_bytes += _RECORD.size + len(data) + len(reply or b"")
+        self._commands.append(req.cmd)
+        if self._frame_bytes >= FRAME_BYTES:
+            self._flush_frame()
+
+    def _flush_frame(self):
+        count = len(self._commands) - sum(n for _, _, n in self._frames)
+        if not count:
+            return
+        raw = b"".join(self._frame)
+        blob = _compress(self.codec, raw)
+        first = len(self._commands) - count
+        self._frames.append((self._f.tell(), first, count))
+        self._f.write(_FRAME_HEADER.pack(len(blob), len(raw), count))
+        self._f.write(blob)
+        self._f.flush()
+        self._frame = []
+        self._frame_bytes = 0
+
+    def _write_index(self):
+        offset = self._f.tell()
+        for frame in self._frames:
+            self._f.write(_FRAME_INDEX.pack(*frame))
+        self._f.write(self._commands)
+        self._f.write(
+            _TRAILER.pack(offset, len(self._frames), len(self._commands), _INDEX_MAGIC)
+        )
+
 
 def parse_trace_line(line: str) -> dict | None:
     """Parse one line into a dict: cmd, core, address, size, data, reply.
@@ -94,3 +245,149 @@ def parse_trace_line(line: str) -> dict | None:
         "data": _parse_hex(fields.get("data", "-")),
         "reply": _parse_hex(fields["reply"]) if "reply" in fields else None,
     }
+
+
+class BinaryTraceReader:
+    """Random access to a binary trace: its index, and records from any point.
+
+    ``commands`` is every record's command byte, in order, straight from the
+    index — enough to locate a launch without touching a frame. Records come
+    back as the dicts :func:`parse_trace_line` returns.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, self.codec = _FILE_HEADER.unpack(f.read(_FILE_HEADER.size))
+            if magic != BINARY_MAGIC:
+                raise ValueError(f"{path} is not a binary wire trace")
+            if version != BINARY_VERSION:
+                raise ValueError(
+                    f"{path} is binary trace version {version}; "
+                    f"this reader reads {BINARY_VERSION}"
+                )
+            self.frames, self.commands = self._read_index(f)
+
+    def _read_index(self, f):
+        end = f.seek(0, 2)
+        if end >= _FILE_HEADER.size + _TRAILER.size:
+            f.seek(end - _TRAILER.size)
+            offset, frames, records, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if magic == _INDEX_MAGIC:
+                f.seek(offset)
+                index = [
+                    _FRAME_INDEX.unpack(f.read(_FRAME_INDEX.size))
+                    for _ in range(frames)
+                ]
+                return index, f.read(records)
+        # No trailer: a recording that never reached __exit__. Walk the
+        # complete frames; the record count makes the command column cheap.
+        index, commands = [], bytearray()
+        f.seek(_FILE_HEADER.size)
+        while True:
+            offset = f.tell()
+            head = f.read(_FRAME_HEADER.size)
+            if len(head) < _FRAME_HEADER.size:
+                break
+            length, raw_length, count = _FRAME_HEADER.unpack(head)
+            blob = f.read(length)
+            if len(blob) < length:
+                break
+            index.append((offset, len(commands), count))
+            for record in self._decode(blob, raw_length):
+                commands.append(record["cmd"])
+        return index, bytes(commands)
+
+    def __len__(self):
+        return len(self.commands)
+
+    def find(self, cmd, start=0):
+        """Index of the first record at or after ``start`` with command
+        ``cmd``, or -1. Reads only the index."""
+        return self.commands.find(bytes([cmd]), start)
+
+    def records(self, start=0):
+        """Every record from number ``start`` on, decompressing only the
+        frames that hold them."""
+        with open(self.path, "rb") as f:
+            for offset, first, count in self.frames:
+                if first + count <= start:
+                    continue
+                f.seek(offset)
+                length, raw_length, _ = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+                skip = max(0, start - first)
+                for n, record in enumerate(self._decode(f.read(length), raw_length)):
+                    if n >= skip:
+                        yield record
+
+    def _decode(self, blob, raw_length):
+        raw = _decompress(self.codec, blob, raw_length)
+        view = memoryview(raw)
+        unpack = _RECORD.unpack_from
+        pos = 0
+        while pos < len(raw):
+            cmd, has_reply, x, y, address, size, data_len, reply_len = unpack(raw, pos)
+            pos += _RECORD.size
+            data = bytes(view[pos : pos + data_len])
+            pos += data_len
+            reply = bytes(view[pos : pos + reply_len]) if has_reply else None
+            pos += reply_len
+            yield {
+                "cmd": cmd,
+                "core": (x, y),
+                "address": address,
+                "size": size,
+                "data": data,
+                "reply": reply,
+            }
+
+
+def is_binary_trace(path):
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def read_trace(path, start=0):
+    """Every message in the trace at ``path``, either format, as the dicts
+    :func:`parse_trace_line` returns. ``start`` skips that many messages —
+    without decompressing them, in a binary trace."""
+    if is_binary_trace(path):
+        yield from BinaryTraceReader(path).records(start)
+        return
+    with open(path) as f:
+        n = 0
+        for line in f:
+            parsed = parse_trace_line(line)
+            if parsed is None:
+                continue
+            if n >= start:
+                yield parsed
+            n += 1
+
+
+class _Message:
+    """A parsed trace dict in the shape ``TraceWriter.record`` takes."""
+
+    __slots__ = ("cmd", "core", "address", "size", "data")
+
+    def __init__(self, parsed):
+        self.cmd = parsed["cmd"]
+        self.core = parsed["core"]
+        self.address = parsed["address"]
+        self.size = parsed["size"]
+        self.data = parsed["data"]
+
+
+def convert_trace(src, dst, *, binary=None, codec=None):
+    """Rewrite the trace at ``src`` to ``dst``; returns the message count.
+
+    The output format follows ``dst``'s suffix unless ``binary`` says
+    otherwise. Every field survives both ways, so text -> binary -> text
+    reproduces the original minus its comment and blank lines.
+    """
+    count = 0
+    with TraceWriter(dst, binary=binary, codec=codec) as writer:
+        for parsed in read_trace(src):
+            writer.record(_Message(parsed), parsed["reply"])
+            count += 1
+    return count
@@ -0,0 +1,42 @@
+"""Convert a wire trace between the text and binary formats.
+
+::
+
+    python3 -m tt_sim.bridge.trace_convert traces/one.trace /tmp/one.ttrace
+    python3 -m tt_sim.bridge.trace_convert /tmp/one.ttrace /tmp/one.trace
+
+The output is binary when its name ends in ``.ttrace`` and text otherwise; see
+``tt_sim/bridge/trace.py`` for both formats.
+"""
+
+import argparse
+import os
+
+from tt_sim.bridge.trace import BINARY_SUFFIX, CODECS, convert_trace
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        prog="python3 -m tt_sim.bridge.trace_convert",
+        description="Convert a wire trace between the text and binary formats.",
+    )
+    ap.add_argument("src", help="a trace in either format")
+    ap.add_argument("dst", help=f"written as binary if it ends in {BINARY_SUFFIX}")
+    ap.add_argument(
+        "--codec",
+        choices=sorted(CODECS),
+        default=None,
+        help="binary output's frame compression (default: zstd if installed, "
+        "else zlib)",
+    )
+    args = ap.parse_args(argv)
+    count = convert_trace(args.src, args.dst, codec=args.codec)
+    print(
+        f"{count} messages: {args.src} ({os.path.getsize(args.src)} bytes) -> "
+        f"{args.dst} ({os.path.getsize(args.dst)} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
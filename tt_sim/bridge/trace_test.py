@@ -0,0 +1,129 @@
+"""The wire-trace formats (``tt_sim/bridge/trace.py``).
+
+1. A captured trace survives text -> binary -> text with every field intact,
+   and ``read_trace`` gives the same messages from either file.
+2. The binary index: records split across several frames come back in order
+   from any starting point, ``find`` locates a command from the index alone,
+   and a recording cut off before its index is still read, by its frames.
+3. The consumers really take both formats: the offline "one" guard passes
+   replaying the binary form of its trace.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tt_sim.bridge import protocol as proto
+from tt_sim.bridge import trace as trace_mod
+from tt_sim.bridge.trace import (
+    BinaryTraceReader,
+    TraceWriter,
+    convert_trace,
+    is_binary_trace,
+    read_trace,
+)
+
+ONE_TRACE = (
+    Path(__file__).resolve().parents[2] / "driver/wormhole/server/traces/one.trace"
+)
+
+
+class _Req:
+    def __init__(self, cmd, core=(1, 2), address=0x100, data=b""):
+        self.cmd = cmd
+        self.core = core
+        self.address = address
+        self.size = len(data) or 4
+        self.data = data
+
+
+def _messages(n):
+    """A made-up conversation: writes with growing payloads, replied reads,
+    and one READ recorded with an empty reply."""
+    out = []
+    for i in range(n):
+        out.append(
+            (_Req(proto.CMD_WRITE, (i % 7, 3), 0x1000 + i, bytes([i % 256]) * i), None)
+        )
+        out.append((_Req(proto.CMD_READ, (2, i % 5), 0xFFB0_0000 + i), bytes(4)))
+    out.append((_Req(proto.CMD_READ), b""))
+    out.append((_Req(proto.CMD_RESET_DEASSERT, (1, 1), 0), None))
+    out.append((_Req(proto.CMD_EXIT, (0, 0), 0), None))
+    return out
+
+
+def _record(path, messages, **kwargs):
+    with TraceWriter(path, **kwargs) as writer:
+        for req, reply in messages:
+            writer.record(req, reply)
+
+
+@pytest.mark.skipif(not ONE_TRACE.exists(), reason="one.trace not present")
+def test_captured_trace_round_trips(tmp_path):
+    binary = tmp_path / "one.ttrace"
+    text = tmp_path / "one.trace"
+    count = convert_trace(ONE_TRACE, binary)
+    assert is_binary_trace(binary)
+    assert not is_binary_trace(ONE_TRACE)
+    assert binary.stat().st_size < ONE_TRACE.stat().st_size // 20
+    assert convert_trace(binary, text) == count
+    original = list(read_trace(ONE_TRACE))
+    assert len(original) == count
+    assert list(read_trace(binary)) == original
+    assert list(read_trace(text)) == original
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib"])
+def test_frames_seek_and_find(tmp_path, monkeypatch, codec):
+    monkeypatch.setattr(trace_mod, "FRAME_BYTES", 512)
+    text, binary = tmp_path / "t.trace", tmp_path / "t.ttrace"
+    messages = _messages(60)
+    _record(text, messages)
+    _record(binary, messages, codec=codec)
+    expected = list(read_trace(text))
+    reader = BinaryTraceReader(binary)
+    assert len(reader) == len(messages)
+    assert len(reader.frames) > 5
+    assert list(reader.records()) == expected
+    for start in (0, 1, 37, len(expected) - 1, len(expected)):
+        assert list(read_trace(binary, start)) == expected[start:]
+        assert list(read_trace(text, start)) == expected[start:]
+    launch = reader.find(proto.CMD_RESET_DEASSERT)
+    assert expected[launch]["cmd"] == proto.CMD_RESET_DEASSERT
+    assert reader.find(proto.CMD_START) == -1
+    # A READ recorded with an empty reply keeps it; every other command has none.
+    assert expected[-3]["reply"] == b""
+    assert expected[0]["reply"] is None
+
+
+def test_an_unfinished_recording_is_read_by_its_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(trace_mod, "FRAME_BYTES", 256)
+    path = tmp_path / "cut.ttrace"
+    messages = _messages(40)
+    _record(path, messages)
+    whole = list(read_trace(path))
+    reader = BinaryTraceReader(path)
+    last_offset, first, _ = reader.frames[-1]
+    # Drop the index and half of the final frame, as a killed server would.
+    path.write_bytes(path.read_bytes()[: last_offset + 10])
+    cut = BinaryTraceReader(path)
+    assert len(cut) == first
+    assert list(cut.records()) == whole[:first]
+
+
+def test_writer_picks_the_format_from_the_suffix(tmp_path):
+    for name, binary in (("a.trace", False), ("a.ttrace", True)):
+        _record(tmp_path / name, _messages(2))
+        assert is_binary_trace(tmp_path / name) is binary
+    with pytest.raises(ValueError, match="not a binary wire trace"):
+        BinaryTraceReader(tmp_path / "a.trace")
+
+
+@pytest.mark.skipif(not ONE_TRACE.exists(), reason="one.trace not present")
+def test_offline_guard_replays_the_binary_form(tmp_path, monkeypatch):
+    from driver.wormhole.server import offline_replay_test as guard
+
+    binary = tmp_path / "one.ttrace"
+    convert_trace(ONE_TRACE, binary)
+    monkeypatch.setattr(guard, "TRACE", binary)
+    assert guard.main() == 0
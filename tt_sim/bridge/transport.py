@@ -4,21 +4,66 @@ UMD is the LISTENER (binds the port in ``simulation_host.cpp::init`` and
 exports it via ``NNG_SOCKET_ADDR``); the simulator is the DIALER. On
 connect, we immediately send an EXIT message as the "I'm alive"
 handshake UMD expects in ``start_device()``.
+
+Consecutive WRITEs already waiting on the socket are taken as one batch and
+applied with ``Fabric.write_many`` — one resolve per destination and one pump
+for the lot, instead of one per message. A WRITE has no reply, so the host is
+free to send the next message before this one is handled, and a tensor or a
+set of binaries going out arrives as exactly such a run. A batch never waits
+for a message: it is what the socket already holds, and it ends at anything
+that is not a WRITE and just after a go message, so a launch still gets its
+poll before the host's next message. ``TT_SIM_BATCH_WRITES=0`` handles every
+message on its own.
 """
 
+import os
 import sys
 
 import pynng
 
 from . import protocol as proto
 
+#: ``go_msg_t`` is a 4-byte union whose ``signal`` is the top byte; these are
+#: the run-states the host writes and then polls (``hostdev/dev_msgs.h``), the
+#: same set ``cores._WriteShadow`` answers ``RUN_MSG_DONE`` for.
+_GO_MSG_SIZE = 4
+_RUN_STATES = frozenset({0x40, 0x80, 0xC0, 0xE0, 0xF0})
+
+
+def _truthy(val, default):
+    if val is None:
+        return default
+    return val.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def batch_writes_from_env(env=None):
+    """``TT_SIM_BATCH_WRITES`` (default on; ``0`` handles every WRITE alone)."""
+    if env is None:
+        env = os.environ
+    return _truthy(env.get("TT_SIM_BATCH_WRITES"), True)
+
+
+def _ends_batch(req):
+    """Is ``req`` a go-message write — the last WRITE a batch may take?"""
+    return len(req.data) == _GO_MSG_SIZE and req.data[_GO_MSG_SIZE - 1] in _RUN_STATES
+
 
 class Transport:
-    def __init__(self, addr, log_protocol=False, trace_writer=None):
+    #: Most WRITEs taken as one batch; bounds how long the host's next READ
+    #: can wait behind writes it sent before it.
+    MAX_BATCH = 256
+
+    def __init__(self, addr, log_protocol=False, trace_writer=None, batch_writes=None):
         self.addr = addr
         self.log_protocol = log_protocol
         self.trace_writer = trace_writer
         self.msg_count = 0
+        if batch_writes is None:
+            batch_writes = batch_writes_from_env()
+        self.batch_writes = batch_writes
+        #: Diagnostics: batches of more than one WRITE, and the WRITEs in them.
+        self.batches = 0
+        self.batched_writes = 0
 
     def serve(self, fabric):
         with pynng.Pair1(dial=self.addr) as sock:
@@ -26,15 +71,22 @@ class Transport:
             sock.send(proto.build_msg(proto.CMD_EXIT))
             self._log("sent EXIT ack")
 
+            pending = None
             while True:
-                try:
-                    buf = sock.recv()
-                except pynng.exceptions.Closed:
-                    return
-
-                req = proto.parse(buf)
-                self.msg_count += 1
-                self._log_request(req)
+                if pending is not None:
+                    req, pending = pending, None
+                else:
+                    try:
+                        buf = sock.recv()
+                    except pynng.exceptions.Closed:
+                        return
+                    req = self._receive(buf)
+
+                if self.batch_writes and req.cmd == proto.CMD_WRITE:
+                    batch, pending = self._next_batch(sock, req)
+                    if len(batch) > 1:
+                        self._handle_writes(fabric, batch)
+                        continue
 
                 reply_data = self._handle(fabric, req)
 
@@ -48,6 +100,44 @@ class Transport:
                     # Host is shutting us down.
                     return
 
+    def _receive(self, buf):
+        req = proto.parse(buf)
+        self.msg_count += 1
+        self._log_request(req)
+        return req
+
+    def _next_batch(self, sock, first):
+        """``(writes, pending)``: ``first`` and the WRITEs queued behind it, and
+        the message that ended the run if it was not a WRITE (else None).
+
+        Only what ``sock`` already holds is taken — a non-blocking ``recv``
+        that finds nothing ends the batch.
+        """
+        batch = [first]
+        if _ends_batch(first):
+            return batch, None
+        while len(batch) < Transport.MAX_BATCH:
+            try:
+                buf = sock.recv(block=False)
+            except (pynng.exceptions.TryAgain, pynng.exceptions.Closed):
+                break
+            req = self._receive(buf)
+            if req.cmd != proto.CMD_WRITE:
+                return batch, req
+            batch.append(req)
+            if _ends_batch(req):
+                break
+        return batch, None
+
+    def _handle_writes(self, fabric, batch):
+        """Apply a batch of WRITEs as one ``Fabric.write_many``."""
+        fabric.write_many([(req.core, req.address, req.data) for req in batch])
+        self.batches += 1
+        self.batched_writes += len(batch)
+        if self.trace_writer is not None:
+            for req in batch:
+                self.trace_writer.record(req, None)
+
     def _handle(self, fabric, req):
         """Run side effects for ``req``; return reply payload bytes for READ."""
         if req.cmd == proto.CMD_WRITE:
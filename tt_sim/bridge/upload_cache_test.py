@@ -0,0 +1,130 @@
+"""The wire bridge's upload cache (``tt_sim.bridge.device.UploadCache``).
+
+1. A binary sent to several running workers lands in every one of them, and
+   the per-message pumps those repeats owe are paid as one ``run`` before the
+   next host read — the same number of cycles, in one call.
+2. Turned off (``TT_SIM_UPLOAD_CACHE=0``), and for payloads under the size
+   floor, every write pumps exactly as it always did.
+3. ``TT_Device.write_bulk`` is ``write`` by another road: same bytes in L1 and
+   DRAM, and the ordinary path — trace events included — while the bus is on.
+"""
+
+import pytest
+
+from tt_sim.bridge.device import Device, UploadCache, upload_summary
+from tt_sim.device.wormhole import Wormhole
+from tt_sim.pe.rv.spin_test import _jal
+from tt_sim.trace.bus import get_bus
+from tt_sim.trace.events import EventCategory
+from tt_sim.util.conversion import conv_to_bytes
+
+TENSIX_COORD_MAP = {
+    Wormhole.physical_noc0_coord_from_unified_worker((ux, uy)): (ux, uy)
+    for ux in range(18, 26)
+    for uy in range(16, 26)
+}
+WORKERS = [(1, 1), (2, 1), (3, 1)]
+CYCLES_PER_POLL = 100
+KERNEL_ADDR = 0x8000
+#: Not a binary anyone would ship, but the size and shape of one.
+KERNEL = bytes(range(256)) * 8
+
+
+def _running(upload_cache):
+    """Three workers with BRISC released into ``j .``, and a run() counter."""
+    device = Device(
+        Wormhole,
+        TENSIX_COORD_MAP,
+        cycles_per_poll=CYCLES_PER_POLL,
+        upload_cache=upload_cache,
+    )
+    unified = [device.ensure_tensix_tile(coord) for coord in WORKERS]
+    for coord in unified:
+        device.tt_device.write(coord, 0x0, conv_to_bytes(_jal(0, 0)))
+        device.deassert_reset(coord)
+    runs = []
+    run = device.tt_device.run
+
+    def counting_run(cycles):
+        runs.append(cycles)
+        return run(cycles)
+
+    device.tt_device.run = counting_run
+    return device, unified, runs
+
+
+def test_repeated_uploads_land_and_share_one_pump():
+    device, unified, runs = _running(upload_cache=True)
+    start = device.tt_device.clocks[0].clock_tick_num
+    for coord in unified:
+        device.write(coord, KERNEL_ADDR, KERNEL)
+    # The first sighting pumps; the two repeats only owe theirs.
+    assert runs == [CYCLES_PER_POLL]
+    assert device.upload_cache.hits == 2
+    assert device.pumps_coalesced == 2
+
+    assert device.read(unified[-1], KERNEL_ADDR, len(KERNEL)) == KERNEL
+    # Owed cycles first, as one run, then the read's own poll.
+    assert runs == [CYCLES_PER_POLL, 2 * CYCLES_PER_POLL, CYCLES_PER_POLL]
+    assert device.tt_device.clocks[0].clock_tick_num - start == 4 * CYCLES_PER_POLL
+    for coord in unified:
+        assert device.tt_device.read(coord, KERNEL_ADDR, len(KERNEL)) == KERNEL
+    assert upload_summary(device) == (
+        f"upload cache: 2 repeated uploads ({2 * len(KERNEL)} bytes), 2 pumps coalesced"
+    )
+    device.tt_device.shutdown()
+
+
+@pytest.mark.parametrize("env", ["0", None])
+def test_off_and_small_writes_pump_per_message(monkeypatch, env):
+    if env is None:
+        # On, but every payload is under the floor.
+        payload = KERNEL[: UploadCache.MIN_BYTES - 1]
+    else:
+        monkeypatch.setenv("TT_SIM_UPLOAD_CACHE", env)
+        payload = KERNEL
+    device, unified, runs = _running(upload_cache=None)
+    assert (device.upload_cache is None) == (env == "0")
+    for coord in unified:
+        device.write(coord, KERNEL_ADDR, payload)
+    assert runs == [CYCLES_PER_POLL] * len(unified)
+    assert device.pumps_coalesced == 0
+    assert upload_summary(device) == ""
+    device.tt_device.shutdown()
+
+
+def test_write_bulk_is_write():
+    device = Wormhole()
+    worker = next(c for c, tile in device.tile_directory.items() if tile.is_tensix)
+    dram = device.dram_tiles[0].get_coord_pair()
+    for coord in (worker, dram):
+        device.write_bulk(coord, KERNEL_ADDR, KERNEL)
+        assert device.read(coord, KERNEL_ADDR, len(KERNEL)) == KERNEL
+
+    bus = get_bus()
+    events = []
+    bus.subscribe(EventCategory.MEM, events.append)
+    bus.enabled = True
+    try:
+        device.write_bulk(worker, KERNEL_ADDR + 0x1000, KERNEL)
+    finally:
+        bus.reset()
+    assert device.read(worker, KERNEL_ADDR + 0x1000, len(KERNEL)) == KERNEL
+    assert [(e.op, e.address, e.size) for e in events] == [
+        ("write", KERNEL_ADDR + 0x1000, len(KERNEL))
+    ]
+    device.shutdown()
+
+
+def test_the_store_is_bounded(monkeypatch):
+    monkeypatch.setattr(UploadCache, "MAX_BYTES", 2 * len(KERNEL))
+    cache = UploadCache()
+    payloads = [bytes([i]) * len(KERNEL) for i in range(3)]
+    for payload in payloads:
+        assert cache.intern(payload) == (payload, False)
+    assert len(cache) == 2
+    # The oldest went; the newest is answered with the copy already held.
+    held, repeated = cache.intern(bytes(bytearray(payloads[2])))
+    assert repeated
+    assert held is payloads[2]
+    assert cache.intern(payloads[0]) == (payloads[0], False)
@@ -692,3 +692,20 @@ class MultiTileClock(Clock):
         for t in self._workers:
             t.join(timeout=5.0)
         self._workers_started = False
+
+    def __getstate__(self):
+        # For ``tt_sim.device.snapshot``: worker threads are not state. A
+        # restored pump starts with none and spawns its own on the first
+        # threaded ``run``; the handshake counters go back to where a fresh
+        # worker expects them (it treats any generation above 0 as a batch).
+        state = self.__dict__.copy()
+        state.update(
+            _workers_started=False,
+            _workers=[],
+            _barrier=None,
+            _generation=0,
+            _workers_done=0,
+            _shutdown=False,
+            _error=None,
+        )
+        return state
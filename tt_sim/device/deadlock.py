@@ -633,9 +633,10 @@ class DeadlockDetector:
                     pc = conv_to_uint32(core.register_file["pc"].read())
                     self.recent_pcs[key].append(pc)
                     bucket = pc // _PC_BUCKET_BYTES
-                    # ``Register.value`` is a plain ``bytes`` attribute (see
+                    # ``Register.value`` is a ``bytes`` attribute, or on an
+                    # int-backed file a one-line property (see
                     # ``pe/register/register.py``), so a core's whole data state
-                    # is ~34 attribute reads.
+                    # is ~34 cheap reads.
                     state = tuple(r.value for r in self.data_registers[key])
                     if confirming:
                         # Judge growth against what this core had already been
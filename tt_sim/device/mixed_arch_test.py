@@ -0,0 +1,103 @@
+"""A Wormhole and a Blackhole device in one process.
+
+Runs standalone (``python3 -m tt_sim.device.mixed_arch_test``) or under
+pytest.
+
+The Tensix config-register layout used to be selected process-wide, by
+whichever device last built a config unit, so a second device of the other
+architecture silently re-pointed the first. Each device now reads the layout
+its arch profile names (``ArchProfile.tensix_config``). The properties pinned:
+
+1. Every coprocessor carries its own profile's layout, one shared object per
+   architecture, and a pickled layout (a snapshot) comes back as that object.
+2. A Blackhole-only config write is decoded with Blackhole's layout after a
+   Wormhole device has been built.
+3. A Wormhole core's reset-PC override is read with Wormhole's layout after a
+   Blackhole device has been built.
+"""
+
+import pickle
+
+import pytest
+
+from tt_sim.arch.blackhole import BLACKHOLE_PROFILE
+from tt_sim.arch.wormhole import WORMHOLE_PROFILE
+from tt_sim.device.blackhole import Blackhole
+from tt_sim.device.wormhole import Wormhole
+from tt_sim.pe.tensix.util import TensixConfigurationConstants
+from tt_sim.util.conversion import conv_to_bytes
+
+#: Where a baby core sees its tile's Tensix backend config.
+TENSIX_BACKEND_CONFIG_BASE = 0xFFEF_0000
+
+
+def _backend(device):
+    tile = next(t for t in device.tile_directory.values() if t.is_tensix)
+    return tile, tile.tensix_coprocessor.getBackend()
+
+
+def _field_word(layout, name, value):
+    field = layout.fields[name]
+    return (value << field.shamt) & field.mask
+
+
+def test_each_device_reads_its_profiles_layout():
+    wormhole, blackhole = Wormhole(), Blackhole()
+    try:
+        for device, profile in (
+            (wormhole, WORMHOLE_PROFILE),
+            (blackhole, BLACKHOLE_PROFILE),
+        ):
+            backend = _backend(device)[1]
+            assert backend.config_layout is profile.tensix_config
+            assert backend.config_fields is profile.tensix_config.fields
+            assert pickle.loads(pickle.dumps(backend.config_layout)) is (
+                profile.tensix_config
+            )
+        assert WORMHOLE_PROFILE.tensix_config is not BLACKHOLE_PROFILE.tensix_config
+    finally:
+        TensixConfigurationConstants.use_blackhole(False)
+
+
+def test_a_blackhole_write_after_a_wormhole_device_is_built():
+    blackhole = Blackhole()
+    Wormhole()
+    # The process-wide accessors now describe Wormhole, which has no
+    # DEST_ACCESS_CFG at all.
+    assert not TensixConfigurationConstants.exists("DEST_ACCESS_CFG_remap_addrs")
+
+    backend = _backend(blackhole)[1]
+    layout = backend.config_layout
+    unit = backend.config_unit
+    unit.setConfig(
+        0,
+        unit.dest_access_cfg_idx,
+        _field_word(layout, "DEST_ACCESS_CFG_remap_addrs", 1),
+    )
+    assert backend.getDst().dest_remap_addrs
+    assert not backend.getDst().dest_swizzle_32b
+
+
+def test_a_wormhole_reset_pc_after_a_blackhole_device_is_built():
+    wormhole = Wormhole()
+    Blackhole()
+    try:
+        tile, backend = _backend(wormhole)
+        layout = backend.config_layout
+        default = tile.ncrisc.get_start_address()
+        for name, value in (
+            ("NCRISC_RESET_PC_OVERRIDE_Reset_PC_Override_en", 1),
+            ("NCRISC_RESET_PC_PC", 0x4000),
+        ):
+            address = TENSIX_BACKEND_CONFIG_BASE + layout.fields[name].addr32 * 4
+            tile.ncrisc.visible_memory.write(
+                address, conv_to_bytes(_field_word(layout, name, value), 4)
+            )
+        assert default != 0x4000
+        assert tile.ncrisc.get_start_address() == 0x4000
+    finally:
+        TensixConfigurationConstants.use_blackhole(False)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,206 @@
+"""Snapshot and restore of a whole simulated device.
+
+:func:`capture` freezes a live :class:`~tt_sim.device.tt_device.TT_Device` —
+every tile's L1, the DRAM chunks that have been touched, the baby cores'
+register files, the Tensix backend, the NoC's in-flight queues and
+outstanding-request state, the pump's cycle count — into a
+:class:`DeviceSnapshot`, and :meth:`DeviceSnapshot.restore` builds an
+independent device that carries on from exactly that point. A snapshot can be
+restored any number of times, and saved to disk with :meth:`DeviceSnapshot.save`
+and read back with :meth:`DeviceSnapshot.load`, so firmware boot and a grid-wide
+init handshake can be run once and every later experiment started from the
+post-init checkpoint.
+
+**What is captured is the object graph, not a schema.** The device is pickled
+(protocol 5), so a field added to any unit is in the snapshot without anyone
+remembering to add it here — which is the failure a hand-written field list
+would have the first time someone forgot. A few things do not pickle as-is, and
+each is handled where it is owned:
+
+- thread locks and condition variables (the NUI inboxes, the link registries,
+  the pump's handshake) are re-created fresh on restore, by
+  :class:`_DevicePickler`;
+- the pump's worker threads are not state; ``MultiTileClock.__getstate__``
+  drops them and a threaded ``run`` respawns them;
+- the process-wide event bus restores as *this* process's bus
+  (``EventBus.__reduce_ex__``), so a restored device publishes to whatever writers
+  are subscribed here rather than to a detached copy;
+- NumPy views (each ``LReg`` is a row of ``VectorUnit.lreg_file``) are pickled
+  as views of their base array, so they still alias it after a restore;
+- the RV cores' decoded-instruction and basic-block caches hold closures; they
+  are pure caches of memory contents, so a restored core starts with them empty
+  and refills them on the first fetch.
+
+The wire bridge's directory-miss hook is not captured: it belongs to the
+bridge, not the device. Re-install it with ``set_directory_miss_hook`` on the
+restored device.
+
+**On disk** a snapshot is the pickle stream plus its memories as raw
+out-of-band buffers — every ``AddressableMemory`` array, every
+``SparseDRAM`` chunk and every written chunk of a ``MappedDRAM`` — with each
+buffer stored as the list of its non-zero
+4 KiB pages. L1 is mostly zeros and DRAM is chunked lazily already, so a
+freshly booted device costs a few megabytes rather than its address space. The
+layout is::
+
+    b"TTSIMSNP" | version:u32 | buffer count:u32 | pickle length:u64 | pickle
+    then per buffer:
+      length:u64 | pages:u32 | page index:u32 * pages | page data | tail bytes
+
+Snapshots are for checkpointing a run inside one tt-sim version; like any
+pickle they are not a stable interchange format across source changes, and
+like any pickle they must only be loaded from a trusted file.
+"""
+
+import io
+import pickle
+import struct
+import threading
+
+import numpy as np
+
+from tt_sim.pe.tensix.util import TensixConfigurationConstants
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"TTSIMSNP"
+_HEADER = struct.Struct("<8sIIQ")
+_BUFFER_HEADER = struct.Struct("<QI")
+#: Granularity of the zero-page elision in the on-disk form.
+PAGE_SIZE = 4096
+
+_LOCK_FACTORIES = {
+    type(threading.Lock()): threading.Lock,
+    type(threading.RLock()): threading.RLock,
+}
+
+
+def _rebuild_view(base, shape, dtype, offset, strides):
+    return np.ndarray(shape, dtype, buffer=base, offset=offset, strides=strides)
+
+
+class _DevicePickler(pickle.Pickler):
+    """A protocol-5 pickler that re-creates locks and keeps NumPy views views."""
+
+    def reducer_override(self, obj):
+        factory = _LOCK_FACTORIES.get(type(obj))
+        if factory is not None:
+            return factory, ()
+        if type(obj) is threading.Condition:
+            return threading.Condition, ()
+        if type(obj) is np.ndarray and isinstance(obj.base, np.ndarray):
+            base = obj.base
+            while isinstance(base.base, np.ndarray):
+                base = base.base
+            if base.flags.c_contiguous:
+                offset = obj.ctypes.data - base.ctypes.data
+                return _rebuild_view, (base, obj.shape, obj.dtype, offset, obj.strides)
+        return NotImplemented
+
+
+class DeviceSnapshot:
+    """A captured device: a pickle stream plus its out-of-band memory buffers.
+
+    Build one with :func:`capture` or :meth:`load`; nothing here refers to the
+    device it came from, so the device can keep running.
+    """
+
+    def __init__(self, data, buffers):
+        self.data = data
+        self.buffers = buffers
+
+    @property
+    def nbytes(self):
+        """Bytes held in memory: the pickle stream plus every raw buffer."""
+        return len(self.data) + sum(len(buffer) for buffer in self.buffers)
+
+    def restore(self):
+        """A new device in the captured state.
+
+        Every buffer is copied, so two devices restored from one snapshot share
+        nothing.
+        """
+        device = pickle.loads(
+            self.data, buffers=[bytearray(buffer) for buffer in self.buffers]
+        )
+        # The device carries its own config-register layout; this only points
+        # the process-wide accessors at it, as building the device would have.
+        TensixConfigurationConstants.use_blackhole(device.profile.tensix_blackhole)
+        return device
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(_MAGIC, FORMAT_VERSION, len(self.buffers), len(self.data))
+            )
+            f.write(self.data)
+            for buffer in self.buffers:
+                _write_buffer(f, buffer)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, version, count, length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a tt-sim device snapshot")
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} is snapshot format {version}; this tt-sim reads "
+                    f"{FORMAT_VERSION}"
+                )
+            data = f.read(length)
+            buffers = [_read_buffer(f) for _ in range(count)]
+        return cls(data, buffers)
+
+
+def capture(device):
+    """Snapshot ``device`` as it stands between pump calls."""
+    hook = device._directory_miss_hook
+    if hook is not None:
+        device.set_directory_miss_hook(None)
+    try:
+        buffers = []
+        stream = io.BytesIO()
+        _DevicePickler(stream, protocol=5, buffer_callback=buffers.append).dump(device)
+    finally:
+        if hook is not None:
+            device.set_directory_miss_hook(hook)
+    return DeviceSnapshot(
+        stream.getvalue(), [buffer.raw().tobytes() for buffer in buffers]
+    )
+
+
+def save_snapshot(device, path):
+    """:func:`capture` ``device`` and write it to ``path``."""
+    snapshot = capture(device)
+    snapshot.save(path)
+    return snapshot
+
+
+def load_snapshot(path):
+    """Restore the device saved at ``path``."""
+    return DeviceSnapshot.load(path).restore()
+
+
+def _write_buffer(f, buffer):
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    full = len(raw) // PAGE_SIZE
+    pages = raw[: full * PAGE_SIZE].reshape(full, PAGE_SIZE)
+    present = np.flatnonzero(pages.any(axis=1)).astype("<u4")
+    f.write(_BUFFER_HEADER.pack(len(raw), len(present)))
+    f.write(present.tobytes())
+    f.write(pages[present].tobytes())
+    f.write(raw[full * PAGE_SIZE :].tobytes())
+
+
+def _read_buffer(f):
+    length, count = _BUFFER_HEADER.unpack(f.read(_BUFFER_HEADER.size))
+    full = length // PAGE_SIZE
+    raw = np.zeros(length, dtype=np.uint8)
+    pages = raw[: full * PAGE_SIZE].reshape(full, PAGE_SIZE)
+    present = np.frombuffer(f.read(4 * count), dtype="<u4")
+    pages[present] = np.frombuffer(f.read(count * PAGE_SIZE), dtype=np.uint8).reshape(
+        count, PAGE_SIZE
+    )
+    raw[full * PAGE_SIZE :] = np.frombuffer(f.read(length - full * PAGE_SIZE), np.uint8)
+    return raw.tobytes()
@@ -0,0 +1,129 @@
+"""Device snapshot and restore (``tt_sim.device.snapshot``).
+
+1. A device captured mid-program — a DRAM -> L1 NoC read in flight, BRISC in a
+   store loop — and restored carries on exactly as the original does: same
+   registers, NoC counters, L1, DRAM and cycle count after the same number of
+   further cycles, on both architectures.
+2. Two restores of one snapshot share no memory, and the on-disk form round
+   trips while storing only the non-zero pages.
+3. What must not be copied is not: the process-wide event bus, and the wire
+   bridge's directory-miss hook; and what must still alias does: each ``LReg``
+   is a row of its ``lreg_file`` again.
+"""
+
+import numpy as np
+import pytest
+
+from tt_sim.device.blackhole import Blackhole
+from tt_sim.device.snapshot import DeviceSnapshot, capture, load_snapshot
+from tt_sim.device.wormhole import Wormhole
+from tt_sim.network.attribution_test import _dram_mid, _li, _noc_read_program
+from tt_sim.pe.rv.babyriscv import BabyRISCVCoreType
+from tt_sim.pe.rv.spin_test import _addi, _jal, _sw
+from tt_sim.trace.bus import get_bus
+from tt_sim.trace.state_dump import dump_device_state
+
+DEVICES = pytest.mark.parametrize(
+    "device_class", [Wormhole, Blackhole], ids=lambda c: c.__name__
+)
+
+_DRAM_SRC = 0x1000
+_L1_DST = 0x20000
+_COUNTER = 0x21000
+
+
+def _tensix_coord(device):
+    return next(c for c, tile in device.tile_directory.items() if tile.is_tensix)
+
+
+def _booted(device_class):
+    """A device whose BRISC has issued a NoC read and is counting in L1."""
+    device = device_class()
+    device.reset()
+    dram = device.dram_tiles[0]
+    dram_coord = dram.get_coord_pair()
+    device.write(dram_coord, _DRAM_SRC, bytes(range(64)))
+    read, _ = _noc_read_program(_dram_mid(device), _DRAM_SRC, _L1_DST)
+    words = [int.from_bytes(read[i : i + 4], "little") for i in range(0, len(read), 4)]
+    words = words[:-1]  # drop the parking `j .`
+    words += _li(6, _COUNTER)
+    words += [_addi(5, 5, 1), _sw(5, 6, 0), _jal(0, -8)]
+    coord = _tensix_coord(device)
+    device.write(coord, 0x0, b"".join(w.to_bytes(4, "little") for w in words))
+    device.deassert_soft_reset(coord, core_type=BabyRISCVCoreType.BRISC)
+    device.run(30)
+    return device
+
+
+def _state(device):
+    coord = _tensix_coord(device)
+    dram = device.dram_tiles[0]
+    return (
+        dump_device_state(device),
+        device.clocks[0].clock_tick_num,
+        device.read(coord, _L1_DST, 64),
+        device.read(coord, _COUNTER, 4),
+        device.read(dram.get_coord_pair(), _DRAM_SRC, 64),
+    )
+
+
+@DEVICES
+def test_restored_device_continues_like_the_original(device_class):
+    device = _booted(device_class)
+    snapshot = capture(device)
+    device.run(300)
+    expected = _state(device)
+
+    restored = snapshot.restore()
+    assert restored.clocks[0].clock_tick_num == 30
+    restored.run(300)
+    assert _state(restored) == expected
+    # The loop ran (and on Wormhole, whose NoC register layout the program
+    # is written for, the read landed), so the comparison compared something.
+    coord = _tensix_coord(restored)
+    assert int.from_bytes(restored.read(coord, _COUNTER, 4), "little") > 0
+    if device_class is Wormhole:
+        assert restored.read(coord, _L1_DST, 64) == bytes(range(64))
+
+
+def test_restores_are_independent_and_the_file_is_sparse(tmp_path):
+    device = _booted(Wormhole)
+    snapshot = capture(device)
+    coord = _tensix_coord(device)
+    first, second = snapshot.restore(), snapshot.restore()
+    first.write(coord, _COUNTER, b"\xaa" * 4)
+    assert second.read(coord, _COUNTER, 4) != b"\xaa" * 4
+
+    path = tmp_path / "device.snap"
+    snapshot.save(path)
+    assert path.stat().st_size < snapshot.nbytes // 4
+    loaded = DeviceSnapshot.load(path)
+    assert loaded.data == snapshot.data
+    assert loaded.buffers == snapshot.buffers
+    restored = load_snapshot(path)
+    restored.run(300)
+    device.run(300)
+    assert _state(restored) == _state(device)
+
+
+def test_bus_hook_and_views():
+    device = _booted(Blackhole)
+    hook_calls = []
+    device.set_directory_miss_hook(lambda noc, coord: hook_calls.append(coord))
+    restored = capture(device).restore()
+    assert device._directory_miss_hook is not None
+    assert restored._directory_miss_hook is None
+    tile = restored.tile_directory[_tensix_coord(restored)]
+    assert tile.brisc.bus is get_bus()
+
+    vector = tile.tensix_coprocessor.getBackend().vector_unit
+    assert all(np.shares_memory(lreg.data, vector.lreg_file) for lreg in vector.lregs)
+    vector.lregs[3][0] = 0x1234
+    assert vector.lreg_file[3, 0] == 0x1234
+
+
+if __name__ == "__main__":
+    for device_class in (Wormhole, Blackhole):
+        test_restored_device_continues_like_the_original(device_class)
+    test_bus_hook_and_views()
+    print("ok")
@@ -9,12 +9,20 @@ assemble these into a netlist. See ``docs/plans/blackhole-support.md``.
 """
 
 import math
+import os
 import threading
 
 from tt_sim.device.tt_device import (
     TTDeviceTile,
 )
-from tt_sim.memory.memory import DRAM, SparseDRAM, TensixMemory, TileMemory
+from tt_sim.memory.memory import (
+    DRAM,
+    MappedDRAM,
+    SparseDRAM,
+    TensixMemory,
+    TileMemory,
+    dram_backing_from_env,
+)
 from tt_sim.memory.memory_map import AddressRange, MemoryMap
 from tt_sim.misc.mailbox import Mailbox
 from tt_sim.misc.tile_ctrl import TensixTileControl
@@ -438,8 +446,19 @@ class DRAMTile(TTDeviceTile):
         # top-down allocation (``DeviceLocalBufferConfig{.bottom_up = false}``)
         # starts at the very top of the bank and used to land outside every
         # registered range. Sparse because 6 x 2 GiB / 8 x ~4 GiB cannot be
-        # allocated up front; untouched chunks read as zeros.
-        self.ddr = SparseDRAM(profile.dram_channel_size)
+        # allocated up front; untouched chunks read as zeros. Mapped instead
+        # under ``TT_SIM_DRAM_MMAP``, and onto ``TT_SIM_DRAM_DIR/dram-X-Y.bin``
+        # when the image should be kept.
+        mapped, image_dir = dram_backing_from_env()
+        if image_dir is not None:
+            self.ddr = MappedDRAM(
+                profile.dram_channel_size,
+                path=os.path.join(image_dir, f"dram-{coord_x}-{coord_y}.bin"),
+            )
+        elif mapped:
+            self.ddr = MappedDRAM(profile.dram_channel_size)
+        else:
+            self.ddr = SparseDRAM(profile.dram_channel_size)
         dram_tile_mem_map[AddressRange(0x0, self.ddr.getSize())] = self.ddr
 
         self.dram_memory = TileMemory(dram_tile_mem_map, safe, snoop_addresses)
@@ -556,6 +575,9 @@ class DRAMTile(TTDeviceTile):
     def write(self, address, value, size=None):
         return self.dram_memory.write(address, value, size)
 
+    def get_host_memory(self):
+        return self.dram_memory
+
     def getSize(self):
         # Dummy value for now
         return 0xFFFF
@@ -694,6 +716,9 @@ class EthTile(TTDeviceTile):
     def write(self, address, value, size=None):
         return self.eth_memory.write(address, value, size)
 
+    def get_host_memory(self):
+        return self.eth_memory
+
     def getSize(self):
         return 0xFFFF
 
@@ -724,6 +749,7 @@ class TensixTile(TTDeviceTile):
             cfg_state_size=profile.tensix_cfg_state_size,
             thd_state_size=profile.tensix_thd_state_size,
             blackhole=profile.tensix_blackhole,
+            config_layout=profile.tensix_config,
         )
 
         self._mb_brisc = Mailbox(BabyRISCVCoreType.BRISC)
@@ -1084,6 +1110,9 @@ class TensixTile(TTDeviceTile):
     def write(self, address, value, size=None):
         return self.tensix_mem.write(address, value, size)
 
+    def get_host_memory(self):
+        return self.tensix_mem
+
     def getSize(self):
         # Dummy value for now
         return 0xFFFF
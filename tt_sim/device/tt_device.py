@@ -8,6 +8,7 @@ from tt_sim.device.deadlock import (
 )
 from tt_sim.device.device import Device, DeviceTile
 from tt_sim.device.reset import Reset
+from tt_sim.memory.memory import resolve_plain_ram_span
 from tt_sim.network.noc_shadow import ShadowReporter
 from tt_sim.network.tt_noc import AliasedEndpoint, NocLinkRegistry, resolved_nui
 from tt_sim.pe.rv.babyriscv import BabyRISCVCoreType
@@ -685,6 +686,26 @@ class TT_Device(Device):
             tile.get_noc_nui(0).directory_miss_hook = hook
             tile.get_noc_nui(1).directory_miss_hook = hook
 
+    def __getstate__(self):
+        # For ``tt_sim.device.snapshot``: ``_tile_of_nui`` is keyed by ``id``,
+        # which does not survive a restore, so it travels as pairs and is
+        # re-keyed on the way back in.
+        state = self.__dict__.copy()
+        tiles = {id(tile): tile for tile in self.tile_directory.values()}
+        nuis = {
+            id(tile.get_noc_nui(noc)): tile.get_noc_nui(noc)
+            for tile in tiles.values()
+            for noc in (0, 1)
+        }
+        state["_tile_of_nui"] = [
+            (nuis[key], tile) for key, tile in self._tile_of_nui.items()
+        ]
+        return state
+
+    def __setstate__(self, state):
+        state["_tile_of_nui"] = {id(nui): tile for nui, tile in state["_tile_of_nui"]}
+        self.__dict__.update(state)
+
     def register_tensix_tile(self, tile):
         """Register a TensixTile constructed after device __init__.
 
@@ -750,6 +771,82 @@ class TT_Device(Device):
         tile.clock.wake()
         tile.write(address, value, size)
 
+    def write_bulk(self, coordinate_pair, address, value):
+        """A host write of ``value`` (``bytes``) as one copy into the RAM behind it.
+
+        Same effect as :meth:`write`, minus the per-level walk: the tile's
+        memory space is resolved once to the plain-RAM leaf that backs
+        ``address`` (``resolve_plain_ram_span``) and the payload is written
+        into that leaf directly. Anything that walk would have done more than
+        copy — a trace event while the bus is enabled, a snoop print, an MMIO
+        component, a payload that runs past the leaf — takes :meth:`write`
+        instead, so the result is the same bytes either way. For the wire
+        bridge's firmware and kernel uploads; see
+        ``tt_sim.bridge.device.UploadCache``.
+        """
+        self.write_many(((coordinate_pair, address, value),))
+
+    def write_many(self, writes):
+        """Apply ``writes`` — ``(coord, address, bytes)`` — in order, as
+        :meth:`write_bulk` applies one.
+
+        What a batch saves over a loop of :meth:`write_bulk` is the resolve: the
+        plain-RAM span found for a tile is kept for the rest of the batch, so a
+        tensor going out as a run of writes into one L1 or one DRAM channel
+        walks the memory map once and is then one slice copy per write. Each
+        tile is woken once. For the wire bridge's batched host writes; see
+        ``tt_sim.bridge.device.Device.write_many``.
+        """
+        spans = {}
+        for coord, address, value in writes:
+            found = self._host_leaf(spans, coord, address, len(value))
+            if found is None:
+                self.tile_directory[coord].write(address, value)
+            else:
+                leaf, offset = found
+                leaf.write(offset, value)
+
+    def read_many(self, reads):
+        """``[read(coord, address, size) for ...]`` over ``reads`` —
+        ``(coord, address, size)`` — resolved as :meth:`write_many` resolves,
+        and returned as ``bytes``."""
+        spans = {}
+        out = []
+        for coord, address, size in reads:
+            found = self._host_leaf(spans, coord, address, size)
+            if found is None:
+                out.append(bytes(self.tile_directory[coord].read(address, size)))
+            else:
+                leaf, offset = found
+                out.append(bytes(leaf.read(offset, size)))
+        return out
+
+    def _host_leaf(self, spans, coord, address, size):
+        """``(leaf, offset)`` for a host access of ``size`` bytes at ``address``
+        of tile ``coord``, or None for the tile's own ``read`` / ``write``.
+
+        ``spans`` is the batch's cache, ``coord -> [(low, high, leaf, base)]``;
+        a tile's first appearance in it wakes the tile. Nothing is cached while
+        the trace bus is on: the direct copy publishes no ``MemEvent``.
+        """
+        known = spans.get(coord)
+        if known is None:
+            tile = self.tile_directory[coord]
+            tile.clock.wake()
+            known = spans[coord] = []
+        memory = self.tile_directory[coord].get_host_memory()
+        if memory.bus.enabled:
+            return None
+        end = address + size - 1
+        for low, high, leaf, base in known:
+            if low <= address and end <= high:
+                return leaf, address - base
+        span = resolve_plain_ram_span(memory, address)
+        if span is None or end > span[1]:
+            return None
+        known.append(span)
+        return span[2], address - span[3]
+
     def deassert_soft_reset(self, coordinate_pair=None, core_type=None):
         if coordinate_pair is None:
             for pair, value in self.tile_directory.items():
@@ -0,0 +1,121 @@
+"""Tests for the memory-mapped DRAM backing (``TT_SIM_DRAM_MMAP``).
+
+Runs standalone (``python3 -m tt_sim.memory.mapped_memory_test``) or under
+pytest.
+
+``MappedAddressableMemory`` is ``AddressableMemory`` on an ``mmap``, so the
+read/write contract is inherited rather than re-implemented; what is pinned
+here is what the mapping adds:
+
+1. A whole channel maps at construction and costs nothing until written;
+   unwritten bytes read as zeros.
+2. File-backed, the image outlives the memory: a second memory on the same
+   path starts with what the first wrote, and knows which chunks hold it.
+3. Pickled — which is what a device snapshot does — it carries only the
+   chunks that were written, and restores into a private mapping that does not
+   write back into the file.
+4. On a device, the knob swaps every DRAM channel's backing and a snapshot
+   round-trips its contents.
+"""
+
+import pickle
+
+import pytest
+
+from tt_sim.arch.blackhole import BLACKHOLE_PROFILE
+from tt_sim.memory.memory import (
+    MappedAddressableMemory,
+    MappedDRAM,
+    SparseDRAM,
+    dram_backing_from_env,
+)
+
+CHUNK = MappedAddressableMemory.CHUNK_SIZE
+
+
+def test_a_whole_channel_maps_and_reads_as_zeros():
+    mem = MappedDRAM(BLACKHOLE_PROFILE.dram_channel_size)
+    top = BLACKHOLE_PROFILE.dram_channel_size - 8
+    assert mem.read(0, 8) == bytes(8)
+    assert mem.read(top, 8) == bytes(8)
+    mem.write(top, b"\x01\x02\x03\x04\x05\x06\x07\x08")
+    assert mem.read(top, 8) == b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    assert mem.touched == {top // CHUNK}
+    with pytest.raises(IndexError):
+        mem.read(top + 4, 8)
+
+
+def test_a_write_across_chunks_touches_each():
+    mem = MappedAddressableMemory(4 * CHUNK)
+    payload = bytes(range(256)) * 4
+    mem.write(CHUNK - 512, payload)
+    assert mem.read(CHUNK - 512, len(payload)) == payload
+    assert mem.touched == {0, 1}
+    # A lend is a view from anywhere, even across the chunk boundary.
+    loan = mem.lend(CHUNK - 512, len(payload))
+    mem.land(3 * CHUNK, loan)
+    assert mem.read(3 * CHUNK, len(payload)) == payload
+    assert mem.touched == {0, 1, 3}
+
+
+def test_a_file_backed_image_is_there_for_the_next_run(tmp_path):
+    path = tmp_path / "dram.bin"
+    first = MappedDRAM(8 * CHUNK, path=path)
+    first.write(5 * CHUNK + 3, b"kept")
+    first.flush()
+    # Sparse: the file is the channel's size, but only the page written holds
+    # any blocks.
+    assert path.stat().st_size == 8 * CHUNK
+    assert path.stat().st_blocks * 512 < CHUNK
+
+    second = MappedDRAM(8 * CHUNK, path=path)
+    assert second.read(5 * CHUNK + 3, 4) == b"kept"
+    assert second.touched == {5}
+
+
+def test_pickling_carries_only_written_chunks_and_detaches_the_file(tmp_path):
+    path = tmp_path / "dram.bin"
+    mem = MappedDRAM(64 * CHUNK, path=path)
+    mem.write(7 * CHUNK, b"\xaa" * 16)
+    data = pickle.dumps(mem)
+    assert len(data) < 2 * CHUNK
+
+    restored = pickle.loads(data)
+    assert restored.path is None
+    assert restored.read(7 * CHUNK, 16) == b"\xaa" * 16
+    assert restored.touched == {7}
+    restored.write(0, b"new")
+    assert mem.read(0, 3) == bytes(3)
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, (False, None)),
+        ({"TT_SIM_DRAM_MMAP": "1"}, (True, None)),
+        ({"TT_SIM_DRAM_MMAP": "0"}, (False, None)),
+        ({"TT_SIM_DRAM_DIR": "/images"}, (True, "/images")),
+    ],
+)
+def test_the_backing_knobs(env, expected):
+    assert dram_backing_from_env(env) == expected
+
+
+def test_a_device_snapshot_keeps_mapped_dram(monkeypatch):
+    from tt_sim.device.blackhole import Blackhole
+    from tt_sim.device.snapshot import capture
+
+    monkeypatch.setenv("TT_SIM_DRAM_MMAP", "1")
+    device = Blackhole()
+    assert all(isinstance(t.ddr, MappedDRAM) for t in device.dram_tiles)
+    coord = device.dram_tiles[1].get_coord_pair()
+    device.write(coord, 0xFEFF_FC00, b"top-down")
+
+    restored = capture(device).restore()
+    assert restored.read(coord, 0xFEFF_FC00, 8) == b"top-down"
+    monkeypatch.delenv("TT_SIM_DRAM_MMAP")
+    assert isinstance(Blackhole().dram_tiles[0].ddr, SparseDRAM)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
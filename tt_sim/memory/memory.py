@@ -1,3 +1,7 @@
+import mmap
+import os
+import tempfile
+import threading
 from abc import ABC
 
 import numpy as np
@@ -225,6 +229,160 @@ def resolve_plain_ram_span(memory, addr):
     return None
 
 
+def _plain_ram_leaf(memory, addr, size):
+    """``(leaf, offset)`` for ``size`` bytes at ``addr`` of ``memory``, or None.
+
+    ``memory`` may already be a leaf (a Tensix NIU is handed its L1 directly);
+    otherwise it is resolved as :func:`resolve_plain_ram_span` does, and only
+    while its trace bus is off, because the direct access publishes no
+    ``MemEvent``. None sends the caller back to ``read`` / ``write``, which
+    also raises for an out-of-range access exactly as it always did.
+    """
+    if isinstance(memory, (AddressableMemory, SparseAddressableMemory)):
+        leaf, offset = memory, addr
+    else:
+        bus = getattr(memory, "bus", None)
+        if bus is None or bus.enabled:
+            return None
+        span = resolve_plain_ram_span(memory, addr)
+        if span is None or addr + size - 1 > span[1]:
+            return None
+        leaf, offset = span[2], addr - span[3]
+    if size <= 0 or offset < 0 or offset + size > leaf.size:
+        return None
+    return leaf, offset
+
+
+def lend_plain_ram(memory, addr, size):
+    """``memory.read(addr, size)`` as a :class:`MemoryLoan`, or None.
+
+    None when the bytes are not plain RAM reachable without side effects (see
+    :func:`_plain_ram_leaf`) or the leaf declines to lend them, in which case
+    the caller reads a copy as before.
+    """
+    found = _plain_ram_leaf(memory, addr, size)
+    if found is None:
+        return None
+    leaf, offset = found
+    return leaf.lend(offset, size)
+
+
+def land_plain_ram(memory, addr, loan):
+    """``memory.write(addr, bytes(loan))`` as one slice copy; False if it cannot
+    be done that way, and the caller writes the loan's bytes instead."""
+    found = _plain_ram_leaf(memory, addr, len(loan))
+    if found is None:
+        return False
+    leaf, offset = found
+    leaf.land(offset, loan)
+    return True
+
+
+#: Guards every loan's hand-over between the memory it was lent from and the
+#: memory it lands in. The two belong to different tiles, so under
+#: ``TT_SIM_THREADED`` a write to the source and the landing can run at once;
+#: the lock makes "copy the loan out" and "take a private copy before
+#: overwriting" mutually exclusive, which is all copy-on-write needs. Lending
+#: itself happens on the source's own tile, as every write to it does.
+_LOAN_LOCK = threading.Lock()
+
+
+class MemoryLoan:
+    """Bytes of a plain-RAM leaf lent to a NoC packet instead of copied into it.
+
+    A NoC transfer used to read its payload with ``read`` — a ``tobytes()``
+    copy — and land it with ``write``, a second copy into the destination. A
+    loan is a ``numpy`` view of the source bytes, so the landing is the only
+    copy. What it must not change is *which* bytes land: those the source held
+    when the packet was sent. So the loan is registered with the memory that
+    lent it, and any write to that memory overlapping a loan still in flight
+    first gives the loan a private copy of what it covered (:meth:`detach`) —
+    copy-on-write, paid only by the transfers that actually race a writer.
+
+    A loan lands once, and landing returns it. One whose packet is dropped
+    instead (a write to an unmodelled tile) is returned with :meth:`release`.
+    """
+
+    __slots__ = ("source", "low", "high", "view")
+
+    def __init__(self, source, low, view):
+        #: The memory the bytes are borrowed from; None once returned.
+        self.source = source
+        self.low = low
+        self.high = low + len(view)
+        self.view = view
+
+    def __len__(self):
+        return self.high - self.low
+
+    def __bytes__(self):
+        with _LOAN_LOCK:
+            return self.view.tobytes()
+
+    def __reduce__(self):
+        # For ``tt_sim.device.snapshot``: a loan in flight is restored as the
+        # private copy a write would have given it.
+        return (MemoryLoan, (None, self.low, self.view.copy()))
+
+    def detach(self):
+        """Take a private copy of the bytes, so the source may change. Called
+        with the lock held, by a write to the source that overlaps them."""
+        self.view = self.view.copy()
+        self.source._loans.discard(self)
+        self.source = None
+
+    def take(self):
+        """The bytes, as ``bytes``, and the loan returned."""
+        with _LOAN_LOCK:
+            data = self.view.tobytes()
+            self._return()
+        return data
+
+    def release(self):
+        """Return the loan without landing it."""
+        with _LOAN_LOCK:
+            self._return()
+
+    def _return(self):
+        source = self.source
+        if source is not None:
+            source._loans.discard(self)
+            self.source = None
+
+
+def _lend(leaf, low, view):
+    loan = MemoryLoan(leaf, low, view)
+    loans = leaf._loans
+    if loans.__class__ is tuple:
+        loans = leaf._loans = set()
+    loans.add(loan)
+    return loan
+
+
+def _land(loan, target):
+    """Copy ``loan`` into ``target``, a ``numpy`` slice of the same length."""
+    with _LOAN_LOCK:
+        target[:] = loan.view
+        loan._return()
+
+
+def _detach_loans(leaf, low, high):
+    """Give every loan out of ``leaf`` that overlaps ``[low, high)`` its own
+    copy, before those bytes are overwritten."""
+    with _LOAN_LOCK:
+        for loan in list(leaf._loans):
+            if loan.low < high and low < loan.high:
+                loan.detach()
+
+
+def _leaf_state(leaf):
+    # Loans in flight are packets' business, and pickle as their own copies
+    # (``MemoryLoan.__reduce__``); a restored memory starts with none out.
+    state = leaf.__dict__.copy()
+    state.pop("_loans", None)
+    return state
+
+
 class VisibleMemory(MemorySpace):
     def __init__(self, memory_map, safe=True, snoop_addresses=None):
         super().__init__(memory_map, safe, snoop_addresses)
@@ -253,6 +411,14 @@ class AddressableMemory(MemMapable):
         self.size = size
         self.alignment = alignment
 
+    #: :class:`MemoryLoan` s out of this memory and still in flight. An empty
+    #: tuple until the first is lent, so a memory nobody borrows from pays one
+    #: falsy check per write.
+    _loans = ()
+
+    def __getstate__(self):
+        return _leaf_state(self)
+
     def read(self, addr, size):
         if addr > self.size:
             raise IndexError(
@@ -285,9 +451,30 @@ class AddressableMemory(MemMapable):
                     f"Start address must be aligned to '{self.alignment}' whereas '{addr}' is not"
                 )
 
+        if self._loans:
+            _detach_loans(self, addr, addr + size)
         byte_buffer = np.frombuffer(value, dtype=np.uint8)
         self.memory[addr : addr + size] = byte_buffer[:size]
 
+    def lend(self, addr, size):
+        """The ``size`` bytes at ``addr`` as a :class:`MemoryLoan`."""
+        return _lend(self, addr, self.memory[addr : addr + size])
+
+    def land(self, addr, loan):
+        """:meth:`write` of ``loan``'s bytes, as one slice copy."""
+        size = len(loan)
+        if addr + size > self.size:
+            raise IndexError(
+                f"End address '{addr + size}' overflows memory size '{self.size}'"
+            )
+        if self.alignment is not None and addr % self.alignment != 0:
+            raise IndexError(
+                f"Start address must be aligned to '{self.alignment}' whereas '{addr}' is not"
+            )
+        if self._loans:
+            _detach_loans(self, addr, addr + size)
+        _land(loan, self.memory[addr : addr + size])
+
     def getSize(self):
         return self.size
 
@@ -305,7 +492,10 @@ class SparseAddressableMemory(MemMapable):
     4 GiB on Blackhole, times 6 / 8 channels, so a flat array per channel would
     ask for 12 / 32 GiB at device construction. The vendor reference simulator
     solves it the same way, with a lazily-faulted anonymous ``mmap`` per channel
-    (ttsim ``src/sim.cpp``); Python has no equivalent, so chunk it explicitly.
+    (ttsim ``src/sim.cpp``). This class chunks it explicitly, which works the
+    same on every host and pickles only what was written;
+    :class:`MappedAddressableMemory` is the ``mmap`` version, opt-in with
+    ``TT_SIM_DRAM_MMAP``.
     """
 
     #: 2 MiB, matching the huge page ttsim ``madvise``s its DRAM mapping to.
@@ -317,6 +507,12 @@ class SparseAddressableMemory(MemMapable):
         self.chunk_size = self.CHUNK_SIZE if chunk_size is None else chunk_size
         self.chunks: dict[int, np.ndarray] = {}
 
+    #: As :attr:`AddressableMemory._loans`.
+    _loans = ()
+
+    def __getstate__(self):
+        return _leaf_state(self)
+
     def _check_range(self, addr, size):
         if addr > self.size:
             raise IndexError(
@@ -365,7 +561,15 @@ class SparseAddressableMemory(MemMapable):
 
         if size <= 0:
             return
+        if self._loans:
+            _detach_loans(self, addr, addr + size)
         byte_buffer = np.frombuffer(value, dtype=np.uint8)[:size]
+        for chunk, offset, pos, take in self._chunks_for(addr, size):
+            chunk[offset : offset + take] = byte_buffer[pos : pos + take]
+
+    def _chunks_for(self, addr, size):
+        """``(chunk, offset, pos, take)`` for each chunk ``size`` bytes at
+        ``addr`` touch, materialising any not yet written."""
         index, offset = divmod(addr, self.chunk_size)
         pos = 0
         while pos < size:
@@ -374,15 +578,196 @@ class SparseAddressableMemory(MemMapable):
             if chunk is None:
                 chunk = np.zeros(self.chunk_size, dtype=np.uint8)
                 self.chunks[index] = chunk
-            chunk[offset : offset + take] = byte_buffer[pos : pos + take]
+            yield chunk, offset, pos, take
             pos += take
             index += 1
             offset = 0
 
+    def lend(self, addr, size):
+        """The ``size`` bytes at ``addr`` as a :class:`MemoryLoan`, or None
+        when they are not one view: they straddle a chunk, or sit in one never
+        written (whose zeros ``read`` makes up rather than stores)."""
+        index, offset = divmod(addr, self.chunk_size)
+        chunk = self.chunks.get(index)
+        if chunk is None or offset + size > self.chunk_size:
+            return None
+        return _lend(self, addr, chunk[offset : offset + size])
+
+    def land(self, addr, loan):
+        """:meth:`write` of ``loan``'s bytes, a slice copy per chunk touched."""
+        size = len(loan)
+        self._check_range(addr, size)
+        if self.alignment is not None and addr % self.alignment != 0:
+            raise IndexError(
+                f"Start address must be aligned to '{self.alignment}' whereas '{addr}' is not"
+            )
+        if self._loans:
+            _detach_loans(self, addr, addr + size)
+        parts = list(self._chunks_for(addr, size))
+        if len(parts) == 1:
+            chunk, offset, _, take = parts[0]
+            _land(loan, chunk[offset : offset + take])
+            return
+        data = loan.take()
+        byte_buffer = np.frombuffer(data, dtype=np.uint8)
+        for chunk, offset, pos, take in parts:
+            chunk[offset : offset + take] = byte_buffer[pos : pos + take]
+
     def getSize(self):
         return self.size
 
 
+def _truthy(raw, default):
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def dram_backing_from_env(env=None):
+    """``(mapped, directory)`` for the DRAM channels.
+
+    ``TT_SIM_DRAM_MMAP`` (default off) backs each channel with one
+    :class:`MappedAddressableMemory` instead of a :class:`SparseDRAM`;
+    ``TT_SIM_DRAM_DIR=<dir>`` does too, and maps each channel onto a file in
+    ``<dir>`` so the image outlives the run. ``directory`` is None without it.
+    """
+    if env is None:
+        env = os.environ
+    directory = env.get("TT_SIM_DRAM_DIR") or None
+    mapped = directory is not None or _truthy(env.get("TT_SIM_DRAM_MMAP"), False)
+    return mapped, directory
+
+
+#: Present from Python 3.13; without it a private anonymous mapping is charged
+#: against the commit limit up front, and a host with less memory than one
+#: channel refuses it (see :meth:`MappedAddressableMemory._map`).
+_MAP_NORESERVE = getattr(mmap, "MAP_NORESERVE", 0)
+
+
+class MappedAddressableMemory(AddressableMemory):
+    """An :class:`AddressableMemory` whose array is a memory mapping.
+
+    What :class:`SparseAddressableMemory` does by hand, the kernel does here:
+    the whole space is one ``mmap``, a page is only given memory the first time
+    it is written, and an untouched one reads as zeros. So ``read`` and
+    ``write`` are the flat slice operations of :class:`AddressableMemory` --
+    this class inherits them -- with no chunk arithmetic and no dict lookup,
+    and a loan can be lent from any address rather than only from inside one
+    chunk that happens to exist.
+
+    The mapping is anonymous by default, the same lazily-faulted mapping ttsim
+    gives each channel (``src/sim.cpp``). With ``path`` it is a shared mapping
+    of that file, created sparse at ``size`` if it is shorter: what the run
+    writes is in the file, and a later memory built on the same path starts
+    from it. :meth:`flush` forces it out before a copy of the file is taken.
+
+    Pickling (and so ``tt_sim.device.snapshot``) cannot take the mapping as a
+    whole -- it is the channel's full size -- so :attr:`touched` records which
+    ``CHUNK_SIZE`` chunks have ever been written, and only those are pickled.
+    That is one shift and a set insert per write; reads pay nothing. A restored
+    memory is anonymous: it must not write into the file it was captured from.
+    """
+
+    #: Granularity of :attr:`touched`. As :attr:`SparseAddressableMemory.CHUNK_SIZE`.
+    CHUNK_SIZE = 2 * 1024 * 1024
+
+    def __init__(self, size, alignment=None, path=None):
+        self.size = size
+        self.alignment = alignment
+        self.path = None if path is None else os.fspath(path)
+        #: Indices of the chunks ever written; see the class docstring.
+        self.touched: set[int] = set()
+        self._shift = self.CHUNK_SIZE.bit_length() - 1
+        self._map()
+
+    def _map(self):
+        if self.path is None:
+            try:
+                self._mmap = mmap.mmap(
+                    -1,
+                    self.size,
+                    flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | _MAP_NORESERVE,
+                )
+            except OSError:
+                # Refused by the commit limit. An unlinked sparse file maps
+                # the same way and is not charged against it.
+                with tempfile.TemporaryFile() as f:
+                    f.truncate(self.size)
+                    self._mmap = mmap.mmap(f.fileno(), self.size)
+        else:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size < self.size:
+                    os.ftruncate(fd, self.size)
+                self._mmap = mmap.mmap(fd, self.size)
+                self.touched.update(self._written_chunks(fd))
+            finally:
+                os.close(fd)
+        self.memory = np.frombuffer(self._mmap, dtype=np.uint8)
+
+    def _written_chunks(self, fd):
+        """Chunks of an existing file holding data, from its holes where the
+        filesystem reports them, otherwise every chunk."""
+        chunks = range((self.size + self.CHUNK_SIZE - 1) >> self._shift)
+        if not hasattr(os, "SEEK_DATA"):
+            return chunks
+        found = set()
+        pos = 0
+        while pos < self.size:
+            try:
+                start = os.lseek(fd, pos, os.SEEK_DATA)
+            except OSError:
+                break  # ENXIO: no data past ``pos``
+            if start >= self.size:
+                break
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), self.size)
+            found.update(range(start >> self._shift, ((end - 1) >> self._shift) + 1))
+            pos = end
+        return found
+
+    def _touch(self, addr, size):
+        if size > 0:
+            first = addr >> self._shift
+            last = (addr + size - 1) >> self._shift
+            if first == last:
+                self.touched.add(first)
+            else:
+                self.touched.update(range(first, last + 1))
+
+    def write(self, addr, value, size=None):
+        super().write(addr, value, size)
+        self._touch(addr, len(value) if size is None else size)
+
+    def land(self, addr, loan):
+        super().land(addr, loan)
+        self._touch(addr, len(loan))
+
+    def flush(self):
+        """Write a file-backed memory's dirty pages out to its file."""
+        if self.path is not None:
+            self._mmap.flush()
+
+    def __getstate__(self):
+        state = _leaf_state(self)
+        del state["memory"], state["_mmap"]
+        state["path"] = None
+        # Copies, so each pickles as its own small buffer rather than as a
+        # view of the whole mapping.
+        step = self.CHUNK_SIZE
+        state["chunks"] = {
+            i: self.memory[i * step : (i + 1) * step].copy() for i in self.touched
+        }
+        return state
+
+    def __setstate__(self, state):
+        chunks = state.pop("chunks")
+        self.__dict__.update(state)
+        self._map()
+        step = self.CHUNK_SIZE
+        for i, data in chunks.items():
+            self.memory[i * step : i * step + len(data)] = data
+
+
 class DRAM(AddressableMemory):
     def __init__(self, size):
         super().__init__(size, None)
@@ -395,6 +780,14 @@ class SparseDRAM(SparseAddressableMemory):
         super().__init__(size, None)
 
 
+class MappedDRAM(MappedAddressableMemory):
+    """A DRAM channel as one mapping (``TT_SIM_DRAM_MMAP``), optionally onto
+    a file that keeps its image."""
+
+    def __init__(self, size, path=None):
+        super().__init__(size, None, path)
+
+
 class L1(AddressableMemory):
     def __init__(self, size):
         super().__init__(size, None)
@@ -0,0 +1,121 @@
+"""Tests for memory loans, the zero-copy NoC data path (``TT_SIM_NOC_ZERO_COPY``).
+
+Runs standalone (``python3 -m tt_sim.memory.memory_loan_test``) or under
+pytest.
+
+A NoC payload in plain RAM travels as a ``MemoryLoan`` — a view of the source
+bytes — and is copied once, into the destination, when it lands. The property
+everything here pins is that this changes nothing but the copy count: the
+bytes that land are the bytes the source held when the packet left, however
+the source is written in between.
+"""
+
+import pickle
+
+import pytest
+
+from tt_sim.memory.memory import (
+    AddressableMemory,
+    MappedAddressableMemory,
+    MemoryLoan,
+    SparseAddressableMemory,
+    land_plain_ram,
+    lend_plain_ram,
+)
+from tt_sim.network.noc_link_congestion_test import (
+    _L1_DST,
+    _L1_SRC,
+    _arm_write,
+    _device,
+    _issue,
+    _tiles,
+)
+
+OLD = bytes(range(64))
+NEW = bytes(64 - i for i in range(64))
+
+
+def _memories():
+    return [
+        AddressableMemory(4096),
+        SparseAddressableMemory(4096, chunk_size=1024),
+        MappedAddressableMemory(4096),
+    ]
+
+
+@pytest.mark.parametrize("memory", _memories(), ids=["flat", "sparse", "mapped"])
+def test_a_loan_lands_the_bytes_and_is_returned(memory):
+    memory.write(0x100, OLD)
+    loan = lend_plain_ram(memory, 0x100, len(OLD))
+    assert isinstance(loan, MemoryLoan)
+    assert len(loan) == len(OLD)
+    assert loan in memory._loans
+    assert land_plain_ram(memory, 0x800, loan)
+    assert memory.read(0x800, len(OLD)) == OLD
+    assert not memory._loans
+
+
+@pytest.mark.parametrize("memory", _memories(), ids=["flat", "sparse", "mapped"])
+def test_a_write_before_landing_leaves_the_loan_its_own_copy(memory):
+    memory.write(0x100, OLD)
+    clear = lend_plain_ram(memory, 0x200 - 64, 64)
+    loan = lend_plain_ram(memory, 0x100, len(OLD))
+    memory.write(0x120, NEW[:8])
+    # Only the loan the write overlaps pays for a copy.
+    assert loan.source is None
+    assert clear.source is memory
+    memory.land(0x800, loan)
+    assert memory.read(0x800, len(OLD)) == OLD
+    assert memory.read(0x100, len(OLD)) == OLD[:0x20] + NEW[:8] + OLD[0x28:]
+
+
+def test_a_loan_landing_on_its_own_source_lands_the_old_bytes():
+    memory = AddressableMemory(4096)
+    memory.write(0x100, OLD)
+    loan = memory.lend(0x100, len(OLD))
+    memory.land(0x110, loan)
+    assert memory.read(0x110, len(OLD)) == OLD
+
+
+def test_sparse_memory_lends_only_what_is_one_stored_view():
+    memory = SparseAddressableMemory(4096, chunk_size=1024)
+    # Never written: the zeros are made up by ``read``, so there is nothing to
+    # lend, and the caller reads a copy as before.
+    assert lend_plain_ram(memory, 0x100, 64) is None
+    memory.write(1024 - 32, OLD)
+    assert lend_plain_ram(memory, 1024 - 32, 64) is None
+    # Landing, though, may straddle chunks.
+    memory.write(0x100, OLD)
+    memory.land(1024 - 16, memory.lend(0x100, len(OLD)))
+    assert memory.read(1024 - 16, len(OLD)) == OLD
+
+
+def test_loans_pickle_as_their_own_copies():
+    memory = AddressableMemory(4096)
+    memory.write(0x100, OLD)
+    loan = memory.lend(0x100, len(OLD))
+    restored_memory, restored_loan = pickle.loads(pickle.dumps((memory, loan)))
+    assert not restored_memory._loans
+    assert restored_loan.source is None
+    restored_memory.write(0x100, NEW)
+    assert bytes(restored_loan) == OLD
+
+
+@pytest.mark.parametrize("zero_copy", [True, False])
+def test_a_noc_write_lands_what_the_source_held_when_it_was_issued(zero_copy):
+    device = _device([(1, 2), (3, 2)], model=None)
+    initiator = _arm_write(device, (1, 2), (3, 2), OLD)
+    initiator.nui.zero_copy = zero_copy
+    device.run(1)
+    _issue(initiator)
+    (packet,) = _tiles(device)[(3, 2)].noc0_router.noc_new_requests_to_handle
+    assert isinstance(packet.data, MemoryLoan) == zero_copy
+    # The kernel reuses its buffer before the packet has landed.
+    device.write((1, 2), _L1_SRC, NEW)
+    device.run(5)
+    assert device.read((3, 2), _L1_DST, len(OLD)) == OLD
+    device.shutdown()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -267,19 +267,23 @@ def test_the_transaction_ids_own_slot_is_the_one_that_moves(broadcast):
     device.write(_ORIGIN, _L1_SRC, _PAYLOAD)
     nui = _nui(device)
     memory = nui.attached_memory
-    original = memory.read
     seen = []
 
-    def spy(addr, *args, **kwargs):
-        if addr == _L1_SRC:
-            seen.append([nui.nui_counters[_OUTGOING_ID_0 + i] for i in range(16)])
-        return original(addr, *args, **kwargs)
+    def spying(original):
+        def spy(addr, *args, **kwargs):
+            if addr == _L1_SRC:
+                seen.append([nui.nui_counters[_OUTGOING_ID_0 + i] for i in range(16)])
+            return original(addr, *args, **kwargs)
 
-    memory.read = spy
+        return spy
+
+    # A copy (``read``) or, with TT_SIM_NOC_ZERO_COPY, a loan (``lend``).
+    memory.read = spying(memory.read)
+    memory.lend = spying(memory.lend)
     try:
         _issue(device, trid=5, broadcast=broadcast)
     finally:
-        memory.read = original
+        del memory.read, memory.lend
     _settle(device, nui)
 
     assert seen, "the write never read its payload out of L1"
@@ -361,3 +365,31 @@ def test_an_unmarked_write_never_bumps_the_barrier_counter():
     assert _noc_status(nui, _OUTSTANDING_ID_0) == 0
     _settle(device, nui)
     assert _noc_status(nui, _OUTSTANDING_ID_0) == 0
+
+
+def test_the_hot_path_indices_are_the_counter_names():
+    """The packet path bumps counters by plain int (``_CTR``) rather than by
+    enum member; the two must name the same slots, all of them."""
+    from tt_sim.network.tt_noc import _CTR
+
+    names = NUI.NUICounters.CounterNames
+    assert {m.name: int(m) for m in names} == {
+        name: getattr(_CTR, name) for name in names.__members__
+    }
+    counters = NUI.NUICounters()
+    counters.increment((_CTR.NIU_SLV_REQ_ACCEPTED, _CTR.NIU_SLV_RD_REQ_RECEIVED))
+    counters.decrement([_CTR.NIU_SLV_RD_REQ_RECEIVED])
+    assert counters[names.NIU_SLV_REQ_ACCEPTED] == 1
+    assert counters[names.NIU_SLV_RD_REQ_RECEIVED] == 0
+
+
+def test_a_packet_is_slotted_and_a_branch_copies_every_slot():
+    packet = NUI.NoCDataRequest(
+        0x100, NUI.NoCDataRequest.DataRequestAction.WRITE, 4, (1, 1), 3, b"abcd"
+    )
+    assert not hasattr(packet, "__dict__")
+    branch = packet.branch(7)
+    for name in NUI.NoCDataRequest.__slots__:
+        expected = 7 if name == "seq" else getattr(packet, name)
+        assert getattr(branch, name) == expected, name
+    assert branch.data is packet.data
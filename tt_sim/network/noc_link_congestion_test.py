@@ -17,8 +17,8 @@ wrong rather than a detail:
 2. **The network layer now commits to a hop *order***, not just a count, since
    a link needs an identity. It is the experiment planner's order, literally
    the same function — see ``noc_congestion_plan_test``, which pins that.
-3. **A multicast claims each link once.** tt-sim models a multicast write as N
-   unicasts; claiming per destination would serialise the launch-message path
+3. **A multicast claims each link once.** tt-sim lands a multicast write as N
+   branches; claiming per destination would serialise the launch-message path
    every tt-metal program uses against itself, which is the over-charge
    ``claim_injection_port`` was given its odd signature to avoid.
 
@@ -37,10 +37,20 @@ under pytest.
 """
 
 import os
+import pickle
 from contextlib import contextmanager
 
+import pytest
+
 from tt_sim.device.blackhole import Blackhole
-from tt_sim.network.tt_noc import NUI, NocLinkRegistry, noc_route_links
+from tt_sim.network.tt_noc import (
+    NUI,
+    NoCCoordinateError,
+    NocLinkRegistry,
+    noc_hop_count,
+    noc_route_links,
+    noc_route_table,
+)
 
 _GRID_X, _GRID_Y = 17, 12
 _FLIT_BYTES = 64  # Blackhole: 512-bit flits, one per cycle per axis
@@ -273,6 +283,92 @@ def test_the_multicast_tree_is_exactly_the_union_of_its_destinations_routes():
     assert all(registry.free_cycle(link) for link in needed)
 
 
+def test_a_multicast_is_one_payload_fanned_out_at_each_branchs_own_arrival():
+    """Every branch carries the one payload the initiator read, under its own
+    issue number, and arrives exactly when a unicast of it would have: its
+    flight, plus the tail and the waits the whole tree shares."""
+    payload = bytes(range(256)) * 4
+    rectangle = [(x, y) for x in range(3, 5) for y in range(3, 5)]
+    device = _device([(1, 2), *rectangle])
+    tiles = _tiles(device)
+    initiator = _arm_write(device, (1, 2), (3, 3), payload, broadcast_to=(4, 4))
+    device.run(1)
+    now = device.clocks[0].current_cycle
+    _issue(initiator)
+
+    sender = initiator.nui
+    branches = []
+    for coord in rectangle:
+        nui = tiles[coord].noc0_router
+        ((arrival, packets),) = nui.delayed_arrivals.items()
+        (branch,) = packets
+        assert arrival - now - sender.flight_cycles_to(nui) == (
+            len(payload) // _FLIT_BYTES - 1
+        )
+        branches.append(branch)
+    assert all(b.data is branches[0].data for b in branches)
+    assert sorted(b.seq for b in branches) == sorted(sender.outstanding_noc_requests[0])
+
+    outstanding = NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
+    while sender.nui_counters[outstanding]:
+        device.run(10)
+    for coord in rectangle:
+        assert device.read(coord, _L1_DST, len(payload)) == payload
+    assert not sender.outstanding_noc_requests[0]
+    device.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# The route table: each journey walked once, for every NUI of the grid shape.
+# ---------------------------------------------------------------------------
+
+
+def test_the_route_table_answers_repeats_from_one_walk():
+    """What the NUIs ask per packet is what the two functions answer, and the
+    second asking is the first answer, not a second walk."""
+    device = _device([(1, 2), (5, 4)])
+    tiles = _tiles(device)
+    src, dst = tiles[(1, 2)].noc1_router, tiles[(5, 4)].noc1_router
+    table = src.noc_routes
+    # One table per grid shape: both NoCs, every tile, every device.
+    assert table is tiles[(5, 4)].noc0_router.noc_routes
+    assert table is noc_route_table(_GRID_X, _GRID_Y)
+    assert pickle.loads(pickle.dumps(table)) is table
+
+    links = src.route_links_to(dst)
+    cells = ((src.x_coord, src.y_coord), (dst.x_coord, dst.y_coord))
+    assert links == noc_route_links(*cells, _GRID_X, _GRID_Y)
+    assert table.route(*cells) == (noc_hop_count(*cells, _GRID_X, _GRID_Y), links)
+    assert src.route_links_to(dst) is links
+    device.shutdown()
+
+
+def test_an_off_grid_journey_raises_every_time_and_is_never_kept():
+    table = noc_route_table(_GRID_X, _GRID_Y)
+    before = len(table)
+    for _ in range(2):
+        with pytest.raises(NoCCoordinateError, match="destination coordinate"):
+            table.route((1, 2), (_GRID_X, 2))
+    assert len(table) == before
+
+
+def test_a_multicast_tree_is_built_once_per_source_and_rectangle():
+    payload = bytes(512)
+    device = _device([(1, 2)])
+    initiator = _arm_write(device, (1, 2), (3, 3), payload, broadcast_to=(6, 6))
+    device.run(1)
+    _issue(initiator)
+    table = initiator.nui.noc_routes
+    cells = tuple((x, y) for x in range(3, 7) for y in range(3, 7))
+    tree = table.multicast_tree((1, 2), cells)
+    assert tree == tuple(
+        dict.fromkeys(link for c in cells for link in table.route((1, 2), c)[1])
+    )
+    _issue(initiator)
+    assert table.multicast_tree((1, 2), cells) is tree
+    device.shutdown()
+
+
 # ---------------------------------------------------------------------------
 # The measurement: a step at the first shared link, sized like the occupancy.
 # ---------------------------------------------------------------------------
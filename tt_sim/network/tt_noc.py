@@ -1,9 +1,11 @@
+import os
 import sys
 import threading
 from enum import IntEnum
 
 from tt_sim.device.clock import Clockable
 from tt_sim.memory.mem_mapable import MemMapable
+from tt_sim.memory.memory import MemoryLoan, land_plain_ram, lend_plain_ram
 from tt_sim.network.alignment import (
     L1_CONGRUENCE,
     NoCAlignmentError,
@@ -24,6 +26,19 @@ from tt_sim.util.conversion import (
 )
 
 
+def _truthy(raw, default):
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def noc_zero_copy_enabled_from_env(env=None):
+    """``TT_SIM_NOC_ZERO_COPY`` (default off). See :meth:`NUI.payload`."""
+    if env is None:
+        env = os.environ
+    return _truthy(env.get("TT_SIM_NOC_ZERO_COPY"), False)
+
+
 class NoCOverlay(MemMapable):
     NOC_NUM_STREAMS = 64
     NOC_STREAM_REG_SPACE_SIZE = 0x1000
@@ -166,6 +181,94 @@ def noc_route_links(
     return tuple(links)
 
 
+class NocRouteTable:
+    """:func:`noc_hop_count` and :func:`noc_route_links`, each journey once.
+
+    Both functions are pure in ``(src, dst, grid_x, grid_y)``, and a NoC-bound
+    kernel asks them the same question for every packet it sends: a
+    ``vecadd_sharding`` worker streams hundreds of tiles between one pair of
+    cells, a nocbench congestion sweep thousands, and each used to re-check
+    both coords and re-walk the torus in Python. A table answers a repeat with
+    one dict lookup.
+
+    One table per grid shape (:func:`noc_route_table`), shared by every NUI on
+    both NoCs of every device of that architecture: NoC 1's routes are the
+    same formula over mirrored coords, so a ``(src, dst)`` pair means the same
+    journey whichever NoC asks. Filled lazily — the full Blackhole grid has
+    over 40 000 ordered pairs, of which a program touches a handful — and only
+    with journeys that succeeded, so an off-grid coord still raises
+    :class:`NoCCoordinateError` on every call. Entries are ``(hops, links)``;
+    the hop count *is* the route's length, which is the invariant the two
+    functions already promise each other.
+
+    A multicast crosses a tree, the first-appearance union of the routes to
+    each destination in its rectangle (see
+    ``RequestInitiator.handle_multicast_write``); :meth:`multicast_tree` keeps
+    those too, keyed by the source and the destinations' coords in order.
+    Unbounded like the route map: a tree per (source, rectangle) a program
+    actually multicasts over.
+
+    Not locked: a dict store is atomic, and two threads racing on a miss
+    compute the same tuple.
+    """
+
+    def __init__(self, grid_x, grid_y):
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        #: ``(src, dst) -> (hops, links)``.
+        self._routes = {}
+        #: ``(src, (dst, ...)) -> links``.
+        self._trees = {}
+
+    def __reduce__(self):
+        # A pickled NUI (``tt_sim.device.snapshot``) refers to the table of the
+        # process that unpickles it rather than carrying a copy of this one.
+        return noc_route_table, (self.grid_x, self.grid_y)
+
+    def __len__(self):
+        return len(self._routes)
+
+    def route(self, src, dst, *, src_role="source", dst_role="destination"):
+        """``(hops, links)`` from ``src`` to ``dst``; see :func:`noc_route_links`."""
+        entry = self._routes.get((src, dst))
+        if entry is None:
+            links = noc_route_links(
+                src,
+                dst,
+                self.grid_x,
+                self.grid_y,
+                src_role=src_role,
+                dst_role=dst_role,
+            )
+            entry = self._routes[(src, dst)] = (len(links), links)
+        return entry
+
+    def multicast_tree(self, src, dsts):
+        """The de-duplicated links from ``src`` to every coord in ``dsts``,
+        in first-appearance order. ``dsts`` must be a tuple."""
+        tree = self._trees.get((src, dsts))
+        if tree is None:
+            route = self.route
+            tree = tuple(
+                dict.fromkeys(link for dst in dsts for link in route(src, dst)[1])
+            )
+            self._trees[(src, dsts)] = tree
+        return tree
+
+
+_ROUTE_TABLES = {}
+
+
+def noc_route_table(grid_x, grid_y):
+    """The process-wide :class:`NocRouteTable` for a ``grid_x`` x ``grid_y`` NoC."""
+    table = _ROUTE_TABLES.get((grid_x, grid_y))
+    if table is None:
+        table = _ROUTE_TABLES.setdefault(
+            (grid_x, grid_y), NocRouteTable(grid_x, grid_y)
+        )
+    return table
+
+
 class NocLinkRegistry:
     """One free-cycle watermark per router-to-router link, on one NoC.
 
@@ -344,6 +447,10 @@ class AliasedEndpoint:
         self.endpoint.transmit(request, delay)
 
     def __getattr__(self, name):
+        if name == "endpoint":
+            # Not set yet: unpickling (``tt_sim.device.snapshot``) probes an
+            # empty instance for hooks before it restores the slots.
+            raise AttributeError(name)
         return getattr(self.endpoint, name)
 
     def __repr__(self):
@@ -411,6 +518,9 @@ class NullEndpoint:
                 ),
             )
         elif request.action == NUI.NoCDataRequest.DataRequestAction.WRITE:
+            if isinstance(request.data, MemoryLoan):
+                # Nothing lands here, so nothing will return the loan.
+                request.data.release()
             if request.noc_cmd_resp_marked:
                 self._respond(
                     request,
@@ -498,6 +608,25 @@ class NUI(MemMapable, Clockable):
             ATOMIC = 4
             RESPONSE_ATOMIC = 5
 
+        # Every request, response and ACK on the NoC is one of these, so a
+        # NoC-bound run makes millions: slotted, each is about a third of the
+        # size of its dict-backed form and its fields are read without a dict
+        # lookup. Nothing may hang an attribute on a packet that is not here.
+        __slots__ = (
+            "tgt_address",
+            "action",
+            "request_id",
+            "data_length_bytes",
+            "source_coord",
+            "reply_to",
+            "seq",
+            "data",
+            "noc_cmd_resp_marked",
+            "at_data",
+            "issue_cycle",
+            "arrived_at",
+        )
+
         def __init__(
             self,
             tgt_address,
@@ -557,6 +686,22 @@ class NUI(MemMapable, Clockable):
             # NIU's own coord", which is every ordinary tile.
             self.arrived_at = None
 
+        def branch(self, seq):
+            """This request again, as issue number ``seq`` — one branch of a
+            multicast (see :meth:`NUI.send_multicast`).
+
+            The header is copied, not rebuilt, and ``data`` is *shared*: every
+            branch carries the one immutable payload the initiator read. The
+            copy is what the fields the journey stamps (``issue_cycle``,
+            ``arrived_at``) and the one the answer echoes (``seq``) need to be
+            per destination.
+            """
+            branch = object.__new__(NUI.NoCDataRequest)
+            for name in NUI.NoCDataRequest.__slots__:
+                setattr(branch, name, getattr(self, name))
+            branch.seq = seq
+            return branch
+
     class RequestInitiator:
         def __init__(self, nui):
             self.target_addr_low = 0
@@ -621,13 +766,12 @@ class NUI(MemMapable, Clockable):
 
             self.nui.nui_counters.increment(
                 [
-                    NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED,
-                    NUI.NUICounters.CounterNames.NIU_MST_RD_REQ_STARTED,
+                    _CTR.NIU_MST_CMD_ACCEPTED,
+                    _CTR.NIU_MST_RD_REQ_STARTED,
                 ]
             )
             self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                + noc_packet_transaction_id,
+                _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_packet_transaction_id,
                 num_chunks,
             )
             self.cmd_ctrl = 0
@@ -666,9 +810,7 @@ class NUI(MemMapable, Clockable):
                 )
                 self.nui.send_to(destination, read_req)
 
-            self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_RD_REQ_SENT, num_chunks
-            )
+            self.nui.nui_counters.increment(_CTR.NIU_MST_RD_REQ_SENT, num_chunks)
 
             if self.nui.snoop:
                 print(
@@ -687,26 +829,23 @@ class NUI(MemMapable, Clockable):
 
             if noc_cmd_resp_marked:
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                    + noc_packet_transaction_id
+                    _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_packet_transaction_id
                 )
 
-            self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED
-            )
+            self.nui.nui_counters.increment(_CTR.NIU_MST_CMD_ACCEPTED)
 
             if noc_cmd_resp_marked:
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_STARTED,
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_SENT,
+                        _CTR.NIU_MST_NONPOSTED_WR_REQ_STARTED,
+                        _CTR.NIU_MST_NONPOSTED_WR_REQ_SENT,
                     ]
                 )
             else:
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_STARTED,
-                        NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_SENT,
+                        _CTR.NIU_MST_POSTED_WR_REQ_STARTED,
+                        _CTR.NIU_MST_POSTED_WR_REQ_SENT,
                     ]
                 )
             self.cmd_ctrl = 0
@@ -715,7 +854,7 @@ class NUI(MemMapable, Clockable):
             ret_tile_x, ret_tile_y = self.nui.noc_coord_strategy.ret_coord(self)
             destination = self.nui.resolve_destination((ret_tile_x, ret_tile_y))
 
-            data = self.nui.attached_memory.read(self.target_addr_low, self.at_len_be)
+            data = self.nui.payload(self.target_addr_low, self.at_len_be)
 
             seq = self.nui.next_request_seq()
             write_req = NUI.NoCDataRequest(
@@ -760,8 +899,7 @@ class NUI(MemMapable, Clockable):
                 # was masked because tt-sim resolves responses within the
                 # same cycle pump as the request.)
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                    + noc_packet_transaction_id,
+                    _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_packet_transaction_id,
                     num_chunks,
                 )
 
@@ -774,23 +912,16 @@ class NUI(MemMapable, Clockable):
             # slot 0 was hardcoded here while the matching decrement used the
             # real ID, so the pair did not describe the same counter.
             self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_WRITE_REQS_OUTGOING_ID_0
-                + noc_packet_transaction_id,
+                _CTR.NIU_MST_WRITE_REQS_OUTGOING_ID_0 + noc_packet_transaction_id,
                 num_chunks,
             )
 
-            self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED
-            )
+            self.nui.nui_counters.increment(_CTR.NIU_MST_CMD_ACCEPTED)
 
             if noc_cmd_resp_marked:
-                self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_STARTED
-                )
+                self.nui.nui_counters.increment(_CTR.NIU_MST_NONPOSTED_WR_REQ_STARTED)
             else:
-                self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_STARTED
-                )
+                self.nui.nui_counters.increment(_CTR.NIU_MST_POSTED_WR_REQ_STARTED)
             self.cmd_ctrl = 0
 
             # Send N write requests, one per chunk. Each carries its slice
@@ -811,9 +942,7 @@ class NUI(MemMapable, Clockable):
             )
 
             for chunk_offset, chunk_size in chunks:
-                data = self.nui.attached_memory.read(
-                    self.target_addr_low + chunk_offset, chunk_size
-                )
+                data = self.nui.payload(self.target_addr_low + chunk_offset, chunk_size)
                 seq = self.nui.next_request_seq()
                 write_req = NUI.NoCDataRequest(
                     self.ret_addr_low + chunk_offset,
@@ -835,27 +964,26 @@ class NUI(MemMapable, Clockable):
 
             if noc_cmd_resp_marked:
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_SENT,
+                    _CTR.NIU_MST_NONPOSTED_WR_REQ_SENT,
                     num_chunks,
                 )
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_DATA_WORD_SENT,
+                    _CTR.NIU_MST_NONPOSTED_WR_DATA_WORD_SENT,
                     total_size / 4,
                 )
             else:
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_SENT,
+                    _CTR.NIU_MST_POSTED_WR_REQ_SENT,
                     num_chunks,
                 )
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_DATA_WORD_SENT,
+                    _CTR.NIU_MST_POSTED_WR_DATA_WORD_SENT,
                     total_size / 4,
                 )
             # Every chunk's payload has now left L1 (we read it synchronously,
             # above), so the counter comes back down by exactly what it went up.
             self.nui.nui_counters.decrement(
-                NUI.NUICounters.CounterNames.NIU_MST_WRITE_REQS_OUTGOING_ID_0
-                + noc_packet_transaction_id,
+                _CTR.NIU_MST_WRITE_REQS_OUTGOING_ID_0 + noc_packet_transaction_id,
                 num_chunks,
             )
 
@@ -909,8 +1037,10 @@ class NUI(MemMapable, Clockable):
             (This is the bit packing of ``NOC_MULTICAST_ADDR`` in
             ``tt_metal/hw/inc/wormhole/noc/noc_parameters.h``.) On real
             silicon the NoC routes a single packet that the routers split
-            along the rectangle; tt-sim transmits one ``WRITE`` request
-            per destination. The master's ``REQS_OUTSTANDING`` counter
+            along the rectangle; tt-sim builds that one ``WRITE`` request
+            and fans it out with :meth:`NUI.send_multicast`, one branch per
+            destination, each with its own issue number and flight and all
+            sharing the one payload. The master's ``REQS_OUTSTANDING`` counter
             (and the per-trid FIFO) is bumped by ``num_dests`` so the
             kernel's ``noc_async_write_barrier`` waits for all N ACKs.
 
@@ -942,35 +1072,32 @@ class NUI(MemMapable, Clockable):
 
             if noc_cmd_resp_marked:
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                    + noc_packet_transaction_id,
+                    _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_packet_transaction_id,
                     num_dests,
                 )
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_STARTED,
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_REQ_SENT,
+                        _CTR.NIU_MST_NONPOSTED_WR_REQ_STARTED,
+                        _CTR.NIU_MST_NONPOSTED_WR_REQ_SENT,
                     ]
                 )
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_WR_DATA_WORD_SENT,
+                    _CTR.NIU_MST_NONPOSTED_WR_DATA_WORD_SENT,
                     self.at_len_be / 4,
                 )
             else:
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_STARTED,
-                        NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_REQ_SENT,
+                        _CTR.NIU_MST_POSTED_WR_REQ_STARTED,
+                        _CTR.NIU_MST_POSTED_WR_REQ_SENT,
                     ]
                 )
                 self.nui.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_POSTED_WR_DATA_WORD_SENT,
+                    _CTR.NIU_MST_POSTED_WR_DATA_WORD_SENT,
                     self.at_len_be / 4,
                 )
 
-            self.nui.nui_counters.increment(
-                NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED
-            )
+            self.nui.nui_counters.increment(_CTR.NIU_MST_CMD_ACCEPTED)
             self.cmd_ctrl = 0
 
             # A multicast write is still an L1 -> L1 write per destination, so
@@ -989,10 +1116,7 @@ class NUI(MemMapable, Clockable):
             # one and comes back down when that read completes, whatever
             # ``num_dests`` is. (It is the acknowledgements that are per
             # destination, and they are REQS_OUTSTANDING's business.)
-            outgoing = (
-                NUI.NUICounters.CounterNames.NIU_MST_WRITE_REQS_OUTGOING_ID_0
-                + noc_packet_transaction_id
-            )
+            outgoing = _CTR.NIU_MST_WRITE_REQS_OUTGOING_ID_0 + noc_packet_transaction_id
             if not noc_cmd_wr_inline:
                 self.nui.nui_counters.increment(outgoing)
             data = self.nui.attached_memory.read(self.target_addr_low, self.at_len_be)
@@ -1015,43 +1139,46 @@ class NUI(MemMapable, Clockable):
             # itself on the launch-message path every tt-metal program uses --
             # the same over-charge ``claim_injection_port`` exists to avoid,
             # one resource further along. First-appearance order is kept so the
-            # tree is walked outwards from this NIU, as the packet does.
+            # tree is walked outwards from this NIU, as the packet does. The
+            # tree for a (source, rectangle) is built once and kept
+            # (``NocRouteTable.multicast_tree``).
             endpoints = [self.nui.resolve_destination(c) for c in destinations]
             self.nui.report_multicast_gaps(
                 (x_start, y_start, x_end, y_end), destinations, endpoints
             )
-            tree = dict.fromkeys(
-                link
-                for destination in endpoints
-                for link in self.nui.route_links_to(destination)
+            tree = self.nui.multicast_links_to(endpoints)
+            link_wait = self.nui.claim_route_links(tree, payload_bytes, queued)
+
+            # One packet, one payload: ``data`` is the bytes read out of L1
+            # above, shared by every branch. It is a snapshot rather than a
+            # view of the live L1 slice on purpose -- the kernel is free to
+            # overwrite its source the moment the command is accepted, and a
+            # view would deliver whatever was there when each branch landed.
+            # (Nor is it a ``NUI.payload`` loan, which lands exactly once.)
+            write_req = NUI.NoCDataRequest(
+                self.ret_addr_low,
+                NUI.NoCDataRequest.DataRequestAction.WRITE,
+                self.at_len_be,
+                self.nui.id_pair,
+                noc_packet_transaction_id,
+                data,
+                bool(noc_cmd_resp_marked),
+                reply_to=self.nui,
             )
-            link_wait = self.nui.claim_route_links(tuple(tree), payload_bytes, queued)
-
-            for destination in endpoints:
-                seq = self.nui.next_request_seq()
-                write_req = NUI.NoCDataRequest(
-                    self.ret_addr_low,
-                    NUI.NoCDataRequest.DataRequestAction.WRITE,
-                    self.at_len_be,
-                    self.nui.id_pair,
-                    noc_packet_transaction_id,
-                    data,
-                    bool(noc_cmd_resp_marked),
-                    reply_to=self.nui,
-                    seq=seq,
-                )
-                # Each destination's ACK clears its own entry. The rectangle is
-                # the one place in the tree where one trid's requests genuinely
-                # go to many tiles at once, so it is also where their ACKs are
-                # most obviously free to come back in any order.
+            first_seq = self.nui.next_request_seq(num_dests)
+            # Each destination's ACK clears its own entry. The rectangle is
+            # the one place in the tree where one trid's requests genuinely
+            # go to many tiles at once, so it is also where their ACKs are
+            # most obviously free to come back in any order.
+            for seq in range(first_seq, first_seq + num_dests):
                 self.nui.add_outstanding_noc_request(
                     noc_packet_transaction_id,
                     (noc_cmd_wr_inline, noc_cmd_resp_marked),
                     seq,
                 )
-                self.nui.send_to(
-                    destination, write_req, queued=queued, link_wait=link_wait
-                )
+            self.nui.send_multicast(
+                endpoints, write_req, first_seq, queued=queued, link_wait=link_wait
+            )
 
             if self.nui.snoop:
                 print(
@@ -1076,18 +1203,17 @@ class NUI(MemMapable, Clockable):
             if noc_cmd_resp_marked:
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                        + noc_packet_transaction_id,
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_ATOMIC_STARTED,
-                        NUI.NUICounters.CounterNames.NIU_MST_NONPOSTED_ATOMIC_SENT,
-                        NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED,
+                        _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_packet_transaction_id,
+                        _CTR.NIU_MST_NONPOSTED_ATOMIC_STARTED,
+                        _CTR.NIU_MST_NONPOSTED_ATOMIC_SENT,
+                        _CTR.NIU_MST_CMD_ACCEPTED,
                     ]
                 )
             else:
                 self.nui.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_MST_POSTED_ATOMIC_SENT,
-                        NUI.NUICounters.CounterNames.NIU_MST_CMD_ACCEPTED,
+                        _CTR.NIU_MST_POSTED_ATOMIC_SENT,
+                        _CTR.NIU_MST_CMD_ACCEPTED,
                     ]
                 )
 
@@ -1226,19 +1352,24 @@ class NUI(MemMapable, Clockable):
         def __setitem__(self, idx, value):
             self.counters[idx] = value
 
+        # Indexed by plain ints on the hot path (``_CTR``): a list subscripted
+        # by an ``IntEnum`` member goes through ``__index__`` every time, which
+        # made a two-counter increment cost seven times the two adds.
         def increment(self, idx_to_increment, val=1):
-            if isinstance(idx_to_increment, list):
+            counters = self.counters
+            if isinstance(idx_to_increment, (list, tuple)):
                 for idx in idx_to_increment:
-                    self.counters[idx] += val
+                    counters[idx] += val
             else:
-                self.counters[idx_to_increment] += val
+                counters[idx_to_increment] += val
 
         def decrement(self, idx_to_decrement, val=1):
-            if isinstance(idx_to_decrement, list):
+            counters = self.counters
+            if isinstance(idx_to_decrement, (list, tuple)):
                 for idx in idx_to_decrement:
-                    self.counters[idx] -= val
+                    counters[idx] -= val
             else:
-                self.counters[idx_to_decrement] -= val
+                counters[idx_to_decrement] -= val
 
         def __delitem__(self, idx):
             del self.counters[idx]
@@ -1297,6 +1428,7 @@ class NUI(MemMapable, Clockable):
         self.noc_number = noc_number
         self.noc_grid_x = NUI.NOC_GRID_X if noc_grid_x is None else noc_grid_x
         self.noc_grid_y = NUI.NOC_GRID_Y if noc_grid_y is None else noc_grid_y
+        self.noc_routes = noc_route_table(self.noc_grid_x, self.noc_grid_y)
         self.noc_max_burst_size = (
             NOC_MAX_BURST_SIZE if noc_max_burst_size is None else noc_max_burst_size
         )
@@ -1375,6 +1507,9 @@ class NUI(MemMapable, Clockable):
         #: modelled tile — one line per distinct rectangle, not per packet.
         self._reported_multicast_gaps = set()
         self.attached_memory = attached_memory
+        #: Whether payloads read out of :attr:`attached_memory` travel as
+        #: loans of its bytes rather than copies; see :meth:`payload`.
+        self.zero_copy = noc_zero_copy_enabled_from_env()
         #: ``{trid: {seq: state}}`` — what this NIU saved when it issued each
         #: request that is still awaiting a response. See
         #: :meth:`take_outstanding_noc_request` for why it is keyed by ``seq``
@@ -1481,10 +1616,47 @@ class NUI(MemMapable, Clockable):
         )
         self.generate_NoC_id_logical()
 
-    def next_request_seq(self):
-        """A fresh issue number for a request this NIU is about to send."""
-        self._request_seq += 1
-        return self._request_seq
+    def payload(self, address, size):
+        """The ``size`` bytes at ``address`` of this NIU's memory, to send.
+
+        A NoC transfer's data is copied twice: out of the source with ``read``
+        and into the destination with ``write``. With ``TT_SIM_NOC_ZERO_COPY``
+        on, a payload in plain RAM is lent instead
+        (:class:`~tt_sim.memory.memory.MemoryLoan`), and :meth:`land` makes the
+        one copy straight into the destination's RAM. The bytes that land are
+        still the ones the source held now: a write to them before the packet
+        lands gives the loan its own copy first. A payload that is not plain
+        RAM, or is read while the trace bus is on, is read as a copy exactly as
+        before.
+
+        Off by default because a loan's bookkeeping costs about what copying
+        a few KiB does: it halves the bytes copied and all but removes the
+        per-packet allocation, but only pays for itself in wall-clock time on
+        packets of tens of KiB, past the burst size of most kernels' packets.
+        """
+        if self.zero_copy:
+            loan = lend_plain_ram(self.attached_memory, address, size)
+            if loan is not None:
+                return loan
+        return self.attached_memory.read(address, size)
+
+    def land(self, address, data):
+        """Write a packet's payload at ``address`` of this NIU's memory."""
+        if isinstance(data, MemoryLoan):
+            if land_plain_ram(self.attached_memory, address, data):
+                return
+            data = data.take()
+        self.attached_memory.write(address, data)
+
+    def next_request_seq(self, count=1):
+        """A fresh issue number for a request this NIU is about to send.
+
+        ``count`` reserves that many consecutive numbers and returns the
+        first — one per branch of a multicast.
+        """
+        first = self._request_seq + 1
+        self._request_seq += count
+        return first
 
     def add_outstanding_noc_request(self, request_id, tgt_addr, seq):
         # Per-trid, because tt-metal kernels (e.g. DRAM-sharded reads) issue
@@ -1589,21 +1761,19 @@ class NUI(MemMapable, Clockable):
                 )
                 self.nui_counters.increment(
                     [
-                        NUI.NUICounters.CounterNames.NIU_SLV_REQ_ACCEPTED,
-                        NUI.NUICounters.CounterNames.NIU_SLV_RD_REQ_RECEIVED,
+                        _CTR.NIU_SLV_REQ_ACCEPTED,
+                        _CTR.NIU_SLV_RD_REQ_RECEIVED,
                     ]
                 )
 
-                data = self.attached_memory.read(
+                data = self.payload(
                     noc_request.tgt_address, noc_request.data_length_bytes
                 )
 
-                self.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_SLV_RD_RESP_SENT
-                )
+                self.nui_counters.increment(_CTR.NIU_SLV_RD_RESP_SENT)
 
                 self.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_SLV_RD_DATA_WORD_SENT,
+                    _CTR.NIU_SLV_RD_DATA_WORD_SENT,
                     noc_request.data_length_bytes / 4,
                 )
 
@@ -1639,25 +1809,23 @@ class NUI(MemMapable, Clockable):
                 if noc_request.noc_cmd_resp_marked:
                     self.nui_counters.increment(
                         [
-                            NUI.NUICounters.CounterNames.NIU_SLV_NONPOSTED_WR_REQ_STARTED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_NONPOSTED_WR_DATA_WORD_RECEIVED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_NONPOSTED_WR_REQ_RECEIVED,
+                            _CTR.NIU_SLV_NONPOSTED_WR_REQ_STARTED,
+                            _CTR.NIU_SLV_NONPOSTED_WR_DATA_WORD_RECEIVED,
+                            _CTR.NIU_SLV_NONPOSTED_WR_REQ_RECEIVED,
                         ]
                     )
                 else:
                     self.nui_counters.increment(
                         [
-                            NUI.NUICounters.CounterNames.NIU_SLV_POSTED_WR_REQ_STARTED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_POSTED_WR_DATA_WORD_RECEIVED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_POSTED_WR_REQ_RECEIVED,
+                            _CTR.NIU_SLV_POSTED_WR_REQ_STARTED,
+                            _CTR.NIU_SLV_POSTED_WR_DATA_WORD_RECEIVED,
+                            _CTR.NIU_SLV_POSTED_WR_REQ_RECEIVED,
                         ]
                     )
-                self.attached_memory.write(noc_request.tgt_address, noc_request.data)
+                self.land(noc_request.tgt_address, noc_request.data)
 
                 if noc_request.noc_cmd_resp_marked:
-                    self.nui_counters.increment(
-                        NUI.NUICounters.CounterNames.NIU_SLV_WR_ACK_SENT
-                    )
+                    self.nui_counters.increment(_CTR.NIU_SLV_WR_ACK_SENT)
 
                 response = NUI.NoCDataRequest(
                     None,
@@ -1672,7 +1840,7 @@ class NUI(MemMapable, Clockable):
                 noc_request.action == NUI.NoCDataRequest.DataRequestAction.RESPONSE_READ
             ):
                 tgt_addr = self.take_outstanding_noc_request(noc_request)
-                self.attached_memory.write(tgt_addr, noc_request.data)
+                self.land(tgt_addr, noc_request.data)
 
                 if self.snoop:
                     print(
@@ -1691,18 +1859,15 @@ class NUI(MemMapable, Clockable):
                     issue_cycle=noc_request.issue_cycle,
                 )
 
-                self.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_RD_RESP_RECEIVED
-                )
+                self.nui_counters.increment(_CTR.NIU_MST_RD_RESP_RECEIVED)
                 # Each flit is 32 bytes, increment by this number
                 self.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_RD_DATA_WORD_RECEIVED,
+                    _CTR.NIU_MST_RD_DATA_WORD_RECEIVED,
                     noc_request.data_length_bytes / 4,
                 )
 
                 self.nui_counters.decrement(
-                    NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                    + noc_request.request_id
+                    _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_request.request_id
                 )
                 # NB: do NOT del self.outstanding_noc_requests[trid]. The FIFO
                 # may still hold writes / atomics queued under the same trid;
@@ -1730,15 +1895,15 @@ class NUI(MemMapable, Clockable):
                 if noc_request.noc_cmd_resp_marked:
                     self.nui_counters.increment(
                         [
-                            NUI.NUICounters.CounterNames.NIU_SLV_REQ_ACCEPTED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_NONPOSTED_ATOMIC_RECEIVED,
+                            _CTR.NIU_SLV_REQ_ACCEPTED,
+                            _CTR.NIU_SLV_NONPOSTED_ATOMIC_RECEIVED,
                         ]
                     )
                 else:
                     self.nui_counters.increment(
                         [
-                            NUI.NUICounters.CounterNames.NIU_SLV_REQ_ACCEPTED,
-                            NUI.NUICounters.CounterNames.NIU_SLV_POSTED_ATOMIC_RECEIVED,
+                            _CTR.NIU_SLV_REQ_ACCEPTED,
+                            _CTR.NIU_SLV_POSTED_ATOMIC_RECEIVED,
                         ]
                     )
 
@@ -1750,9 +1915,7 @@ class NUI(MemMapable, Clockable):
                 )
 
                 if noc_request.noc_cmd_resp_marked:
-                    self.nui_counters.increment(
-                        NUI.NUICounters.CounterNames.NIU_SLV_ATOMIC_RESP_SENT
-                    )
+                    self.nui_counters.increment(_CTR.NIU_SLV_ATOMIC_RESP_SENT)
                     response = NUI.NoCDataRequest(
                         None,
                         NUI.NoCDataRequest.DataRequestAction.RESPONSE_ATOMIC,
@@ -1782,12 +1945,9 @@ class NUI(MemMapable, Clockable):
                     txn_id=noc_request.request_id,
                     issue_cycle=noc_request.issue_cycle,
                 )
-                self.nui_counters.increment(
-                    NUI.NUICounters.CounterNames.NIU_MST_ATOMIC_RESP_RECEIVED
-                )
+                self.nui_counters.increment(_CTR.NIU_MST_ATOMIC_RESP_RECEIVED)
                 self.nui_counters.decrement(
-                    NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                    + noc_request.request_id
+                    _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_request.request_id
                 )
                 self.take_outstanding_noc_request(noc_request)
             elif noc_request.action == NUI.NoCDataRequest.DataRequestAction.ACK:
@@ -1823,12 +1983,9 @@ class NUI(MemMapable, Clockable):
                     self.take_outstanding_noc_request(noc_request)
                 )
                 if noc_cmd_resp_marked:
-                    self.nui_counters.increment(
-                        NUI.NUICounters.CounterNames.NIU_MST_WR_ACK_RECEIVED
-                    )
+                    self.nui_counters.increment(_CTR.NIU_MST_WR_ACK_RECEIVED)
                     self.nui_counters.decrement(
-                        NUI.NUICounters.CounterNames.NIU_MST_REQS_OUTSTANDING_ID_0
-                        + noc_request.request_id
+                        _CTR.NIU_MST_REQS_OUTSTANDING_ID_0 + noc_request.request_id
                     )
 
         # Now copy over the new requests to the requests to handle
@@ -1968,6 +2125,48 @@ class NUI(MemMapable, Clockable):
             ),
         )
 
+    def send_multicast(
+        self, destinations, packet, first_seq, queued=None, link_wait=None
+    ):
+        """Fan ``packet`` out to every one of ``destinations``, as one packet.
+
+        What :meth:`send_to` would do once per destination, minus the parts a
+        multicast does once: ``queued`` and ``link_wait`` are the occupancies
+        the whole tree already claimed, and the bandwidth terms depend only on
+        the payload, which every branch shares — so only the flight, read from
+        the route table, differs per destination. Branch ``i`` is ``packet.branch(first_seq + i)``:
+        its own header, its own issue number, the same payload object.
+
+        The arrival each branch is given is exactly the one :meth:`send_to`
+        would have computed for it, so nothing downstream — landing, the ACK,
+        its counters and trace events — can tell the two apart.
+        """
+        model = self.noc_latency
+        if model is None:
+            for seq, destination in enumerate(destinations, first_seq):
+                destination.transmit(packet.branch(seq))
+            return
+        if queued is None:
+            queued = self.claim_injection_port(_payload_bytes(packet))
+        if link_wait is None:
+            link_wait = self.claim_route_links(
+                self.multicast_links_to(destinations), _payload_bytes(packet), queued
+            )
+        occupancy = model.serialisation_cycles(_payload_bytes(packet))
+        for seq, destination in enumerate(destinations, first_seq):
+            flight = self.flight_cycles_to(destination)
+            if occupancy is not None:
+                # ``_bandwidth_delay``'s terms, none of which depend on where
+                # this branch is going.
+                flight = (
+                    (0 if flight is None else flight)
+                    + queued
+                    + link_wait
+                    + occupancy
+                    - 1
+                )
+            destination.transmit(packet.branch(seq), flight)
+
     def route_links_to(self, destination, *, sent_from=None):
         """The router-to-router links a packet from here to ``destination``
         crosses, in order — or ``()`` when nothing shares links.
@@ -1979,15 +2178,28 @@ class NUI(MemMapable, Clockable):
         if self.noc_link_registry is None or self.noc_latency is None:
             return ()
         try:
-            return noc_route_links(
+            return self.noc_routes.route(
                 (self.x_coord, self.y_coord) if sent_from is None else sent_from,
                 _endpoint_noc_coord(destination),
-                self.noc_grid_x,
-                self.noc_grid_y,
-            )
+            )[1]
         except NoCCoordinateError as exc:
             raise self._off_grid(exc, destination) from None
 
+    def multicast_links_to(self, destinations):
+        """The links a multicast from here to ``destinations`` crosses, once
+        each — the tree :meth:`route_links_to` would give as the union of its
+        routes — or ``()`` when nothing shares links."""
+        if self.noc_link_registry is None or self.noc_latency is None:
+            return ()
+        cells = tuple(_endpoint_noc_coord(d) for d in destinations)
+        try:
+            return self.noc_routes.multicast_tree((self.x_coord, self.y_coord), cells)
+        except NoCCoordinateError:
+            # Re-raised against the endpoint that is actually off the grid.
+            for destination in destinations:
+                self.route_links_to(destination)
+            raise
+
     def claim_route_links(self, links, payload_bytes, queued=0):
         """Hold each of ``links`` long enough to carry ``payload_bytes``.
 
@@ -2115,12 +2327,10 @@ class NUI(MemMapable, Clockable):
         if model is None:
             return None
         try:
-            hops = noc_hop_count(
+            hops = self.noc_routes.route(
                 (self.x_coord, self.y_coord) if sent_from is None else sent_from,
                 _endpoint_noc_coord(destination),
-                self.noc_grid_x,
-                self.noc_grid_y,
-            )
+            )[0]
         except NoCCoordinateError as exc:
             raise self._off_grid(exc, destination) from None
         return model.flight_cycles(hops)
@@ -2148,13 +2358,9 @@ class NUI(MemMapable, Clockable):
         if model is None:
             return None
         return model.flight_cycles(
-            noc_hop_count(
-                coord,
-                (self.x_coord, self.y_coord),
-                self.noc_grid_x,
-                self.noc_grid_y,
-                src_role="source NullEndpoint",
-            )
+            self.noc_routes.route(
+                coord, (self.x_coord, self.y_coord), src_role="source NullEndpoint"
+            )[0]
         )
 
     def send_response(self, noc_request, response):
@@ -2681,3 +2887,17 @@ class NUI(MemMapable, Clockable):
 
     def getSize(self):
         return 0xFFFF
+
+
+class _CTR:
+    """``NUI.NUICounters.CounterNames`` as plain ints, for the packet path.
+
+    Same names, same values; what differs is the lookup. The enum is three
+    attribute hops away and each member indexes the counter list through
+    ``__index__``, and the NIU bumps several counters per packet.
+    """
+
+
+for _member in NUI.NUICounters.CounterNames:
+    setattr(_CTR, _member.name, int(_member))
+del _member
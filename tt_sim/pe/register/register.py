@@ -57,6 +57,16 @@ class Register:
         """Value as a signed integer; the signed counterpart of read_uint."""
         return int.from_bytes(self.value, "little", signed=True)
 
+    def write_uint(self, value):
+        """Write an unsigned integer that already fits the register width.
+
+        The integer counterpart of ``write``, for callers that computed the
+        value as an int; on an :class:`IntRegister` it skips the ``bytes``
+        round trip altogether. Goes through ``write`` here, so access mode and
+        any tracing hook on the instance apply unchanged.
+        """
+        self.write(value.to_bytes(self.size, "little"))
+
     def write(self, value):
         if self.access_mode != RegisterAccessMode.RW:
             # Some ISA might error on this, others such as RV simply ignore it
@@ -66,3 +76,94 @@ class Register:
                 return
         assert isinstance(value, bytes)
         self.value = value if len(value) == self.size else self._fit(value, self.value)
+
+
+class IntRegister:
+    """A :class:`Register` whose value lives in its register file's int list.
+
+    Used by :class:`~tt_sim.pe.register.register_file.IntRegisterFile`: the
+    file holds every register's value as an unsigned Python ``int`` in one
+    flat list, and each of these is a view of one slot. ``read_uint`` is a
+    list index and ``write_uint`` a list store — no ``bytes`` is built, so the
+    ISA fast paths that compute in integers (``RV_ISA.predecode``, the core's
+    PC update) make no garbage per instruction. The ``bytes`` API is kept
+    exactly, for everything that still speaks it: ``read`` / ``write`` and the
+    ``value`` attribute the firmware-loop recogniser and the deadlock
+    watchdog snapshot and restore.
+
+    ``write_uint`` trusts its caller to have masked the value to the register
+    width, which is what every caller computing in integers does anyway.
+    """
+
+    def __init__(
+        self,
+        values,
+        idx,
+        size,
+        access_mode=RegisterAccessMode.RW,
+        error_on_write_to_read=True,
+    ):
+        self.values = values
+        self.idx = idx
+        self.size = size
+        self.access_mode = access_mode
+        self.error_on_write_to_read = error_on_write_to_read
+
+    @property
+    def value(self):
+        return self.values[self.idx].to_bytes(self.size, "little")
+
+    @value.setter
+    def value(self, value):
+        # A raw restore, like assigning ``Register.value``: no access check.
+        self.values[self.idx] = int.from_bytes(value, "little")
+
+    def read(self):
+        return self.values[self.idx].to_bytes(self.size, "little")
+
+    def read_uint(self):
+        return self.values[self.idx]
+
+    def read_int(self):
+        value = self.values[self.idx]
+        sign = 1 << (8 * self.size - 1)
+        return value - (sign << 1) if value & sign else value
+
+    def write_uint(self, value):
+        self.values[self.idx] = value
+
+    def write(self, value):
+        assert isinstance(value, bytes)
+        size = self.size
+        if len(value) >= size:
+            self.values[self.idx] = int.from_bytes(value[:size], "little")
+        else:
+            # Register._fit: a short write replaces the low bytes only.
+            keep = ~((1 << (8 * len(value))) - 1) & ((1 << (8 * size)) - 1)
+            self.values[self.idx] = (self.values[self.idx] & keep) | int.from_bytes(
+                value, "little"
+            )
+
+
+class ReadOnlyIntRegister(IntRegister):
+    """An :class:`IntRegister` in ``RegisterAccessMode.R`` (RV's ``x0``).
+
+    A subclass rather than a mode check in ``write`` so the read-write
+    registers' writes stay branch-free.
+    """
+
+    def __init__(self, values, idx, size, error_on_write_to_read=True):
+        super().__init__(
+            values, idx, size, RegisterAccessMode.R, error_on_write_to_read
+        )
+
+    def write_uint(self, value):
+        self._refuse()
+
+    def write(self, value):
+        self._refuse()
+
+    def _refuse(self):
+        # Same contract as Register.write on a read-only register.
+        if self.error_on_write_to_read:
+            raise Exception("Can not call set on a read only register")
@@ -1,3 +1,25 @@
+import os
+
+from tt_sim.pe.register.register import (
+    IntRegister,
+    ReadOnlyIntRegister,
+    RegisterAccessMode,
+)
+
+
+def _truthy(raw, default):
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def int_registers_enabled_from_env(env=None):
+    """``TT_SIM_INT_REGISTERS`` (default on); ``0`` keeps ``bytes`` registers."""
+    if env is None:
+        env = os.environ
+    return _truthy(env.get("TT_SIM_INT_REGISTERS"), True)
+
+
 class RegisterFile:
     #: The owning core's :class:`~tt_sim.pe.rv.isa.zicsr_isa.CSRFile`, or ``None``
     #: when it has no CSRs. Held here as well as on the core because the ISA
@@ -67,3 +89,53 @@ class RegisterFile:
             ) from None
 
     __getitem__ = get
+
+
+class IntRegisterFile(RegisterFile):
+    """A :class:`RegisterFile` whose values are one flat list of Python ints.
+
+    ``values[i]`` is register ``i``'s value, unsigned; ``registers[i]`` is an
+    :class:`~tt_sim.pe.register.register.IntRegister` view of that slot, so
+    every caller that indexes the file and talks ``Register`` — the ISA
+    handlers, the spin recogniser, the commit log, the state dump — works
+    unchanged, while a caller that computes in integers (``read_uint`` /
+    ``write_uint``) never builds a ``bytes``. The RV cores use this by
+    default; ``TT_SIM_INT_REGISTERS=0`` puts them back on ``bytes``-backed
+    :class:`~tt_sim.pe.register.register.Register` objects, as a debugging
+    switch.
+    """
+
+    def __init__(self, registers, register_name_mapping):
+        self.values = [reg.read_uint() for reg in registers]
+        views = []
+        for idx, reg in enumerate(registers):
+            if reg.access_mode == RegisterAccessMode.RW:
+                views.append(IntRegister(self.values, idx, reg.size))
+            else:
+                views.append(
+                    ReadOnlyIntRegister(
+                        self.values, idx, reg.size, reg.error_on_write_to_read
+                    )
+                )
+        super().__init__(views, register_name_mapping)
+
+    def _install_write_hook(self, reg, idx):
+        # ``write_uint`` does not go through ``write`` here, so it needs its
+        # own hook; the record is kept as ``bytes`` either way.
+        super()._install_write_hook(reg, idx)
+        original_write_uint = reg.write_uint
+
+        def wrapped_write_uint(value):
+            original_write_uint(value)
+            self.last_write_idx = idx
+            self.last_write_value = value.to_bytes(reg.size, "little")
+
+        reg.write_uint = wrapped_write_uint
+
+    def set_write_recording(self, enabled):
+        if enabled == self.write_recording:
+            return
+        super().set_write_recording(enabled)
+        if not enabled:
+            for reg in self.registers:
+                del reg.write_uint
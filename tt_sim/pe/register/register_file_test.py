@@ -0,0 +1,115 @@
+"""The int-backed register file (``IntRegisterFile``, ``TT_SIM_INT_REGISTERS``).
+
+1. Every ``Register`` operation on an ``IntRegister`` view gives the same
+   answer as on a ``bytes``-backed ``Register``: full, short and over-wide
+   writes, signed reads, the ``value`` attribute, and a read-only ``x0``.
+2. Tracing's write record sees ``write_uint`` as well as ``write``, and the
+   hooks come off again.
+3. A core runs a program to the same registers with either file.
+"""
+
+import pytest
+
+from tt_sim.pe.register.register import (
+    IntRegister,
+    Register,
+    RegisterAccessMode,
+)
+from tt_sim.pe.register.register_file import (
+    IntRegisterFile,
+    RegisterFile,
+    int_registers_enabled_from_env,
+)
+from tt_sim.pe.rv.predecode_test import _core
+from tt_sim.pe.rv.spin_test import _addi, _beq, _jal, _lw, _sw
+
+
+def _files():
+    def registers():
+        regs = [Register(4, bytes(4), RegisterAccessMode.R, False)]
+        regs += [Register(4) for _ in range(3)]
+        return regs
+
+    mapping = {"pc": 3}
+    return RegisterFile(registers(), mapping), IntRegisterFile(registers(), mapping)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [b"\x01\x02\x03\x04", b"\xff\xff\xff\xff", b"\x80", b"\x12\x34", b"\x01" * 6],
+)
+def test_views_match_bytes_registers(value):
+    plain, ints = _files()
+    for rf in (plain, ints):
+        rf[1].write(b"\xaa\xbb\xcc\xdd")
+        rf[1].write(value)
+        rf[0].write(value)
+    for idx in (0, 1):
+        assert ints[idx].read() == plain[idx].read()
+        assert ints[idx].value == plain[idx].value
+        assert ints[idx].read_uint() == plain[idx].read_uint()
+        assert ints[idx].read_int() == plain[idx].read_int()
+    assert isinstance(ints[1], IntRegister)
+    assert ints.values[1] == plain[1].read_uint()
+
+
+def test_write_uint_and_value_restore():
+    plain, ints = _files()
+    for rf in (plain, ints):
+        rf[2].write_uint(0xDEADBEEF)
+        rf[0].write_uint(7)
+        rf["pc"].value = b"\x00\x10\x00\x00"
+    for idx in range(4):
+        assert ints[idx].read() == plain[idx].read()
+    assert ints.values == [0, 0, 0xDEADBEEF, 0x1000]
+
+
+def test_read_only_error_matches():
+    strict = [Register(4, bytes(4), RegisterAccessMode.R)]
+    rf = IntRegisterFile(strict, {})
+    with pytest.raises(Exception, match="read only"):
+        rf[0].write_uint(1)
+    with pytest.raises(Exception, match="read only"):
+        rf[0].write(b"\x01\x00\x00\x00")
+
+
+def test_write_record_sees_write_uint():
+    _, ints = _files()
+    ints.set_write_recording(True)
+    ints[2].write_uint(0x1234)
+    assert ints.last_write_idx == 2
+    assert ints.last_write_value == (0x1234).to_bytes(4, "little")
+    ints.clear_write_record()
+    ints[1].write(b"\x05\x00\x00\x00")
+    assert ints.last_write_idx == 1
+    ints.set_write_recording(False)
+    ints[2].write_uint(1)
+    assert "write_uint" not in vars(ints[2])
+    assert ints.last_write_idx == -1
+
+
+def test_program_matches_bytes_register_file(monkeypatch):
+    program = [
+        _addi(10, 0, 0),
+        _addi(11, 0, 30),
+        _lw(12, 0, 0x400),
+        _addi(12, 12, -3),
+        _sw(12, 0, 0x400),
+        _addi(10, 10, 1),
+        _beq(10, 11, 8),
+        _jal(0, -20),
+        _jal(0, 0),
+    ]
+    runs = []
+    for setting in ("1", "0"):
+        monkeypatch.setenv("TT_SIM_INT_REGISTERS", setting)
+        core, mem = _core(program)
+        assert isinstance(core.register_file, IntRegisterFile) == (setting == "1")
+        for cycle in range(300):
+            core.clock_tick(cycle)
+        runs.append(
+            ([r.read() for r in core.register_file.registers], mem.memory.tobytes())
+        )
+    assert runs[0] == runs[1]
+    assert int_registers_enabled_from_env({})
+    assert not int_registers_enabled_from_env({"TT_SIM_INT_REGISTERS": "0"})
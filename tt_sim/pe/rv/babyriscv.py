@@ -14,7 +14,7 @@ from tt_sim.pe.rv.spin import (
     firmware_idle_debug_from_env,
     firmware_idle_enabled_from_env,
 )
-from tt_sim.pe.tensix.util import TensixConfigurationConstants
+from tt_sim.pe.tensix.util import TensixConfigLayout
 from tt_sim.util.bits import get_nth_bit
 from tt_sim.util.conversion import conv_to_uint32
 
@@ -152,6 +152,9 @@ class BabyRISCV(RV32IM_TT):
             if firmware_idle_enabled_from_env()
             else None
         )
+        if self._blocks is not None:
+            # Blocks step aside while the recogniser is watching; see blocks.py.
+            self._blocks.spin = self._spin
         # Bound once: the plain RV32I tick the spin state machine drives.
         self._base_tick = super().clock_tick
         # The CSR file, on the arches whose docs describe CSRs (Blackhole only).
@@ -208,17 +211,17 @@ class BabyRISCV(RV32IM_TT):
             override_key = "TRISC_RESET_PC_OVERRIDE_Reset_PC_Override_en"
             enabled_bit = self.core_type - 2
 
-        override_tensix_config_addr_offset = (
-            TensixConfigurationConstants.get_addr32(override_key) * 4
-        )
+        # Only Wormhole keeps the override in the Tensix backend config (see
+        # ``reset_pc_debug_regs``), so its layout is the one to read it with,
+        # whatever other device shares the process.
+        layout = TensixConfigLayout.for_arch(blackhole=False)
+        override_tensix_config_addr_offset = layout.get_addr32(override_key) * 4
         override_flag = conv_to_uint32(
             self.visible_memory.read(
                 TENSIX_BACKEND_CONFIG_BASE + override_tensix_config_addr_offset, 4
             )
         )
-        override_flag = TensixConfigurationConstants.parse_raw_config_value(
-            override_flag, override_key
-        )
+        override_flag = layout.parse_raw_config_value(override_flag, override_key)
         override_enabled = get_nth_bit(override_flag, enabled_bit)
 
         if override_enabled:
@@ -232,13 +235,13 @@ class BabyRISCV(RV32IM_TT):
                 pc_key = "TRISC_RESET_PC_SEC2_PC"
             else:
                 raise Exception("Unknown core type")
-            pc_val_addr_offset = TensixConfigurationConstants.get_addr32(pc_key) * 4
+            pc_val_addr_offset = layout.get_addr32(pc_key) * 4
             raw_pc = conv_to_uint32(
                 self.visible_memory.read(
                     TENSIX_BACKEND_CONFIG_BASE + pc_val_addr_offset, 4
                 )
             )
-            return TensixConfigurationConstants.parse_raw_config_value(raw_pc, pc_key)
+            return layout.parse_raw_config_value(raw_pc, pc_key)
         else:
             return self.start_address
 
@@ -315,6 +318,18 @@ class BabyRISCV(RV32IM_TT):
             return self._spin.wake_check(self, cycle_num)
         return super().next_wake_cycle(cycle_num)
 
+    def __getstate__(self):
+        # A pickled bound method is looked up again by name on restore, which
+        # would bind ``_base_tick`` to this class's ``clock_tick`` rather than
+        # RV32I's; rebind it in ``__setstate__`` instead.
+        state = super().__getstate__()
+        del state["_base_tick"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._base_tick = super().clock_tick
+
     def clock_tick(self, cycle_num):
         # These cores have a soft reset that they need to check
         is_in_reset = self._read_soft_reset() & self.soft_reset_mask != 0
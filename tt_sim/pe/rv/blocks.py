@@ -0,0 +1,314 @@
+"""Basic-block execution for the RV32 interpreter (``TT_SIM_RV_BLOCKS=1``).
+
+The decoded-instruction cache (``RV32I._predecode``) takes decode out of the
+per-instruction cost, but every instruction still pays a whole ``clock_tick``:
+the fetch, the cost-model and tracing checks, the PC and next-PC writes, and
+the pump's call into the core. On data-movement kernels that overhead is most
+of the wall clock. This module amortises it: a core finds the straight-line
+run of instructions starting at its PC, executes all of them in one tick, and
+then reports itself busy (``Clockable.busy_until``) for as many cycles as it
+retired, so the PC it reaches and the cycle it reaches it on are exactly those
+of the one-instruction-a-tick interpreter.
+
+What a block is
+---------------
+
+Everything the decoded-instruction cache can predecode, walked forward from a
+start PC through the plain-RAM span the core is fetching from:
+
+* **Body**: ``lui``, ``auipc``, OP / OP-IMM (including M), loads, stores and
+  ``fence`` — instructions that fall through to ``pc + 4``.
+* **Terminator**: a branch, ``jal`` or ``jalr``, which is included and ends
+  the block.
+* Anything else ends the block *before* it: a CSR access, ``ecall`` /
+  ``ebreak``, a ``.ttinsn`` push, an extension the cache does not predecode,
+  or the end of the fetch span. So does :data:`MAX_BLOCK_INSTRUCTIONS`.
+
+A block is only ever entered at its start and is keyed by that PC. Like the
+per-instruction cache it has no write hook: the block keeps the bytes it was
+built from and is rebuilt when one read of that span no longer matches.
+
+Memory inside a block
+---------------------
+
+Loads and stores in a block go through :class:`_BlockMemory`, which serves an
+address only when it resolves to plain RAM (``resolve_plain_ram_span``) and
+otherwise *leaves the block* before the access happens. The instructions
+already executed are retired, the PC is left on the one that touched MMIO,
+and the ordinary interpreter runs it — on this very tick when it is the
+block's first instruction, on the tick the busy window ends otherwise. A
+mailbox pop, a PC-buffer wait or a NoC register poll therefore still happens
+one instruction at a time, at the cycle it would have.
+
+What stays exact and what does not
+----------------------------------
+
+The core's own architectural state — GPRs, PC, next-PC, ``minstret`` — and
+the cycle each block boundary is reached on are identical to the
+per-instruction run. What moves is *when within the block* a plain-RAM load
+or store happens: all of them happen on the block's first cycle. A block that
+shares L1 with a concurrent writer (another core, a NoC transfer landing) can
+therefore see a value up to ``len(block) - 1`` cycles early or publish one
+that much sooner. Anything that samples the core from outside between
+boundaries — the deadlock watchdog, a debugger reading registers — sees the
+state at the end of the block for its whole window, so a loop that is one
+block looks to the watchdog like a core frozen at its first PC rather than
+one oscillating through its body. That is why this is opt-in.
+
+Declined (the tick falls back to the interpreter) while any of the following
+hold, each because it needs to see one instruction per tick:
+
+* the trace bus is enabled, the core is snooping, or its memory has snoop
+  addresses — events, disassembly and snoop prints are per instruction;
+* ``TT_SIM_COST_MODEL`` is on — the RV cost model prices each instruction as
+  it issues (``RiscvCostState.can_issue``), and a block would skip its stalls;
+* the firmware-loop recogniser (``tt_sim/pe/rv/spin.py``) is observing,
+  parked, or due to start an attempt — its proof is a tick-by-tick trajectory.
+"""
+
+import os
+
+from tt_sim.memory.memory import resolve_plain_ram_span
+from tt_sim.pe.rv.spin import SPIN_IDLE
+
+#: Longest block, in instructions. Long enough to cover a copy loop's body; a
+#: cap keeps a block's bytes comparison and its early-memory window bounded.
+MAX_BLOCK_INSTRUCTIONS = 32
+#: Opcodes that fall through to ``pc + 4``.
+_BODY_OPCODES = frozenset({0x37, 0x17, 0x13, 0x33, 0x03, 0x23, 0x0F})
+#: Opcodes that end a block and are part of it.
+_TERMINATOR_OPCODES = frozenset({0x63, 0x6F, 0x67})
+#: Refused-address memo size; see ``_BlockMemory``.
+_MAX_REFUSED = 4096
+
+
+def _truthy(raw, default):
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def rv_blocks_enabled_from_env(env=None):
+    """``TT_SIM_RV_BLOCKS`` (default off)."""
+    if env is None:
+        env = os.environ
+    return _truthy(env.get("TT_SIM_RV_BLOCKS"), False)
+
+
+class _BlockExit(Exception):
+    """Raised by :class:`_BlockMemory` before an access it will not serve."""
+
+
+class _BlockMemory:
+    """The memory a block's loads and stores see: plain RAM, and nothing else.
+
+    Each access is served straight from the leaf ``resolve_plain_ram_span``
+    names, which is what ``MemorySpace.read`` / ``write`` would reach minus
+    the MemEvent (blocks never run with the bus enabled). Anything that does
+    not resolve raises :class:`_BlockExit` before any side effect, so the
+    instruction is left wholly unexecuted for the interpreter to run.
+    """
+
+    __slots__ = ("memory", "spans", "refused")
+
+    def __init__(self, memory):
+        self.memory = memory
+        #: ``(low, high, leaf, base)`` spans resolved so far; a core touches
+        #: a handful (its L1, its local data RAM).
+        self.spans = []
+        #: Addresses known not to resolve, so an MMIO poll at the start of a
+        #: block costs a set lookup rather than a memory-map walk every tick.
+        self.refused = set()
+
+    def _span(self, addr, size):
+        for span in self.spans:
+            if span[0] <= addr and addr + size - 1 <= span[1]:
+                return span
+        if addr in self.refused:
+            raise _BlockExit
+        span = resolve_plain_ram_span(self.memory, addr)
+        if span is None or addr + size - 1 > span[1]:
+            if len(self.refused) >= _MAX_REFUSED:
+                self.refused.clear()
+            self.refused.add(addr)
+            raise _BlockExit
+        self.spans.append(span)
+        return span
+
+    def read(self, addr, size):
+        span = self._span(addr, size)
+        return span[2].read(addr - span[3], size)
+
+    def write(self, addr, value, size=None):
+        if size is None:
+            size = len(value)
+        span = self._span(addr, size)
+        return span[2].write(addr - span[3], value, size)
+
+
+class BasicBlock:
+    """One straight-line run of predecoded instructions starting at ``start``."""
+
+    __slots__ = ("start", "length", "code", "run", "terminator_pc", "next_pc")
+
+    def __init__(self, start, code, body, terminator, nextpc):
+        self.start = start
+        self.length = len(body) + (terminator is not None)
+        #: The instruction bytes the block was built from.
+        self.code = code
+        #: Where the core continues when the block has no terminator.
+        self.next_pc = start + 4 * self.length
+        self.terminator_pc = start + 4 * len(body) if terminator is not None else None
+        self.run = _make_block_fn(body, terminator, nextpc, self.terminator_pc)
+
+
+def _make_block_fn(body, terminator, nextpc, terminator_pc):
+    """The block as one closure: ``run(memory) -> instructions retired``.
+
+    Body instructions neither read nor write the PC registers — the PC-relative
+    ones had the PC folded in when they were predecoded — so only the
+    terminator needs next-PC set up first, exactly as ``clock_tick`` does.
+    A ``_BlockExit`` part-way leaves the count of what did retire.
+    """
+    body = tuple(body)
+    if terminator is None:
+
+        def run(memory):
+            retired = 0
+            try:
+                for op in body:
+                    op(memory)
+                    retired += 1
+            except _BlockExit:
+                pass
+            return retired
+
+        return run
+
+    link = terminator_pc + 4
+    length = len(body) + 1
+
+    def run(memory):
+        retired = 0
+        try:
+            for op in body:
+                op(memory)
+                retired += 1
+        except _BlockExit:
+            return retired
+        nextpc.write_uint(link)
+        terminator(memory)
+        return length
+
+    return run
+
+
+class BlockRunner:
+    """A core's block cache and the per-tick entry point. Owned by ``RV32I``."""
+
+    __slots__ = ("blocks", "memory", "spin", "blocks_run", "instructions")
+
+    def __init__(self, core):
+        #: Start PC -> :class:`BasicBlock`, or ``None`` for a PC where no block
+        #: of two or more instructions starts.
+        self.blocks = {}
+        self.memory = _BlockMemory(core.visible_memory)
+        #: The core's :class:`~tt_sim.pe.rv.spin.FirmwareSpin`, when it has
+        #: one; set by ``BabyRISCV``.
+        self.spin = None
+        #: Diagnostics: blocks executed and the instructions they retired.
+        self.blocks_run = 0
+        self.instructions = 0
+
+    def __getstate__(self):
+        # For ``tt_sim.device.snapshot``: blocks are compiled closures. They
+        # are rebuilt from memory on demand, so a restored runner starts empty.
+        return {name: getattr(self, name) for name in self.__slots__} | {"blocks": {}}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def tick(self, core, cycle_num):
+        """True when this tick executed a block; False hands it to the
+        one-instruction interpreter. ``clock_tick`` has already returned for
+        the ticks inside a previous block's busy window."""
+        core.busy_until = None
+        if (
+            core.snoop
+            or core.bus.enabled
+            or core.rv_cost is not None
+            or core._exec_memory is not core.visible_memory
+            or core.visible_memory.snoop_addresses
+        ):
+            return False
+        spin = self.spin
+        if spin is not None and (
+            spin.state != SPIN_IDLE or cycle_num >= spin.next_attempt
+        ):
+            return False
+        pc_val = core.pc_register.read_uint()
+        src = core._fetch_src
+        if src is None or not src[0] <= pc_val <= src[1]:
+            # Let the interpreter's fetch resolve the span first.
+            return False
+        leaf = src[2]
+        blocks = self.blocks
+        block = blocks.get(pc_val, False)
+        if block is False:
+            block = blocks[pc_val] = self._build(core, pc_val, src)
+        elif block is not None and (
+            leaf.read(pc_val - src[3], 4 * block.length) != block.code
+        ):
+            block = blocks[pc_val] = self._build(core, pc_val, src)
+        if block is None:
+            return False
+        memory = core.visible_memory
+        memory.caller_context = (core.unit_id, core.core_label, pc_val)
+        retired = block.run(self.memory)
+        if retired == 0:
+            return False
+        if retired == block.length:
+            if block.terminator_pc is None:
+                core.nextpc_register.write_uint(block.next_pc)
+            core.pc_register.write_uint(core.nextpc_register.read_uint())
+        else:
+            resume = pc_val + 4 * retired
+            core.nextpc_register.write_uint(resume)
+            core.pc_register.write_uint(resume)
+        csrs = core.csrs
+        if csrs is not None:
+            csrs.retired += retired
+        self.blocks_run += 1
+        self.instructions += retired
+        core.busy_until = cycle_num + retired
+        return True
+
+    def _build(self, core, start, src):
+        """Discover the block at ``start``; ``None`` if it would be shorter
+        than two instructions (nothing to amortise)."""
+        low, last, leaf, base = src
+        body = []
+        terminator = None
+        pc = start
+        while pc <= last and len(body) < MAX_BLOCK_INSTRUCTIONS:
+            instr = int.from_bytes(leaf.read(pc - base, 4), "little")
+            entry = core._decoded.get(pc)
+            if entry is None or entry[0] != instr:
+                entry = core._predecode(pc, instr)
+            op = entry[1]
+            opcode = instr & 0x7F
+            if op is None:
+                break
+            if opcode in _TERMINATOR_OPCODES:
+                terminator = op
+                break
+            if opcode not in _BODY_OPCODES:
+                break
+            body.append(op)
+            pc += 4
+        length = len(body) + (terminator is not None)
+        if length < 2:
+            return None
+        code = leaf.read(start - base, 4 * length)
+        return BasicBlock(start, code, body, terminator, core.nextpc_register)
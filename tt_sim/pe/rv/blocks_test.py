@@ -0,0 +1,166 @@
+"""Basic-block execution (``tt_sim/pe/rv/blocks.py``, ``TT_SIM_RV_BLOCKS``).
+
+Runs standalone (``python3 -m tt_sim.pe.rv.blocks_test``) or under pytest.
+
+1. At every block boundary the core's registers equal the one-instruction-a-
+   tick run's at the same cycle, and the final memory is the same.
+2. A load from outside plain RAM leaves the block before the access; the
+   interpreter performs it on the cycle it would have anyway.
+3. A store over a block's code rebuilds the block.
+4. The knob is off by default (pytest only).
+"""
+
+from tt_sim.memory.mem_mapable import MemMapable
+from tt_sim.memory.memory import DRAM, VisibleMemory
+from tt_sim.memory.memory_map import AddressRange, MemoryMap
+from tt_sim.pe.rv.blocks import BlockRunner, rv_blocks_enabled_from_env
+from tt_sim.pe.rv.rv32 import RV32IM
+from tt_sim.pe.rv.spin_test import _addi, _beq, _jal, _lw, _sw
+from tt_sim.util.conversion import conv_to_bytes
+
+MEM_SIZE = 0x10000
+#: Where :class:`_Counter` is mapped: past the DRAM, and not plain RAM.
+MMIO = MEM_SIZE + 0x100
+
+
+class _Counter(MemMapable):
+    """An MMIO register whose every read returns the next integer, so a read
+    that happens twice, or on the wrong cycle, shows up in the result."""
+
+    def __init__(self):
+        self.reads = []
+        self.cycle = None
+
+    def getSize(self):
+        return 4
+
+    def read(self, addr, size):
+        self.reads.append(self.cycle)
+        return len(self.reads).to_bytes(4, "little")
+
+    def write(self, addr, value, size=None):
+        pass
+
+
+LOOP = [
+    _addi(10, 0, 0),  # 0x00: i = 0
+    _addi(11, 0, 40),  # 0x04: n = 40
+    _lw(12, 0, 0x400),  # 0x08: acc = mem[0x400]
+    _addi(12, 12, 3),  # 0x0c
+    _sw(12, 0, 0x400),  # 0x10: mem[0x400] = acc
+    _addi(10, 10, 1),  # 0x14
+    _beq(10, 11, 8),  # 0x18: done -> 0x20
+    _jal(0, -20),  # 0x1c: -> 0x08
+    _jal(0, 0),  # 0x20: j .
+]
+
+
+def _core(program, blocks, mmio=None):
+    mem = DRAM(MEM_SIZE)
+    for i, word in enumerate(program):
+        mem.write(i * 4, conv_to_bytes(word))
+    memory_map = MemoryMap()
+    memory_map[AddressRange(0, MEM_SIZE)] = mem
+    if mmio is not None:
+        memory_map[AddressRange(MMIO, mmio.getSize())] = mmio
+    core = RV32IM(0, [VisibleMemory(memory_map)])
+    if blocks:
+        core._blocks = BlockRunner(core)
+    core.start()
+    return core, mem
+
+
+def _regs(core):
+    return [r.read_uint() for r in core.register_file.registers[:34]]
+
+
+def _lockstep(program, cycles, mmios=(None, None)):
+    """Run both modes side by side; compare wherever the block core is at a
+    block boundary. Returns the two cores and memories."""
+    block_core, block_mem = _core(program, blocks=True, mmio=mmios[0])
+    plain_core, plain_mem = _core(program, blocks=False, mmio=mmios[1])
+    boundaries = 0
+    for cycle in range(cycles):
+        for mmio in mmios:
+            if mmio is not None:
+                mmio.cycle = cycle
+        block_core.clock_tick(cycle)
+        plain_core.clock_tick(cycle)
+        busy = block_core.busy_until
+        if busy is None or busy <= cycle + 1:
+            assert _regs(block_core) == _regs(plain_core), cycle
+            boundaries += 1
+    return block_core, block_mem, plain_core, plain_mem, boundaries
+
+
+def test_block_boundaries_match_single_step():
+    block_core, block_mem, plain_core, plain_mem, boundaries = _lockstep(LOOP, 400)
+    assert block_mem.memory.tobytes() == plain_mem.memory.tobytes()
+    assert int.from_bytes(block_mem.read(0x400, 4), "little") == 120
+    runner = block_core._blocks
+    # The loop body ran as blocks, and far fewer boundaries were visited than
+    # cycles ticked.
+    assert runner.blocks_run > 0
+    assert runner.instructions > runner.blocks_run
+    assert boundaries < 400
+
+
+def test_mmio_load_leaves_the_block():
+    program = [
+        _addi(10, 0, 5),  # 0x00
+        _addi(11, 0, 7),  # 0x04
+        _lui(13, MMIO),  # 0x08: a3 = MMIO & ~0xfff
+        _lw(12, 13, MMIO & 0xFFF),  # 0x0c: not plain RAM
+        _addi(12, 12, 1),  # 0x10
+        _sw(12, 0, 0x400),  # 0x14
+        _jal(0, 0),  # 0x18: j .
+    ]
+    mmios = (_Counter(), _Counter())
+    block_core, block_mem, plain_core, plain_mem, _ = _lockstep(program, 20, mmios)
+    assert _regs(block_core) == _regs(plain_core)
+    assert block_mem.memory.tobytes() == plain_mem.memory.tobytes()
+    # Read once, on the same cycle as the one-instruction run.
+    assert mmios[0].reads == mmios[1].reads == [3]
+    # The first tick resolves the fetch span through the interpreter. The
+    # block at 0x04 covers the load but retired only the two instructions
+    # before it; the one at the load retired none, so the interpreter ran it.
+    assert block_core._blocks.blocks[0x4].length == 6
+    assert block_core._blocks.blocks[0xC].length == 4
+    assert block_core._blocks.instructions < 20
+
+
+def _lui(rd, value):
+    return (value & ~0xFFF) | (rd << 7) | 0x37
+
+
+def test_store_over_block_rebuilds_it():
+    replacement = _addi(10, 10, 100)
+    program = [
+        _addi(10, 10, 1),  # 0x00
+        _sw(11, 0, 0x0),  # 0x04: overwrite 0x00
+        _jal(0, -8),  # 0x08
+    ]
+    core, _ = _core(program, blocks=True)
+    core.register_file[11].write(conv_to_bytes(replacement))
+    for cycle in range(3):
+        core.clock_tick(cycle)
+    assert core.register_file[10].read_uint() == 1
+    for cycle in range(3, 6):
+        core.clock_tick(cycle)
+    assert core.register_file[10].read_uint() == 101
+
+
+def test_knob_defaults_off(monkeypatch):
+    assert not rv_blocks_enabled_from_env({})
+    assert rv_blocks_enabled_from_env({"TT_SIM_RV_BLOCKS": "1"})
+    monkeypatch.delenv("TT_SIM_RV_BLOCKS", raising=False)
+    assert _core(LOOP, blocks=False)[0]._blocks is None
+    monkeypatch.setenv("TT_SIM_RV_BLOCKS", "1")
+    assert _core(LOOP, blocks=False)[0]._blocks is not None
+
+
+if __name__ == "__main__":
+    test_block_boundaries_match_single_step()
+    test_mmio_load_leaves_the_block()
+    test_store_over_block_rebuilds_it()
+    print("ok")
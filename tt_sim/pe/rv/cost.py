@@ -573,6 +573,20 @@ class RiscvCostState:
         self.pending_stall = 0
         return n, STALL_REASON_NAMES[self._stall_reason]
 
+    def stall_reason_at(self, cycle_num):
+        """The reason this core is held at ``cycle_num``, or ``""`` if it was
+        free to issue.
+
+        Read from outside the core by the sampling profiler
+        (``tt_sim.trace.sampling``) after the cycle has been ticked. It is the
+        test :meth:`can_issue` opens with, repeated without its side effects;
+        the one cycle it misreads is the issue cycle of a blocking divide,
+        which arms ``_stall_until`` for the cycles after it.
+        """
+        if cycle_num < self._stall_until:
+            return STALL_REASON_NAMES[self._stall_reason]
+        return ""
+
     def summary(self):
         """A plain dict of what this core was charged, for the §I reports."""
         return {
@@ -56,6 +56,289 @@ _IMMEDIATE_DECODERS = {
 }
 
 
+# Predecoded forms for the core's decoded-instruction cache (``RV_ISA.predecode``,
+# ``RV32I._predecode``). Each ``_predecode_*`` pulls the fields out of the word
+# once and returns a closure over the operand registers, so a cache hit costs the
+# closure call and the register traffic and nothing else. Results computed as
+# ints go in with ``write_uint``, which on the RV cores' int-backed register file
+# (``IntRegisterFile``) is a list store. The register *objects* are captured,
+# never their bound ``write`` / ``write_uint``: tracing installs its write hooks
+# on the instance (``RegisterFile.set_write_recording``), and a captured bound
+# method would miss them. Register writes happen in the same order as in the
+# ``handle_*`` methods, so the traced last-write is unchanged too.
+_MASK32 = 0xFFFFFFFF
+_PE_STALL = ProcessingElement.PEStall
+
+
+def _s32(value):
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _sra(value, shift):
+    shifted = value >> shift
+    if value & 0x80000000:
+        return (shifted | (0xFFFFFFFF << (32 - shift))) & _MASK32
+    return shifted
+
+
+# funct3 -> the 32-bit ALU operation shared by the OP and OP-IMM forms, over
+# unsigned operands. The immediate forms pass the immediate in its unsigned
+# 32-bit spelling (see ``handle_i_arith`` for why), and the shifts a shamt that
+# is already five bits wide.
+_ALU = {
+    0x0: lambda a, b: (a + b) & _MASK32,
+    0x1: lambda a, b: (a << (b & 0x1F)) & _MASK32,
+    0x2: lambda a, b: 1 if _s32(a) < _s32(b) else 0,
+    0x3: lambda a, b: 1 if a < b else 0,
+    0x4: lambda a, b: a ^ b,
+    0x5: lambda a, b: a >> (b & 0x1F),
+    0x6: lambda a, b: a | b,
+    0x7: lambda a, b: a & b,
+}
+# The two funct7 == 0x20 alternates: sub and sra.
+_ALU_ALT = {
+    0x0: lambda a, b: (a - b) & _MASK32,
+    0x5: lambda a, b: _sra(a, b & 0x1F),
+}
+
+
+def _fence(memory_space):
+    return True
+
+
+def _alu_imm(rd_reg, rs1_reg, fn, operand):
+    def op(memory_space):
+        rd_reg.write_uint(fn(rs1_reg.read_uint(), operand))
+        return True
+
+    return op
+
+
+def _alu_reg(rd_reg, rs1_reg, rs2_reg, fn):
+    def op(memory_space):
+        rd_reg.write_uint(fn(rs1_reg.read_uint(), rs2_reg.read_uint()))
+        return True
+
+    return op
+
+
+def _predecode_u(instr, register_file, pc):
+    value = _imm_u(instr)
+    if instr & 0x7F == 0x17:
+        value += pc
+    if value > _MASK32:
+        # handle_u_auipc raises converting this; leave it to do so.
+        return None
+    rd_reg = register_file[(instr >> 7) & 0x1F]
+
+    def op(memory_space):
+        rd_reg.write_uint(value)
+        return True
+
+    return op
+
+
+def _predecode_jal(instr, register_file, pc):
+    rd = (instr >> 7) & 0x1F
+    target = pc + _imm_j(instr)
+    if not 0 <= target <= _MASK32 or (rd > 0 and pc + 4 > _MASK32):
+        return None
+    nextpc = register_file["nextpc"]
+    if rd == 0:
+
+        def op(memory_space):
+            nextpc.write_uint(target)
+            return True
+
+        return op
+    rd_reg = register_file[rd]
+    link = pc + 4
+
+    def op(memory_space):
+        rd_reg.write_uint(link)
+        nextpc.write_uint(target)
+        return True
+
+    return op
+
+
+def _predecode_jalr(instr, register_file, pc):
+    rd = (instr >> 7) & 0x1F
+    if rd > 0 and pc + 4 > _MASK32:
+        return None
+    rd_reg = register_file[rd] if rd > 0 else None
+    link = pc + 4
+    rs1_reg = register_file[(instr >> 15) & 0x1F]
+    offset = _imm_i(instr)
+    nextpc = register_file["nextpc"]
+
+    def op(memory_space):
+        # The link is written before rs1 is read, exactly as handle_i_jalr
+        # does, so ``jalr ra, 0(ra)`` jumps through the new value.
+        if rd_reg is not None:
+            rd_reg.write_uint(link)
+        nextpc.write(conv_to_bytes((rs1_reg.read_uint() + offset) & ~1))
+        return True
+
+    return op
+
+
+def _predecode_branch(instr, register_file, pc):
+    funct3 = (instr >> 12) & 0x7
+    if funct3 in (0x2, 0x3):
+        return False
+    target = pc + _imm_b(instr)
+    if not 0 <= target <= _MASK32:
+        return None
+    nextpc = register_file["nextpc"]
+    rs1_reg = register_file[(instr >> 15) & 0x1F]
+    rs2_reg = register_file[(instr >> 20) & 0x1F]
+    if funct3 == 0x0:
+
+        def op(memory_space):
+            if rs1_reg.read_uint() == rs2_reg.read_uint():
+                nextpc.write_uint(target)
+            return True
+
+    elif funct3 == 0x1:
+
+        def op(memory_space):
+            if rs1_reg.read_uint() != rs2_reg.read_uint():
+                nextpc.write_uint(target)
+            return True
+
+    elif funct3 == 0x4:
+
+        def op(memory_space):
+            if rs1_reg.read_int() < rs2_reg.read_int():
+                nextpc.write_uint(target)
+            return True
+
+    elif funct3 == 0x5:
+
+        def op(memory_space):
+            if rs1_reg.read_int() >= rs2_reg.read_int():
+                nextpc.write_uint(target)
+            return True
+
+    elif funct3 == 0x6:
+
+        def op(memory_space):
+            if rs1_reg.read_uint() < rs2_reg.read_uint():
+                nextpc.write_uint(target)
+            return True
+
+    else:
+
+        def op(memory_space):
+            if rs1_reg.read_uint() >= rs2_reg.read_uint():
+                nextpc.write_uint(target)
+            return True
+
+    return op
+
+
+# Sub-word load funct3 -> (width, signed).
+_SUBWORD_LOADS = {0x0: (1, True), 0x4: (1, False), 0x1: (2, True), 0x5: (2, False)}
+
+
+def _predecode_load(instr, register_file):
+    funct3 = (instr >> 12) & 0x7
+    rs1_reg = register_file[(instr >> 15) & 0x1F]
+    rd_reg = register_file[(instr >> 7) & 0x1F]
+    offset = _imm_i(instr)
+    if funct3 == 0x2:
+
+        def op(memory_space):
+            result = memory_space.read(rs1_reg.read_uint() + offset, 4)
+            if result == MemoryStall:
+                return _PE_STALL
+            rd_reg.write(result)
+            return True
+
+        return op
+    if funct3 not in _SUBWORD_LOADS:
+        # handle_i_load has no answer for these either; let it fail as it does.
+        return None
+    width, signed = _SUBWORD_LOADS[funct3]
+
+    def op(memory_space):
+        raw = memory_space.read(rs1_reg.read_uint() + offset, width)
+        if raw == MemoryStall:
+            return _PE_STALL
+        # Only the low ``width`` bytes count, however wide the component's
+        # answer: that is what sign_extend / zero_extend reduce it to.
+        value = int.from_bytes(raw[:width], "little", signed=signed)
+        rd_reg.write(value.to_bytes(4, "little", signed=signed))
+        return True
+
+    return op
+
+
+def _predecode_store(instr, register_file):
+    funct3 = (instr >> 12) & 0x7
+    if funct3 > 0x2:
+        return False
+    width = 1 << funct3
+    rs1_reg = register_file[(instr >> 15) & 0x1F]
+    rs2_reg = register_file[(instr >> 20) & 0x1F]
+    offset = _imm_s(instr)
+
+    if width == 4:
+
+        def op(memory_space):
+            if (
+                memory_space.write(rs1_reg.read_uint() + offset, rs2_reg.read())
+                == MemoryStall
+            ):
+                return _PE_STALL
+            return True
+
+    else:
+
+        def op(memory_space):
+            value = rs2_reg.read()[:width]
+            if memory_space.write(rs1_reg.read_uint() + offset, value) == MemoryStall:
+                return _PE_STALL
+            return True
+
+    return op
+
+
+def _predecode_i_arith(instr, register_file):
+    funct3 = (instr >> 12) & 0x7
+    rs1_reg = register_file[(instr >> 15) & 0x1F]
+    rd_reg = register_file[(instr >> 7) & 0x1F]
+    if funct3 == 0x1 or funct3 == 0x5:
+        # Same split as handle_i_arith: any other high field is Zbb's.
+        high = (instr >> 25) & 0x7F
+        if high == 0x00:
+            fn = _ALU[funct3]
+        elif high == 0x20 and funct3 == 0x5:
+            fn = _ALU_ALT[funct3]
+        else:
+            return False
+        return _alu_imm(rd_reg, rs1_reg, fn, (instr >> 20) & 0x1F)
+    return _alu_imm(rd_reg, rs1_reg, _ALU[funct3], _imm_i(instr) & _MASK32)
+
+
+def _predecode_r_arith(instr, register_file):
+    funct3 = (instr >> 12) & 0x7
+    funct7 = (instr >> 25) & 0x7F
+    if funct7 == 0x00:
+        fn = _ALU[funct3]
+    elif funct7 == 0x20 and funct3 in _ALU_ALT:
+        fn = _ALU_ALT[funct3]
+    else:
+        return False
+    return _alu_reg(
+        register_file[(instr >> 7) & 0x1F],
+        register_file[(instr >> 15) & 0x1F],
+        register_file[(instr >> 20) & 0x1F],
+        fn,
+    )
+
+
 class RV_I_ISA(RV_ISA):
     @classmethod
     def run(cls, register_file, memory_space, snoop, instr=None):
@@ -102,6 +385,44 @@ class RV_I_ISA(RV_ISA):
             case _:
                 return False
 
+    @classmethod
+    def predecode(cls, instr, register_file, pc):
+        """See ``RV_ISA.predecode``. Each ``_predecode_*`` below is the
+        ``handle_*`` of the same name with the field extraction hoisted out of
+        the returned closure; the snoop disassembly is left to ``run``, since a
+        snooping core never consults the cache."""
+        match instr & 0x7F:
+            case 0x37 | 0x17:
+                return _predecode_u(instr, register_file, pc)
+            case 0x6F:
+                return _predecode_jal(instr, register_file, pc)
+            case 0x67:
+                return _predecode_jalr(instr, register_file, pc)
+            case 0x63:
+                return _predecode_branch(instr, register_file, pc)
+            case 0x3:
+                return _predecode_load(instr, register_file)
+            case 0x23:
+                return _predecode_store(instr, register_file)
+            case 0x13:
+                return _predecode_i_arith(instr, register_file)
+            case 0x33:
+                return _predecode_r_arith(instr, register_file)
+            case 0x0F:
+                return _fence
+            case 0x73:
+                # ecall/ebreak consult the breakpoint switch at run time, and
+                # the Zicsr refusal depends on the CSR file; only the plain
+                # decline is certain here.
+                funct3 = (instr >> 12) & 0x7
+                if funct3 != 0x0 and (
+                    funct3 == 0x4 or getattr(register_file, "csrs", None) is not None
+                ):
+                    return False
+                return None
+            case _:
+                return False
+
     @classmethod
     def handle_u_lui(cls, instr, register_file, memory_space, snoop):
         rd = (instr >> 7) & 0x1F
@@ -1,8 +1,41 @@
 from tt_sim.pe.rv.isa.rv_isa import RV_ISA
 from tt_sim.util.conversion import conv_to_bytes
 
+# funct3 -> (rs1 signed, rs2 signed, result signed, operation): the table form of
+# ``RV_M_ISA.run``'s match, for ``predecode``. The operations are spelled exactly
+# as ``run`` spells them, division by Python float and all, so a predecoded
+# instruction cannot disagree with an interpreted one.
+_M_OPS = {
+    0x0: (False, False, False, lambda a, b: (a * b) % (1 << 32)),
+    0x1: (True, True, True, lambda a, b: (a * b) >> 32),
+    0x2: (True, False, True, lambda a, b: (a * b) >> 32),
+    0x3: (False, False, False, lambda a, b: (a * b) >> 32),
+    0x4: (True, True, True, lambda a, b: int(a / b)),
+    0x5: (False, False, False, lambda a, b: int(a / b)),
+    0x6: (True, True, True, lambda a, b: a % b),
+    0x7: (False, False, False, lambda a, b: a % b),
+}
+
 
 class RV_M_ISA(RV_ISA):
+    @classmethod
+    def predecode(cls, instr, register_file, pc):
+        """See ``RV_ISA.predecode``."""
+        if instr & 0x7F != 0x33 or not (instr >> 25) & 0x1:
+            return False
+        signed_a, signed_b, signed, fn = _M_OPS[(instr >> 12) & 0x7]
+        rs1_reg = register_file[(instr >> 15) & 0x1F]
+        rs2_reg = register_file[(instr >> 20) & 0x1F]
+        rd_reg = register_file[(instr >> 7) & 0x1F]
+
+        def op(memory_space):
+            a = rs1_reg.read_int() if signed_a else rs1_reg.read_uint()
+            b = rs2_reg.read_int() if signed_b else rs2_reg.read_uint()
+            rd_reg.write(conv_to_bytes(fn(a, b), signed=signed))
+            return True
+
+        return op
+
     @classmethod
     def run(cls, register_file, memory_space, snoop, instr=None):
         if instr is None:
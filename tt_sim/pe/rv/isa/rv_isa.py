@@ -98,3 +98,24 @@ class RV_ISA(ABC):
     @abstractmethod
     def run(cls, register_file, device_memory, snoop, instr=None):
         raise NotImplementedError()
+
+    @classmethod
+    def predecode(cls, instr, register_file, pc):
+        """Decode ``instr`` at ``pc`` once, for the core's decoded-instruction cache.
+
+        Returns one of three answers, mirroring ``run``'s contract:
+
+        * a callable ``op(memory_space)`` that executes the instruction exactly
+          as ``run`` would (same register writes in the same order, same memory
+          accesses, same return value), with the operand fields, immediates
+          and — since the cache is keyed by PC — any PC-relative values already
+          worked out;
+        * ``False`` when ``run`` is certain to decline this word, so the core
+          can move on to the next ISA in its list without asking again;
+        * ``None`` when this ISA cannot say ahead of time, in which case the
+          core falls back to walking the ISA list for this word every time.
+
+        The default is ``None``: an ISA that does not predecode costs nothing
+        and behaves exactly as before. See ``RV32I._predecode``.
+        """
+        return None
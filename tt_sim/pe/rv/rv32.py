@@ -1,7 +1,12 @@
 from tt_sim.memory.memory import VisibleMemory, resolve_plain_ram_span
 from tt_sim.pe.pe import ProcessingElement
 from tt_sim.pe.register.register import Register, RegisterAccessMode
-from tt_sim.pe.register.register_file import RegisterFile
+from tt_sim.pe.register.register_file import (
+    IntRegisterFile,
+    RegisterFile,
+    int_registers_enabled_from_env,
+)
+from tt_sim.pe.rv.blocks import BlockRunner, rv_blocks_enabled_from_env
 from tt_sim.pe.rv.isa.i_isa import RV_I_ISA
 from tt_sim.pe.rv.isa.m_isa import RV_M_ISA
 from tt_sim.pe.rv.isa.tt_isa import RV_TT_ISA
@@ -99,6 +104,10 @@ class RV32I(ProcessingElement):
     #: register file's reference to the same object: the ISA executors are
     #: handed the register file, and the retire counter is bumped from here.
     csrs = None
+    #: This core's :class:`~tt_sim.pe.rv.blocks.BlockRunner` when
+    #: ``TT_SIM_RV_BLOCKS`` is set, ``None`` otherwise — the default, which
+    #: costs ``clock_tick`` one attribute read and a predicted branch.
+    _blocks = None
 
     def __init__(
         self,
@@ -151,7 +160,13 @@ class RV32I(ProcessingElement):
         # cores set it (they are the ones with an architecture and a memory
         # map to classify addresses against); see ``tt_sim/pe/rv/cost.py``.
         self.rv_cost = None
-        self.register_file = RegisterFile(registers, REGISTER_NAME_MAPPING)
+        # Int-backed by default: the values live in one list of ints and the
+        # registers are views onto it, so the integer fast paths below and in
+        # the predecoded ops never build a ``bytes``. See IntRegisterFile.
+        register_file_class = (
+            IntRegisterFile if int_registers_enabled_from_env() else RegisterFile
+        )
+        self.register_file = register_file_class(registers, REGISTER_NAME_MAPPING)
         # PC and next-PC are touched several times per simulated cycle; resolve
         # them once instead of going through the name map every time.
         self.pc_register = self.register_file["pc"]
@@ -185,6 +200,29 @@ class RV32I(ProcessingElement):
         # only while nothing is subscribed to the event bus, so a MemEvent for
         # the fetch is never dropped; see ``_cache_fetch_src``.
         self._fetch_src = None
+        # Decoded-instruction cache: PC -> ``(word, op)``, where ``op`` is the
+        # closure an ISA's ``predecode`` built for that word at that PC, or
+        # ``None`` for a word no ISA would predecode (it takes the ISA-list walk
+        # every time). Kernel and firmware loops run the same few hundred PCs
+        # millions of times, and a hit skips the field extraction, the opcode
+        # dispatch and the walk down ``_isa_runs``; see ``_predecode``.
+        self._decoded = {}
+        # Basic-block execution (``tt_sim/pe/rv/blocks.py``): run a straight-
+        # line run of cached instructions in one tick and stay busy for the
+        # rest. Opt-in, because a block's plain-RAM accesses all land on its
+        # first cycle.
+        if rv_blocks_enabled_from_env():
+            self._blocks = BlockRunner(self)
+
+    def __getstate__(self):
+        # For ``tt_sim.device.snapshot``: the decoded-instruction cache holds
+        # closures, which do not pickle, and the fetch span is re-resolved on
+        # the next fetch anyway. Both are pure caches of what is in memory, so
+        # a restored core starts with them empty.
+        state = self.__dict__.copy()
+        state["_decoded"] = {}
+        state["_fetch_src"] = None
+        return state
 
     def _cache_fetch_src(self, addr):
         """Try to resolve ``addr`` into :attr:`_fetch_src`; clear it otherwise.
@@ -207,6 +245,32 @@ class RV32I(ProcessingElement):
         # ``high < low`` and can therefore never be taken.
         self._fetch_src = (low, high - 3, leaf, base)
 
+    def _predecode(self, pc_val, instr):
+        """Decode ``instr`` at ``pc_val`` and cache the result.
+
+        Asks each ISA in list order, moving past the ones certain to decline
+        (``predecode`` answers ``False``) exactly as the run-time walk would, so
+        the op cached is the one ``_isa_runs`` would have reached. An ISA that
+        cannot say stops the search and the word keeps the slow path.
+
+        There is no write hook behind the cache. An entry carries the word it
+        was decoded from and is only used when the fetch returns that same word,
+        and the fetch is the plain-RAM span read ``_cache_fetch_src`` resolves
+        (``resolve_plain_ram_span``): a store into the code span — from this
+        core, a NoC write landing in L1, or the host reloading a kernel — is
+        seen by the very next fetch of that PC and the word is decoded afresh.
+        Data stores elsewhere in the span, which are the vast majority, cost
+        the cache nothing.
+        """
+        register_file = self.register_file
+        op = None
+        for isa in self.isas:
+            op = isa.predecode(instr, register_file, pc_val)
+            if op is not False:
+                break
+        entry = self._decoded[pc_val] = (instr, op or None)
+        return entry
+
     def print_snoop(self, pc, nextpc, actioned):
         addr = pc.read_uint()
         instr = self.visible_memory.read(addr, 4)
@@ -219,12 +283,21 @@ class RV32I(ProcessingElement):
     def clock_tick(self, cycle_num):
         if not self.active:
             return
+        blocks = self._blocks
+        if blocks is not None:
+            # Still retiring the block a previous tick executed: nothing to do
+            # until its last instruction's cycle has gone by.
+            busy = self.busy_until
+            if busy is not None and cycle_num < busy:
+                return
+            if blocks.tick(self, cycle_num):
+                return
 
         register_file = self.register_file
         pc = self.pc_register
         nextpc = self.nextpc_register
         pc_val = pc.read_uint()
-        nextpc.write(conv_to_bytes(pc_val + 4))
+        nextpc.write_uint(pc_val + 4)
         memory = self.visible_memory
         memory.caller_context = (self.unit_id, self.core_label, pc_val)
 
@@ -274,11 +347,24 @@ class RV32I(ProcessingElement):
         actioned = False
         pe_stall = False
         exec_memory = self._exec_memory
-        for isa_run in self._isa_runs:
-            actioned = isa_run(register_file, exec_memory, self.snoop, instr)
+        # A snooping core prints its disassembly from the ISA handlers, so it
+        # always takes the walk; everything else goes through the decoded-
+        # instruction cache first.
+        op = None
+        if not self.snoop:
+            entry = self._decoded.get(pc_val)
+            if entry is None or entry[0] != instr:
+                entry = self._predecode(pc_val, instr)
+            op = entry[1]
+        if op is not None:
+            actioned = op(exec_memory)
             pe_stall = actioned == ProcessingElement.PEStall
-            if actioned or pe_stall:
-                break
+        else:
+            for isa_run in self._isa_runs:
+                actioned = isa_run(register_file, exec_memory, self.snoop, instr)
+                pe_stall = actioned == ProcessingElement.PEStall
+                if actioned or pe_stall:
+                    break
 
         if not actioned and not pe_stall:
             self.unknown_instructions += 1
@@ -311,19 +397,36 @@ class RV32I(ProcessingElement):
                 stall_cycles, stall_reason = 0, ""
             else:
                 stall_cycles, stall_reason = cost.take_pending_stall()
-            self.bus.publish(
-                InstrEvent(
-                    cycle=cycle_num,
-                    unit_id=self.unit_id,
-                    pc=pc_val,
-                    instruction=instr,
-                    stalled=pe_stall,
-                    reg_write_idx=reg_idx,
-                    reg_write_value=reg_val,
-                    stall_cycles=stall_cycles,
-                    stall_reason=stall_reason,
+            # A columnar recorder listening alone takes the fields as they are
+            # (``EventBus.direct``); building the frozen event is most of what
+            # a traced retire costs, so it is only built for the general bus.
+            record = self.bus.direct(EventCategory.INSTR)
+            if record is not None:
+                record(
+                    cycle_num,
+                    self.unit_id,
+                    pc_val,
+                    instr,
+                    pe_stall,
+                    reg_idx,
+                    reg_val,
+                    stall_cycles,
+                    stall_reason,
+                )
+            else:
+                self.bus.publish(
+                    InstrEvent(
+                        cycle=cycle_num,
+                        unit_id=self.unit_id,
+                        pc=pc_val,
+                        instruction=instr,
+                        stalled=pe_stall,
+                        reg_write_idx=reg_idx,
+                        reg_write_value=reg_val,
+                        stall_cycles=stall_cycles,
+                        stall_reason=stall_reason,
+                    )
                 )
-            )
 
         if not pe_stall:
             csrs = self.csrs
@@ -336,7 +439,7 @@ class RV32I(ProcessingElement):
                 # nothing at all — the hardware would trap on it, and tt-sim
                 # treats it as the doc's UndefinedBehavior.
                 csrs.retired += 1
-            pc.write(nextpc.read())
+            pc.write_uint(nextpc.read_uint())
 
     def reset(self):
         self.stop()
@@ -353,6 +456,8 @@ class RV32I(ProcessingElement):
         pc.write(conv_to_bytes(self.get_start_address()))
 
         self.unknown_instructions = 0
+        # A block still being retired belongs to the run before the reset.
+        self.busy_until = None
         if self.rv_cost is not None:
             self.rv_cost.reset()
         if self.csrs is not None:
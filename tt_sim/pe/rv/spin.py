@@ -331,6 +331,12 @@ class FirmwareSpin:
             # and a user watching instructions should see the spin.
             self.next_attempt = cycle + self.interval
             return
+        if core.busy_until is not None and core.busy_until > cycle:
+            # Part-way through a basic block (``tt_sim/pe/rv/blocks.py``), so
+            # the next few ticks retire nothing. Try again on the tick the
+            # block's window closes, when the core is back to one instruction
+            # per tick; ``next_attempt`` is left alone so that is the next one.
+            return
         if not core.active:
             # A core out of soft reset but never start()ed executes nothing —
             # its frozen state would satisfy every check as a 1-tick "loop".
@@ -10,7 +10,7 @@ from tt_sim.pe.tensix.backends.unpacker import UnPackerUnit
 from tt_sim.pe.tensix.backends.vector import VectorUnit
 from tt_sim.pe.tensix.registers import DstRegister, SrcRegister
 from tt_sim.pe.tensix.util import (
-    TensixConfigurationConstants,
+    TensixConfigLayout,
     TensixInstructionDecoder,
 )
 from tt_sim.util.bits import get_nth_bit
@@ -46,8 +46,21 @@ class TensixBackend:
         cfg_state_size=None,
         thd_state_size=None,
         blackhole=False,
+        config_layout=None,
     ):
         self.blackhole = blackhole
+        #: This device's config-register layout, which every unit reads rather
+        #: than the process-wide ``TensixConfigurationConstants``; from the arch
+        #: profile when the tile passes it.
+        self.config_layout = (
+            config_layout
+            if config_layout is not None
+            else TensixConfigLayout.for_arch(blackhole)
+        )
+        assert self.config_layout.blackhole == blackhole
+        #: This architecture's config-register fields by name; see
+        #: ``getConfigValue``.
+        self.config_fields = self.config_layout.fields
         self.gpr = TensixGPR()
         self.mover_unit = MoverUnit(self)
         self.sync_unit = TensixSyncUnit(self)
@@ -198,35 +211,99 @@ class TensixBackend:
         # A thread-config register that doesn't exist on this architecture (e.g.
         # Wormhole's ADDR_MOD_SET_Base, which Blackhole replaces with the
         # ADDR_MOD_AB2_* register set) reads as unset — 0.
-        if not TensixConfigurationConstants.exists(key):
-            return 0
-        addr_idx = TensixConfigurationConstants.get_addr32(key)
-        val = self.getConfigUnit().get_threadConfig_entry(issue_thread, addr_idx)
-        return TensixConfigurationConstants.parse_raw_config_value(val, key)
+        #
+        # Decoded values are cached on the thread's config words (see
+        # ``ConfigWords``) until one of the words they came from is stored, so
+        # a repeat read of an unchanged field is one dict lookup.
+        words = self.config_unit.threadConfig[issue_thread]
+        value = words.decoded.get(key)
+        if value is None:
+            field = self.config_fields.get(key)
+            if field is None:
+                return words.remember(key, 0, ())
+            addr32 = field.addr32
+            value = words.remember(key, field.extract(words[addr32]), (addr32,))
+        return value
 
     def getConfigValue(self, state_id, key, words=1):
-        addr_idx = TensixConfigurationConstants.get_addr32(key)
+        cfg = self.config_unit.config[state_id]
         if words == 1:
-            val = self.getConfigUnit().get_config_entry(state_id, addr_idx)
-            return TensixConfigurationConstants.parse_raw_config_value(val, key)
-        else:
-            # A multi-word register occupies *consecutive* config words: the
-            # config array is indexed in 32-bit words, so word n of the register
-            # named by ``key`` is at ``addr_idx + n``, not ``addr_idx + 4 * n``.
-            # The only such register is the unpacker's tile descriptor, whose
-            # fields the ISA docs place at bits 16-31 (XDim), 32-39 (YDim),
-            # 48-55 (ZDim) and 64-71 (WDim) of one contiguous bit string -- i.e.
-            # words 0, 1, 1 and 2. Striding by four read THCON_SEC0_REG1 / REG2 /
-            # REG3 in place of descriptor words 1 / 2 / 3, which happened to hold
-            # the right ZDim and a YDim of 0 (read as 1) for an ordinary tile,
-            # and so went unnoticed until ``llk_unpack_untilize`` set YDim to 16.
-            return [
-                TensixConfigurationConstants.parse_raw_config_value(
-                    self.getConfigUnit().get_config_entry(state_id, addr_idx + word),
-                    key,
-                )
-                for word in range(words)
-            ]
+            value = cfg.decoded.get(key)
+            if value is None:
+                field = self.config_fields.get(key)
+                if field is None:
+                    raise IndexError(f"'{key}' not in constants")
+                addr_idx = field.addr32
+                value = cfg.remember(key, field.extract(cfg[addr_idx]), (addr_idx,))
+            return value
+        cache_key = (key, words)
+        value = cfg.decoded.get(cache_key)
+        if value is not None:
+            return list(value)
+        field = self.config_fields.get(key)
+        if field is None:
+            raise IndexError(f"'{key}' not in constants")
+        addr_idx = field.addr32
+        # A multi-word register occupies *consecutive* config words: the
+        # config array is indexed in 32-bit words, so word n of the register
+        # named by ``key`` is at ``addr_idx + n``, not ``addr_idx + 4 * n``.
+        # The only such register is the unpacker's tile descriptor, whose
+        # fields the ISA docs place at bits 16-31 (XDim), 32-39 (YDim),
+        # 48-55 (ZDim) and 64-71 (WDim) of one contiguous bit string -- i.e.
+        # words 0, 1, 1 and 2. Striding by four read THCON_SEC0_REG1 / REG2 /
+        # REG3 in place of descriptor words 1 / 2 / 3, which happened to hold
+        # the right ZDim and a YDim of 0 (read as 1) for an ordinary tile,
+        # and so went unnoticed until ``llk_unpack_untilize`` set YDim to 16.
+        #
+        # Cached as a tuple, handed out as a fresh list.
+        span = range(addr_idx, addr_idx + words)
+        value = tuple(field.extract(cfg[word]) for word in span)
+        return list(cfg.remember(cache_key, value, span))
+
+    #: The fields of one address modifier, in the order ``decodedAddrMod``
+    #: returns them: the SrcA / SrcB / Dst / Bias sections' clears, carry
+    #: selects and increments.
+    _ADDR_MOD_FIELDS = (
+        ("AB", "_SrcAClear"),
+        ("AB", "_SrcACR"),
+        ("AB", "_SrcAIncr"),
+        ("AB", "_SrcBClear"),
+        ("AB", "_SrcBCR"),
+        ("AB", "_SrcBIncr"),
+        ("DST", "_DestClear"),
+        ("DST", "_DestCToCR"),
+        ("DST", "_DestCR"),
+        ("DST", "_DestIncr"),
+        ("DST", "_FidelityClear"),
+        ("DST", "_FidelityIncr"),
+        ("BIAS", "_BiasClear"),
+        ("BIAS", "_BiasIncr"),
+    )
+
+    def decodedAddrMod(self, thread_id, addrmod):
+        """Address modifier ``addrmod``'s fields for ``thread_id``, as a tuple
+        in ``_ADDR_MOD_FIELDS`` order.
+
+        ``RWC.applyAddrMod`` runs on nearly every math and SFPU instruction and
+        reads up to fourteen thread-config fields each time; decoded together
+        and cached on the thread's config words, the whole set is one lookup
+        until the kernel reprograms the modifier.
+        """
+        words = self.config_unit.threadConfig[thread_id]
+        key = ("ADDR_MOD", addrmod)
+        value = words.decoded.get(key)
+        if value is None:
+            fields = self.config_fields
+            decoded, read = [], set()
+            for section, suffix in TensixBackend._ADDR_MOD_FIELDS:
+                field = fields.get(f"ADDR_MOD_{section}_SEC{addrmod}{suffix}")
+                if field is None:
+                    decoded.append(0)
+                else:
+                    decoded.append(field.extract(words[field.addr32]))
+                    read.add(field.addr32)
+            value = words.remember(key, tuple(decoded), read)
+        return value
 
     def hasInflightInstructionsFromThread(self, from_thread):
         for unit in self.backend_units.values():
@@ -240,8 +317,15 @@ class TensixBackend:
         return False
 
     def issueInstruction(self, instruction, from_thread):
-        instruction_info = TensixInstructionDecoder.getInstructionInfo(instruction)
-        instruction_name = instruction_info["name"]
+        return self.issueDecoded(
+            TensixInstructionDecoder.decoded(instruction), from_thread
+        )
+
+    def issueDecoded(self, decoded, from_thread):
+        """:meth:`issueInstruction` for an instruction the frontend has
+        decoded already, which is how the Wait Gate issues."""
+        instruction = decoded.word
+        instruction_name = decoded.name
         if instruction_name in UNMODELLED_BLACKHOLE_INSTRUCTIONS:
             raise NotImplementedError(
                 f"Tensix instruction {instruction_name} ({hex(instruction)}) from thread "
@@ -251,7 +335,7 @@ class TensixBackend:
                 f"cannot be ported. Implement it here (tt_sim/pe/tensix/backend.py) when "
                 f"a kernel needs it."
             )
-        tgt_backend_unit = instruction_info["ex_resource"]
+        tgt_backend_unit = decoded.ex_resource
         if tgt_backend_unit != "NONE":
             if tgt_backend_unit == "UNPACK":
                 which_unpacker = get_nth_bit(instruction, 23)
@@ -310,66 +394,63 @@ class RWC:
         ):
             addrmod += 4
 
-        AB_key = "ADDR_MOD_AB_SEC" + str(addrmod)
-        Dst_key = "ADDR_MOD_DST_SEC" + str(addrmod)
-        Bias_key = "ADDR_MOD_BIAS_SEC" + str(addrmod)
-
-        if self.backend.getThreadConfigValue(thread_id, AB_key + "_SrcAClear"):
+        (
+            srca_clear,
+            srca_cr,
+            srca_incr,
+            srcb_clear,
+            srcb_cr,
+            srcb_incr,
+            dest_clear,
+            dest_c_to_cr,
+            dest_cr,
+            dest_incr,
+            fidelity_clear,
+            fidelity_incr,
+            bias_clear,
+            bias_incr,
+        ) = self.backend.decodedAddrMod(thread_id, addrmod)
+
+        if srca_clear:
             self.SrcA = 0
             self.SrcA_Cr = 0
-        elif self.backend.getThreadConfigValue(thread_id, AB_key + "_SrcACR"):
-            self.SrcA_Cr += self.backend.getThreadConfigValue(
-                thread_id, AB_key + "_SrcAIncr"
-            )
+        elif srca_cr:
+            self.SrcA_Cr += srca_incr
             self.SrcA = self.SrcA_Cr
         else:
-            self.SrcA += self.backend.getThreadConfigValue(
-                thread_id, AB_key + "_SrcAIncr"
-            )
+            self.SrcA += srca_incr
 
-        if self.backend.getThreadConfigValue(thread_id, AB_key + "_SrcBClear"):
+        if srcb_clear:
             self.SrcB = 0
             self.SrcB_Cr = 0
-        elif self.backend.getThreadConfigValue(thread_id, AB_key + "_SrcBCR"):
-            self.SrcB_Cr += self.backend.getThreadConfigValue(
-                thread_id, AB_key + "_SrcBIncr"
-            )
+        elif srcb_cr:
+            self.SrcB_Cr += srcb_incr
             self.SrcB = self.SrcB_Cr
         else:
-            self.SrcB += self.backend.getThreadConfigValue(
-                thread_id, AB_key + "_SrcBIncr"
-            )
+            self.SrcB += srcb_incr
 
-        if self.backend.getThreadConfigValue(thread_id, Dst_key + "_DestClear"):
+        if dest_clear:
             self.Dst = 0
             self.Dst_Cr = 0
-        elif self.backend.getThreadConfigValue(thread_id, Dst_key + "_DestCToCR"):
-            self.Dst += self.backend.getThreadConfigValue(
-                thread_id, Dst_key + "_DestIncr"
-            )
+        elif dest_c_to_cr:
+            self.Dst += dest_incr
             self.Dst_Cr = self.Dst
-        elif self.backend.getThreadConfigValue(thread_id, Dst_key + "_DestCR"):
-            self.Dst_Cr += self.backend.getThreadConfigValue(
-                thread_id, Dst_key + "_DestIncr"
-            )
+        elif dest_cr:
+            self.Dst_Cr += dest_incr
             self.Dst = self.Dst_Cr
         else:
-            self.Dst += self.backend.getThreadConfigValue(
-                thread_id, Dst_key + "_DestIncr"
-            )
+            self.Dst += dest_incr
 
         if updateFidelityPhase:
             # SFPLOAD / SFPSTORE / SFPLOADMACRO do not update FidelityPhase, all other instructions do.
-            if self.backend.getThreadConfigValue(thread_id, Dst_key + "_FidelityClear"):
+            if fidelity_clear:
                 self.FidelityPhase = 0
             else:
-                self.FidelityPhase += self.backend.getThreadConfigValue(
-                    thread_id, Dst_key + "_FidelityIncr"
-                )
+                self.FidelityPhase += fidelity_incr
 
-        if self.backend.getThreadConfigValue(thread_id, Bias_key + "_BiasClear"):
+        if bias_clear:
             self.ExtraAddrModBit = 0
-        elif self.backend.getThreadConfigValue(thread_id, Bias_key + "_BiasIncr") & 3:
+        elif bias_incr & 3:
             # Per ISA RWCs.md, ExtraAddrModBit is uint1_t — it wraps modulo 2.
             self.ExtraAddrModBit = (self.ExtraAddrModBit + 1) & 1
 
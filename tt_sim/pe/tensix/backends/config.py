@@ -5,6 +5,58 @@ from tt_sim.perf.model import unit_cost_model
 from tt_sim.util.conversion import conv_to_bytes, conv_to_uint32
 
 
+class ConfigWords(list):
+    """One config state's (or one thread's) 32-bit config words, plus what has
+    been decoded from them.
+
+    The backend's handlers read a configuration far more often than anything
+    writes one — an unpacker or packer instruction reads a dozen fields, an
+    address-mod update up to fourteen, and kernels set them up once and then
+    run thousands of instructions against them. So a decoded value is kept in
+    :attr:`decoded` under whatever key its reader chose, alongside the words it
+    was decoded from, and a store to one of those words drops it and nothing
+    else. Every store goes through ``__setitem__`` — ``setConfig``,
+    ``setThreadConfig``, and anything that pokes a word directly — so the cache
+    cannot be bypassed.
+
+    A decoded value must be immutable (an ``int`` or a tuple): it is handed to
+    every reader as is.
+    """
+
+    def __init__(self, size):
+        super().__init__([0] * size)
+        #: ``key -> value`` for everything decoded since its words were stored.
+        self.decoded = {}
+        #: ``word index -> {key, ...}`` of the decoded values that read it. A
+        #: key stays listed under its other words once dropped; that costs a
+        #: spurious drop of a later value at worst, and sets keep it bounded.
+        self._readers = {}
+
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        if isinstance(index, slice):
+            self.decoded.clear()
+            self._readers.clear()
+            return
+        keys = self._readers.pop(index, None)
+        if keys is not None:
+            decoded = self.decoded
+            for key in keys:
+                decoded.pop(key, None)
+
+    def remember(self, key, value, words):
+        """Cache ``value`` under ``key`` until any of ``words`` is stored."""
+        self.decoded[key] = value
+        readers = self._readers
+        for word in words:
+            keys = readers.get(word)
+            if keys is None:
+                readers[word] = {key}
+            else:
+                keys.add(key)
+        return value
+
+
 class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
     """
     Backend configuration unit as per description and code snippets at
@@ -39,9 +91,11 @@ class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
     def __init__(
         self, backend, gprs, cfg_state_size=None, thd_state_size=None, blackhole=False
     ):
-        # Select the arch-specific config-register layout (name -> ADDR32 / SHAMT
-        # / MASK) that every backend unit reads through TensixConfigurationConstants.
+        # Every unit reads this device's config-register layout through
+        # ``backend.config_layout``. The process-wide accessors are pointed at
+        # it too, for the scripts and tests that use them; nothing here does.
         TensixConfigurationConstants.use_blackhole(blackhole)
+        layout = backend.config_layout
         self.CFG_STATE_SIZE = (
             cfg_state_size if cfg_state_size is not None else self.CFG_STATE_SIZE
         )
@@ -49,13 +103,13 @@ class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
             thd_state_size if thd_state_size is not None else self.THD_STATE_SIZE
         )
         self.config = [
-            [0] * (self.CFG_STATE_SIZE * 4),
-            [0] * (self.CFG_STATE_SIZE * 4),
+            ConfigWords(self.CFG_STATE_SIZE * 4),
+            ConfigWords(self.CFG_STATE_SIZE * 4),
         ]
         self.threadConfig = [
-            [0] * self.THD_STATE_SIZE,
-            [0] * self.THD_STATE_SIZE,
-            [0] * self.THD_STATE_SIZE,
+            ConfigWords(self.THD_STATE_SIZE),
+            ConfigWords(self.THD_STATE_SIZE),
+            ConfigWords(self.THD_STATE_SIZE),
         ]
         self.gprs = gprs
         self.prev_cycle_setc16_or_wrcfg = False
@@ -64,8 +118,8 @@ class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
         # mirrored into the Dst register's row-remap gates; see
         # ``_apply_dest_access_cfg``.
         self.dest_access_cfg_idx = (
-            TensixConfigurationConstants.get_addr32("DEST_ACCESS_CFG_remap_addrs")
-            if TensixConfigurationConstants.exists("DEST_ACCESS_CFG_remap_addrs")
+            layout.get_addr32("DEST_ACCESS_CFG_remap_addrs")
+            if layout.exists("DEST_ACCESS_CFG_remap_addrs")
             else None
         )
         super().__init__(
@@ -249,7 +303,7 @@ class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
         if self.getDiagnosticSettings().reportConfigurationSet():
             frm_thread = f"from thread {from_thread}"
             print(
-                f"Config: set config [{stateID}]{TensixConfigurationConstants.get_name(cfgIndex)} "
+                f"Config: set config [{stateID}]{self.backend.config_layout.get_name(cfgIndex)} "
                 f"value={hex(value)} {frm_thread if from_thread is not None else ''}"
             )
         self.config[stateID][cfgIndex] = value
@@ -276,21 +330,18 @@ class TensixBackendConfigurationUnit(TensixBackendUnit, MemMapable):
         straddles a change and the distinction is unobservable in practice.
         """
         dst = self.backend.getDst()
+        layout = self.backend.config_layout
         dst.dest_remap_addrs = bool(
-            TensixConfigurationConstants.parse_raw_config_value(
-                value, "DEST_ACCESS_CFG_remap_addrs"
-            )
+            layout.parse_raw_config_value(value, "DEST_ACCESS_CFG_remap_addrs")
         )
         dst.dest_swizzle_32b = bool(
-            TensixConfigurationConstants.parse_raw_config_value(
-                value, "DEST_ACCESS_CFG_swizzle_32b"
-            )
+            layout.parse_raw_config_value(value, "DEST_ACCESS_CFG_swizzle_32b")
         )
 
     def setThreadConfig(self, thread_id, cfg_index, value):
         if self.getDiagnosticSettings().reportConfigurationSet():
             print(
-                f"Config: set threadConfig [{thread_id}]{TensixConfigurationConstants.get_name(cfg_index)} "
+                f"Config: set threadConfig [{thread_id}]{self.backend.config_layout.get_name(cfg_index)} "
                 f"value={hex(value)}"
             )
         self.threadConfig[thread_id][cfg_index] = value
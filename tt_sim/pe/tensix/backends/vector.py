@@ -1,3 +1,5 @@
+import numpy as np
+
 from tt_sim.pe.tensix.backends.backend_base import DataFormat, TensixBackendUnit
 from tt_sim.pe.tensix.registers import LReg
 from tt_sim.pe.tensix.util import DataFormatConversions
@@ -33,16 +35,14 @@ def fma_model_bh(x, y, z):
     e.g. recip's Newton refinement).
     """
 
-    def unpack(v):
-        e = (v >> 23) & 255
-        m = (v & 0x7FFFFF) ^ 0x800000
-        if e == 0:  # flush denormals
-            m = 0
-        return e, m
-
-    x_e, x_m = unpack(x)
-    y_e, y_m = unpack(y)
-    z_e, z_m = unpack(z)
+    # unpack(): exponent, and mantissa with its implicit one — or 0 for a
+    # denormal, which flushes. Inline, as it runs three times per FMA.
+    x_e = (x >> 23) & 255
+    x_m = (x & 0x7FFFFF) ^ 0x800000 if x_e else 0
+    y_e = (y >> 23) & 255
+    y_m = (y & 0x7FFFFF) ^ 0x800000 if y_e else 0
+    z_e = (z >> 23) & 255
+    z_m = (z & 0x7FFFFF) ^ 0x800000 if z_e else 0
     z_sign = z & 0x80000000
 
     p_sign = (x ^ y) & 0x80000000
@@ -124,16 +124,14 @@ def fma_model_wh(x, y, z):
     (``tt_sim/pe/tensix/fma_model_test.py`` pins the vectors).
     """
 
-    def unpack(v):
-        e = (v >> 23) & 255
-        m = (v & 0x7FFFFF) ^ 0x800000
-        if e == 0:  # flush denormals
-            m = 0
-        return e, m
-
-    x_e, x_m = unpack(x)
-    y_e, y_m = unpack(y)
-    z_e, z_m = unpack(z)
+    # unpack(): exponent, and mantissa with its implicit one — or 0 for a
+    # denormal, which flushes. Inline, as it runs three times per FMA.
+    x_e = (x >> 23) & 255
+    x_m = (x & 0x7FFFFF) ^ 0x800000 if x_e else 0
+    y_e = (y >> 23) & 255
+    y_m = (y & 0x7FFFFF) ^ 0x800000 if y_e else 0
+    z_e = (z >> 23) & 255
+    z_m = (z & 0x7FFFFF) ^ 0x800000 if z_e else 0
     z_sign = z & 0x80000000
 
     p_sign = (x ^ y) & 0x80000000
@@ -206,6 +204,22 @@ def fma_model_wh(x, y, z):
     return ((nan_result if nan_result else r_sign) | r) & _M32
 
 
+#: Lane ``i``'s row (``i >> 3``) and column (``i & 7``) within the 4x8 SFPU.
+_LANES = np.arange(32)
+_LANE_COLUMN = _LANES & 7
+#: The LaneConfig bit that masks a lane's row: ROW_MASK (bits 15:12) of the
+#: column's LaneConfig, one bit per row.
+_ROW_MASK_BIT = 1 << (12 + (_LANES >> 3))
+#: Every lane / no lane; read-only so a caller cannot mutate the constants.
+_ALL_LANES = np.ones(32, dtype=bool)
+_ALL_LANES.flags.writeable = False
+_NO_LANES = np.zeros(32, dtype=bool)
+_NO_LANES.flags.writeable = False
+#: For SFPSHFT2's subvector shuffles: the lane each lane takes its value from
+#: (its left neighbour, wrapping within the 8-lane subvector).
+_SUBVEC_PREVIOUS = np.where(_LANE_COLUMN != 0, _LANES - 1, _LANES + 7)
+
+
 class VectorUnit(TensixBackendUnit):
     """
     SFPU vector unit, which has 32 lanes of 32 bit and 17 LRegs that can feed these lanes.
@@ -471,7 +485,16 @@ class VectorUnit(TensixBackendUnit):
         # multiply/add rounds through the model for this chip (ttsim's
         # ``#define fma_model fma_model_{wh,bh}``).
         self.fma = fma_model_bh if backend.blackhole else fma_model_wh
-        self.lregs = [LReg(blackhole=backend.blackhole) for i in range(17)]
+        # Every LReg lives in this one (17, 32) uint32 array, and
+        # ``self.lregs[i]`` is an ``LReg`` over row ``i`` of it: the handlers
+        # compute on whole rows under a lane mask, anything that wants a single
+        # lane still indexes ``self.lregs[i][lane]``, and a snapshot of the
+        # whole register file is ``lreg_file.copy()``. The hard-wired constants
+        # fill their rows (``LReg.setHardwiredValue``), so a row read sees them.
+        self.lreg_file = np.zeros((17, 32), dtype=np.uint32)
+        self.lregs = [
+            LReg(blackhole=backend.blackhole, data=self.lreg_file[i]) for i in range(17)
+        ]
         self.lregs[8].setReadOnly(0.8373)
         self.lregs[9].setReadOnly(0)
         self.lregs[10].setReadOnly(1.0)
@@ -479,10 +502,14 @@ class VectorUnit(TensixBackendUnit):
             self.lregs[15][i] = i * 2
         self.lregs[15].setReadOnly()
 
-        self.laneFlags = [False] * 32
-        self.useLaneFlagsForLaneEnable = [False] * 32
+        # Per-lane predication state, as arrays for the same reason; see the
+        # ``laneFlags`` / ``useLaneFlagsForLaneEnable`` properties. Each
+        # ``flagStack`` entry is a copy of the pair, so later in-place updates
+        # cannot reach it.
+        self._lane_flags = np.zeros(32, dtype=bool)
+        self._use_lane_flags = np.zeros(32, dtype=bool)
         self.flagStack = []
-        self.laneConfig = [0] * 32
+        self.laneConfig = np.zeros(32, dtype=np.int64)
         self.loadMacroConfig = [VectorUnit.LoadMacroConfig() for i in range(32)]
         super().__init__(backend, VectorUnit.OPCODE_TO_HANDLER, "Vector")
         # Phase 5 of docs/plans/event-driven-pump.md. ``None`` unless
@@ -515,9 +542,62 @@ class VectorUnit(TensixBackendUnit):
             "SFPU", "blackhole" if backend.blackhole else "wormhole"
         )
 
+    @property
+    def laneFlags(self):
+        """LaneFlags, one bool per lane. Assigning any 32-long sequence of
+        truth values replaces it; indexing and slice-assignment work in place."""
+        return self._lane_flags
+
+    @laneFlags.setter
+    def laneFlags(self, value):
+        self._lane_flags = np.array(value, dtype=bool)
+
+    @property
+    def useLaneFlagsForLaneEnable(self):
+        """UseLaneFlagsForLaneEnable, one bool per lane; as ``laneFlags``."""
+        return self._use_lane_flags
+
+    @useLaneFlagsForLaneEnable.setter
+    def useLaneFlagsForLaneEnable(self, value):
+        self._use_lane_flags = np.array(value, dtype=bool)
+
     def laneConfigValue(self, lane, key):
         assert len(key) == 2
-        return get_bits(self.laneConfig[lane], key[0], (key[0] + key[1]) - 1)
+        return get_bits(int(self.laneConfig[lane]), key[0], (key[0] + key[1]) - 1)
+
+    def _enabled_lanes(self):
+        """:meth:`isLaneEnabled` for all 32 lanes at once, as a bool array."""
+        row_unmasked = (self.laneConfig[_LANE_COLUMN] & _ROW_MASK_BIT) == 0
+        return row_unmasked & (self._lane_flags | ~self._use_lane_flags)
+
+    def _dest_lanes(self, mod0):
+        """The lanes an SFPLOAD / SFPSTORE moves to or from Dst: those not
+        blocked by BLOCK_SFPU_RD_FROM_DEST that are enabled, or every such lane
+        for MOD0_FMT_INT32_ALL."""
+        lanes = (self.laneConfig & (1 << VectorUnit.BLOCK_SFPU_RD_FROM_DEST[0])) == 0
+        if mod0 != VectorUnit.MOD0_FMT_INT32_ALL:
+            lanes &= self._enabled_lanes()
+        return lanes
+
+    def _backdoor_lanes(self, vd):
+        """The ``vd < 12 or laneConfigValue(lane, DISABLE_BACKDOOR_LOAD)`` gate
+        on writes to the constant registers, for all 32 lanes."""
+        if vd < 12:
+            return _ALL_LANES
+        return (self.laneConfig >> VectorUnit.DISABLE_BACKDOOR_LOAD[0]) & 1 != 0
+
+    def _any_backdoor_lane(self, vd):
+        """Whether any lane passes :meth:`_backdoor_lanes` -- the instruction-wide
+        gate of the ops that act on the unit rather than on lanes."""
+        return vd < 12 or bool(
+            ((self.laneConfig >> VectorUnit.DISABLE_BACKDOOR_LOAD[0]) & 1).any()
+        )
+
+    def _write(self, vd, lanes, values):
+        """``lregs[vd][lane] = values[lane]`` for every lane in the bool array
+        ``lanes``. ``values`` is a row (any integer dtype, wrapped to 32 bits)
+        or a scalar."""
+        np.copyto(self.lreg_file[vd], values, casting="unsafe", where=lanes)
 
     def handle_sfpnot(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
@@ -527,9 +607,7 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = ~ lreg[{vc}]")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    self.lregs[vd][lane] = ~conv_to_uint32(self.lregs[vc][lane])
+            self._write(vd, self._enabled_lanes(), ~self.lreg_file[vc])
 
     def handle_sfpxor(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
@@ -547,11 +625,8 @@ class VectorUnit(TensixBackendUnit):
         if self.getDiagnosticSettings().reportSFPUCalculations():
             print(f"SFPU: lreg[{vd}] = lreg[{vb}] ^ lreg[{vc}]")
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    self.lregs[vd][lane] = conv_to_uint32(
-                        self.lregs[vb][lane]
-                    ) ^ conv_to_uint32(self.lregs[vc][lane])
+            lregs = self.lreg_file
+            self._write(vd, self._enabled_lanes(), lregs[vb] ^ lregs[vc])
 
     def handle_sfpand(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
@@ -562,11 +637,8 @@ class VectorUnit(TensixBackendUnit):
         if self.getDiagnosticSettings().reportSFPUCalculations():
             print(f"SFPU: lreg[{vd}] = lreg[{vb}] & lreg[{vc}]")
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    self.lregs[vd][lane] = conv_to_uint32(
-                        self.lregs[vb][lane]
-                    ) & conv_to_uint32(self.lregs[vc][lane])
+            lregs = self.lreg_file
+            self._write(vd, self._enabled_lanes(), lregs[vb] & lregs[vc])
 
     def handle_sfpor(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
@@ -578,11 +650,8 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = lreg[{vb}] | lreg[{vc}]")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    self.lregs[vd][lane] = conv_to_uint32(
-                        self.lregs[vb][lane]
-                    ) | conv_to_uint32(self.lregs[vc][lane])
+            lregs = self.lreg_file
+            self._write(vd, self._enabled_lanes(), lregs[vb] | lregs[vc])
 
     def handle_sfpsetsgn(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -592,17 +661,12 @@ class VectorUnit(TensixBackendUnit):
 
         vb = vd
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    c = conv_to_uint32(self.lregs[vc][lane])
-                    exp = (c >> 23) & 0xFF
-                    man = c & 0x7FFFFF
-                    if mod1 & VectorUnit.SFPSETSGN_MOD1_ARG_IMM:
-                        sign = imm1 & 0x1
-                    else:
-                        b = conv_to_uint32(self.lregs[vb][lane])
-                        sign = b >> 31
-                    self.lregs[vd][lane] = (sign << 31) | (exp << 23) | man
+            lregs = self.lreg_file
+            if mod1 & VectorUnit.SFPSETSGN_MOD1_ARG_IMM:
+                sign = (imm1 & 0x1) << 31
+            else:
+                sign = lregs[vb] & 0x80000000
+            self._write(vd, self._enabled_lanes(), (lregs[vc] & 0x7FFFFFFF) | sign)
 
     def handle_sfpabs(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -613,27 +677,19 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = abs(lreg[{vc}])")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    x = conv_to_uint32(self.lregs[vc][lane])
-                    is_float = bool(mod1 & VectorUnit.SFPABS_MOD1_FLOAT)
-                    if x >= 0x80000000:
-                        # Sign bit is set, i.e. value is negative.
-                        if is_float:
-                            if x > 0xFF800000:
-                                # Value is -NaN; leave it as -NaN
-                                pass
-                            else:
-                                # Clear the sign bit, i.e. floating-point negation
-                                x &= 0x7FFFFFFF
-                        else:
-                            # Two's complement integer negation, unless the input is
-                            # -2147483648, in which case it remains as -2147483648
-                            x = -x
-                    else:
-                        # Value is positive (or zero); leave it as-is
-                        pass
-                    self.lregs[vd][lane] = x
+            x = self.lreg_file[vc]
+            # Only lanes with the sign bit set (negative values) change.
+            negative = x >= 0x80000000
+            if mod1 & VectorUnit.SFPABS_MOD1_FLOAT:
+                # Clear the sign bit, i.e. floating-point negation -- except for
+                # -NaN, which is left as -NaN.
+                result = np.where(negative & (x <= 0xFF800000), x & 0x7FFFFFFF, x)
+            else:
+                # Two's complement integer negation, unless the input is
+                # -2147483648, in which case it remains as -2147483648 (the
+                # uint32 negation wraps exactly that way).
+                result = np.where(negative, -x, x)
+            self._write(vd, self._enabled_lanes(), result)
 
     def handle_sfpmov(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -653,14 +709,16 @@ class VectorUnit(TensixBackendUnit):
             )
             print(f"SFPU: lreg[{vd}] = {src}")
 
-        bypass_mask = bool(mod1 & VectorUnit.SFPMOV_MOD1_ALL_LANES_ENABLED)
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if bypass_mask or self.isLaneEnabled(lane):
-                    value = self.lregs[vc][lane]
-                    if mod1 & VectorUnit.SFPMOV_MOD1_NEGATE:
-                        value = conv_to_uint32(value) ^ 0x80000000
-                    self.lregs[vd][lane] = value
+            lanes = (
+                _ALL_LANES
+                if mod1 & VectorUnit.SFPMOV_MOD1_ALL_LANES_ENABLED
+                else self._enabled_lanes()
+            )
+            value = self.lreg_file[vc]
+            if mod1 & VectorUnit.SFPMOV_MOD1_NEGATE:
+                value = value ^ 0x80000000
+            self._write(vd, lanes, value)
 
     @staticmethod
     def _sign_mag_key(value):
@@ -678,6 +736,11 @@ class VectorUnit(TensixBackendUnit):
             return ~u & 0xFFFFFFFF
         return u | 0x80000000
 
+    @staticmethod
+    def _sign_mag_keys(values):
+        """:meth:`_sign_mag_key` over a uint32 row."""
+        return np.where(values & 0x80000000, ~values, values | 0x80000000)
+
     def handle_sfpswap(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
         vd = instr_args["lreg_dest"]
@@ -695,30 +758,25 @@ class VectorUnit(TensixBackendUnit):
         # empty min-row set so the else-branch (VD=max) applies everywhere.
         min_rows = VectorUnit.SFPSWAP_MOD1_MIN_ROWS.get(mod1, frozenset())
 
-        for lane in range(32):
-            if not self.isLaneEnabled(lane):
-                continue
-            d_val = self.lregs[vd][lane]
-            c_val = self.lregs[vc][lane]
-
-            if mod1 == VectorUnit.SFPSWAP_MOD1_UNCONDITIONAL:
-                new_d, new_c = c_val, d_val
-            else:
-                # Preserve original bit patterns: pick the stored lane values,
-                # ordering them by the sign-magnitude total order.
-                if self._sign_mag_key(c_val) < self._sign_mag_key(d_val):
-                    smaller, larger = c_val, d_val
-                else:
-                    smaller, larger = d_val, c_val
-                if (lane // 8) in min_rows:
-                    new_d, new_c = smaller, larger
-                else:
-                    new_d, new_c = larger, smaller
-
-            if vd_writable:
-                self.lregs[vd][lane] = new_d
-            if vc_writable:
-                self.lregs[vc][lane] = new_c
+        lanes = self._enabled_lanes()
+        d_val = self.lreg_file[vd].copy()
+        c_val = self.lreg_file[vc].copy()
+        if mod1 == VectorUnit.SFPSWAP_MOD1_UNCONDITIONAL:
+            new_d, new_c = c_val, d_val
+        else:
+            # Preserve original bit patterns: pick the stored lane values,
+            # ordering them by the sign-magnitude total order.
+            c_smaller = self._sign_mag_keys(c_val) < self._sign_mag_keys(d_val)
+            smaller = np.where(c_smaller, c_val, d_val)
+            larger = np.where(c_smaller, d_val, c_val)
+            min_lanes = np.isin(_LANES >> 3, tuple(min_rows))
+            new_d = np.where(min_lanes, smaller, larger)
+            new_c = np.where(min_lanes, larger, smaller)
+
+        if vd_writable:
+            self._write(vd, lanes, new_d)
+        if vc_writable:
+            self._write(vc, lanes, new_c)
 
     @staticmethod
     def _cast_negate(c, sign):
@@ -766,27 +824,27 @@ class VectorUnit(TensixBackendUnit):
         if not (vd < 8 or vd == 16):
             return
 
-        for lane in range(32):
-            if not self.isLaneEnabled(lane):
-                continue
-            c = conv_to_uint32(self.lregs[vc][lane]) & 0xFFFFFFFF
-            sign = c & 0x80000000
-            if int_convert:
-                self.lregs[vd][lane] = self._cast_negate(c, sign)
-                continue
-            mag = c & 0x7FFFFFFF
-            # __builtin_clz of the 32-bit magnitude; the docs use 157 as the
-            # sentinel for mag == 0 so the exponent field lands on zero.
-            lz = (32 - mag.bit_length()) if mag else 157
-            norm = (mag << (lz & 31)) & 0xFFFFFFFF
-            # The implicit leading 1 in (norm >> 8) carries into the exponent
-            # field, which is why (157 - lz) rather than (158 - lz) is used.
-            d = (sign + ((157 - lz) << 23) + (norm >> 8)) & 0xFFFFFFFF
-            # Round to nearest, ties to even: round up when the guard bit is
-            # set and either the LSB or any sticky bit is set.
-            if (norm & 0x80) and (norm & 0x17F):
-                d = (d + 1) & 0xFFFFFFFF
-            self.lregs[vd][lane] = d
+        lanes = self._enabled_lanes()
+        c = self.lreg_file[vc]
+        sign = c & 0x80000000
+        if int_convert:
+            # _cast_negate across the row (the uint32 negation wraps as the
+            # scalar form's ``& 0xFFFFFFFF`` does).
+            self._write(vd, lanes, np.where(sign != 0, -c | 0x80000000, c))
+            return
+        mag = (c & 0x7FFFFFFF).astype(np.int64)
+        # __builtin_clz of the 32-bit magnitude; the docs use 157 as the
+        # sentinel for mag == 0 so the exponent field lands on zero. A 31-bit
+        # magnitude is exact in a double, so frexp's exponent is its bit length.
+        lz = np.where(mag != 0, 32 - np.frexp(mag)[1], 157)
+        norm = (mag << (lz & 31)) & 0xFFFFFFFF
+        # The implicit leading 1 in (norm >> 8) carries into the exponent
+        # field, which is why (157 - lz) rather than (158 - lz) is used.
+        d = sign + ((157 - lz) << 23) + (norm >> 8)
+        # Round to nearest, ties to even: round up when the guard bit is set
+        # and either the LSB or any sticky bit is set.
+        d += ((norm & 0x80) != 0) & ((norm & 0x17F) != 0)
+        self._write(vd, lanes, d & 0xFFFFFFFF)
 
     def _read_rnd_mode(self, instruction_info):
         # SFP_STOCH_RND's ``rnd_mode`` is one bit on Wormhole (raw bit 21) and
@@ -826,81 +884,65 @@ class VectorUnit(TensixBackendUnit):
         else:
             prng = VectorUnit.SFP_STOCH_RND_PRNG_RNE
 
-        for lane in range(32):
-            gate = vd < 12 or self.laneConfigValue(
-                lane, VectorUnit.DISABLE_BACKDOOR_LOAD
-            )
-            if not (gate and self.isLaneEnabled(lane)):
-                continue
+        lanes = self._backdoor_lanes(vd) & self._enabled_lanes()
+        if not lanes.any():
+            return
+        c = self.lreg_file[vc].astype(np.int64)
 
-            if mode in (
-                VectorUnit.SFP_STOCH_RND_FP32_TO_FP16A,
-                VectorUnit.SFP_STOCH_RND_FP32_TO_FP16B,
-            ):
-                x = conv_to_uint32(self.lregs[vc][lane]) & 0xFFFFFFFF
-                exp = (x >> 23) & 0xFF
-                if exp == 0:
-                    x = 0  # denormals / zero -> +0
-                elif exp == 255:
-                    x &= 0xFF800000  # NaN / Inf -> normalized Inf
-                elif mode == VectorUnit.SFP_STOCH_RND_FP32_TO_FP16A:
-                    discarded = x & 0x1FFF  # keep 10 mantissa bits
-                    x -= discarded
-                    if discarded >= (prng >> 10):
-                        x += 0x2000
-                else:
-                    discarded = x & 0xFFFF  # keep 7 mantissa bits (bf16)
-                    x -= discarded
-                    if discarded >= (prng >> 7):
-                        x += 0x10000
-                result = x & 0xFFFFFFFF
-            elif mode in VectorUnit.SFP_STOCH_RND_FLOAT_TO_INT:
-                keep_sign, max_mag = VectorUnit.SFP_STOCH_RND_FLOAT_TO_INT[mode]
-                c = conv_to_uint32(self.lregs[vc][lane]) & 0xFFFFFFFF
-                sign = (c & 0x80000000) if keep_sign else 0
-                exp = ((c >> 23) & 0xFF) - 127
-                if exp < -1:
-                    mag = 0  # |x| < 0.5 -> 0
-                    sign = 0
-                elif exp >= 16:
-                    mag = max_mag  # |x| >= 2**16 (and NaN) -> saturate
-                else:
-                    mag = 0x800000 | (c & 0x7FFFFF)
-                    mag = (mag << exp) if exp >= 0 else (mag >> -exp)
-                    mag = (mag >> 23) + (1 if (mag & 0x7FFFFF) >= prng else 0)
-                    if mag > max_mag:
-                        mag = max_mag
-                    if mag == 0:
-                        sign = 0
-                result = (sign + mag) & 0xFFFFFFFF  # sign-magnitude integer
-            elif mode in (
-                VectorUnit.SFP_STOCH_RND_INT32_TO_UINT8,
-                VectorUnit.SFP_STOCH_RND_INT32_TO_INT8,
-            ):
-                c = conv_to_uint32(self.lregs[vc][lane]) & 0xFFFFFFFF
-                sign = c & 0x80000000
-                mag = c & 0x7FFFFFFF  # sign-magnitude source
-                mag <<= 23
-                descale = (
-                    (imm8 & 0x1F)
-                    if use_imm
-                    else (conv_to_uint32(self.lregs[vb][lane]) & 0x1F)
-                )
-                mag >>= descale
-                mag = (mag >> 23) + (1 if (mag & 0x7FFFFF) >= prng else 0)
-                if mode == VectorUnit.SFP_STOCH_RND_INT32_TO_UINT8:
-                    mag = min(mag, 255)
-                    sign = 0
-                else:
-                    mag = min(mag, 127)
-                    if mag == 0:
-                        sign = 0
-                result = (sign + mag) & 0xFFFFFFFF  # sign-magnitude integer
+        if mode in (
+            VectorUnit.SFP_STOCH_RND_FP32_TO_FP16A,
+            VectorUnit.SFP_STOCH_RND_FP32_TO_FP16B,
+        ):
+            if mode == VectorUnit.SFP_STOCH_RND_FP32_TO_FP16A:
+                dropped, unit = 0x1FFF, 0x2000  # keep 10 mantissa bits
+                threshold = prng >> 10
+            else:
+                dropped, unit = 0xFFFF, 0x10000  # keep 7 mantissa bits (bf16)
+                threshold = prng >> 7
+            discarded = c & dropped
+            rounded = c - discarded + np.where(discarded >= threshold, unit, 0)
+            exp = (c >> 23) & 0xFF
+            # Denormals / zero -> +0; NaN / Inf -> normalized Inf.
+            result = np.where(
+                exp == 0, 0, np.where(exp == 255, c & 0xFF800000, rounded)
+            )
+        elif mode in VectorUnit.SFP_STOCH_RND_FLOAT_TO_INT:
+            keep_sign, max_mag = VectorUnit.SFP_STOCH_RND_FLOAT_TO_INT[mode]
+            sign = (c & 0x80000000) if keep_sign else 0
+            exp = ((c >> 23) & 0xFF) - 127
+            # For -1 <= exp < 16 the mantissa is scaled to 23 fraction bits and
+            # rounded; the clip only keeps the out-of-range lanes' (discarded)
+            # shifts in range.
+            mag = 0x800000 | (c & 0x7FFFFF)
+            mag = np.where(exp >= 0, mag << np.clip(exp, 0, 16), mag >> 1)
+            mag = (mag >> 23) + ((mag & 0x7FFFFF) >= prng)
+            mag = np.minimum(mag, max_mag)
+            # |x| < 0.5 -> 0; |x| >= 2**16 (and NaN) -> saturate.
+            mag = np.where(exp < -1, 0, np.where(exp >= 16, max_mag, mag))
+            result = np.where(mag == 0, 0, sign) + mag  # sign-magnitude integer
+        elif mode in (
+            VectorUnit.SFP_STOCH_RND_INT32_TO_UINT8,
+            VectorUnit.SFP_STOCH_RND_INT32_TO_INT8,
+        ):
+            sign = c & 0x80000000
+            mag = (c & 0x7FFFFFFF) << 23  # sign-magnitude source
+            descale = (
+                (imm8 & 0x1F) if use_imm else (self.lreg_file[vb] & 0x1F).astype(int)
+            )
+            mag >>= descale
+            mag = (mag >> 23) + ((mag & 0x7FFFFF) >= prng)
+            if mode == VectorUnit.SFP_STOCH_RND_INT32_TO_UINT8:
+                mag = np.minimum(mag, 255)
+                sign = 0
             else:
-                raise NotImplementedError(f"SFP_STOCH_RND mode {mode} is reserved")
+                mag = np.minimum(mag, 127)
+                sign = np.where(mag == 0, 0, sign)
+            result = sign + mag  # sign-magnitude integer
+        else:
+            raise NotImplementedError(f"SFP_STOCH_RND mode {mode} is reserved")
 
-            if vd < 8 or vd == 16:
-                self.lregs[vd][lane] = result
+        if vd < 8 or vd == 16:
+            self._write(vd, lanes, result & 0xFFFFFFFF)
 
     def handle_sfpdivp2(self, instruction_info, issue_thread, instr_args):
         # Scale by a power of two by adjusting the FP32 exponent field.
@@ -921,19 +963,14 @@ class VectorUnit(TensixBackendUnit):
         if not (vd < 8 or vd == 16):
             return
 
-        for lane in range(32):
-            if not self.isLaneEnabled(lane):
-                continue
-            c = conv_to_uint32(self.lregs[vc][lane]) & 0xFFFFFFFF
-            sign = c & 0x80000000
-            exp = (c >> 23) & 0xFF
-            man = c & 0x7FFFFF
-            if mod1 & VectorUnit.SFPDIVP2_MOD1_ADD:
-                if exp != 0xFF:  # leave Inf / NaN unchanged
-                    exp = (exp + imm8) & 0xFF
-            else:
-                exp = imm8
-            self.lregs[vd][lane] = sign | (exp << 23) | man
+        c = self.lreg_file[vc]
+        exp = (c >> 23) & 0xFF
+        if mod1 & VectorUnit.SFPDIVP2_MOD1_ADD:
+            # Leave Inf / NaN unchanged.
+            exp = np.where(exp != 0xFF, (exp + imm8) & 0xFF, exp)
+        else:
+            exp = imm8
+        self._write(vd, self._enabled_lanes(), (c & 0x807FFFFF) | (exp << 23))
 
     def handle_sfpexexp(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -946,17 +983,15 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = exponent(lreg[{vc}]) - {bias}")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    c = conv_to_uint32(self.lregs[vc][lane])
-                    exp = (c >> 23) & 0xFF
-                    result = exp - bias
-                    self.lregs[vd][lane] = result
-                    if vd < 8:
-                        if mod1 & VectorUnit.SFPEXEXP_MOD1_SET_CC_SGN_EXP:
-                            self.laneFlags[lane] = result < 0
-                        if mod1 & VectorUnit.SFPEXEXP_MOD1_SET_CC_COMP_EXP:
-                            self.laneFlags[lane] = not self.laneFlags[lane]
+            lanes = self._enabled_lanes()
+            result = ((self.lreg_file[vc] >> 23) & 0xFF).astype(np.int64) - bias
+            self._write(vd, lanes, result & 0xFFFFFFFF)
+            if vd < 8:
+                flags = self._lane_flags
+                if mod1 & VectorUnit.SFPEXEXP_MOD1_SET_CC_SGN_EXP:
+                    np.copyto(flags, result < 0, where=lanes)
+                if mod1 & VectorUnit.SFPEXEXP_MOD1_SET_CC_COMP_EXP:
+                    np.logical_not(flags, out=flags, where=lanes)
 
     def handle_sfpexman(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -969,11 +1004,8 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = mantissa(lreg[{vc}]) + {hex(hidden_bit)}")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    c = conv_to_uint32(self.lregs[vc][lane])
-                    man = c & 0x7FFFFF
-                    self.lregs[vd][lane] = hidden_bit + man
+            man = self.lreg_file[vc] & 0x7FFFFF
+            self._write(vd, self._enabled_lanes(), man + hidden_bit)
 
     def handle_sfpsetexp(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -986,20 +1018,16 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = setexp(lreg[{vc}])")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    c = conv_to_uint32(self.lregs[vc][lane])
-                    sign = c >> 31
-                    man = c & 0x7FFFFF
-                    if mod1 & VectorUnit.SFPSETEXP_MOD1_ARG_IMM:
-                        exp = imm
-                    else:
-                        b = conv_to_uint32(self.lregs[vb][lane])
-                        if mod1 & VectorUnit.SFPSETEXP_MOD1_ARG_EXPONENT:
-                            exp = (b >> 23) & 0xFF
-                        else:
-                            exp = b & 0xFF
-                    self.lregs[vd][lane] = (sign << 31) | (exp << 23) | man
+            lregs = self.lreg_file
+            if mod1 & VectorUnit.SFPSETEXP_MOD1_ARG_IMM:
+                exp = imm
+            elif mod1 & VectorUnit.SFPSETEXP_MOD1_ARG_EXPONENT:
+                exp = (lregs[vb] >> 23) & 0xFF
+            else:
+                exp = lregs[vb] & 0xFF
+            self._write(
+                vd, self._enabled_lanes(), (lregs[vc] & 0x807FFFFF) | (exp << 23)
+            )
 
     def handle_sfpsetman(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -1012,17 +1040,12 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = setman(lreg[{vc}])")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    c = conv_to_uint32(self.lregs[vc][lane])
-                    sign = c >> 31
-                    exp = (c >> 23) & 0xFF
-                    if mod1 & VectorUnit.SFPSETMAN_MOD1_ARG_IMM:
-                        man = (imm12 << 11) & 0x7FFFFF
-                    else:
-                        b = conv_to_uint32(self.lregs[vb][lane])
-                        man = b & 0x7FFFFF
-                    self.lregs[vd][lane] = (sign << 31) | (exp << 23) | man
+            lregs = self.lreg_file
+            if mod1 & VectorUnit.SFPSETMAN_MOD1_ARG_IMM:
+                man = (imm12 << 11) & 0x7FFFFF
+            else:
+                man = lregs[vb] & 0x7FFFFF
+            self._write(vd, self._enabled_lanes(), (lregs[vc] & 0xFF800000) | man)
 
     def handle_sfpshft(self, instruction_info, issue_thread, instr_args):
         # Wormhole reserves every instr_mod1 bit above bit 0 (shift amount from
@@ -1045,23 +1068,28 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = lreg[{vb}] shift {amount}")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    if mod1 & VectorUnit.SFPSHFT_MOD1_ARG_IMM:
-                        shift_amount = imm12
-                    else:
-                        u = conv_to_uint32(self.lregs[vc][lane])
-                        shift_amount = u - 0x100000000 if u >= 0x80000000 else u
-                    b = conv_to_uint32(self.lregs[vb][lane])
-                    if shift_amount >= 0:
-                        result = (b << (shift_amount & 31)) & 0xFFFFFFFF
-                    elif mod1 & VectorUnit.SFPSHFT_MOD1_ARITHMETIC:
-                        result = (
-                            conv_to_int32(b) >> ((-shift_amount) & 31)
-                        ) & 0xFFFFFFFF
-                    else:
-                        result = b >> ((-shift_amount) & 31)
-                    self.lregs[vd][lane] = result
+            lregs = self.lreg_file
+            if mod1 & VectorUnit.SFPSHFT_MOD1_ARG_IMM:
+                shift_amount = imm12
+            else:
+                shift_amount = lregs[vc].view(np.int32).astype(np.int64)
+            result = self._shift_lanes(
+                lregs[vb], shift_amount, mod1 & VectorUnit.SFPSHFT_MOD1_ARITHMETIC
+            )
+            self._write(vd, self._enabled_lanes(), result)
+
+    @staticmethod
+    def _shift_lanes(values, amount, arithmetic):
+        """SFPSHFT's shift of a uint32 row by a signed ``amount`` (a scalar or
+        an int64 row): left when non-negative, right -- logical, or arithmetic
+        when ``arithmetic`` -- by its magnitude, both modulo 32. An int64 row of
+        results in ``[0, 2**32)``."""
+        if arithmetic:
+            right = values.view(np.int32).astype(np.int64) >> (-amount & 31)
+        else:
+            right = values.astype(np.int64) >> (-amount & 31)
+        left = values.astype(np.int64) << (amount & 31)
+        return np.where(amount >= 0, left, right) & 0xFFFFFFFF
 
     def handle_sfpshft2(self, instruction_info, issue_thread, instr_args):
         """Cross-lane and register-indirect shifts (SFPSHFT2).
@@ -1104,30 +1132,21 @@ class VectorUnit(TensixBackendUnit):
             # imm12 names the LReg holding the value to shift; VC holds a signed
             # per-lane shift amount (negative shifts right, logically).
             assert imm12 < 16, f"SFPSHFT2 source register {imm12} out of range"
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    amount = conv_to_int32(self.lregs[vc][lane])
-                    b = conv_to_uint32(self.lregs[imm12][lane])
-                    if amount >= 0:
-                        b = (b << (amount & 31)) & 0xFFFFFFFF
-                    else:
-                        b = b >> ((-amount) & 31)
-                    self.lregs[vd][lane] = b
+            lregs = self.lreg_file
+            amount = lregs[vc].view(np.int32).astype(np.int64)
+            result = self._shift_lanes(lregs[imm12], amount, False)
+            self._write(vd, self._enabled_lanes(), result)
             return
 
-        # Snapshot VC before writing: VD and VC are often the same register, and
-        # every lane reads its neighbour's pre-shift value (ttsim copies the
-        # source register first for exactly this reason).
-        src = [conv_to_uint32(self.lregs[vc][lane]) for lane in range(32)]
-        for lane in range(32):
-            if not self.isLaneEnabled(lane):
-                continue
-            if lane & 7:
-                self.lregs[vd][lane] = src[lane - 1]
-            elif mod1 == VectorUnit.SFPSHFT2_MOD1_SUBVEC_SHFLROR1:
-                self.lregs[vd][lane] = src[lane + 7]  # rotate within the subvector
-            else:
-                self.lregs[vd][lane] = 0  # zero fill
+        # Gathering into a new row snapshots VC before writing: VD and VC are
+        # often the same register, and every lane reads its neighbour's
+        # pre-shift value (ttsim copies the source register first for exactly
+        # this reason). Lane 0 of each subvector takes lane 7's value (a
+        # rotate) or, for SHFLSHR1, a zero.
+        result = self.lreg_file[vc][_SUBVEC_PREVIOUS]
+        if mod1 != VectorUnit.SFPSHFT2_MOD1_SUBVEC_SHFLROR1:
+            result[_LANE_COLUMN == 0] = 0
+        self._write(vd, self._enabled_lanes(), result)
 
     def handle_addi(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -1137,21 +1156,8 @@ class VectorUnit(TensixBackendUnit):
 
         if self.getDiagnosticSettings().reportSFPUCalculations():
             print(f"SFPU: lreg[{vd}] = {hex(imm16)} + lreg[{vc}]")
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if self.isLaneEnabled(lane):
-                    # ttsim SFPADDI: fma(imm<<16, 1.0, dst) = imm + dst.
-                    d = self.fma(
-                        imm16 << 16,
-                        0x3F800000,
-                        self._as_fp32_bits(self.lregs[vc][lane]),
-                    )
-                    if (mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VD) and vd != 16:
-                        vd = self.lregs[7][lane] & 15
-                    else:
-                        vd = vd
-                    if vd < 8 or vd == 16:
-                        self.lregs[vd][lane] = d
+        # ttsim SFPADDI: fma(imm<<16, 1.0, dst) = imm + dst.
+        self._perform_fma_imm(mod1, vd, imm16 << 16, 0x3F800000, None, None, vc)
 
     def handle_muli(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -1161,20 +1167,50 @@ class VectorUnit(TensixBackendUnit):
 
         if self.getDiagnosticSettings().reportSFPUCalculations():
             print(f"SFPU: lreg[{vd}] = {hex(imm16)} * lreg[{vc}]")
+        # ttsim SFPMULI: fma(imm<<16, dst, 0) = imm * dst.
+        self._perform_fma_imm(mod1, vd, imm16 << 16, None, vc, 0, None)
 
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if self.isLaneEnabled(lane):
-                    # ttsim SFPMULI: fma(imm<<16, dst, 0) = imm * dst.
-                    d = self.fma(
-                        imm16 << 16, self._as_fp32_bits(self.lregs[vc][lane]), 0
-                    )
-                    if (mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VD) and vd != 16:
-                        vd = self.lregs[7][lane] & 15
-                    else:
-                        vd = vd
-                    if vd < 8 or vd == 16:
-                        self.lregs[vd][lane] = d
+    def _perform_fma_imm(self, mod1, vd, a_bits, b_bits, b_reg, c_bits, c_reg):
+        """SFPADDI / SFPMULI: ``fma(a, b, c)`` on every enabled lane, where each
+        of ``b`` and ``c`` is either the constant ``*_bits`` or, when its
+        ``*_reg`` is given, that LReg's lane (the destination, for both ops).
+        """
+        if mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VD:
+            # Same lane-to-lane ``vd`` re-pointing as _perform_mad_lanewise.
+            for lane in range(32):
+                if vd < 12 or self.laneConfigValue(
+                    lane, VectorUnit.DISABLE_BACKDOOR_LOAD
+                ):
+                    if self.isLaneEnabled(lane):
+                        b = (
+                            self._as_fp32_bits(self.lregs[b_reg][lane])
+                            if b_reg is not None
+                            else b_bits
+                        )
+                        c = (
+                            self._as_fp32_bits(self.lregs[c_reg][lane])
+                            if c_reg is not None
+                            else c_bits
+                        )
+                        d = self.fma(a_bits, b, c)
+                        if vd != 16:
+                            vd = self.lregs[7][lane] & 15
+                        if vd < 8 or vd == 16:
+                            self.lregs[vd][lane] = d
+            return
+        if not (vd < 8 or vd == 16):
+            return
+        lanes, count = self._fma_lanes_enabled(vd)
+        if not count:
+            return
+        lregs = self.lreg_file
+        results = map(
+            self.fma,
+            [a_bits] * count,
+            lregs[b_reg, lanes].tolist() if b_reg is not None else [b_bits] * count,
+            lregs[c_reg, lanes].tolist() if c_reg is not None else [c_bits] * count,
+        )
+        lregs[vd, lanes] = list(results)
 
     @staticmethod
     def _as_fp32(value):
@@ -1196,6 +1232,39 @@ class VectorUnit(TensixBackendUnit):
     def perform_mad(self, va, vb, vc, vd, mod1):
         if self.getDiagnosticSettings().reportSFPUCalculations():
             print(f"SFPU: lreg[{vd}] = lreg[{va}] * lreg[{vb}] + lreg[{vc}]")
+        if mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VD:
+            self._perform_mad_lanewise(va, vb, vc, vd, mod1)
+            return
+        if not (vd < 8 or vd == 16):
+            return
+        lanes, count = self._fma_lanes_enabled(vd)
+        if not count:
+            return
+        lregs = self.lreg_file
+        if mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VA:
+            lane_numbers = _LANES[lanes]
+            a = lregs[lregs[7, lane_numbers] & 15, lane_numbers].tolist()
+        else:
+            a = lregs[va, lanes].tolist()
+        b = lregs[vb, lanes].tolist()
+        c = lregs[vc, lanes].tolist()
+        # The Blackhole operand negations; see _perform_mad_lanewise.
+        if self.backend.blackhole:
+            if mod1 & 1:
+                a = [bits ^ 0x80000000 for bits in a]
+            if mod1 & 2:
+                c = [bits ^ 0x80000000 for bits in c]
+        lregs[vd, lanes] = list(map(self.fma, a, b, c))
+
+    def _perform_mad_lanewise(self, va, vb, vc, vd, mod1):
+        """SFPMAD one lane at a time, through the scalar FMA port.
+
+        The original form of :meth:`perform_mad`, kept for indirect VD: there
+        ``vd`` is re-read from ``lregs[7]`` by each enabled lane and *stays*
+        re-pointed for the lanes after it (including for their back-door
+        check), a lane-to-lane dependency the all-lanes form does not model.
+        It is also the reference ``fma_lanes_test.py`` checks that form against.
+        """
         for lane in range(32):
             if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
                 if self.isLaneEnabled(lane):
@@ -1225,6 +1294,23 @@ class VectorUnit(TensixBackendUnit):
                     if vd < 8 or vd == 16:
                         self.lregs[vd][lane] = d
 
+    def _fma_lanes_enabled(self, vd):
+        """The lanes an FMA-shaped op writes, for a fixed (direct) ``vd``, and
+        how many there are. The scalar FMA port is mapped over the lanes
+        written, so the operands are gathered for those lanes only: the first
+        result indexes a row of ``lreg_file`` -- ``slice(None)`` when every lane
+        is enabled, the common case and the cheapest to gather and scatter
+        through, else the array of lane numbers.
+
+        A numpy transcription of the port, one array op per step, was measured
+        slower on the SFPU's 32 lanes (~110 µs against ~65 µs): each of its ~100
+        steps pays a fixed ~1 µs, and it only pulls ahead from about 64 lanes."""
+        mask = self._enabled_lanes() & self._backdoor_lanes(vd)
+        count = int(np.count_nonzero(mask))
+        if count == 32:
+            return slice(None), count
+        return np.flatnonzero(mask), count
+
     def handle_mad(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
         vd = instr_args["lreg_dest"]
@@ -1301,10 +1387,13 @@ class VectorUnit(TensixBackendUnit):
         if vd < 8 or vd == 16:
             self.lregs[vd][lane] = value
 
-    def _lut_lane_active(self, vd, lane):
-        return (
-            vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD)
-        ) and self.isLaneEnabled(lane)
+    def _lut_lanes(self, vd):
+        """The lanes a LUT op evaluates, and the LReg file as nested lists to
+        read their operands from. Each lane reads only its own lane of LReg[0:7]
+        and writes only its own lane, so reading every operand from this one
+        snapshot is the same as reading the live registers lane by lane."""
+        lanes = np.flatnonzero(self._backdoor_lanes(vd) & self._enabled_lanes())
+        return lanes.tolist(), self.lreg_file[:8].tolist()
 
     def handle_sfplut(self, instruction_info, issue_thread, instr_args):
         """SFPLUT: piecewise-linear evaluation from three 8-bit coefficient pairs.
@@ -1337,17 +1426,16 @@ class VectorUnit(TensixBackendUnit):
                 "SGN_RETAIN (4) and INDIRECT_VD (8) are defined)"
             )
 
-        for lane in range(32):
-            if not self._lut_lane_active(vd, lane):
-                continue
-            l3 = self._as_fp32_bits(self.lregs[3][lane])
+        lanes, lregs = self._lut_lanes(vd)
+        for lane in lanes:
+            l3 = lregs[3][lane]
             b = l3 & 0x7FFFFFFF  # absolute value
             if b < VectorUnit.SFPLUT_RANGE_1_0:
-                coeffs = self._as_fp32_bits(self.lregs[0][lane])
+                coeffs = lregs[0][lane]
             elif b < VectorUnit.SFPLUT_RANGE_2_0:
-                coeffs = self._as_fp32_bits(self.lregs[1][lane])
+                coeffs = lregs[1][lane]
             else:
-                coeffs = self._as_fp32_bits(self.lregs[2][lane])
+                coeffs = lregs[2][lane]
             a = self._lut8_to_fp32((coeffs >> 8) & 0xFF)
             c = self._lut8_to_fp32(coeffs & 0xFF)
             d = self._lut_fma(
@@ -1388,10 +1476,9 @@ class VectorUnit(TensixBackendUnit):
             else VectorUnit.SFPLUT_RANGE_3_0
         )
 
-        for lane in range(32):
-            if not self._lut_lane_active(vd, lane):
-                continue
-            l3 = self._as_fp32_bits(self.lregs[3][lane])
+        lanes, lregs = self._lut_lanes(vd)
+        for lane in lanes:
+            l3 = lregs[3][lane]
             b = l3 & 0x7FFFFFFF  # absolute value
             if b < VectorUnit.SFPLUT_RANGE_1_0:
                 i = 0
@@ -1403,7 +1490,7 @@ class VectorUnit(TensixBackendUnit):
             if fp16_tables:
                 if three_entry:
                     # One LReg holds both halves of the pair for this range.
-                    entry = self._as_fp32_bits(self.lregs[i][lane])
+                    entry = lregs[i][lane]
                     a = self._lut16_to_fp32((entry >> 16) & 0xFFFF)
                     c = self._lut16_to_fp32(entry & 0xFFFF)
                 else:
@@ -1420,15 +1507,11 @@ class VectorUnit(TensixBackendUnit):
                         j = 0
                     else:
                         j = 16
-                    a = self._lut16_to_fp32(
-                        (self._as_fp32_bits(self.lregs[0 + i][lane]) >> j) & 0xFFFF
-                    )
-                    c = self._lut16_to_fp32(
-                        (self._as_fp32_bits(self.lregs[4 + i][lane]) >> j) & 0xFFFF
-                    )
+                    a = self._lut16_to_fp32((lregs[0 + i][lane] >> j) & 0xFFFF)
+                    c = self._lut16_to_fp32((lregs[4 + i][lane] >> j) & 0xFFFF)
             else:
-                a = self._as_fp32_bits(self.lregs[0 + i][lane])
-                c = self._as_fp32_bits(self.lregs[4 + i][lane])
+                a = lregs[0 + i][lane]
+                c = lregs[4 + i][lane]
 
             d = self._lut_fma(
                 a, b, c, l3 & 0x80000000, mod1 & VectorUnit.SFPLUTFP32_MOD1_SGN_RETAIN
@@ -1444,15 +1527,15 @@ class VectorUnit(TensixBackendUnit):
         the movement is purely within a column — this is *not* a transpose of the
         4x8 grid. Both halves of each swap read the pre-swap values, and each
         write is gated on its own lane's enable."""
-        for column in range(8):
-            for i in range(4):
-                for j in range(i):
-                    ij = self.lregs[base + i][j * 8 + column]
-                    ji = self.lregs[base + j][i * 8 + column]
-                    if self.isLaneEnabled(j * 8 + column):
-                        self.lregs[base + i][j * 8 + column] = ji
-                    if self.isLaneEnabled(i * 8 + column):
-                        self.lregs[base + j][i * 8 + column] = ij
+        # (register, row, column) over LReg[base:base+4]; a view, so the masked
+        # copy below writes the file. The transposed block is a fresh array, so
+        # every lane is written from the pre-swap values.
+        block = self.lreg_file[base : base + 4].reshape(4, 4, 8)
+        np.copyto(
+            block,
+            block.transpose(1, 0, 2).copy(),
+            where=self._enabled_lanes().reshape(1, 4, 8),
+        )
 
     def handle_sfptransp(self, instruction_info, issue_thread, instr_args):
         # SFPTRANSP transposes LReg[0:4] and LReg[4:8] independently, used by the
@@ -1466,11 +1549,7 @@ class VectorUnit(TensixBackendUnit):
         # The VD / backdoor-load gate is on the instruction as a whole rather
         # than per lane (SFPTRANSP.md wraps the two Transpose4 calls in it), so
         # it is the same "any lane permits it" test SFPPUSHC / SFPPOPC use.
-        do_transpose = any(
-            vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD)
-            for lane in range(32)
-        )
-        if do_transpose:
+        if self._any_backdoor_lane(vd):
             self._transpose4(0)
             self._transpose4(4)
 
@@ -1493,46 +1572,26 @@ class VectorUnit(TensixBackendUnit):
     def handle_sfpcompc(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
 
-        do_compc = False
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                do_compc = True
-                break
-
-        if do_compc:
+        if self._any_backdoor_lane(vd):
             if len(self.flagStack) == 0:
                 # With nothing pushed, SFPCOMPC is a plain inversion of the lane
-                # flags (ttsim: `cc = ~cc` when cc_sp == 0). The per-lane loop
-                # below indexes both halves of `top`, so they must be vectors --
-                # scalars here raise TypeError the moment a kernel complements
-                # an empty stack, which `tanh_tile` and `where_tile` both do.
-                top = ([True] * 32, [True] * 32)
+                # flags (ttsim: `cc = ~cc` when cc_sp == 0).
+                top_flags = top_use = _ALL_LANES
             else:
-                top = self.flagStack[-1]
+                top_flags, top_use = self.flagStack[-1]
 
-            # Note we are doing this on a lane by lane basis, whereas have implemented
-            # popc and pushc across all lanes
-            for lane in range(32):
-                # Invert laneFlags, subject to top
-                if top[1][lane] and self.useLaneFlagsForLaneEnable[lane]:
-                    self.laneFlags[lane] = top[0][lane] and (not self.laneFlags[lane])
-                else:
-                    self.laneFlags[lane] = False
+            # Invert laneFlags, subject to top.
+            self._lane_flags = (top_use & self._use_lane_flags) & (
+                top_flags & ~self._lane_flags
+            )
 
     def handle_sfppopc(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
         vd = instr_args["lreg_dest"]
 
-        do_pop = False
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                do_pop = True
-                break
-
-        if do_pop:
+        if self._any_backdoor_lane(vd):
             if len(self.flagStack) == 0:
-                # Both halves are indexed per lane, so they must be vectors.
-                top = ([False] * 32, [False] * 32)
+                top = (_NO_LANES, _NO_LANES)
             else:
                 top = self.flagStack[-1]
 
@@ -1545,69 +1604,66 @@ class VectorUnit(TensixBackendUnit):
 
             if mod1 == 0:
                 # Set LaneFlags and UseLaneFlagsForLaneEnable to Top
-                self.laneFlags = list(top[0])
-                self.useLaneFlagsForLaneEnable = list(top[1])
+                self._lane_flags = top[0].copy()
+                self._use_lane_flags = top[1].copy()
             elif mod1 <= 12:
                 # Mutate LaneFlags and UseLaneFlagsForLaneEnable based on Top
-                self.laneFlags = list(self.booleanOp(mod1, self.laneFlags, top[0]))
-                self.useLaneFlagsForLaneEnable = list(top[1])
+                self._lane_flags = self.booleanOp(mod1, self._lane_flags, top[0])
+                self._use_lane_flags = top[1].copy()
             elif mod1 == 13:
                 # Just invert laneFlags
-                self.laneFlags = [not v for v in self.laneFlags]
+                self._lane_flags = ~self._lane_flags
             elif mod1 == 14:
-                # Set laneFlags and useLaneFlagsForLaneEnable to constants
-                self.laneFlags = self.useLaneFlagsForLaneEnable = [
-                    True for _ in range(32)
-                ]
+                # Set laneFlags and useLaneFlagsForLaneEnable to constants. (This
+                # once bound both names to one list, so a later in-place flag
+                # update also rewrote the enables.)
+                self._lane_flags = np.ones(32, dtype=bool)
+                self._use_lane_flags = np.ones(32, dtype=bool)
             elif mod1 == 15:
                 # Set LaneFlags and UseLaneFlagsForLaneEnable to constants
-                self.useLaneFlagsForLaneEnable = [True for _ in range(32)]
-                self.laneFlags = [False for _ in range(32)]
+                self._use_lane_flags = np.ones(32, dtype=bool)
+                self._lane_flags = np.zeros(32, dtype=bool)
 
-    def booleanOp(self, mod1, A_list, B_list):
-        for A, B in zip(A_list, B_list):
-            match mod1:
-                case 1:
-                    yield B
-                case 2:
-                    yield not B
-                case 3:
-                    yield A and B
-                case 4:
-                    yield A or B
-                case 5:
-                    yield A and (not B)
-                case 6:
-                    yield A or (not B)
-                case 7:
-                    yield (not A) and B
-                case 8:
-                    yield (not A) or B
-                case 9:
-                    yield (not A) and (not B)
-                case 10:
-                    yield (not A) or (not B)
-                case 11:
-                    yield A != B
-                case 12:
-                    yield A == B
+    @staticmethod
+    def booleanOp(mod1, A, B):
+        """SFPPOPC's ``mod1`` 1..12 combination of LaneFlags (``A``) with the
+        stack top's (``B``), over bool arrays; a new array."""
+        match mod1:
+            case 1:
+                return B.copy()
+            case 2:
+                return ~B
+            case 3:
+                return A & B
+            case 4:
+                return A | B
+            case 5:
+                return A & ~B
+            case 6:
+                return A | ~B
+            case 7:
+                return ~A & B
+            case 8:
+                return ~A | B
+            case 9:
+                return ~A & ~B
+            case 10:
+                return ~A | ~B
+            case 11:
+                return A != B
+            case 12:
+                return A == B
 
     def handle_sfppushc(self, instruction_info, issue_thread, instr_args):
         vd = instr_args["lreg_dest"]
-        do_push = False
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                do_push = True
-                break
-
-        if do_push:
+        if self._any_backdoor_lane(vd):
             assert len(self.flagStack) < 8
-            # Snapshot by value: SFPSETCC and friends mutate these lists in
+            # Snapshot by value: SFPSETCC and friends mutate these arrays in
             # place, which would otherwise rewrite the entry already pushed.
             # The stack is LIFO -- pushed at the end, read and popped from the
             # end (ttsim writes at cc_sp then increments, and pops the reverse).
             self.flagStack.append(
-                (list(self.laneFlags), list(self.useLaneFlagsForLaneEnable))
+                (self._lane_flags.copy(), self._use_lane_flags.copy())
             )
 
     def handle_sfpsetcc(self, instruction_info, issue_thread, instr_args):
@@ -1616,35 +1672,35 @@ class VectorUnit(TensixBackendUnit):
         vc = instr_args["lreg_c"]
         imm1 = instr_args["imm12_math"] & 0x1
 
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if self.isLaneEnabled(
-                    lane
-                ):  # Is this correct? Seems strange that can not reenable
-                    if not self.useLaneFlagsForLaneEnable[lane]:
-                        self.laneFlags[lane] = False
-                    elif mod1 & VectorUnit.SFPSETCC_MOD1_CLEAR:
-                        self.laneFlags[lane] = False
-                    elif mod1 & VectorUnit.SFPSETCC_MOD1_IMM_BIT0:
-                        self.laneFlags[lane] = imm1 != 0
-                    else:
-                        # Lanes are raw uint32 bit patterns, and ttsim compares
-                        # them as `int32_t src = LReg[c]` -- i.e. for a float
-                        # lane the FP32 sign bit is what decides `< 0`. An
-                        # unsigned Python int is never negative, so without this
-                        # every `v_if(x < 0)` (the Newton-Raphson step in
-                        # sfpu_reciprocal_iter, among others) silently disabled
-                        # all 32 lanes.
-                        c = conv_to_int32(self.lregs[vc][lane])
-                        match mod1:
-                            case VectorUnit.SFPSETCC_MOD1_LREG_LT0:
-                                self.laneFlags[lane] = c < 0
-                            case VectorUnit.SFPSETCC_MOD1_LREG_NE0:
-                                self.laneFlags[lane] = c != 0
-                            case VectorUnit.SFPSETCC_MOD1_LREG_GTE0:
-                                self.laneFlags[lane] = c >= 0
-                            case VectorUnit.SFPSETCC_MOD1_LREG_EQ0:
-                                self.laneFlags[lane] = c == 0
+        # Is this correct? Seems strange that can not reenable.
+        lanes = self._backdoor_lanes(vd) & self._enabled_lanes()
+        flags = self._lane_flags
+        if mod1 & VectorUnit.SFPSETCC_MOD1_CLEAR:
+            result = False
+        elif mod1 & VectorUnit.SFPSETCC_MOD1_IMM_BIT0:
+            result = imm1 != 0
+        else:
+            # Lanes are raw uint32 bit patterns, and ttsim compares them as
+            # `int32_t src = LReg[c]` -- i.e. for a float lane the FP32 sign bit
+            # is what decides `< 0`. Compared unsigned, no lane is ever
+            # negative, so without this every `v_if(x < 0)` (the Newton-Raphson
+            # step in sfpu_reciprocal_iter, among others) silently disabled all
+            # 32 lanes.
+            c = self.lreg_file[vc].view(np.int32)
+            match mod1:
+                case VectorUnit.SFPSETCC_MOD1_LREG_LT0:
+                    result = c < 0
+                case VectorUnit.SFPSETCC_MOD1_LREG_NE0:
+                    result = c != 0
+                case VectorUnit.SFPSETCC_MOD1_LREG_GTE0:
+                    result = c >= 0
+                case VectorUnit.SFPSETCC_MOD1_LREG_EQ0:
+                    result = c == 0
+                case _:
+                    # No condition: the flag is left as it was.
+                    result = flags
+        # A lane that is not using its flag for enable has it cleared.
+        np.copyto(flags, self._use_lane_flags & result, where=lanes)
 
     @staticmethod
     def _sign_mag_total_order(value):
@@ -1660,6 +1716,11 @@ class VectorUnit(TensixBackendUnit):
             value ^= 0x7FFFFFFF
         return conv_to_int32(value)
 
+    @staticmethod
+    def _sign_mag_total_orders(values):
+        """:meth:`_sign_mag_total_order` over a uint32 row; an int32 row."""
+        return np.where(values & 0x80000000, values ^ 0x7FFFFFFF, values).view(np.int32)
+
     def _compare_lanes(self, name, mod1, vd, vc, compare):
         """Shared body of the Blackhole SFPGT / SFPLE comparisons.
 
@@ -1679,19 +1740,16 @@ class VectorUnit(TensixBackendUnit):
             raise NotImplementedError(
                 f"{name} with instr_mod1={mod1} is not modelled (want 1 or 8)"
             )
-        set_vd = mod1 == VectorUnit.SFPCMP_MOD1_SET_VD
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if self.isLaneEnabled(lane):
-                    result = compare(
-                        self._sign_mag_total_order(self.lregs[vd][lane]),
-                        self._sign_mag_total_order(self.lregs[vc][lane]),
-                    )
-                    if set_vd:
-                        if vd < 8 or vd == 16:
-                            self.lregs[vd][lane] = 0xFFFFFFFF if result else 0
-                    else:
-                        self.laneFlags[lane] = result
+        lanes = self._backdoor_lanes(vd) & self._enabled_lanes()
+        result = compare(
+            self._sign_mag_total_orders(self.lreg_file[vd]),
+            self._sign_mag_total_orders(self.lreg_file[vc]),
+        )
+        if mod1 == VectorUnit.SFPCMP_MOD1_SET_VD:
+            if vd < 8 or vd == 16:
+                self._write(vd, lanes, np.where(result, 0xFFFFFFFF, 0))
+        else:
+            np.copyto(self._lane_flags, result, where=lanes)
 
     def handle_sfpgt(self, instruction_info, issue_thread, instr_args):
         # Blackhole SFPGT: (VD > VC) into LaneFlags (mod1 1) or VD (mod1 8).
@@ -1725,11 +1783,10 @@ class VectorUnit(TensixBackendUnit):
         va = instr_args["lreg_src_a"]
         vb = instr_args["lreg_src_b"]
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    a = conv_to_uint32(self.lregs[va][lane]) & 0x7FFFFF
-                    b = conv_to_uint32(self.lregs[vb][lane]) & 0x7FFFFF
-                    self.lregs[vd][lane] = (a * b) & 0x7FFFFF
+            lregs = self.lreg_file
+            a = (lregs[va] & 0x7FFFFF).astype(np.int64)
+            b = (lregs[vb] & 0x7FFFFF).astype(np.int64)
+            self._write(vd, self._enabled_lanes(), (a * b) & 0x7FFFFF)
 
     # Reciprocal-mantissa lookup table for SFPARECIP (128 entries), a verbatim
     # port of ttsim's data/bh reference (src/tensix.cpp approx_recip).
@@ -1864,6 +1921,8 @@ class VectorUnit(TensixBackendUnit):
         0,
     )
 
+    _ARECIP_LUT_ROW = np.array(ARECIP_LUT, dtype=np.uint32)
+
     @staticmethod
     def _approx_recip(x):
         # x is the FP32 magnitude (bits 30:0). Port of ttsim approx_recip:
@@ -1877,6 +1936,14 @@ class VectorUnit(TensixBackendUnit):
         else:
             return 0
 
+    @staticmethod
+    def _approx_recips(x):
+        """:meth:`_approx_recip` over a uint32 row of magnitudes."""
+        estimate = ((253 - (x >> 23)) << 23) | (
+            VectorUnit._ARECIP_LUT_ROW[(x >> 16) & 0x7F] << 16
+        )
+        return np.where(x < 0x800000, 0x7F800000, np.where(x < 0x7E800000, estimate, 0))
+
     def handle_sfparecip(self, instruction_info, issue_thread, instr_args):
         # Blackhole approximate reciprocal: sign preserved, magnitude replaced by
         # the LUT-based 1/x approximation. Mirrors ttsim's SFPARECIP, which only
@@ -1886,36 +1953,33 @@ class VectorUnit(TensixBackendUnit):
         assert instr_args["instr_mod1"] == 0, "SFPARECIP instr_mod1 not modelled"
         assert instr_args["imm12_math"] == 0, "SFPARECIP imm12_math not modelled"
         if vd < 8:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    x = conv_to_uint32(self.lregs[vc][lane])
-                    self.lregs[vd][lane] = (x & 0x80000000) | self._approx_recip(
-                        x & 0x7FFFFFFF
-                    )
+            x = self.lreg_file[vc]
+            self._write(
+                vd,
+                self._enabled_lanes(),
+                (x & 0x80000000) | self._approx_recips(x & 0x7FFFFFFF),
+            )
 
     def handle_sfpencc(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
         vd = instr_args["lreg_dest"]
         imm2 = instr_args["imm12_math"]
 
-        for lane in range(32):
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if mod1 & VectorUnit.SFPENCC_MOD1_EI:
-                    self.useLaneFlagsForLaneEnable[lane] = (
-                        imm2 & VectorUnit.SFPENCC_IMM2_E
-                    ) != 0
-                elif mod1 & VectorUnit.SFPENCC_MOD1_EC:
-                    self.useLaneFlagsForLaneEnable[
-                        lane
-                    ] = not self.useLaneFlagsForLaneEnable[lane]
-                else:
-                    # UseLaneFlagsForLaneEnable left as-is.
-                    pass
+        lanes = self._backdoor_lanes(vd)
+        use_flags = self._use_lane_flags
+        if mod1 & VectorUnit.SFPENCC_MOD1_EI:
+            np.copyto(use_flags, (imm2 & VectorUnit.SFPENCC_IMM2_E) != 0, where=lanes)
+        elif mod1 & VectorUnit.SFPENCC_MOD1_EC:
+            np.logical_not(use_flags, out=use_flags, where=lanes)
+        else:
+            # UseLaneFlagsForLaneEnable left as-is.
+            pass
 
-                if mod1 & VectorUnit.SFPENCC_MOD1_RI:
-                    self.laneFlags[lane] = (imm2 & VectorUnit.SFPENCC_IMM2_R) != 0
-                else:
-                    self.laneFlags[lane] = True
+        if mod1 & VectorUnit.SFPENCC_MOD1_RI:
+            flag = (imm2 & VectorUnit.SFPENCC_IMM2_R) != 0
+        else:
+            flag = True
+        np.copyto(self._lane_flags, flag, where=lanes)
 
     def handle_sfpiadd(self, instruction_info, issue_thread, instr_args):
         mod1 = instr_args["instr_mod1"]
@@ -1935,34 +1999,31 @@ class VectorUnit(TensixBackendUnit):
             print(f"SFPU: lreg[{vd}] = lreg[{vc}] + lreg[{vb}]")
 
         if vd < 8 or vd == 16:
-            for lane in range(32):
-                if self.isLaneEnabled(lane):
-                    # Every lane is a raw uint32 bit pattern, so read the
-                    # operands as such (ttsim's TENSIX_EXECUTE_SFPIADD).
-                    c = self.lregs[vc][lane]
-                    b = self.lregs[vb][lane]
-
-                    if mod1 & VectorUnit.SFPIADD_MOD1_ARG_IMM:
-                        result = c + imm12
-                    elif mod1 & VectorUnit.SFPIADD_MOD1_ARG_2SCOMP_LREG_DST:
-                        result = c - b
-                    else:
-                        result = c + b
-
-                    # The add wraps, and "negative" is bit 31 of the wrapped
-                    # result (ttsim's `src & 0x80000000`). Testing an unsigned
-                    # Python int for `< 0` never fires.
-                    result &= 0xFFFFFFFF
-                    negative = bool(result & 0x80000000)
-                    self.lregs[vd][lane] = result
-
-                    if vd < 8:
-                        # Mod1 bit 3 (CC_GTE0) wins over bit 2 (CC_NONE), which
-                        # in turn leaves LaneFlags alone.
-                        if mod1 & VectorUnit.SFPIADD_MOD1_CC_GTE0:
-                            self.laneFlags[lane] = not negative
-                        elif not (mod1 & VectorUnit.SFPIADD_MOD1_CC_NONE):
-                            self.laneFlags[lane] = negative
+            lanes = self._enabled_lanes()
+            # Every lane is a raw uint32 bit pattern, so read the operands as
+            # such (ttsim's TENSIX_EXECUTE_SFPIADD).
+            c = self.lreg_file[vc].astype(np.int64)
+            if mod1 & VectorUnit.SFPIADD_MOD1_ARG_IMM:
+                result = c + imm12
+            elif mod1 & VectorUnit.SFPIADD_MOD1_ARG_2SCOMP_LREG_DST:
+                result = c - self.lreg_file[vb]
+            else:
+                result = c + self.lreg_file[vb]
+
+            # The add wraps, and "negative" is bit 31 of the wrapped result
+            # (ttsim's `src & 0x80000000`). Testing an unsigned value for
+            # `< 0` never fires.
+            result &= 0xFFFFFFFF
+            negative = (result & 0x80000000) != 0
+            self._write(vd, lanes, result)
+
+            if vd < 8:
+                # Mod1 bit 3 (CC_GTE0) wins over bit 2 (CC_NONE), which in turn
+                # leaves LaneFlags alone.
+                if mod1 & VectorUnit.SFPIADD_MOD1_CC_GTE0:
+                    np.copyto(self._lane_flags, ~negative, where=lanes)
+                elif not (mod1 & VectorUnit.SFPIADD_MOD1_CC_NONE):
+                    np.copyto(self._lane_flags, negative, where=lanes)
 
     def _read_sfpu_addr_mode(self, instruction_info, instr_args):
         # SFPLOAD/SFPSTORE/SFPLOADMACRO ``sfpu_addr_mode`` is 3 bits on Blackhole
@@ -2058,77 +2119,74 @@ class VectorUnit(TensixBackendUnit):
                 f"[{(addr & ~3) + int(31 / 8)}, X] from thread{issue_thread}"
             )
 
-        for lane in range(32):
-            if self.laneConfigValue(lane, VectorUnit.BLOCK_SFPU_RD_FROM_DEST):
-                continue
-            if vd < 12 or self.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
-                if self.isLaneEnabled(lane) or mod0 == VectorUnit.MOD0_FMT_INT32_ALL:
-                    row = (addr & ~3) + int(lane / 8)
-                    column = (lane & 7) * 2
-                    if addr & 2 or self.laneConfigValue(
-                        lane & 7, VectorUnit.DEST_RD_COL_EXCHANGE
-                    ):
-                        column += 1
-
-                    datum = self.lregs[vd][lane]
-                    match mod0:
-                        case VectorUnit.MOD0_FMT_FP16:
-                            write_val = DataFormatConversions.FP16ToDstFormatFP16(
-                                DataFormatConversions.FP32ToFP16(conv_to_uint32(datum))
-                            )
-                            self.getDst().setDst16b(row, column, write_val)
-                        case VectorUnit.MOD0_FMT_BF16:
-                            write_val = DataFormatConversions.BF16ToDstFormatBF16(
-                                DataFormatConversions.FP32ToBF16(conv_to_uint32(datum))
-                            )
-                            self.getDst().setDst16b(row, column, write_val)
-                        case VectorUnit.MOD0_FMT_FP32:
-                            self.getDst().setDst32b(
-                                row,
-                                column,
-                                DataFormatConversions.FP32ToDstFormatFP32(
-                                    conv_to_uint32(datum)
-                                ),
-                            )
-                        case VectorUnit.MOD0_FMT_INT32 | VectorUnit.MOD0_FMT_INT32_ALL:
-                            # INT32 stored verbatim (mirrors the SFPLOAD case) —
-                            # no float-format rearrangement for integers.
-                            self.getDst().setDst32b(row, column, conv_to_uint32(datum))
-                        case VectorUnit.MOD0_FMT_INT32_SM:
-                            write_val = DataFormatConversions.FP32ToDstFormatFP32(
-                                DataFormatConversions.toSignMag(datum)
-                            )
-                            self.getDst().setDst32b(row, column, write_val)
-                        case VectorUnit.MOD0_FMT_INT8:
-                            write_val = DataFormatConversions.FP16ToDstFormatFP16(
-                                DataFormatConversions.signMag11ToFP16(datum)
-                            )
-                            self.getDst().setDst16b(row, column, write_val)
-                        case VectorUnit.MOD0_FMT_INT8_COMP:
-                            write_val = DataFormatConversions.FP16ToDstFormatFP16(
-                                DataFormatConversions.signMag11ToFP16(
-                                    DataFormatConversions.ToSignMag(datum)
-                                )
-                            )
-                            self.getDst().setDst16b(row, column, write_val)
-                        case VectorUnit.MOD0_FMT_LO16_ONLY | VectorUnit.MOD0_FMT_UINT16:
-                            self.getDst().setDst16b(row, column, datum & 0xFFFF)
-                        case VectorUnit.MOD0_FMT_HI16_ONLY:
-                            self.getDst().setDst16b(row, column, datum >> 16)
-                        case VectorUnit.MOD0_FMT_INT16:
-                            self.getDst().setDst16b(
-                                row, column, ((datum >> 31) << 15) | (datum & 0x7FFF)
-                            )
-                        case VectorUnit.MOD0_FMT_LO16:
-                            self.getDst().setDst32b(
-                                row, column, (datum << 16) | (datum >> 16)
-                            )
-                        case VectorUnit.MOD0_FMT_HI16:
-                            self.getDst().setDst32b(row, column, datum)
-                        case VectorUnit.MOD0_FMT_ZERO:
-                            self.getDst().setDst16b(row, column, 0)
-                        case _:
-                            raise NotImplementedError()
+        config = self.laneConfig.tolist()
+        reg = self.lregs[vd]
+        lanes = self._dest_lanes(mod0) & self._backdoor_lanes(vd)
+        for lane in np.flatnonzero(lanes).tolist():
+            row = (addr & ~3) + (lane >> 3)
+            column = (lane & 7) * 2
+            if addr & 2 or get_nth_bit(
+                config[lane & 7], VectorUnit.DEST_RD_COL_EXCHANGE[0]
+            ):
+                column += 1
+
+            datum = reg[lane]
+            match mod0:
+                case VectorUnit.MOD0_FMT_FP16:
+                    write_val = DataFormatConversions.FP16ToDstFormatFP16(
+                        DataFormatConversions.FP32ToFP16(conv_to_uint32(datum))
+                    )
+                    self.getDst().setDst16b(row, column, write_val)
+                case VectorUnit.MOD0_FMT_BF16:
+                    write_val = DataFormatConversions.BF16ToDstFormatBF16(
+                        DataFormatConversions.FP32ToBF16(conv_to_uint32(datum))
+                    )
+                    self.getDst().setDst16b(row, column, write_val)
+                case VectorUnit.MOD0_FMT_FP32:
+                    self.getDst().setDst32b(
+                        row,
+                        column,
+                        DataFormatConversions.FP32ToDstFormatFP32(
+                            conv_to_uint32(datum)
+                        ),
+                    )
+                case VectorUnit.MOD0_FMT_INT32 | VectorUnit.MOD0_FMT_INT32_ALL:
+                    # INT32 stored verbatim (mirrors the SFPLOAD case) —
+                    # no float-format rearrangement for integers.
+                    self.getDst().setDst32b(row, column, conv_to_uint32(datum))
+                case VectorUnit.MOD0_FMT_INT32_SM:
+                    write_val = DataFormatConversions.FP32ToDstFormatFP32(
+                        DataFormatConversions.toSignMag(datum)
+                    )
+                    self.getDst().setDst32b(row, column, write_val)
+                case VectorUnit.MOD0_FMT_INT8:
+                    write_val = DataFormatConversions.FP16ToDstFormatFP16(
+                        DataFormatConversions.signMag11ToFP16(datum)
+                    )
+                    self.getDst().setDst16b(row, column, write_val)
+                case VectorUnit.MOD0_FMT_INT8_COMP:
+                    write_val = DataFormatConversions.FP16ToDstFormatFP16(
+                        DataFormatConversions.signMag11ToFP16(
+                            DataFormatConversions.ToSignMag(datum)
+                        )
+                    )
+                    self.getDst().setDst16b(row, column, write_val)
+                case VectorUnit.MOD0_FMT_LO16_ONLY | VectorUnit.MOD0_FMT_UINT16:
+                    self.getDst().setDst16b(row, column, datum & 0xFFFF)
+                case VectorUnit.MOD0_FMT_HI16_ONLY:
+                    self.getDst().setDst16b(row, column, datum >> 16)
+                case VectorUnit.MOD0_FMT_INT16:
+                    self.getDst().setDst16b(
+                        row, column, ((datum >> 31) << 15) | (datum & 0x7FFF)
+                    )
+                case VectorUnit.MOD0_FMT_LO16:
+                    self.getDst().setDst32b(row, column, (datum << 16) | (datum >> 16))
+                case VectorUnit.MOD0_FMT_HI16:
+                    self.getDst().setDst32b(row, column, datum)
+                case VectorUnit.MOD0_FMT_ZERO:
+                    self.getDst().setDst16b(row, column, 0)
+                case _:
+                    raise NotImplementedError()
 
         self.backend.getRWC(issue_thread).applyPartialAddrMod(issue_thread, addrmod)
 
@@ -2151,77 +2209,75 @@ class VectorUnit(TensixBackendUnit):
             )
 
         if vd < 8:
-            for lane in range(32):
-                if self.laneConfigValue(lane, VectorUnit.BLOCK_SFPU_RD_FROM_DEST):
-                    continue
-                if self.isLaneEnabled(lane) or mod0 == VectorUnit.MOD0_FMT_INT32_ALL:
-                    row = (addr & ~3) + int(lane / 8)
-                    column = (lane & 7) * 2
-                    if addr & 2 or self.laneConfigValue(
-                        lane & 7, VectorUnit.DEST_RD_COL_EXCHANGE
-                    ):
-                        column += 1
-
-                    match mod0:
-                        case VectorUnit.MOD0_FMT_FP16:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = DataFormatConversions.FP16InDstToFP32(
-                                rd,
-                                self.laneConfigValue(lane, VectorUnit.ENABLE_FP16A_INF),
-                            )
-                        case VectorUnit.MOD0_FMT_BF16:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = DataFormatConversions.BF16InDstToBF16(rd) << 16
-                        case VectorUnit.MOD0_FMT_FP32:
-                            rd = self.getDst().getDst32b(row, column)
-                            datum = DataFormatConversions.FP32InDstToFP32(rd)
-                        case VectorUnit.MOD0_FMT_INT32 | VectorUnit.MOD0_FMT_INT32_ALL:
-                            # INT32 is stored verbatim in Dst, so load it raw. The
-                            # FP32InDstToFP32 rearrangement is only for actual
-                            # floats — applying it to an integer permutes its bits
-                            # and corrupts every non-bit-symmetric op (add, sub,
-                            # and, or), while XOR-with-a-halfword-mask survives.
-                            datum = self.getDst().getDst32b(row, column)
-                        case VectorUnit.MOD0_FMT_INT32_SM:
-                            rd = self.getDst().getDst32b(row, column)
-                            datum = DataFormatConversions.signMagToTwosComp(
-                                DataFormatConversions.FP32InDstToFP32(rd)
-                            )
-                        case VectorUnit.MOD0_FMT_INT8:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = DataFormatConversions.signMag8ToSignMag32(rd)
-                        case VectorUnit.MOD0_FMT_INT8_COMP:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = DataFormatConversions.signMagToTwosComp(
-                                DataFormatConversions.signMag11ToSignMag32(rd)
-                            )
-                        case VectorUnit.MOD0_FMT_LO16_ONLY:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = (self.lregs[vd][lane] & 0xFFFF0000) | rd
-                        case VectorUnit.MOD0_FMT_HI16_ONLY:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = (rd << 16) | (self.lregs[vd][lane] & 0xFFFF)
-                        case VectorUnit.MOD0_FMT_HI16_ONLY:
-                            rd = self.getDst().getDst16b(row, column)
-                            datum = DataFormatConversions.signMag16ToSignMag32(rd)
-                        case VectorUnit.MOD0_FMT_UINT16 | VectorUnit.MOD0_FMT_LO16:
-                            datum = DataFormatConversions.signMag16ToSignMag32(rd)
-                        case VectorUnit.MOD0_FMT_HI16:
-                            datum = DataFormatConversions.signMag16ToSignMag32(rd) << 16
-                        case VectorUnit.MOD0_FMT_ZERO:
-                            datum = 0
-                        case _:
-                            raise NotImplementedError()
-
-                    self.lregs[vd][lane] = datum
-                    if (
-                        (vd < 4)
-                        and self.laneConfigValue(lane, VectorUnit.ENABLE_DEST_INDEX)
-                        and self.laneConfigValue(
-                            lane, VectorUnit.CAPTURE_DEFAULT_DEST_INDEX
+            config = self.laneConfig.tolist()
+            for lane in np.flatnonzero(self._dest_lanes(mod0)).tolist():
+                row = (addr & ~3) + (lane >> 3)
+                column = (lane & 7) * 2
+                if addr & 2 or get_nth_bit(
+                    config[lane & 7], VectorUnit.DEST_RD_COL_EXCHANGE[0]
+                ):
+                    column += 1
+
+                match mod0:
+                    case VectorUnit.MOD0_FMT_FP16:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = DataFormatConversions.FP16InDstToFP32(
+                            rd,
+                            get_nth_bit(config[lane], VectorUnit.ENABLE_FP16A_INF[0]),
+                        )
+                    case VectorUnit.MOD0_FMT_BF16:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = DataFormatConversions.BF16InDstToBF16(rd) << 16
+                    case VectorUnit.MOD0_FMT_FP32:
+                        rd = self.getDst().getDst32b(row, column)
+                        datum = DataFormatConversions.FP32InDstToFP32(rd)
+                    case VectorUnit.MOD0_FMT_INT32 | VectorUnit.MOD0_FMT_INT32_ALL:
+                        # INT32 is stored verbatim in Dst, so load it raw. The
+                        # FP32InDstToFP32 rearrangement is only for actual
+                        # floats — applying it to an integer permutes its bits
+                        # and corrupts every non-bit-symmetric op (add, sub,
+                        # and, or), while XOR-with-a-halfword-mask survives.
+                        datum = self.getDst().getDst32b(row, column)
+                    case VectorUnit.MOD0_FMT_INT32_SM:
+                        rd = self.getDst().getDst32b(row, column)
+                        datum = DataFormatConversions.signMagToTwosComp(
+                            DataFormatConversions.FP32InDstToFP32(rd)
+                        )
+                    case VectorUnit.MOD0_FMT_INT8:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = DataFormatConversions.signMag8ToSignMag32(rd)
+                    case VectorUnit.MOD0_FMT_INT8_COMP:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = DataFormatConversions.signMagToTwosComp(
+                            DataFormatConversions.signMag11ToSignMag32(rd)
                         )
-                    ):
-                        self.lregs[vd + 4][lane] = (row << 4) | column
+                    case VectorUnit.MOD0_FMT_LO16_ONLY:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = (self.lregs[vd][lane] & 0xFFFF0000) | rd
+                    case VectorUnit.MOD0_FMT_HI16_ONLY:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = (rd << 16) | (self.lregs[vd][lane] & 0xFFFF)
+                    case VectorUnit.MOD0_FMT_HI16_ONLY:
+                        rd = self.getDst().getDst16b(row, column)
+                        datum = DataFormatConversions.signMag16ToSignMag32(rd)
+                    case VectorUnit.MOD0_FMT_UINT16 | VectorUnit.MOD0_FMT_LO16:
+                        datum = DataFormatConversions.signMag16ToSignMag32(rd)
+                    case VectorUnit.MOD0_FMT_HI16:
+                        datum = DataFormatConversions.signMag16ToSignMag32(rd) << 16
+                    case VectorUnit.MOD0_FMT_ZERO:
+                        datum = 0
+                    case _:
+                        raise NotImplementedError()
+
+                self.lregs[vd][lane] = datum
+                if (
+                    (vd < 4)
+                    and get_nth_bit(config[lane], VectorUnit.ENABLE_DEST_INDEX[0])
+                    and get_nth_bit(
+                        config[lane], VectorUnit.CAPTURE_DEFAULT_DEST_INDEX[0]
+                    )
+                ):
+                    self.lregs[vd + 4][lane] = (row << 4) | column
 
         self.backend.getRWC(issue_thread).applyPartialAddrMod(issue_thread, addrmod)
 
@@ -2231,27 +2287,25 @@ class VectorUnit(TensixBackendUnit):
         imm16 = instr_args["imm16"]
 
         assert vd < 8
-        for lane in range(32):
-            if self.isLaneEnabled(lane):
-                match mod0:
-                    case VectorUnit.SFPLOADI_MOD0_FLOATB:
-                        self.lregs[vd][lane] = self.BF16toFP32(imm16)
-                    case VectorUnit.SFPLOADI_MOD0_FLOATA:
-                        self.lregs[vd][lane] = self.FP16toFP32(imm16)
-                    case VectorUnit.SFPLOADI_MOD0_USHORT:
-                        self.lregs[vd][lane] = imm16
-                    case VectorUnit.SFPLOADI_MOD0_SHORT:
-                        self.lregs[vd][lane] = imm16
-                    case VectorUnit.SFPLOADI_MOD0_UPPER:
-                        self.lregs[vd][lane] = (imm16 << 16) | (
-                            conv_to_uint32(self.lregs[vd][lane]) & 0x0000FFFF
-                        )
-                    case VectorUnit.SFPLOADI_MOD0_LOWER:
-                        self.lregs[vd][lane] = (
-                            conv_to_uint32(self.lregs[vd][lane]) & 0xFFFF0000
-                        ) | imm16
-                    case _:
-                        raise ValueError()
+        lanes = self._enabled_lanes()
+        match mod0:
+            case VectorUnit.SFPLOADI_MOD0_FLOATB:
+                value = self.BF16toFP32(imm16)
+            case VectorUnit.SFPLOADI_MOD0_FLOATA:
+                value = self.FP16toFP32(imm16)
+            case VectorUnit.SFPLOADI_MOD0_USHORT:
+                value = imm16
+            case VectorUnit.SFPLOADI_MOD0_SHORT:
+                value = imm16
+            case VectorUnit.SFPLOADI_MOD0_UPPER:
+                value = (imm16 << 16) | (self.lreg_file[vd] & 0x0000FFFF)
+            case VectorUnit.SFPLOADI_MOD0_LOWER:
+                value = (self.lreg_file[vd] & 0xFFFF0000) | imm16
+            case _:
+                if lanes.any():
+                    raise ValueError()
+                return
+        self._write(vd, lanes, value)
 
     def handle_sfpnop(self, instruction_info, issue_thread, instr_args):
         pass
@@ -2260,27 +2314,33 @@ class VectorUnit(TensixBackendUnit):
         mod1 = instr_args["instr_mod1"]
         vd = instr_args["config_dest"]
         imm16 = instr_args["imm16_math"]
+        # Plain-list copies of the state each lane reads, and LaneConfig as a
+        # list it updates and then stores back: this loop is lane at a time
+        # (LoadMacroConfig is per-lane objects), and list indexing is several
+        # times cheaper than array element access.
+        use_flags = self._use_lane_flags.tolist()
+        flags = self._lane_flags.tolist()
+        lreg0 = self.lreg_file[0].tolist()
+        config = self.laneConfig.tolist()
         for lane in range(32):
             if mod1 & VectorUnit.MOD1_IMM16_IS_LANE_MASK:
                 if not get_nth_bit(imm16, (lane & 7) * 2):
                     continue
 
-            if self.useLaneFlagsForLaneEnable[lane & 7]:
-                if not self.laneFlags[lane & 7]:
+            if use_flags[lane & 7]:
+                if not flags[lane & 7]:
                     continue
 
             match vd:
                 case 0 | 1 | 2 | 3:
                     # Write to LoadMacroConfig::InstructionTemplate.
-                    self.loadMacroConfig[lane].instructionTemplate[vd] = self.lregs[0][
-                        lane & 7
-                    ]
+                    self.loadMacroConfig[lane].instructionTemplate[vd] = lreg0[lane & 7]
                 case 4 | 5 | 6 | 7:
                     # Write to LoadMacroConfig::Sequence
                     value = (
                         imm16
                         if (mod1 & VectorUnit.MOD1_IMM16_IS_VALUE)
-                        else self.lregs[0][lane & 7]
+                        else lreg0[lane & 7]
                     )
                     self.loadMacroConfig[lane].sequence[vd - 4] = value
                 case 8:
@@ -2288,7 +2348,7 @@ class VectorUnit(TensixBackendUnit):
                     value = (
                         imm16
                         if (mod1 & VectorUnit.MOD1_IMM16_IS_VALUE)
-                        else self.lregs[0][lane & 7]
+                        else lreg0[lane & 7]
                     )
                     self.loadMacroConfig[lane].misc(value, mod1 & 6)
                 case 9 | 10:
@@ -2306,36 +2366,38 @@ class VectorUnit(TensixBackendUnit):
                             case 14:
                                 value = -0.34484843
                     else:
-                        value = self.lregs[0][lane & 7]
+                        value = lreg0[lane & 7]
                     self.lregs[vd][lane] = value
                 case 15:
                     # Write or manipulate LaneConfig
-                    original = self.laneConfig[lane]
+                    original = config[lane]
                     value = (
                         imm16
                         if (mod1 & VectorUnit.MOD1_IMM16_IS_VALUE)
-                        else self.lregs[0][lane & 7]
+                        else lreg0[lane & 7]
                     )
                     match mod1 & 6:
                         case 0:
-                            self.laneConfig[lane] = value
+                            config[lane] = value
                         case VectorUnit.MOD1_BITWISE_OR:
-                            self.laneConfig[lane] |= value
+                            config[lane] |= value
                         case VectorUnit.MOD1_BITWISE_AND:
-                            self.laneConfig[lane] &= value
+                            config[lane] &= value
                         case VectorUnit.MOD1_BITWISE_XOR:
-                            self.laneConfig[lane] ^= value
+                            config[lane] ^= value
 
                     if mod1 & VectorUnit.MOD1_IMM16_IS_VALUE:
-                        self.laneConfig[lane] |= original & ~0xFFFF
+                        config[lane] |= original & ~0xFFFF
+        if vd == 15:
+            self.laneConfig[:] = config
 
     def isLaneEnabled(self, lane):
         if get_nth_bit(
             self.laneConfigValue(lane & 7, VectorUnit.ROW_MASK), int(lane / 8)
         ):
             return False
-        elif self.useLaneFlagsForLaneEnable[lane]:
-            return self.laneFlags[lane]
+        elif self._use_lane_flags[lane]:
+            return bool(self._lane_flags[lane])
         else:
             return True
 
@@ -0,0 +1,149 @@
+"""Pre-resolved config fields and the decoded-configuration cache.
+
+Runs standalone (``python3 -m tt_sim.pe.tensix.config_cache_test``) or under
+pytest.
+
+``TensixBackend.getConfigValue`` / ``getThreadConfigValue`` read through
+``ConfigField`` objects compiled once per architecture, and keep what they
+decode on the config words it came from (``ConfigWords``). What that must not
+change is the value any read returns, so the properties pinned are:
+
+1. The compiled fields are the YAML's: same word, shift and mask as the
+   class-method accessors, for every field of both layouts.
+2. A cached value is dropped by a store to a word it was decoded from —
+   whichever way the word is stored — and by nothing else.
+3. A decoded address modifier is the fields ``applyAddrMod`` used to read one
+   by one, and a ``SETC16`` that reprograms the modifier is seen by the next
+   update.
+4. The cache survives a pickle (a device snapshot) still tracking its words.
+"""
+
+import pickle
+from contextlib import contextmanager
+
+import pytest
+
+from tt_sim.arch.blackhole import BLACKHOLE_PROFILE
+from tt_sim.pe.tensix.backend import TensixBackend
+from tt_sim.pe.tensix.tensix import TensixCoProcessor
+from tt_sim.pe.tensix.util import TensixConfigurationConstants
+
+
+@contextmanager
+def _backend(blackhole):
+    """A bare backend. The config-register layout the class accessors read is
+    process-global, so the Wormhole one is put back on the way out."""
+    try:
+        yield TensixCoProcessor(
+            None,
+            BLACKHOLE_PROFILE.tensix_cfg_state_size if blackhole else None,
+            BLACKHOLE_PROFILE.tensix_thd_state_size if blackhole else None,
+            blackhole=blackhole,
+        ).getBackend()
+    finally:
+        TensixConfigurationConstants.use_blackhole(False)
+
+
+@pytest.mark.parametrize("blackhole", [False, True])
+def test_the_compiled_fields_are_the_yamls(blackhole):
+    fields = TensixConfigurationConstants.fields_for(blackhole)
+    TensixConfigurationConstants.use_blackhole(blackhole)
+    try:
+        assert set(fields) == set(TensixConfigurationConstants.config_constants)
+        for name, field in fields.items():
+            assert field.addr32 == TensixConfigurationConstants.get_addr32(name)
+            assert field.shamt == TensixConfigurationConstants.get_shamt(name)
+            assert field.mask == TensixConfigurationConstants.get_mask(name)
+    finally:
+        TensixConfigurationConstants.use_blackhole(False)
+    assert TensixConfigurationConstants.fields_for(blackhole) is fields
+
+
+@pytest.mark.parametrize("blackhole", [False, True])
+def test_a_store_drops_exactly_what_it_decoded_into(blackhole):
+    with _backend(blackhole) as backend:
+        fields = backend.config_fields
+        unit = backend.config_unit
+        base = fields["THCON_SEC0_REG3_Base_address"]
+        other = fields["THCON_SEC0_REG2_Unpack_fifo_size"]
+        assert base.addr32 != other.addr32
+
+        unit.setConfig(0, base.addr32, base.mask & (0x123 << base.shamt))
+        assert backend.getConfigValue(0, base.name) == 0x123
+        assert backend.getConfigValue(0, other.name) == 0
+        assert base.name in unit.config[0].decoded
+
+        unit.setConfig(0, other.addr32, other.mask)
+        assert base.name in unit.config[0].decoded
+        assert backend.getConfigValue(0, other.name) == other.mask >> other.shamt
+        # The other state's words are separate.
+        assert backend.getConfigValue(1, base.name) == 0
+
+        # A store that bypasses setConfig is still seen.
+        unit.config[0][base.addr32] = base.mask & (0x456 << base.shamt)
+        assert backend.getConfigValue(0, base.name) == 0x456
+
+        state_id = fields["CFG_STATE_ID_StateID"]
+        assert backend.getThreadConfigValue(1, state_id.name) == 0
+        unit.setThreadConfig(1, state_id.addr32, 1 << state_id.shamt)
+        assert backend.getThreadConfigValue(1, state_id.name) == 1
+        assert backend.getThreadConfigValue(0, state_id.name) == 0
+
+
+def test_a_missing_field_reads_as_before():
+    with _backend(blackhole=True) as backend:
+        # Wormhole-only thread config reads as unset on Blackhole ...
+        assert "ADDR_MOD_SET_Base" not in backend.config_fields
+        assert backend.getThreadConfigValue(0, "ADDR_MOD_SET_Base") == 0
+        # ... and an unknown config field still raises.
+        with pytest.raises(IndexError):
+            backend.getConfigValue(0, "NO_SUCH_FIELD")
+
+
+def _program(backend, thread, name, value):
+    field = backend.config_fields[name]
+    words = backend.config_unit.threadConfig[thread]
+    current = words[field.addr32] & ~field.mask
+    backend.config_unit.setThreadConfig(
+        thread, field.addr32, current | ((value << field.shamt) & field.mask)
+    )
+
+
+@pytest.mark.parametrize("blackhole", [False, True])
+def test_a_decoded_address_modifier_is_its_fields(blackhole):
+    with _backend(blackhole) as backend:
+        _program(backend, 0, "ADDR_MOD_AB_SEC2_SrcAIncr", 3)
+        _program(backend, 0, "ADDR_MOD_DST_SEC2_DestIncr", 5)
+        _program(backend, 0, "ADDR_MOD_DST_SEC2_FidelityIncr", 1)
+        decoded = backend.decodedAddrMod(0, 2)
+        assert decoded == tuple(
+            backend.getThreadConfigValue(0, f"ADDR_MOD_{section}_SEC2{suffix}")
+            for section, suffix in TensixBackend._ADDR_MOD_FIELDS
+        )
+
+        rwc = backend.getRWC(0)
+        rwc.applyAddrMod(0, 2)
+        assert (rwc.SrcA, rwc.Dst, rwc.FidelityPhase) == (3, 5, 1)
+        _program(backend, 0, "ADDR_MOD_DST_SEC2_DestClear", 1)
+        rwc.applyAddrMod(0, 2)
+        assert (rwc.SrcA, rwc.Dst, rwc.FidelityPhase) == (6, 0, 2)
+        # Another thread's modifier 2 is its own.
+        assert backend.decodedAddrMod(1, 2) == (0,) * 14
+
+
+def test_the_cache_survives_a_pickle():
+    with _backend(blackhole=False) as backend:
+        field = backend.config_fields["THCON_SEC0_REG3_Base_address"]
+        unit = backend.config_unit
+        unit.setConfig(0, field.addr32, field.mask & (7 << field.shamt))
+        assert backend.getConfigValue(0, field.name) == 7
+
+        restored = pickle.loads(pickle.dumps(backend))
+        assert restored.config_unit.config[0].decoded[field.name] == 7
+        restored.config_unit.setConfig(0, field.addr32, 0)
+        assert restored.getConfigValue(0, field.name) == 0
+        assert backend.getConfigValue(0, field.name) == 7
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,129 @@
+"""The compiled Tensix decode table and decoded-word cache.
+
+Runs standalone (``python3 -m tt_sim.pe.tensix.decode_cache_test``) or under
+pytest.
+
+1. For every opcode in ``tensix_instructions.yaml``, the compiled
+   ``(name, shift, mask)`` extractors give the same ``instr_args`` as slicing
+   each argument out with ``get_bits`` the way the decoder used to, on the
+   all-zero, all-one and random operand fields.
+2. A repeat decode of a word is the cached info object, and the cache is
+   dropped rather than grown past ``_DECODED_LIMIT``.
+3. The ``DecodedInstruction`` for a word is one frozen object, and its
+   ``name`` / ``ex_resource`` are its info's.
+4. The frontend queues carry that object from the core's push to the Wait
+   Gate -- through a MOP expansion and the replay buffer -- so nothing between
+   decodes the word again.
+"""
+
+import dataclasses
+import random
+
+import pytest
+
+from tt_sim.arch.wormhole import WORMHOLE_PROFILE
+from tt_sim.pe.tensix.tensix import TensixCoProcessor
+from tt_sim.pe.tensix.util import TensixInstructionDecoder
+from tt_sim.util.bits import get_bits
+
+
+def _reference_args(instruction):
+    """The per-call argument slicing the decoder did before it was compiled."""
+    info = TensixInstructionDecoder.opcodes[instruction >> 24]
+    instr_args = {}
+    if isinstance(info.get("arguments"), list):
+        arg_ends = [arg["start_bit"] - 1 for arg in info["arguments"][1:]] + [23]
+        for idx, arg in enumerate(info["arguments"]):
+            instr_args[arg["name"]] = get_bits(
+                instruction, arg["start_bit"], arg_ends[idx]
+            )
+    return instr_args
+
+
+def test_extractors_match_get_bits_for_every_opcode():
+    TensixInstructionDecoder.init()
+    rng = random.Random(0x7E)
+    for opcode, entry in TensixInstructionDecoder.opcodes.items():
+        for operands in (0, 0xFFFFFF, *(rng.getrandbits(24) for _ in range(20))):
+            instruction = (opcode << 24) | operands
+            info = TensixInstructionDecoder.getInstructionInfo(instruction)
+            assert info["name"] == entry["name"]
+            assert info["raw_instruction"] == instruction
+            assert info["instr_args"] == _reference_args(instruction), hex(instruction)
+
+
+def test_repeat_decode_is_cached():
+    instruction = (0x7B << 24) | 0x123
+    first = TensixInstructionDecoder.getInstructionInfo(instruction)
+    assert TensixInstructionDecoder.getInstructionInfo(instruction) is first
+    assert TensixInstructionDecoder.isInstructionRecognised(instruction)
+    assert not TensixInstructionDecoder.isInstructionRecognised(0xFF << 24)
+    # The YAML entry itself never gains the per-word keys.
+    assert "instr_args" not in TensixInstructionDecoder.opcodes[0x7B]
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(TensixInstructionDecoder, "_DECODED_LIMIT", 8)
+    monkeypatch.setattr(TensixInstructionDecoder, "_decoded", {})
+    for operands in range(20):
+        TensixInstructionDecoder.getInstructionInfo((0x7B << 24) | operands)
+        assert len(TensixInstructionDecoder._decoded) <= 8
+
+
+def test_a_decoded_instruction_is_one_frozen_object():
+    instruction = (0x7B << 24) | 0x456
+    decoded = TensixInstructionDecoder.decoded(instruction)
+    assert TensixInstructionDecoder.decoded(instruction) is decoded
+    assert decoded.info is TensixInstructionDecoder.getInstructionInfo(instruction)
+    assert decoded.word == instruction
+    assert decoded.name == decoded.info["name"]
+    assert decoded.ex_resource == decoded.info["ex_resource"]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        decoded.word = 0
+
+
+NOP = 0x02 << 24
+#: Two distinct words that decode, for the replay buffer to hold.
+BODY = (NOP, NOP | 1)
+
+
+def _replay(load, length, start=0):
+    return (0x04 << 24) | (start << 14) | (length << 4) | load
+
+
+def test_the_frontend_queues_carry_the_decode():
+    thread = TensixCoProcessor(
+        None,
+        WORMHOLE_PROFILE.tensix_cfg_state_size,
+        WORMHOLE_PROFILE.tensix_thd_state_size,
+    ).getThread(0)
+
+    def expand():
+        for _ in range(8):
+            thread.mop_expander.clock_tick(0)
+            thread.replay_expander.clock_tick(0)
+
+    for word in (_replay(load=1, length=2), *BODY):
+        thread.write(0, word)
+        assert thread.mop_instruction_fifo[-1] is TensixInstructionDecoder.decoded(word)
+    expand()
+    # Loaded and not executed: the buffer holds the decodes, the gate nothing.
+    assert thread.replay_expander.replay_buffer[:2] == [
+        TensixInstructionDecoder.decoded(word) for word in BODY
+    ]
+    assert not thread.wait_gate_instruction_fifo
+
+    thread.write(0, _replay(load=0, length=2))
+    expand()
+    assert len(thread.wait_gate_instruction_fifo) == len(BODY)
+    for instruction, word in zip(thread.wait_gate_instruction_fifo, BODY):
+        assert instruction is TensixInstructionDecoder.decoded(word)
+    # A bare word pushed from outside is decoded on the way in.
+    thread.push_wait_gate_instruction(NOP)
+    assert thread.wait_gate_instruction_fifo[-1] is TensixInstructionDecoder.decoded(
+        NOP
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
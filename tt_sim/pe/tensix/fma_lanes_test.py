@@ -0,0 +1,104 @@
+"""The SFPU FMA ops, run across all their lanes at once.
+
+Runs standalone (``python3 -m tt_sim.pe.tensix.fma_lanes_test``) or under
+pytest.
+
+SFPMAD / SFPADD / SFPMUL / SFPADDI / SFPMULI through a real ``VectorUnit``
+leave every LReg exactly as the lane-at-a-time loop does, under random lane
+masks, lane flags, back-door-disable bits and indirect VA / VD. (The FMA ports
+themselves are pinned in ``fma_model_test.py``.)
+"""
+
+import copy
+import random
+
+import pytest
+
+from tt_sim.pe.tensix.backends.vector import VectorUnit
+from tt_sim.pe.tensix.tensix import TensixCoProcessor
+
+
+def _edge_word(rng):
+    sign = rng.getrandbits(1) << 31
+    exponent = rng.choice((0, 1, 2, 126, 127, 128, 253, 254, 255, rng.randrange(256)))
+    mantissa = rng.choice(
+        (0, 1, 0x7FFFFF, 0x400000, 0x3FFFFF, rng.getrandbits(23), rng.getrandbits(3))
+    )
+    return sign | exponent << 23 | mantissa
+
+
+def _randomised_unit(rng, blackhole):
+    vu = TensixCoProcessor(None, blackhole=blackhole).getBackend().vector_unit
+    for reg in list(range(8)) + [16]:
+        for lane in range(32):
+            vu.lregs[reg][lane] = _edge_word(rng)
+    # Lane 7's low bits are the indirection register for VA / VD.
+    for lane in range(32):
+        if rng.random() < 0.5:
+            vu.lregs[7][lane] = rng.randrange(17)
+    for lane in range(32):
+        vu.laneConfig[lane] = rng.getrandbits(16) if rng.random() < 0.3 else 0
+        vu.useLaneFlagsForLaneEnable[lane] = rng.random() < 0.3
+        vu.laneFlags[lane] = rng.random() < 0.5
+    return vu
+
+
+def _lregs(vu):
+    return [[reg[lane] for lane in range(32)] for reg in vu.lregs]
+
+
+def _reference_addi(vu, instr_args, multiply):
+    """The lane-at-a-time SFPADDI / SFPMULI this tree used to run."""
+    mod1 = instr_args["instr_mod1"]
+    vd = instr_args["lreg_dest"]
+    imm = instr_args["imm16_math"] << 16
+    vc = vd
+    for lane in range(32):
+        if vd < 12 or vu.laneConfigValue(lane, VectorUnit.DISABLE_BACKDOOR_LOAD):
+            if vu.isLaneEnabled(lane):
+                if multiply:
+                    d = vu.fma(imm, vu.lregs[vc][lane] & 0xFFFFFFFF, 0)
+                else:
+                    d = vu.fma(imm, 0x3F800000, vu.lregs[vc][lane] & 0xFFFFFFFF)
+                if (mod1 & VectorUnit.SFPMAD_MOD1_INDIRECT_VD) and vd != 16:
+                    vd = vu.lregs[7][lane] & 15
+                if vd < 8 or vd == 16:
+                    vu.lregs[vd][lane] = d
+
+
+@pytest.mark.parametrize("blackhole", [False, True])
+def test_vector_unit_matches_lanewise(blackhole):
+    rng = random.Random(0xFA + blackhole)
+    for trial in range(300):
+        vu = _randomised_unit(rng, blackhole)
+        reference = copy.deepcopy(vu)
+        op = rng.choice(("mad", "add", "mul", "addi", "muli"))
+        mod1 = rng.choice((0, 1, 2, 3, 4, 8, 12, rng.randrange(16)))
+        args = {
+            "instr_mod1": mod1,
+            "lreg_dest": rng.choice((0, 3, 7, 8, 12, 16)),
+            "lreg_src_a": rng.randrange(17),
+            "lreg_src_b": rng.randrange(17),
+            "lreg_src_c": rng.randrange(17),
+            "imm16_math": rng.getrandbits(16),
+        }
+        if op in ("addi", "muli"):
+            getattr(vu, f"handle_{op}")(None, 0, args)
+            _reference_addi(reference, args, op == "muli")
+        else:
+            getattr(vu, f"handle_{op}")(None, 0, args)
+            va, vc = args["lreg_src_a"], args["lreg_src_c"]
+            if op == "add":
+                va = 10
+            if op == "mul":
+                vc = 9
+            reference._perform_mad_lanewise(
+                va, args["lreg_src_b"], vc, args["lreg_dest"], mod1
+            )
+        assert _lregs(vu) == _lregs(reference), (trial, op, args)
+
+
+if __name__ == "__main__":
+    for blackhole in (False, True):
+        test_vector_unit_matches_lanewise(blackhole)
+    print("ok")
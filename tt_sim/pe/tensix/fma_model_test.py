@@ -21,12 +21,22 @@ models over the same inputs; that harness also fuzz-matched both ports on 200k
 random triples (19934 of which exercised the Wormhole/Blackhole difference),
 with zero mismatches.
 
+The ports have since been rewritten for speed (their operand unpacking is
+inlined), so the ports as first written -- the ones that fuzz-matched ttsim --
+are kept below as a reference, and a seeded fuzz holds the rewrites to them on
+triples biased towards the edges and towards cancellation.
+
 Runs standalone (``python3 -m tt_sim.pe.tensix.fma_model_test``) or under
 pytest.
 """
 
+import random
+
 from tt_sim.pe.tensix.backends.vector import fma_model_bh, fma_model_wh
 
+_M64 = 0xFFFFFFFFFFFFFFFF
+_M32 = 0xFFFFFFFF
+
 # (x, y, z, expected Wormhole, expected Blackhole).
 FMA_VECTORS = [
     # --- the two models agree: ordinary values, overflow to Inf, denormal in
@@ -85,8 +95,222 @@ def test_simple_identities():
         assert fma(0xBF800000, 0x3F800000, 0x40000000) == 0x3F800000  # -1*1+2 = 1
 
 
+# --- the reference ports ---------------------------------------------------
+# Verbatim from before the rewrite; see the module docstring. Not to be
+# "tidied": their value is that they are the code that matched ttsim.
+
+
+def _semi_sticky_shift(var, amount, mask):
+    """ttsim's ``semi_sticky_shift``: a right shift that ORs a sticky bit into
+    the result when it discarded anything — but only if the result is non-zero
+    (that is the "semi"). ``mask`` gives the C variable's width."""
+    if amount >= mask.bit_length():
+        return 0
+    orig = var
+    v = var >> amount
+    if v:
+        v |= 1 if (((v << amount) & mask) != orig) else 0
+    return v
+
+
+def _reference_bh(x, y, z):
+    """``fma_model_bh`` as first ported, before its unpacking was inlined."""
+
+    def unpack(v):
+        e = (v >> 23) & 255
+        m = (v & 0x7FFFFF) ^ 0x800000
+        if e == 0:  # flush denormals
+            m = 0
+        return e, m
+
+    x_e, x_m = unpack(x)
+    y_e, y_m = unpack(y)
+    z_e, z_m = unpack(z)
+    z_sign = z & 0x80000000
+
+    p_sign = (x ^ y) & 0x80000000
+    p_m = x_m * y_m
+    p_e = x_e + y_e - 23 - 127
+
+    p_m = (p_m << 3) & _M64
+    z_m = (z_m << 3) & _M32
+    p_m = (p_m >> 23) | (1 if (p_m & 0x7FFFFF) else 0)
+    p_e += 23
+
+    if x_e == 255 or y_e == 255 or p_e >= 255 or z_e == 255:
+        if (
+            (x_e == 255 and (x_m != 0x800000 or y_m == 0))
+            or (y_e == 255 and (y_m != 0x800000 or x_m == 0))
+            or (z_e == 255 and z_m != 0x4000000)
+            or (z_e == 255 and (x_e == 255 or y_e == 255) and z_sign != p_sign)
+        ):
+            return 0x7FC00000  # NaN
+        if z_e == 255:
+            return z  # Inf
+        return p_sign | 0x7F800000  # Inf
+
+    if p_m == 0 or p_e < 0:
+        return z if z_m else (z_sign & p_sign)
+
+    r_e = p_e if p_e > z_e else z_e
+    if p_e < r_e:
+        p_m = _semi_sticky_shift(p_m, r_e - p_e, _M64)
+    if z_e < r_e:
+        z_m = _semi_sticky_shift(z_m, r_e - z_e, _M32)
+    r_sign = p_sign if p_m >= z_m else z_sign
+    if z_sign != r_sign:
+        z_m = (~z_m) & _M32
+    if p_sign != r_sign:
+        p_m = (~p_m) & _M64
+    r_m = (z_m + p_m + (1 if p_sign != z_sign else 0)) & _M32
+
+    if r_m == 0:
+        return z_sign & p_sign
+
+    n = 5 - (32 - r_m.bit_length())  # 5 - clz(r_m)
+    r_e += n
+    if r_e >= 255:
+        return r_sign | 0x7F800000  # Inf
+    if r_e <= 0:  # denorm or zero
+        n += 1
+        r_e = 0
+    if n <= 0:
+        r_m = (r_m << (-n)) & _M32
+    else:
+        r_m = (r_m >> n) | (1 if (r_m & (n | 1)) else 0)
+
+    r = ((r_e << 23) + ((r_m >> 3) & 0x7FFFFF)) & _M32
+    r += 1 if (((r_m & 7) + (r & 1)) > 4) else 0  # round to nearest even
+    if not (r >> 23):  # flush denormals (post-round, keep sign)
+        r = 0
+    return (r_sign | r) & _M32
+
+
+def _reference_wh(x, y, z):
+    """``fma_model_wh`` as first ported, before its unpacking was inlined."""
+
+    def unpack(v):
+        e = (v >> 23) & 255
+        m = (v & 0x7FFFFF) ^ 0x800000
+        if e == 0:  # flush denormals
+            m = 0
+        return e, m
+
+    x_e, x_m = unpack(x)
+    y_e, y_m = unpack(y)
+    z_e, z_m = unpack(z)
+    z_sign = z & 0x80000000
+
+    p_sign = (x ^ y) & 0x80000000
+    p_m = x_m * y_m
+    p_e = x_e + y_e - 23 - 127
+
+    p_m = (p_m << 3) & _M64
+    z_m = (z_m << 3) & _M32
+    p_m = (p_m >> 23) | (1 if (p_m & 0x7FFFFF) else 0)
+    p_e += 23
+
+    nan_result = 0
+    if x_e == 255 or y_e == 255 or p_e >= 255 or z_e == 255:
+        if (
+            (x_e == 255 and (x_m != 0x800000 or y_m == 0))
+            or (y_e == 255 and (y_m != 0x800000 or x_m == 0))
+            or (
+                z_e == 255
+                and z_m == 0x4000000
+                and (x_e == 255 or y_e == 255 or p_e >= 255)
+                and z_sign != p_sign
+            )
+        ):
+            nan_result = p_sign | 0x7F800001
+        elif z_e == 255 and z_m != 0x4000000:  # z NaN
+            nan_result = z_sign | 0x7F800001
+        elif z_e == 255:  # z Inf
+            return z
+        else:  # (x * y) Inf
+            return p_sign | 0x7F800000
+        if p_e > 255:
+            p_e = 255
+
+    if p_m == 0 or p_e < 0:
+        if nan_result:
+            p_m, p_e = 0, 0
+        else:
+            return z if z_m else 0
+
+    r_e = p_e if p_e > z_e else z_e
+    if p_e < r_e:
+        p_m = _semi_sticky_shift(p_m, r_e - p_e, _M64)
+    if z_e < r_e:
+        z_m = _semi_sticky_shift(z_m, r_e - z_e, _M32)
+    r_sign = p_sign if p_m >= z_m else z_sign
+    if z_sign != r_sign:
+        z_m = (~z_m) & _M32
+    if p_sign != r_sign:
+        p_m = (~p_m) & _M64
+    r_m = (z_m + p_m + (1 if p_sign != z_sign else 0)) & _M32
+
+    if r_m == 0:
+        return nan_result
+
+    n = 5 - (32 - r_m.bit_length())  # 5 - clz(r_m)
+    r_e += n
+    if r_e >= 255:
+        return nan_result if nan_result else (r_sign | 0x7F800000)
+    if r_e < 0:  # flush blatant denormals (before rounding, discarding sign)
+        return nan_result
+    if n <= 0:
+        r_m = (r_m << (-n)) & _M32
+    else:
+        r_m = (r_m >> n) | (r_m & 1)
+
+    r = ((r_e << 23) + ((r_m >> 3) & 0x7FFFFF)) & _M32
+    r += 1 if (((r_m & 7) + (r & 1)) > 4) else 0  # round to nearest even
+    if not (r >> 23):  # flush denormals (after rounding, discarding sign)
+        return nan_result
+    return ((nan_result if nan_result else r_sign) | r) & _M32
+
+
+def _edge_word(rng):
+    """A bit pattern biased towards where FMA rounding goes wrong: zero and
+    maximum exponents, exponents either side of the bias, and all-ones,
+    all-zeros and single-bit mantissas."""
+    sign = rng.getrandbits(1) << 31
+    exponent = rng.choice((0, 1, 2, 126, 127, 128, 253, 254, 255, rng.randrange(256)))
+    mantissa = rng.choice(
+        (0, 1, 0x7FFFFF, 0x400000, 0x3FFFFF, rng.getrandbits(23), rng.getrandbits(3))
+    )
+    return sign | exponent << 23 | mantissa
+
+
+def _triples(seed, count):
+    rng = random.Random(seed)
+    for i in range(count):
+        x, y, z = (
+            _edge_word(rng) if rng.random() < 0.6 else rng.getrandbits(32)
+            for _ in range(3)
+        )
+        if i % 4 == 0:
+            # Give z the product's exponent, so the add aligns and cancels.
+            product_e = ((x >> 23 & 255) + (y >> 23 & 255) - 127) & 255
+            z = (z & 0x807FFFFF) | product_e << 23
+        yield x, y, z
+
+
+def test_fma_models_match_the_reference_ports():
+    for port, reference in (
+        (fma_model_wh, _reference_wh),
+        (fma_model_bh, _reference_bh),
+    ):
+        for x, y, z in _triples(0x5F9, 40_000):
+            assert port(x, y, z) == reference(x, y, z), (
+                f"{port.__name__}({x:#010x}, {y:#010x}, {z:#010x})"
+            )
+
+
 if __name__ == "__main__":
     test_fma_models_match_ttsim()
     test_the_two_models_really_differ()
     test_simple_identities()
+    test_fma_models_match_the_reference_ports()
     print("fma_model tests OK")
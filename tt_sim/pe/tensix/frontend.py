@@ -4,7 +4,7 @@ from tt_sim.device.clock import Clockable
 from tt_sim.memory.mem_mapable import MemMapable
 from tt_sim.memory.memory import MemoryStall
 from tt_sim.pe.tensix.registers import SrcRegister
-from tt_sim.pe.tensix.util import TensixInstructionDecoder
+from tt_sim.pe.tensix.util import DecodedInstruction, TensixInstructionDecoder
 from tt_sim.trace import DispatchEvent, EventCategory, StallEvent, get_bus
 from tt_sim.util.bits import extract_bits, get_nth_bit
 from tt_sim.util.conversion import conv_to_uint32
@@ -37,6 +37,14 @@ from tt_sim.util.conversion import conv_to_uint32
 CORE_PUSH_INFLIGHT_BOUND = 64
 
 
+def _decoded(instruction):
+    """``instruction`` as the :class:`DecodedInstruction` the queues carry,
+    whether it is one already or a bare word."""
+    if type(instruction) is DecodedInstruction:
+        return instruction
+    return TensixInstructionDecoder.decoded(instruction)
+
+
 class TensixFrontend(MemMapable):
     """
     Tensix unit frontend, we have a frontend per thread and there are three threads.
@@ -44,6 +52,12 @@ class TensixFrontend(MemMapable):
 
     Based on description at
     https://github.com/tenstorrent/tt-isa-documentation/tree/main/WormholeB0/TensixTile/TensixCoprocessor
+
+    Every queue here holds :class:`DecodedInstruction` objects, not words: an
+    instruction is decoded once, when the core pushes it (or when the MOP
+    expander first expands it), and the expanders and the Wait Gate read the
+    decode they are handed. The ``push_*`` methods take either, so a test can
+    still queue a bare word.
     """
 
     def __init__(self, thread_id, backend, diags_settings, blackhole_conditions=False):
@@ -89,7 +103,7 @@ class TensixFrontend(MemMapable):
             return None
 
     def push_mop_instruction(self, instruction):
-        return self.mop_instruction_fifo.append(instruction)
+        return self.mop_instruction_fifo.append(_decoded(instruction))
 
     def pop_replay_instruction(self):
         if len(self.replay_instruction_fifo) > 0:
@@ -98,7 +112,11 @@ class TensixFrontend(MemMapable):
             return None
 
     def push_replay_instruction(self, instruction):
-        return self.replay_instruction_fifo.append(instruction)
+        return self.replay_instruction_fifo.append(_decoded(instruction))
+
+    def push_replay_instructions(self, instructions):
+        """Queue a MOP expansion, which is decoded already."""
+        self.replay_instruction_fifo.extend(instructions)
 
     def pop_wait_gate_instruction(self):
         if len(self.wait_gate_instruction_fifo) > 0:
@@ -113,7 +131,7 @@ class TensixFrontend(MemMapable):
             return None
 
     def push_wait_gate_instruction(self, instruction):
-        return self.wait_gate_instruction_fifo.append(instruction)
+        return self.wait_gate_instruction_fifo.append(_decoded(instruction))
 
     def getMOPExpander(self):
         return self.mop_expander
@@ -136,7 +154,9 @@ class TensixFrontend(MemMapable):
             # :data:`CORE_PUSH_INFLIGHT_BOUND` for what the bound is and is not.
             if self.inflight_count() >= CORE_PUSH_INFLIGHT_BOUND:
                 return MemoryStall
-            self.push_mop_instruction(instruction)
+            self.mop_instruction_fifo.append(
+                TensixInstructionDecoder.decoded(instruction)
+            )
         else:
             opcode = extract_bits(instruction, 8, 24)
             raise NotImplementedError(
@@ -241,8 +261,10 @@ class WaitGate(TensixFrontendUnit):
             self.block_mask = block_mask
             self.semaphore_mask = semaphore_mask
 
-        def doesInstructionMatchBlockMask(self, instruction_info):
-            if instruction_info["name"] == "STALLWAIT":
+        def doesInstructionMatchBlockMask(self, instruction):
+            """Whether the latched wait holds ``instruction``, a
+            :class:`DecodedInstruction`."""
+            if instruction.name == "STALLWAIT":
                 # ``STALLWAIT`` is the one instruction *every* block bit
                 # catches: its row in ``STALLWAIT.md``'s "exact set of
                 # instructions blocked from starting by each bit" table is
@@ -281,7 +303,7 @@ class WaitGate(TensixFrontendUnit):
                 # an all-bits block mask blocks whatever follows it anyway, so
                 # holding one changes cycle counts and nothing else.
                 return True
-            tgt_backend_unit = instruction_info["ex_resource"]
+            tgt_backend_unit = instruction.ex_resource
             for bit_idx in range(9):
                 do_check = get_nth_bit(self.block_mask, bit_idx)
                 if do_check:
@@ -796,12 +818,9 @@ class WaitGate(TensixFrontendUnit):
             instruction = self.frontend.inspect_wait_gate_instruction()
             if not self.latch_wait and self.latchedWaitInstruction is not None:
                 if instruction is not None:
-                    instruction_info = TensixInstructionDecoder.getInstructionInfo(
-                        instruction
-                    )
                     self.latch_wait = (
                         self.latchedWaitInstruction.doesInstructionMatchBlockMask(
-                            instruction_info
+                            instruction
                         )
                     )
                 if not self.latch_wait:
@@ -819,9 +838,8 @@ class WaitGate(TensixFrontendUnit):
 
             if not self.latch_wait:
                 if instruction is not None:
-                    instruction_info = TensixInstructionDecoder.getInstructionInfo(
-                        instruction
-                    )
+                    name = instruction.name
+                    ex_resource = instruction.ex_resource
                     thread_id = self.frontend.thread_id
                     if self.backend.thread_issue_block[thread_id] > cycle_num:
                         # A documented whole-thread interlock is live: the
@@ -838,25 +856,23 @@ class WaitGate(TensixFrontendUnit):
                             cycle_num,
                             "thread_issue_block",
                             blocked_on=self.backend.thread_issue_block_unit[thread_id],
-                            opcode=instruction_info["name"],
+                            opcode=name,
                         )
                         return
-                    if instruction_info["ex_resource"] == "MATH":
+                    if ex_resource == "MATH":
                         # For FPU instructions need to ensure that srcA and srcB
                         # being consumed has allowed client of MatrixUnit
-                        blocked_bank = self.whichSrcBankBlocksFPUInstruction(
-                            instruction_info["name"]
-                        )
+                        blocked_bank = self.whichSrcBankBlocksFPUInstruction(name)
                         if blocked_bank is not None:
                             self._note_stall(
                                 cycle_num,
                                 "src_reserved_by_unpacker",
                                 blocked_on="UNPACK",
-                                opcode=instruction_info["name"],
+                                opcode=name,
                                 src_bank=blocked_bank,
                             )
                             return
-                    instruction_accepted = self.frontend.backend.issueInstruction(
+                    instruction_accepted = self.frontend.backend.issueDecoded(
                         instruction, self.frontend.thread_id
                     )
                     if not instruction_accepted:
@@ -869,11 +885,8 @@ class WaitGate(TensixFrontendUnit):
                         self._note_stall(
                             cycle_num,
                             backend.last_refusal_reason,
-                            blocked_on=(
-                                backend.last_refusal_blocked_on
-                                or instruction_info["ex_resource"]
-                            ),
-                            opcode=instruction_info["name"],
+                            blocked_on=(backend.last_refusal_blocked_on or ex_resource),
+                            opcode=name,
                             src_bank=backend.last_refusal_src_bank,
                         )
                     elif self._stall_since is not None:
@@ -889,13 +902,13 @@ class WaitGate(TensixFrontendUnit):
                         # this cycle (its issue queue was busy), the gate must stay
                         # free to retry next cycle — otherwise mutex_stall latches
                         # forever with no ATGETM in flight to ever clear it.
-                        if instruction_info["name"] == "ATGETM":
+                        if name == "ATGETM":
                             self.mutex_stall = True
                         # If the instruction was accepted then remove it,
                         # otherwise retry next cycle
                         if self.getDiagnosticSettings().reportIssuedInstructions():
                             print(
-                                f"Wait gate: issued {instruction_info['name']} to {instruction_info['ex_resource']} "
+                                f"Wait gate: issued {name} to {ex_resource} "
                                 f"from thread {self.frontend.thread_id}"
                             )
                         counters = self.perf_counters
@@ -911,8 +924,8 @@ class WaitGate(TensixFrontendUnit):
                                 DispatchEvent(
                                     cycle=cycle_num,
                                     unit_id=self.frontend.unit_id,
-                                    opcode=instruction_info["name"],
-                                    target_unit=instruction_info["ex_resource"],
+                                    opcode=name,
+                                    target_unit=ex_resource,
                                     thread_id=self.frontend.thread_id,
                                 )
                             )
@@ -963,7 +976,9 @@ class TensixReplayExpander(TensixFrontendUnit):
     """
 
     def __init__(self, frontend):
-        self.replay_buffer = [0] * 32
+        # Decoded instructions, as the FIFOs hold; ``None`` is a slot no
+        # REPLAY has loaded yet.
+        self.replay_buffer = [None] * 32
         self.append_instruction_to_buffer = False
         self.exec_while_load = False
         self.replay_len = 0
@@ -975,13 +990,12 @@ class TensixReplayExpander(TensixFrontendUnit):
         bus = get_bus()
         if self.frontend.unit_id is None or not bus.is_enabled(EventCategory.DISPATCH):
             return
-        instruction_info = TensixInstructionDecoder.getInstructionInfo(instruction)
         bus.publish(
             DispatchEvent(
                 cycle=cycle_num,
                 unit_id=self.frontend.unit_id,
-                opcode=instruction_info["name"],
-                target_unit=instruction_info["ex_resource"],
+                opcode=instruction.name,
+                target_unit=instruction.ex_resource,
                 thread_id=self.frontend.thread_id,
             )
         )
@@ -1000,22 +1014,23 @@ class TensixReplayExpander(TensixFrontendUnit):
                     ] = instruction
                     self.replay_idx += 1
                     if self.exec_while_load:
-                        self.frontend.push_wait_gate_instruction(instruction)
+                        self.frontend.wait_gate_instruction_fifo.append(instruction)
                 else:
                     self.append_instruction_to_buffer = False
 
             if not self.append_instruction_to_buffer:
-                instruction_info = TensixInstructionDecoder.getInstructionInfo(
-                    instruction
-                )
-                if instruction_info["name"] == "REPLAY":
-                    instr_args = instruction_info["instr_args"]
+                if instruction.name == "REPLAY":
+                    instr_args = instruction.info["instr_args"]
                     if instr_args["load_mode"] == 0:
                         index = instr_args["start_idx"]
                         for i in range(instr_args["len"] or 64):
-                            self.frontend.push_wait_gate_instruction(
-                                self.replay_buffer[(index + i) % 32]
+                            replayed = self.replay_buffer[(index + i) % 32]
+                            # The word this slot held before decoding moved to
+                            # push time was 0, which no decode accepts either.
+                            assert replayed is not None, (
+                                f"REPLAY of unloaded replay buffer slot {(index + i) % 32}"
                             )
+                            self.frontend.wait_gate_instruction_fifo.append(replayed)
                     else:
                         self.replay_start_idx = instr_args["start_idx"]
                         self.exec_while_load = instr_args["execute_while_loading"]
@@ -1023,7 +1038,7 @@ class TensixReplayExpander(TensixFrontendUnit):
                         self.replay_idx = 0
                         self.append_instruction_to_buffer = True
                 else:
-                    self.frontend.push_wait_gate_instruction(instruction)
+                    self.frontend.wait_gate_instruction_fifo.append(instruction)
 
 
 class TensixMOPExpander(TensixFrontendUnit, MemMapable):
@@ -1036,9 +1051,20 @@ class TensixMOPExpander(TensixFrontendUnit, MemMapable):
     https://github.com/tenstorrent/tt-isa-documentation/blob/main/WormholeB0/TensixTile/TensixCoprocessor/MOPExpander.md
     """
 
+    # An expansion is a pure function of the nine config words and, for
+    # template 0, the mask and loop count, and the LLK programs the expander
+    # once per op and then issues the same MOP for every tile. So each
+    # expansion is kept, as a tuple of decoded instructions (so its words are
+    # decoded once per expansion rather than once per issue), until the next write
+    # to the config window, which is the only thing that can change it. The
+    # limit is for a kernel that sweeps masks without ever reprogramming.
+    _EXPANSIONS_LIMIT = 256
+
     def __init__(self, frontend):
         self.mop_cfg = [0] * 9
         self.mask_hi = 0
+        #: ``(0, mask, count1)`` / ``(1,)`` -> the expansion's instructions.
+        self._expansions = {}
         super().__init__(frontend)
 
     def read(self, address, size):
@@ -1049,6 +1075,7 @@ class TensixMOPExpander(TensixFrontendUnit, MemMapable):
         assert idx < 9
 
         self.mop_cfg[idx] = conv_to_uint32(value)
+        self._expansions.clear()
 
     def is_clock_idle(self):
         return not self.frontend.mop_instruction_fifo
@@ -1060,34 +1087,57 @@ class TensixMOPExpander(TensixFrontendUnit, MemMapable):
             if self.frontend.unit_id is not None and bus.is_enabled(
                 EventCategory.DISPATCH
             ):
-                mop_info = TensixInstructionDecoder.getInstructionInfo(instruction)
                 bus.publish(
                     DispatchEvent(
                         cycle=cycle_num,
                         unit_id=self.frontend.unit_id,
-                        opcode=mop_info["name"],
-                        target_unit=mop_info["ex_resource"],
+                        opcode=instruction.name,
+                        target_unit=instruction.ex_resource,
                         thread_id=self.frontend.thread_id,
                     )
                 )
-            instruction_info = TensixInstructionDecoder.getInstructionInfo(instruction)
-            if instruction_info["name"] == "MOP":
-                instr_args = instruction_info["instr_args"]
+            if instruction.name == "MOP":
+                instr_args = instruction.info["instr_args"]
                 if instr_args["mop_type"] == 0:
-                    for new_instr in self.expand_template_zero(
+                    expansion = self.expand_template_zero(
                         (self.mask_hi << 16) + instr_args["zmask_lo16"],
                         instr_args["loop_count"],
-                    ):
-                        self.frontend.push_replay_instruction(new_instr)
+                    )
                 else:
-                    for new_instr in self.expand_template_one():
-                        self.frontend.push_replay_instruction(new_instr)
-            elif instruction_info["name"] == "MOP_CFG":
-                self.mask_hi = instruction_info["instr_args"]["zmask_hi16"]
+                    expansion = self.expand_template_one()
+                self.frontend.push_replay_instructions(expansion)
+            elif instruction.name == "MOP_CFG":
+                self.mask_hi = instruction.info["instr_args"]["zmask_hi16"]
             else:
-                self.frontend.push_replay_instruction(instruction)
+                self.frontend.replay_instruction_fifo.append(instruction)
 
     def expand_template_zero(self, mask, count1):
+        """Template 0's instructions for ``mask`` and ``count1``, as a tuple
+        of :class:`DecodedInstruction`; see the class comment on caching."""
+        # Only the low count1 + 1 bits of the mask are ever looked at.
+        key = (0, mask & ((1 << (count1 + 1)) - 1), count1)
+        expansion = self._expansions.get(key)
+        if expansion is None:
+            expansion = self._remember(key, self._template_zero(key[1], count1))
+        return expansion
+
+    def expand_template_one(self):
+        """Template 1's instructions, as a tuple of
+        :class:`DecodedInstruction`; see the class comment on caching."""
+        expansion = self._expansions.get((1,))
+        if expansion is None:
+            expansion = self._remember((1,), self._template_one())
+        return expansion
+
+    def _remember(self, key, instructions):
+        if len(self._expansions) >= TensixMOPExpander._EXPANSIONS_LIMIT:
+            self._expansions.clear()
+        expansion = self._expansions[key] = tuple(
+            TensixInstructionDecoder.decoded(word) for word in instructions
+        )
+        return expansion
+
+    def _template_zero(self, mask, count1):
         flags = self.mop_cfg[1]
         insnb = self.mop_cfg[2]
         insna0 = self.mop_cfg[3]
@@ -1113,7 +1163,7 @@ class TensixMOPExpander(TensixFrontendUnit, MemMapable):
                     yield skipb
             mask >>= 1
 
-    def expand_template_one(self):
+    def _template_one(self):
         outercount = self.mop_cfg[0] & 127
         innercount = self.mop_cfg[1] & 127
         startop = self.mop_cfg[2]
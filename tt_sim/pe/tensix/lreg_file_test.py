@@ -0,0 +1,141 @@
+"""The array-backed SFPU register state (``VectorUnit.lreg_file``).
+
+Runs standalone (``python3 -m tt_sim.pe.tensix.lreg_file_test``) or under
+pytest.
+
+1. Every ``LReg`` is a view of one row of the ``(17, 32)`` uint32 file: a write
+   through either shows in the other, the hard-wired constants fill their rows,
+   and a snapshot of the whole register file is one ``copy()``.
+2. Lane flags, their enables and LaneConfig are arrays; assigning a list
+   coerces it, and SFPPUSHC / SFPPOPC snapshot by value.
+3. SFPPOPC ``instr_mod1 == 14`` sets LaneFlags and UseLaneFlagsForLaneEnable
+   to two independent arrays (the list version bound both names to one list,
+   so the next SFPSETCC also rewrote the enables).
+4. The masked whole-row ops leave disabled lanes, and lanes masked off by
+   LaneConfig's row bits, exactly as they were.
+"""
+
+import numpy as np
+
+from tt_sim.pe.tensix.tensix import TensixCoProcessor
+from tt_sim.pe.tensix.util import TensixInstructionDecoder
+from tt_sim.util.conversion import conv_to_uint32
+
+
+def _vector_unit(blackhole=False):
+    return TensixCoProcessor(None, blackhole=blackhole).getBackend().vector_unit
+
+
+def _run(vu, instruction):
+    assert TensixInstructionDecoder.isInstructionRecognised(instruction)
+    assert vu.issueInstruction(instruction, 0)
+    vu.clock_tick(0)
+
+
+def _op(opcode, imm12_math, lreg_c, lreg_dest, instr_mod1):
+    """The common SFPU layout (SFPSETCC, SFPPUSHC, SFPPOPC, SFPNOT, ...)."""
+    return (
+        (opcode << 24)
+        | (imm12_math << 12)
+        | (lreg_c << 8)
+        | (lreg_dest << 4)
+        | instr_mod1
+    )
+
+
+SFPNOT, SFPPUSHC, SFPPOPC, SFPSETCC = 0x80, 0x87, 0x88, 0x7B
+
+
+def test_lregs_are_views_of_the_file():
+    vu = _vector_unit()
+    vu.lregs[3][5] = 0xDEADBEEF
+    assert vu.lreg_file[3, 5] == 0xDEADBEEF
+    vu.lreg_file[4, 31] = 7
+    assert vu.lregs[4][31] == 7
+    assert type(vu.lregs[4][31]) is int
+    vu.lregs[2][0] = -1
+    assert vu.lreg_file[2, 0] == 0xFFFFFFFF
+
+
+def test_hard_wired_rows_are_filled():
+    vu = _vector_unit()
+    assert vu.lreg_file[9].tolist() == [0] * 32
+    assert vu.lreg_file[10].tolist() == [conv_to_uint32(1.0)] * 32
+    assert vu.lreg_file[8].tolist() == [vu.lregs[8][0]] * 32
+    assert vu.lreg_file[15].tolist() == [lane * 2 for lane in range(32)]
+
+
+def test_snapshot_is_one_copy():
+    vu = _vector_unit()
+    vu.lregs[0][0] = 1
+    snapshot = vu.lreg_file.copy()
+    vu.lregs[0][0] = 2
+    assert snapshot[0, 0] == 1
+    vu.lreg_file[:] = snapshot
+    assert vu.lregs[0][0] == 1
+
+
+def test_flag_lists_are_coerced_and_stack_copies():
+    vu = _vector_unit()
+    vu.useLaneFlagsForLaneEnable = [True] * 32
+    vu.laneFlags = [lane % 3 == 0 for lane in range(32)]
+    assert vu.laneFlags.dtype == bool
+    _run(vu, _op(SFPPUSHC, 0, 0, 0, 0))
+    vu.laneFlags[:] = False
+    _run(vu, _op(SFPPOPC, 0, 0, 0, 0))
+    assert vu.laneFlags.tolist() == [lane % 3 == 0 for lane in range(32)]
+
+
+def test_popc_mod1_14_does_not_alias_the_enables():
+    vu = _vector_unit()
+    _run(vu, _op(SFPPOPC, 0, 0, 0, 14))
+    assert vu.laneFlags.all()
+    assert vu.useLaneFlagsForLaneEnable.all()
+    assert vu.laneFlags is not vu.useLaneFlagsForLaneEnable
+    _run(vu, _op(SFPSETCC, 0, 0, 0, 8))  # clear every enabled lane's flag
+    assert not vu.laneFlags.any()
+    assert vu.useLaneFlagsForLaneEnable.all()
+
+
+def test_masked_op_leaves_disabled_lanes():
+    vu = _vector_unit()
+    for lane in range(32):
+        vu.lregs[1][lane] = lane
+        vu.lregs[0][lane] = 0x55
+    vu.useLaneFlagsForLaneEnable = [True] * 32
+    vu.laneFlags = [lane % 2 == 0 for lane in range(32)]
+    # LaneConfig bit 12 + r of column c masks lane 8 * r + c: lane 10 here.
+    vu.laneConfig[2] = 1 << 13
+    _run(vu, _op(SFPNOT, 0, 1, 0, 0))
+    expected = [
+        (~lane & 0xFFFFFFFF) if lane % 2 == 0 and lane != 10 else 0x55
+        for lane in range(32)
+    ]
+    assert vu.lreg_file[0].tolist() == expected
+
+
+def test_masked_op_matches_per_lane_enables():
+    vu = _vector_unit(blackhole=True)
+    rng = np.random.default_rng(5)
+    vu.lreg_file[:8] = rng.integers(0, 1 << 32, size=(8, 32), dtype=np.uint32)
+    vu.useLaneFlagsForLaneEnable = rng.random(32) < 0.5
+    vu.laneFlags = rng.random(32) < 0.5
+    before = vu.lreg_file[2].tolist()
+    source = vu.lreg_file[3].tolist()
+    _run(vu, _op(SFPNOT, 0, 3, 2, 0))
+    for lane in range(32):
+        if vu.isLaneEnabled(lane):
+            assert vu.lregs[2][lane] == ~source[lane] & 0xFFFFFFFF
+        else:
+            assert vu.lregs[2][lane] == before[lane]
+
+
+if __name__ == "__main__":
+    test_lregs_are_views_of_the_file()
+    test_hard_wired_rows_are_filled()
+    test_snapshot_is_one_copy()
+    test_flag_lists_are_coerced_and_stack_copies()
+    test_popc_mod1_14_does_not_alias_the_enables()
+    test_masked_op_leaves_disabled_lanes()
+    test_masked_op_matches_per_lane_enables()
+    print("ok")
@@ -36,11 +36,18 @@ below is faithful. If this file goes green-but-wrong, that claim rots silently,
 so both directions are pinned: a clobber *does* change the expansion, and an
 unrelated write *does not*.
 
+The expander keeps each expansion until the next write to its config, which
+is what makes a repeated ``MOP`` a lookup. Every clobber test above therefore
+also pins that cache's invalidation; the last three pin the cache itself: a
+repeat is the same words, only the mask bits an expansion reads distinguish
+one, and a ``MOP`` issued through the expander's tick queues exactly them.
+
 Run standalone (``python3 -m tt_sim.pe.tensix.mop_clobber_test``) or under
 pytest.
 """
 
 from tt_sim.pe.tensix.frontend import TensixMOPExpander
+from tt_sim.pe.tensix.util import TensixInstructionDecoder
 
 # Stand-ins for the encoded Tensix instructions the LLK stores into the
 # expander's config. Their values are arbitrary and deliberately distinct; only
@@ -49,6 +56,7 @@ UNPACK_A0 = 0xA0A0A0A0
 UNPACK_B = 0xB0B0B0B0
 SKIP_A0 = 0x5A5A5A5A
 SKIP_B = 0x5B5B5B5B
+NOP = 0x02 << 24
 
 # ``mop_cfg[1]`` bit 0 is the expander's "there is a SrcB instruction" flag —
 # ``m_unpackB`` on the tt-metal side, ``hasb`` in ``expand_template_zero``.
@@ -76,9 +84,14 @@ def _program_unpack_a(mop):
     mop.write(7 * 4, SKIP_A0)
 
 
+def _words(expansion):
+    """An expansion's instruction words; the expander queues their decodes."""
+    return tuple(instruction.word for instruction in expansion)
+
+
 def _expand_one_iteration(mop):
     """Expand a single-iteration, nothing-masked-off template-zero MOP."""
-    return list(mop.expand_template_zero(mask=0, count1=0))
+    return list(_words(mop.expand_template_zero(mask=0, count1=0)))
 
 
 def test_unpack_ab_macro_issues_both_operands():
@@ -152,14 +165,24 @@ def test_template_one_runs_whatever_was_programmed_last():
     expander's state, never of the ``MOP`` instruction that triggers it.
     """
     mop = TensixMOPExpander(frontend=None)
+
+    # ``program()`` writes all nine words: NOP where the template has no
+    # instruction, and the loop body again as both last-iteration overrides.
+    # (Every word an expansion emits must decode.)
+    def program(body):
+        for idx in (2, 3, 4, 6):
+            mop.write(idx * 4, NOP)
+        for idx in (5, 7, 8):
+            mop.write(idx * 4, body)
+
     # One outer iteration, one inner iteration, a single distinguishable body.
     mop.write(0 * 4, 1)
     mop.write(1 * 4, 1)
-    mop.write(5 * 4, UNPACK_A0)
-    first = list(mop.expand_template_one())
+    program(UNPACK_A0)
+    first = list(_words(mop.expand_template_one()))
 
-    mop.write(5 * 4, UNPACK_B)
-    second = list(mop.expand_template_one())
+    program(UNPACK_B)
+    second = list(_words(mop.expand_template_one()))
 
     assert UNPACK_A0 in first
     assert UNPACK_B not in first
@@ -167,6 +190,60 @@ def test_template_one_runs_whatever_was_programmed_last():
     assert UNPACK_A0 not in second
 
 
+def _mop(mop_type, loop_count, zmask_lo16):
+    """An encoded ``MOP`` (opcode 0x01)."""
+    return (0x01 << 24) | (mop_type << 23) | (loop_count << 16) | zmask_lo16
+
+
+class _Frontend:
+    """The expander's view of its thread: one MOP queued, and the replay
+    queue it expands into."""
+
+    unit_id = None
+
+    def __init__(self, instructions):
+        self.mop_instruction_fifo = [
+            TensixInstructionDecoder.decoded(word) for word in instructions
+        ]
+        self.replay_instruction_fifo = []
+
+    def pop_mop_instruction(self):
+        return self.mop_instruction_fifo.pop(0)
+
+    def push_replay_instructions(self, instructions):
+        self.replay_instruction_fifo.extend(instructions)
+
+
+def test_a_repeated_expansion_is_the_same_words():
+    mop = TensixMOPExpander(frontend=None)
+    _program_unpack_ab(mop)
+    first = mop.expand_template_zero(mask=0b0101, count1=3)
+    assert _words(first) == (SKIP_A0, SKIP_B, UNPACK_A0, UNPACK_B) * 2
+    assert mop.expand_template_zero(mask=0b0101, count1=3) is first
+    assert mop.expand_template_one() is mop.expand_template_one()
+
+
+def test_only_the_mask_bits_an_expansion_reads_tell_two_apart():
+    mop = TensixMOPExpander(frontend=None)
+    _program_unpack_ab(mop)
+    two = mop.expand_template_zero(mask=0b01, count1=1)
+    # Bit 2 and up are never looked at by a two-iteration expansion ...
+    assert mop.expand_template_zero(mask=0xFFFF_FFFC | 0b01, count1=1) is two
+    # ... bit 1 is.
+    both = mop.expand_template_zero(mask=0b11, count1=1)
+    assert _words(both) == (SKIP_A0, SKIP_B) * 2
+
+
+def test_a_mop_queues_its_expansion():
+    mop = TensixMOPExpander(frontend=None)
+    _program_unpack_ab(mop)
+    expected = list(mop.expand_template_zero(mask=0b10, count1=2))
+    for _ in range(2):
+        mop.frontend = _Frontend([_mop(0, 2, 0b10)])
+        mop.clock_tick(0)
+        assert mop.frontend.replay_instruction_fifo == expected
+
+
 if __name__ == "__main__":
     for name, fn in sorted(list(globals().items())):
         if name.startswith("test_") and callable(fn):
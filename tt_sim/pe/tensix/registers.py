@@ -260,14 +260,19 @@ class LReg:
     instead of rounding to FP32 each time. See docs/plans/blackhole-support.md.
     """
 
-    def __init__(self, blackhole=False):
+    def __init__(self, blackhole=False, data=None):
         # ``blackhole`` no longer selects a value model (both are uint32); it is
         # kept because callers construct LRegs per-arch and future per-arch
         # register behaviour would land here.
         self.blackhole = blackhole
         self.read_only = False
         self.hard_wired_value = None
-        self.data = [0] * 32
+        # The 32 lanes as a uint32 array. The vector unit passes one row of its
+        # (17, 32) LReg file (``VectorUnit.lreg_file``), so this is a view and a
+        # lane written here is written there, which is what lets the SFPU ops
+        # work on whole registers at once while per-lane code keeps using
+        # ``lreg[lane]``. A standalone LReg owns its own row.
+        self.data = np.zeros(32, dtype=np.uint32) if data is None else data
 
     @staticmethod
     def _coerce(value):
@@ -284,7 +289,9 @@ class LReg:
         if self.hard_wired_value is not None:
             return self.hard_wired_value
         else:
-            return self.data[key]
+            # A Python int, not an ``np.uint32``: callers do unbounded integer
+            # arithmetic on lanes, and ``conv_to_*`` only accept ``int``.
+            return int(self.data[key])
 
     def setReadOnly(self, hard_wired_value=None):
         self.read_only = True
@@ -293,4 +300,7 @@ class LReg:
     def setHardwiredValue(self, value):
         if value is not None:
             value = self._coerce(value)
+            # Fill the row too, so whole-register reads of the file see the
+            # constant without consulting ``hard_wired_value``.
+            self.data[:] = value
         self.hard_wired_value = value
@@ -38,8 +38,8 @@ def test_sfpgt_sets_lane_flag_when_vd_gt_vc():
     vu.lregs[0][0], vu.lregs[1][0] = 3.0, 2.0  # 3 > 2 -> True
     vu.lregs[0][1], vu.lregs[1][1] = 1.0, 5.0  # 1 > 5 -> False
     vu.handle_sfpgt(None, 0, _args(instr_mod1=1, lreg_dest=0, lreg_c=1))
-    assert vu.laneFlags[0] is True
-    assert vu.laneFlags[1] is False
+    assert vu.laneFlags[0]
+    assert not vu.laneFlags[1]
 
 
 def test_sfple_sets_lane_flag_when_vd_le_vc():
@@ -47,8 +47,8 @@ def test_sfple_sets_lane_flag_when_vd_le_vc():
     vu.lregs[0][0], vu.lregs[1][0] = 2.0, 2.0  # 2 <= 2 -> True
     vu.lregs[0][1], vu.lregs[1][1] = 3.0, 2.0  # 3 <= 2 -> False
     vu.handle_sfple(None, 0, _args(instr_mod1=1, lreg_dest=0, lreg_c=1))
-    assert vu.laneFlags[0] is True
-    assert vu.laneFlags[1] is False
+    assert vu.laneFlags[0]
+    assert not vu.laneFlags[1]
 
 
 def test_sfpgt_mod1_8_writes_mask_into_vd():
@@ -62,8 +62,8 @@ def test_sfpgt_mod1_8_writes_mask_into_vd():
     vu.handle_sfpgt(None, 0, _args(instr_mod1=8, lreg_dest=0, lreg_c=1))
     assert vu.lregs[0][0] == 0xFFFFFFFF
     assert vu.lregs[0][1] == 0
-    assert vu.laneFlags[0] is False
-    assert vu.laneFlags[1] is False
+    assert not vu.laneFlags[0]
+    assert not vu.laneFlags[1]
 
 
 def test_sfple_mod1_8_writes_mask_into_vd():
@@ -18,11 +18,12 @@ class TensixCoProcessor(ProcessingElement):
         cfg_state_size=None,
         thd_state_size=None,
         blackhole=False,
+        config_layout=None,
     ):
         if diags_settings is None:
             diags_settings = TensixCoprocessorDiagnostics()
         self.backend = TensixBackend(
-            diags_settings, cfg_state_size, thd_state_size, blackhole
+            diags_settings, cfg_state_size, thd_state_size, blackhole, config_layout
         )
         self.threads = [
             TensixFrontend(i, self.backend, diags_settings, blackhole) for i in range(3)
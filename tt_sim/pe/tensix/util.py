@@ -1,9 +1,10 @@
 import importlib.resources as resources
 from copy import copy
+from dataclasses import dataclass
 
 import numpy as np
 
-from tt_sim.util.bits import extract_bits, get_bits
+from tt_sim.util.bits import extract_bits
 from tt_sim.util.yaml_cache import load_yaml_cached
 
 # Lookup tables for the block conversions at the end of DataFormatConversions,
@@ -88,19 +89,119 @@ class TensixCoprocessorDiagnostics:
         return self.configurations_set
 
 
-class TensixConfigurationConstants:
-    # The Tensix backend config-register layout (register name -> ADDR32 / SHAMT
-    # / MASK) differs between architectures: Blackhole has a larger, differently
-    # indexed register map (e.g. SRCA_SET_Base is thread-config index 3 on
-    # Wormhole but 5 on Blackhole). ``use_blackhole`` selects which layout the
-    # (process-global) accessors use; it is set when a device's config unit is
-    # built. Both layouts are cached, so switching is cheap.
+class ConfigField:
+    """One named config-register field: which 32-bit word it is in (``addr32``)
+    and where in it (``shamt``, ``mask``).
+
+    Compiled once per architecture from the backend config YAML
+    (:attr:`TensixConfigLayout.fields`), so reading a field is an
+    attribute load and a mask and shift rather than the class-method walk —
+    ``init``, a membership test and a nested dict lookup per attribute — that
+    ``parse_raw_config_value`` does.
+    """
+
+    __slots__ = ("name", "addr32", "shamt", "mask")
+
+    def __init__(self, name, addr32, shamt, mask):
+        self.name = name
+        self.addr32 = addr32
+        self.shamt = shamt
+        self.mask = mask
+
+    def extract(self, word):
+        return (word & self.mask) >> self.shamt
+
+    def __repr__(self):
+        return (
+            f"ConfigField({self.name!r}, addr32={self.addr32}, "
+            f"shamt={self.shamt}, mask={self.mask:#x})"
+        )
+
+
+class TensixConfigLayout:
+    """One architecture's Tensix backend config-register layout (register name
+    -> ADDR32 / SHAMT / MASK).
+
+    The layout differs between architectures: Blackhole has a larger,
+    differently indexed register map (e.g. SRCA_SET_Base is thread-config index
+    3 on Wormhole but 5 on Blackhole). Each device reaches its own through its
+    arch profile (:attr:`ArchProfile.tensix_config`) and the backend's
+    ``config_layout``, so devices of both architectures can share a process.
+    There is one instance per architecture (:meth:`for_arch`), shared and
+    read-only; pickling one (a device snapshot) stores only which it was.
+    """
+
     _YAML_BY_ARCH = {
         False: "tensix_backend_cfg.yaml",
         True: "tensix_backend_cfg_blackhole.yaml",
     }
+    _BY_ARCH = {}
+
+    @classmethod
+    def for_arch(cls, blackhole):
+        layout = cls._BY_ARCH.get(blackhole)
+        if layout is None:
+            layout = cls._BY_ARCH[blackhole] = cls(blackhole)
+        return layout
+
+    def __init__(self, blackhole):
+        self.blackhole = blackhole
+        yaml_name = self._YAML_BY_ARCH[blackhole]
+        self.constants = load_yaml_cached(
+            resources.files("tt_sim.pe.tensix").joinpath(yaml_name),
+            yaml_name.removesuffix(".yaml"),
+        )
+        self.ids = {entry["ADDR32"]: name for name, entry in self.constants.items()}
+        #: Every field by name, as a :class:`ConfigField`.
+        self.fields = {
+            name: ConfigField(name, entry["ADDR32"], entry["SHAMT"], entry["MASK"])
+            for name, entry in self.constants.items()
+        }
+
+    def __reduce__(self):
+        return TensixConfigLayout.for_arch, (self.blackhole,)
+
+    def get_name(self, id):
+        return self.ids.get(id, "NONE")
+
+    def exists(self, key):
+        return key in self.constants
+
+    def _entry(self, key):
+        if key not in self.constants:
+            raise IndexError(f"'{key}' not in constants")
+        return self.constants[key]
+
+    def get_addr32(self, key):
+        return self._entry(key)["ADDR32"]
+
+    def get_shamt(self, key):
+        return self._entry(key)["SHAMT"]
+
+    def get_mask(self, key):
+        return self._entry(key)["MASK"]
+
+    def parse_raw_config_value(self, value, key):
+        entry = self._entry(key)
+        return (value & entry["MASK"]) >> entry["SHAMT"]
+
+
+class TensixConfigurationConstants:
+    # Process-wide accessors onto one :class:`TensixConfigLayout`: the last one
+    # a config unit was built (or a snapshot restored) for, or whichever
+    # ``use_blackhole`` names. They are for scripts and tests that handle one
+    # device at a time; the model itself reads its own device's layout through
+    # ``TensixBackend.config_layout`` and never these, which is what lets a
+    # Wormhole and a Blackhole device run side by side.
     _blackhole = False
 
+    @classmethod
+    def fields_for(cls, blackhole):
+        """Every field of ``blackhole``'s layout, by name, as a
+        :class:`ConfigField`. Shared and read-only: compiled once per process
+        per architecture, whichever layout the global accessors are on."""
+        return TensixConfigLayout.for_arch(blackhole).fields
+
     @classmethod
     def use_blackhole(cls, blackhole):
         if getattr(cls, "_loaded_arch", None) != blackhole:
@@ -109,68 +210,88 @@ class TensixConfigurationConstants:
 
     @classmethod
     def _load(cls, blackhole):
-        yaml_name = cls._YAML_BY_ARCH[blackhole]
-        cls.config_constants = load_yaml_cached(
-            resources.files("tt_sim.pe.tensix").joinpath(yaml_name),
-            yaml_name.removesuffix(".yaml"),
-        )
-        cls.ids = {}
-        for k in cls.config_constants.keys():
-            cls.ids[cls.config_constants[k]["ADDR32"]] = k
+        cls.layout = TensixConfigLayout.for_arch(blackhole)
+        cls.config_constants = cls.layout.constants
+        cls.ids = cls.layout.ids
         cls._loaded_arch = blackhole
 
     @classmethod
     def init(cls):
-        if not hasattr(cls, "config_constants"):
+        if not hasattr(cls, "layout"):
             cls._load(cls._blackhole)
 
     @classmethod
     def get_name(cls, id):
         cls.init()
-        if id in cls.ids:
-            return cls.ids[id]
-        else:
-            return "NONE"
+        return cls.layout.get_name(id)
 
     @classmethod
     def exists(cls, key):
         cls.init()
-        return key in cls.config_constants
+        return cls.layout.exists(key)
 
     @classmethod
     def get_addr32(cls, key):
         cls.init()
-        if key not in cls.config_constants:
-            raise IndexError(f"'{key}' not in constants")
-        return cls.config_constants[key]["ADDR32"]
+        return cls.layout.get_addr32(key)
 
     @classmethod
     def get_shamt(cls, key):
         cls.init()
-        if key not in cls.config_constants:
-            raise IndexError(f"'{key}' not in constants")
-        return cls.config_constants[key]["SHAMT"]
+        return cls.layout.get_shamt(key)
 
     @classmethod
     def get_mask(cls, key):
         cls.init()
-        if key not in cls.config_constants:
-            raise IndexError(f"'{key}' not in constants")
-        return cls.config_constants[key]["MASK"]
+        return cls.layout.get_mask(key)
 
     @classmethod
     def parse_raw_config_value(cls, value, key):
         cls.init()
-        mask = cls.get_mask(key)
-        shamt = cls.get_shamt(key)
-        return cls.tensix_be_config_parse_value(value, shamt, mask)
+        return cls.layout.parse_raw_config_value(value, key)
 
     @classmethod
     def tensix_be_config_parse_value(cls, value, shamt, mask):
         return (value & mask) >> shamt
 
 
+@dataclass(frozen=True, slots=True)
+class DecodedInstruction:
+    """One Tensix instruction word and its decode, made once per distinct word.
+
+    This is what the frontend queues carry, from the MOP FIFO through the
+    replay buffer to the Wait Gate, so an instruction is decoded where it
+    enters the thread and nowhere after. ``name`` and ``ex_resource`` are the
+    two keys every stage reads, hoisted out of ``info``; ``info`` is the shared
+    dict :meth:`TensixInstructionDecoder.getInstructionInfo` returns for
+    ``word``, and is as read-only as that is.
+    """
+
+    word: int
+    info: dict
+    name: str
+    ex_resource: str
+
+
 class TensixInstructionDecoder:
+    # Decoding is on the issue path of every Tensix instruction -- the backend's
+    # issueInstruction, the wait gate, each backend unit's retire -- and MOP and
+    # REPLAY expansion issue the same handful of words thousands of times. So
+    # each opcode's argument layout is compiled once, on first use, to a tuple
+    # of (name, shift, mask) extractors, and each decoded word is kept in
+    # ``_decoded``, as the :class:`DecodedInstruction` the frontend queues: a
+    # repeat decode is one dict lookup.
+    #
+    # The info dicts handed out are therefore shared between every decode of a
+    # word, ``instr_args`` included. Nothing in the backend writes to them (the
+    # handlers only read their arguments); a caller that wants to annotate one
+    # must copy it first.
+    _decoded = {}
+    # Distinct words are bounded by the programs loaded, so this only trips on
+    # something like a fuzzer walking the encoding space; dropping everything
+    # then is cheaper to maintain than an LRU on a path this hot.
+    _DECODED_LIMIT = 1 << 16
+
     @classmethod
     def init(cls):
         if not hasattr(cls, "tensix_instructions") or not hasattr(cls, "opcodes"):
@@ -182,6 +303,8 @@ class TensixInstructionDecoder:
             )
 
             cls.opcodes = cls._generate_tensix_instructions_by_opcode()
+            cls.extractors = cls._compile_argument_extractors()
+            cls._decoded.clear()
 
     @classmethod
     def _generate_tensix_instructions_by_opcode(cls):
@@ -191,44 +314,74 @@ class TensixInstructionDecoder:
             by_opcode[instruction["op_binary"]]["name"] = k
         return by_opcode
 
+    @classmethod
+    def _compile_argument_extractors(cls):
+        """Per opcode, a ``(name, shift, mask)`` tuple for each argument.
+
+        Each argument runs from its ``start_bit`` up to the bit before the next
+        argument's, and the last one up to bit 23 (the opcode is from 24
+        onwards).
+        """
+        extractors = {}
+        for opcode, instruction in cls.opcodes.items():
+            arguments = instruction.get("arguments")
+            fields = []
+            if isinstance(arguments, list):
+                ends = [arg["start_bit"] - 1 for arg in arguments[1:]] + [23]
+                for arg, end in zip(arguments, ends):
+                    start = arg["start_bit"]
+                    fields.append((arg["name"], start, (1 << (end - start + 1)) - 1))
+            extractors[opcode] = tuple(fields)
+        return extractors
+
     @classmethod
     def isInstructionRecognised(cls, instruction):
+        if instruction in cls._decoded:
+            return True
         cls.init()
         opcode = extract_bits(instruction, 8, 24)
         return opcode in cls.opcodes
 
     @classmethod
     def getInstructionInfo(cls, instruction):
+        return cls.decoded(instruction).info
+
+    @classmethod
+    def decoded(cls, instruction):
+        """The :class:`DecodedInstruction` for ``instruction``; the same
+        object for every call with the same word."""
+        decoded = cls._decoded.get(instruction)
+        if decoded is None:
+            decoded = cls._decode(instruction)
+        return decoded
+
+    @classmethod
+    def _decode(cls, instruction):
         cls.init()
         opcode = extract_bits(instruction, 8, 24)
         assert opcode in cls.opcodes
-        # Create a copy of the top level object here as will insert the
-        # instruction arguments. If we don't create a copy then the underlying
-        # object is modified and the next same instruction would get those
-        # arguments. This matters if an instruction is blocked. Only do a shallow
-        # copy as only going to change the top level object (add instr_args)
+        # A shallow copy of the opcode's YAML entry: only the top level gains
+        # keys (instr_args, raw_instruction), and the copy is what is cached.
         instruction_info = copy(cls.opcodes[opcode])
-        instr_args = {}
-        if "arguments" in instruction_info and isinstance(
-            instruction_info["arguments"], list
-        ):
-            arg_ends = []  # end of each argument (inclusive)
-            for arg in instruction_info["arguments"][1:]:
-                arg_ends.append(arg["start_bit"] - 1)
-            arg_ends.append(23)  # opcode is from 24 onwards
-
-            for idx, arg in enumerate(instruction_info["arguments"]):
-                instr_args[arg["name"]] = get_bits(
-                    instruction, arg["start_bit"], arg_ends[idx]
-                )
-
-        instruction_info["instr_args"] = instr_args
+        word = instruction & 0xFFFFFFFF
+        instruction_info["instr_args"] = {
+            name: (word >> shift) & mask for name, shift, mask in cls.extractors[opcode]
+        }
         # Keep the raw 32-bit word so handlers can read fields the shared
         # (Wormhole-layout) argument table doesn't expose — e.g. Blackhole's
         # ZEROACC `clear_zero_flags` bit.
         instruction_info["raw_instruction"] = instruction
 
-        return instruction_info
+        decoded = DecodedInstruction(
+            instruction,
+            instruction_info,
+            instruction_info["name"],
+            instruction_info["ex_resource"],
+        )
+        if len(cls._decoded) >= cls._DECODED_LIMIT:
+            cls._decoded.clear()
+        cls._decoded[instruction] = decoded
+        return decoded
 
 
 class DataFormatConversions:
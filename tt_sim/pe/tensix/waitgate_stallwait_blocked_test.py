@@ -53,7 +53,7 @@ def _stallwait(cond=C10_SRCA_NOT_MATH, block=B0_TDMA | B5_THCON):
 
 
 def _info(instruction):
-    return TensixInstructionDecoder.getInstructionInfo(instruction)
+    return TensixInstructionDecoder.decoded(instruction)
 
 
 def test_every_block_bit_catches_a_stallwait():
@@ -0,0 +1,680 @@
+"""How fast the simulator itself runs: a wall-clock benchmark over the replay traces.
+
+Everything else in ``tt_sim/perf`` is about *simulated* time -- what a kernel
+would cost on a card. This module is about the other clock: how many seconds of
+host time it takes to simulate that kernel, and whether a change made it worse.
+ROADMAP quotes cycles/s figures for ``four``, ``six`` and ``matmulblock`` and a
+per-subsystem self-time profile of ``matmulblock``; until now each of those was
+measured by hand, once, and could not be re-run to check a later change against
+it. This is the harness that re-runs them.
+
+What a workload is
+------------------
+
+A captured wire trace, ``driver/<arch>/server/traces/<stem>.trace``, named
+``<arch>/<stem>`` -- ``wormhole/six``, ``blackhole/optest``. It is replayed the
+way the offline value guards replay it (``examples_replay_test`` and its
+Blackhole siblings): build the device, register the DRAM, Ethernet and polled
+Tensix cores on a ``Fabric``, feed every recorded message through the
+transport, and whenever the host polls a worker whose go-message still reads
+``RUN_MSG_GO``, pump the device until it reads ``RUN_MSG_DONE``. Replies are
+not compared -- the guards do that; a benchmark that fails on a value is
+measuring the wrong thing -- so a run here is the guard's work and nothing else.
+Traces not present in a checkout are skipped, as the guards skip them.
+
+What one run measures
+---------------------
+
+Each run is a fresh child process (``--child``), so imports, the Numba cache
+and the allocator start cold every time, and peak RSS belongs to the one
+workload. A run reports:
+
+* ``wall_s`` -- host seconds to replay the trace, device construction excluded;
+* ``setup_s`` -- host seconds to build the device and the fabric;
+* ``cycles`` -- simulated cycles the replay advanced the device clock by;
+* ``peak_rss_kib`` -- the child's ``ru_maxrss`` (KiB on Linux).
+
+Cycles must be identical across the runs of one workload: a replay is
+deterministic, and a workload whose cycle count moves between runs is not a
+benchmark. Two more runs are made once per workload, because each perturbs the
+timing it would otherwise report:
+
+* a **count** run subscribes to ``EventCategory.INSTR`` and counts baby RISC-V
+  instructions retired (``not stalled``). The count is architectural, so it is
+  the count of the timed runs too; instructions/s is that count over their
+  median ``wall_s``. Tensix instructions are not counted: the frontend
+  publishes a ``DispatchEvent`` at each of three stages, not one per
+  instruction, so there is no event whose count *is* the instruction count.
+* a **profile** run (``--profile``) runs the replay under ``cProfile`` and
+  groups self time by subsystem -- ``pe/tensix``, ``pe/rv``, ``device``,
+  ``memory``, builtins, stdlib, third-party -- the grouping ROADMAP's C++
+  assessment used.
+
+The results file and the comparison
+-----------------------------------
+
+Results go to a JSON file (default ``wallclock-bench.json``, gitignored) keyed
+by git revision -- ``git rev-parse HEAD``, with ``-dirty`` appended when the
+tree has uncommitted changes -- alongside the Python version, the host and
+every ``TT_SIM_*`` variable set, because a number separated from those is not
+comparable with anything. Benching a revision again replaces the workloads it
+re-ran and keeps the rest.
+
+``--compare BASE [HEAD]`` reads two revisions back (a unique prefix is enough;
+``HEAD`` defaults to the newest recorded) and gives each workload common to
+both a verdict on ``wall_s``:
+
+* **regression** / **improvement** -- the medians moved by more than the
+  noise floor *and* a one-sided permutation test on the means says the move is
+  significant at :data:`ALPHA`;
+* **noise** -- anything else.
+
+The noise floor is ``max(MIN_NOISE_FLOOR, 2 x the larger CV of the two
+sample sets)``: a change smaller than the runs' own scatter is not a change,
+however small its p-value. The permutation test is exact when the
+rearrangements number at most :data:`PERMUTATIONS` and a seeded estimate
+otherwise; it needs no distribution assumption, which matters for wall-clock
+samples, and no scipy. Its smallest attainable p-value is ``1 / C(n+m, n)``, so
+two runs a side (1/6) can never flag anything -- five a side (1/252) can. A
+workload whose cycle count differs between the revisions is still compared, and
+marked: the simulator did different work, and a slower run of more cycles is
+not the same finding as a slower run of the same ones.
+
+The process exits 1 when any workload regressed, so the comparison drops into a
+script or CI step unchanged.
+
+Run it
+------
+
+::
+
+    python3 -m tt_sim.perf.wallclock_bench                       # the default set
+    python3 -m tt_sim.perf.wallclock_bench wormhole/six --runs 10
+    python3 -m tt_sim.perf.wallclock_bench --all --profile
+    python3 -m tt_sim.perf.wallclock_bench --list
+    python3 -m tt_sim.perf.wallclock_bench --compare 730877e     # against newest
+    python3 -m tt_sim.perf.wallclock_bench --compare 730877e 40b84ce
+
+Bench the base and the head on the same quiet host, with the same
+``TT_SIM_*`` environment; the file records both so a mismatch is visible, but
+it cannot make two hosts comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import sysconfig
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+ARCHES = ("wormhole", "blackhole")
+
+#: Each architecture's device factory module, under ``driver.<arch>.server``.
+DEVICE_MODULES = {"wormhole": "wh_device", "blackhole": "bh_device"}
+
+#: The go-message mailbox the host spin-polls, per architecture. The same
+#: offsets the replay guards poll.
+GO_MSG_ADDR = {"wormhole": 0x4A0, "blackhole": 0x4F0}
+
+RUN_MSG_GO = 0x80
+RUN_MSG_DONE = 0x00
+PUMP_CHUNK = 2000
+PUMP_CAP = 600_000
+
+#: What a bare invocation benches: the three guards ROADMAP quotes cycles/s
+#: for -- one idle-dominated, two compute-bound.
+DEFAULT_WORKLOADS = ("wormhole/four", "wormhole/six", "wormhole/matmulblock")
+DEFAULT_RUNS = 5
+DEFAULT_RESULTS = Path("wallclock-bench.json")
+
+#: Bumped when the results file changes shape; a file of another version is
+#: refused rather than half-read.
+FORMAT_VERSION = 1
+
+#: Significance level for the permutation test.
+ALPHA = 0.05
+#: The smallest relative change ever called a change, however quiet the runs.
+MIN_NOISE_FLOOR = 0.02
+#: Above this many rearrangements the permutation test samples instead.
+PERMUTATIONS = 20_000
+
+
+# ---------------------------------------------------------------------------
+# Workloads.
+# ---------------------------------------------------------------------------
+
+
+def trace_dir(arch):
+    return REPO_ROOT / "driver" / arch / "server" / "traces"
+
+
+def trace_path(name):
+    arch, _, stem = name.partition("/")
+    if arch not in ARCHES or not stem:
+        raise ValueError(f"workload {name!r} is not <arch>/<trace>")
+    return trace_dir(arch) / f"{stem}.trace"
+
+
+def workloads():
+    """Every ``<arch>/<stem>`` whose trace is present, in name order."""
+    return [
+        f"{arch}/{path.stem}"
+        for arch in ARCHES
+        for path in sorted(trace_dir(arch).glob("*.trace"))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# One run (in the child).
+# ---------------------------------------------------------------------------
+
+
+def _read_messages(path):
+    from tt_sim.bridge.trace import read_trace
+
+    return [
+        SimpleNamespace(
+            cmd=p["cmd"],
+            core=p["core"],
+            address=p["address"],
+            size=p["size"],
+            data=p["data"],
+        )
+        for p in read_trace(path)
+    ]
+
+
+def _build(arch, messages):
+    """The device and fabric the replay guards build, for ``messages``."""
+    from tt_sim.bridge import DramCore, EthCore, Fabric, TensixCore
+    from tt_sim.bridge import protocol as proto
+
+    server = f"driver.{arch}.server"
+    coords = importlib.import_module(f"{server}.coords")
+    device = importlib.import_module(f"{server}.{DEVICE_MODULES[arch]}").make_device()
+    fabric = Fabric()
+    for translated, unified in coords.DRAM_COORD_MAP.items():
+        fabric.register(translated, DramCore(device, unified))
+    for translated, unified in coords.ETH_COORD_MAP.items():
+        fabric.register(translated, EthCore(device, unified))
+    # Every core gets one setup read of its go-message; only the launched
+    # workers are polled repeatedly.
+    polls = Counter(
+        m.core
+        for m in messages
+        if m.cmd == proto.CMD_READ and m.address == GO_MSG_ADDR[arch]
+    )
+    pool = {core for core, n in polls.items() if n > 1}
+    for physical in sorted(pool):
+        device.ensure_tensix_tile(physical)
+        fabric.register(physical, TensixCore(device, coords.TENSIX_COORD_MAP[physical]))
+    return device, fabric, pool, coords.TENSIX_COORD_MAP
+
+
+def _replay(arch, messages, device, fabric, pool, tensix_map):
+    from tt_sim.bridge import Transport
+    from tt_sim.bridge import protocol as proto
+
+    go = GO_MSG_ADDR[arch]
+    tt_device = device.tt_device
+    transport = Transport(addr=None)
+
+    def signal(core):
+        return tt_device.read(tensix_map[core], go, 4)[3]
+
+    for m in messages:
+        transport._handle(fabric, m)
+        if m.cmd == proto.CMD_READ and m.address == go and m.core in pool:
+            if signal(m.core) != RUN_MSG_GO:
+                continue
+            pumped = 0
+            while signal(m.core) != RUN_MSG_DONE and pumped < PUMP_CAP:
+                tt_device.run(PUMP_CHUNK)
+                pumped += PUMP_CHUNK
+            if signal(m.core) != RUN_MSG_DONE:
+                raise RuntimeError(
+                    f"worker {m.core} never reached RUN_MSG_DONE within "
+                    f"{PUMP_CAP} pumped cycles"
+                )
+
+
+def run_once(name, mode="time"):
+    """Replay one workload once, in this process; the measurements as a dict.
+
+    ``mode`` is ``"time"``, ``"count"`` or ``"profile"`` -- see the module
+    docstring for what each adds and why they are separate runs.
+    """
+    arch = name.partition("/")[0]
+    messages = _read_messages(trace_path(name))
+    start = time.perf_counter()
+    device, fabric, pool, tensix_map = _build(arch, messages)
+    setup_s = time.perf_counter() - start
+    clock = device.tt_device.clocks[0]
+    cycles_before = clock.clock_tick_num
+    args = (arch, messages, device, fabric, pool, tensix_map)
+    result = {}
+
+    if mode == "time":
+        start = time.perf_counter()
+        _replay(*args)
+        result["wall_s"] = time.perf_counter() - start
+        result["setup_s"] = setup_s
+        result["peak_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    elif mode == "count":
+        from tt_sim.trace.bus import get_bus
+        from tt_sim.trace.events import EventCategory
+
+        retired = 0
+
+        def count(event):
+            nonlocal retired
+            if not event.stalled:
+                retired += 1
+
+        bus = get_bus()
+        bus.subscribe(EventCategory.INSTR, count)
+        bus.enabled = True
+        try:
+            _replay(*args)
+        finally:
+            bus.reset()
+        result["rv_instructions"] = retired
+    elif mode == "profile":
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.runcall(_replay, *args)
+        result["self_time"] = self_time(pstats.Stats(profiler))
+    else:
+        raise ValueError(f"unknown mode {mode!r}")
+
+    result["cycles"] = clock.clock_tick_num - cycles_before
+    device.tt_device.shutdown()
+    return result
+
+
+_PACKAGE = REPO_ROOT / "tt_sim"
+_STDLIB = Path(sysconfig.get_paths()["stdlib"]).resolve()
+
+
+def subsystem(filename):
+    """The self-time bucket a profiled function's ``filename`` belongs to.
+
+    Under ``tt_sim/`` it is the package below it -- two levels under ``pe``
+    (``pe/tensix``, ``pe/rv``), one elsewhere (``device``, ``memory``).
+    cProfile files builtins under ``~``.
+    """
+    if filename.startswith("~") or filename.startswith("<built-in"):
+        return "builtins"
+    if filename.startswith("<"):
+        return "stdlib"
+    path = Path(filename).resolve()
+    if path.is_relative_to(_PACKAGE):
+        parts = path.relative_to(_PACKAGE).parts
+        if len(parts) == 1:
+            return "tt_sim"
+        if parts[0] == "pe" and len(parts) > 2:
+            return f"pe/{parts[1]}"
+        return parts[0]
+    if path.is_relative_to(REPO_ROOT / "driver"):
+        return "driver"
+    if "site-packages" in path.parts or "dist-packages" in path.parts:
+        return "third-party"
+    if path.is_relative_to(_STDLIB):
+        return "stdlib"
+    return "other"
+
+
+def self_time(stats):
+    """Fraction of total self time per :func:`subsystem`, largest first."""
+    totals = Counter()
+    for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+        totals[subsystem(filename)] += tottime
+    whole = sum(totals.values()) or 1.0
+    return {name: round(seconds / whole, 4) for name, seconds in totals.most_common()}
+
+
+# ---------------------------------------------------------------------------
+# Repeated runs (in the parent).
+# ---------------------------------------------------------------------------
+
+
+def _child(name, mode):
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tt_sim.perf.wallclock_bench",
+            "--child",
+            name,
+            "--mode",
+            mode,
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"{name} ({mode}) exited {proc.returncode}:\n{proc.stderr.strip()}"
+        )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(name, runs=DEFAULT_RUNS, profile=False, child=None):
+    """``runs`` timed runs of ``name``, plus a count run and optionally a
+    profile run, each in its own process; one results-file entry."""
+    child = child or _child
+    timed = [child(name, "time") for _ in range(runs)]
+    cycles = {r["cycles"] for r in timed}
+    if len(cycles) != 1:
+        raise RuntimeError(
+            f"{name}: simulated cycles differ between runs ({sorted(cycles)}); "
+            "the replay is not deterministic, so it is not a benchmark"
+        )
+    entry = {
+        "wall_s": [r["wall_s"] for r in timed],
+        "setup_s": [r["setup_s"] for r in timed],
+        "cycles": cycles.pop(),
+        "peak_rss_kib": max(r["peak_rss_kib"] for r in timed),
+        "rv_instructions": child(name, "count")["rv_instructions"],
+    }
+    if profile:
+        entry["self_time"] = child(name, "profile")["self_time"]
+    return entry
+
+
+# ---------------------------------------------------------------------------
+# Statistics.
+# ---------------------------------------------------------------------------
+
+
+def cv(samples):
+    """Coefficient of variation (sample stdev over mean); 0 for fewer than two."""
+    if len(samples) < 2:
+        return 0.0
+    mean = statistics.fmean(samples)
+    return statistics.stdev(samples) / mean if mean else 0.0
+
+
+def noise_floor(base, head):
+    return max(MIN_NOISE_FLOOR, 2 * max(cv(base), cv(head)))
+
+
+def permutation_p(base, head, seed=0):
+    """One-sided p-value that ``head``'s mean exceeds ``base``'s by chance.
+
+    The share of relabellings of the pooled samples whose head mean is at
+    least the observed one: exact when there are at most
+    :data:`PERMUTATIONS` of them, a seeded estimate otherwise.
+    """
+    pooled = list(base) + list(head)
+    n = len(head)
+    observed = sum(head)
+    eps = 1e-12 * max(1.0, abs(observed))
+    if math.comb(len(pooled), n) <= PERMUTATIONS:
+        splits = [
+            sum(pooled[i] for i in chosen)
+            for chosen in itertools.combinations(range(len(pooled)), n)
+        ]
+        return sum(s >= observed - eps for s in splits) / len(splits)
+    rng = random.Random(seed)
+    hits = sum(
+        sum(rng.sample(pooled, n)) >= observed - eps for _ in range(PERMUTATIONS)
+    )
+    # Counting the observed split itself keeps the estimate above zero.
+    return (hits + 1) / (PERMUTATIONS + 1)
+
+
+def compare_workload(base, head):
+    """The verdict on one workload's ``wall_s`` between two results entries."""
+    before, after = base["wall_s"], head["wall_s"]
+    change = statistics.median(after) / statistics.median(before) - 1
+    floor = noise_floor(before, after)
+    verdict = "noise"
+    p = None
+    if change > floor:
+        p = permutation_p(before, after)
+        verdict = "regression" if p < ALPHA else "noise"
+    elif change < -floor:
+        p = permutation_p(after, before)
+        verdict = "improvement" if p < ALPHA else "noise"
+    return {
+        "verdict": verdict,
+        "change": change,
+        "noise_floor": floor,
+        "p": p,
+        "same_cycles": base["cycles"] == head["cycles"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# The results file.
+# ---------------------------------------------------------------------------
+
+
+def git_revision(cwd=REPO_ROOT):
+    """``HEAD``'s hash, ``-dirty`` if the tree has changes; ``"unknown"``
+    outside a git checkout."""
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def load_results(path):
+    path = Path(path)
+    if not path.exists():
+        return {"format": FORMAT_VERSION, "revisions": {}}
+    results = json.loads(path.read_text())
+    if results.get("format") != FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is results format {results.get('format')!r}, "
+            f"this harness reads {FORMAT_VERSION}"
+        )
+    return results
+
+
+def record(results, revision, entries, recorded=None):
+    """Merge ``entries`` (``{workload: entry}``) in under ``revision``."""
+    slot = results["revisions"].setdefault(revision, {"workloads": {}})
+    slot.update(
+        recorded=recorded or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        python=platform.python_version(),
+        host=platform.node(),
+        env={k: v for k, v in sorted(os.environ.items()) if k.startswith("TT_SIM_")},
+    )
+    slot["workloads"].update(entries)
+    return results
+
+
+def save_results(results, path):
+    """Write atomically: a benchmark interrupted mid-write keeps the old file."""
+    path = Path(path)
+    partial = path.with_name(path.name + ".partial")
+    partial.write_text(json.dumps(results, indent=1, sort_keys=True) + "\n")
+    partial.replace(path)
+
+
+def resolve_revision(results, prefix):
+    """The one recorded revision ``prefix`` names (exactly, or as a unique
+    prefix); ``KeyError`` otherwise."""
+    revisions = results["revisions"]
+    if prefix in revisions:
+        return prefix
+    matches = [rev for rev in revisions if rev.startswith(prefix)]
+    if len(matches) != 1:
+        raise KeyError(
+            f"{prefix!r} names {len(matches)} recorded revisions"
+            + (f": {', '.join(sorted(matches))}" if matches else "")
+        )
+    return matches[0]
+
+
+def newest_revision(results):
+    revisions = results["revisions"]
+    return max(revisions, key=lambda rev: revisions[rev]["recorded"])
+
+
+# ---------------------------------------------------------------------------
+# Reports.
+# ---------------------------------------------------------------------------
+
+
+def report(entries, out=print):
+    out(
+        f"{'workload':<24} {'runs':>4} {'median s':>9} {'CV':>6} "
+        f"{'cycles':>10} {'cycles/s':>10} {'RV instr/s':>11} {'RSS MiB':>8}"
+    )
+    for name, e in entries.items():
+        median = statistics.median(e["wall_s"])
+        out(
+            f"{name:<24} {len(e['wall_s']):>4} {median:>9.3f} "
+            f"{cv(e['wall_s']):>6.1%} {e['cycles']:>10,} "
+            f"{e['cycles'] / median:>10,.0f} "
+            f"{e['rv_instructions'] / median:>11,.0f} "
+            f"{e['peak_rss_kib'] / 1024:>8.1f}"
+        )
+        if "self_time" in e:
+            out(
+                "    self time: "
+                + ", ".join(f"{k} {v:.1%}" for k, v in list(e["self_time"].items())[:8])
+            )
+
+
+def report_comparison(base_rev, head_rev, base, head, out=print):
+    """Print each common workload's verdict; the number that regressed."""
+    out(f"base {base_rev}\nhead {head_rev}")
+    if head["host"] != base["host"] or head["env"] != base["env"]:
+        out("  note: the two were recorded on different hosts or TT_SIM_* settings")
+    common = sorted(set(base["workloads"]) & set(head["workloads"]))
+    if not common:
+        out("no workload was benched at both revisions.")
+        return 0
+    regressed = 0
+    for name in common:
+        c = compare_workload(base["workloads"][name], head["workloads"][name])
+        regressed += c["verdict"] == "regression"
+        p = "" if c["p"] is None else f", p={c['p']:.3f}"
+        note = "" if c["same_cycles"] else "  (simulated cycles differ)"
+        out(
+            f"  {name:<24} {c['verdict'].upper():<11} {c['change']:+7.1%} "
+            f"(floor {c['noise_floor']:.1%}{p}){note}"
+        )
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Wall-clock benchmark of the simulator over the replay traces."
+    )
+    parser.add_argument("workloads", nargs="*", help="<arch>/<trace> names")
+    parser.add_argument("--all", action="store_true", help="every trace present")
+    parser.add_argument("--list", action="store_true", help="list workloads")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--results", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument(
+        "--profile", action="store_true", help="add a per-subsystem self-time run"
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="REV",
+        help="BASE [HEAD]: compare two recorded revisions (HEAD: the newest)",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--mode",
+        default="time",
+        choices=("time", "count", "profile"),
+        help=argparse.SUPPRESS,
+    )
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_once(args.child, args.mode)))
+        return 0
+
+    if args.list:
+        for name in workloads():
+            print(name)
+        return 0
+
+    if args.compare:
+        if len(args.compare) > 2:
+            parser.error("--compare takes BASE and at most one HEAD")
+        results = load_results(args.results)
+        try:
+            base_rev = resolve_revision(results, args.compare[0])
+            head_rev = (
+                resolve_revision(results, args.compare[1])
+                if len(args.compare) == 2
+                else newest_revision(results)
+            )
+        except (KeyError, ValueError) as e:
+            print(f"{args.results}: {e.args[0] if e.args else e}")
+            return 2
+        revisions = results["revisions"]
+        regressed = report_comparison(
+            base_rev, head_rev, revisions[base_rev], revisions[head_rev]
+        )
+        return 1 if regressed else 0
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    names = workloads() if args.all else args.workloads or list(DEFAULT_WORKLOADS)
+    try:
+        present = [name for name in names if trace_path(name).exists()]
+    except ValueError as e:
+        parser.error(str(e))
+    for name in names:
+        if name not in present:
+            print(f"{name}: trace not present, skipped")
+    if not present:
+        print("nothing to bench.")
+        return 0
+
+    entries = {}
+    for name in present:
+        entries[name] = measure(name, args.runs, args.profile)
+    revision = git_revision()
+    results = record(load_results(args.results), revision, entries)
+    save_results(results, args.results)
+    print(f"revision {revision} -> {args.results}")
+    report(entries)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
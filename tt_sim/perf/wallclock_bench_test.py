@@ -0,0 +1,205 @@
+"""The wall-clock benchmark harness: what it measures, and what it calls a regression.
+
+Runs standalone (``python3 -m tt_sim.perf.wallclock_bench_test``) or under
+pytest.
+
+Host timings are not asserted on -- they are the one thing a test cannot pin.
+What is pinned is everything that turns them into a verdict:
+
+1. Workloads are the ``.trace`` files present, named ``<arch>/<stem>``, and a
+   name that is not one is refused.
+2. The statistics: the CV, the exact permutation p-value (five runs a side,
+   perfectly separated, is ``1/252``) and its sampled fallback.
+3. A verdict needs both a move past the noise floor and a significant p; a
+   cycle-count change is marked, not hidden.
+4. Profiled self time is bucketed by subsystem as ROADMAP groups it.
+5. The results file merges per workload under a revision, resolves a unique
+   prefix, and refuses a file of another format.
+6. One replay, in each mode, reports cycles that agree, and the child
+   protocol carries a run back to the parent.
+7. ``main`` benches into a results file and a self-comparison finds nothing.
+"""
+
+import json
+import math
+import pstats
+
+import pytest
+
+from tt_sim.perf import wallclock_bench as bench
+
+SMALL = "wormhole/one"
+needs_trace = pytest.mark.skipif(
+    not bench.trace_path(SMALL).exists(), reason=f"{SMALL} trace not present"
+)
+
+
+def _entry(wall_s, cycles=1000):
+    return {
+        "wall_s": list(wall_s),
+        "setup_s": [0.1] * len(wall_s),
+        "cycles": cycles,
+        "peak_rss_kib": 90_000,
+        "rv_instructions": 4000,
+    }
+
+
+def test_workloads_are_the_traces_present():
+    names = bench.workloads()
+    assert names == [
+        f"{arch}/{path.stem}"
+        for arch in bench.ARCHES
+        for path in sorted(bench.trace_dir(arch).glob("*.trace"))
+    ]
+    for name in names:
+        assert bench.trace_path(name).is_file()
+    for bad in ("six", "grayskull/six", "wormhole/"):
+        with pytest.raises(ValueError, match="is not <arch>/<trace>"):
+            bench.trace_path(bad)
+
+
+def test_cv():
+    assert bench.cv([2.0]) == 0.0
+    assert bench.cv([1.0, 1.0, 1.0]) == 0.0
+    assert bench.cv([1.0, 3.0]) == pytest.approx(math.sqrt(2) / 2)
+
+
+def test_the_exact_permutation_p_value():
+    base = [1.00, 1.01, 0.99, 1.02, 0.98]
+    slower = [1.20, 1.21, 1.19, 1.22, 1.18]
+    assert bench.permutation_p(base, slower) == pytest.approx(1 / 252)
+    # The other direction is as unsurprising as it gets.
+    assert bench.permutation_p(slower, base) == 1.0
+    # Two runs a side can never get under ALPHA.
+    assert bench.permutation_p([1.0, 1.0], [2.0, 2.0]) == pytest.approx(1 / 6)
+
+
+def test_the_sampled_permutation_p_value(monkeypatch):
+    monkeypatch.setattr(bench, "PERMUTATIONS", 100)
+    base = [1.0 + 0.01 * i for i in range(10)]
+    slower = [2.0 + 0.01 * i for i in range(10)]
+    assert math.comb(20, 10) > bench.PERMUTATIONS
+    p = bench.permutation_p(base, slower)
+    assert p == pytest.approx(1 / 101)
+    assert bench.permutation_p(base, slower) == p
+    assert bench.permutation_p(base, base) > 0.3
+
+
+@pytest.mark.parametrize(
+    ("head", "verdict"),
+    [
+        ([1.20, 1.21, 1.19, 1.22, 1.18], "regression"),
+        ([0.80, 0.81, 0.79, 0.82, 0.78], "improvement"),
+        # Significant, but inside the 2 % floor.
+        ([1.010, 1.011, 1.009, 1.012, 1.008], "noise"),
+    ],
+)
+def test_a_verdict_needs_the_floor_and_the_p(head, verdict):
+    base = _entry([1.000, 1.001, 0.999, 1.002, 0.998])
+    result = bench.compare_workload(base, _entry(head))
+    assert result["verdict"] == verdict
+    assert result["same_cycles"]
+
+
+def test_noisy_runs_raise_the_floor():
+    base = _entry([1.0, 1.3, 0.7, 1.2, 0.8])
+    head = _entry([1.3, 1.6, 1.0, 1.5, 1.1], cycles=1200)
+    result = bench.compare_workload(base, head)
+    assert result["noise_floor"] == pytest.approx(
+        2 * max(bench.cv(base["wall_s"]), bench.cv(head["wall_s"]))
+    )
+    assert result["change"] > 0.2
+    assert result["verdict"] == "noise"
+    assert not result["same_cycles"]
+
+
+def test_self_time_by_subsystem():
+    root = bench.REPO_ROOT
+    assert bench.subsystem(str(root / "tt_sim/pe/tensix/backend.py")) == "pe/tensix"
+    assert bench.subsystem(str(root / "tt_sim/pe/rv/rv32.py")) == "pe/rv"
+    assert bench.subsystem(str(root / "tt_sim/device/clock.py")) == "device"
+    assert bench.subsystem(str(root / "driver/wormhole/server/coords.py")) == "driver"
+    assert bench.subsystem("~") == "builtins"
+    assert bench.subsystem(json.__file__) == "stdlib"
+
+    stats = pstats.Stats.__new__(pstats.Stats)
+    stats.stats = {
+        (str(root / "tt_sim/pe/rv/rv32.py"), 1, "a"): (1, 1, 3.0, 3.0, {}),
+        (str(root / "tt_sim/pe/rv/decode.py"), 1, "b"): (1, 1, 1.0, 1.0, {}),
+        ("~", 0, "<built-in method len>"): (1, 1, 1.0, 1.0, {}),
+    }
+    assert list(bench.self_time(stats).items()) == [("pe/rv", 0.8), ("builtins", 0.2)]
+
+
+def test_the_results_file(tmp_path):
+    path = tmp_path / "bench.json"
+    results = bench.load_results(path)
+    bench.record(results, "abc123", {"wormhole/a": _entry([1.0])}, recorded="1")
+    bench.record(results, "abd456", {"wormhole/a": _entry([2.0])}, recorded="2")
+    bench.save_results(results, path)
+
+    # Re-benching one workload at a revision keeps the others.
+    results = bench.load_results(path)
+    bench.record(results, "abc123", {"wormhole/b": _entry([3.0])}, recorded="3")
+    bench.save_results(results, path)
+    results = json.loads(path.read_text())
+    assert set(results["revisions"]["abc123"]["workloads"]) == {
+        "wormhole/a",
+        "wormhole/b",
+    }
+    assert not list(tmp_path.glob("*.partial"))
+
+    assert bench.resolve_revision(results, "abc") == "abc123"
+    assert bench.resolve_revision(results, "abd456") == "abd456"
+    for ambiguous_or_absent in ("ab", "fff"):
+        with pytest.raises(KeyError):
+            bench.resolve_revision(results, ambiguous_or_absent)
+    assert bench.newest_revision(results) == "abc123"
+
+    path.write_text(json.dumps({"format": 99, "revisions": {}}))
+    with pytest.raises(ValueError, match="results format 99"):
+        bench.load_results(path)
+
+
+@needs_trace
+def test_one_replay_in_each_mode():
+    timed = bench.run_once(SMALL, "time")
+    counted = bench.run_once(SMALL, "count")
+    profiled = bench.run_once(SMALL, "profile")
+    assert timed["cycles"] > 0
+    assert counted["cycles"] == timed["cycles"] == profiled["cycles"]
+    assert timed["wall_s"] > 0
+    assert timed["peak_rss_kib"] > 0
+    assert counted["rv_instructions"] > 0
+    assert {"pe/rv", "pe/tensix"} <= set(profiled["self_time"])
+    assert sum(profiled["self_time"].values()) == pytest.approx(1, abs=0.01)
+
+
+@needs_trace
+def test_a_child_carries_its_run_back():
+    result = bench._child(SMALL, "time")
+    assert result["cycles"] == bench.run_once(SMALL, "time")["cycles"]
+
+
+@needs_trace
+def test_bench_then_compare(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(bench, "_child", lambda name, mode: bench.run_once(name, mode))
+    monkeypatch.setattr(bench, "git_revision", lambda: "feedface")
+    path = tmp_path / "bench.json"
+    assert (
+        bench.main([SMALL, "blackhole/absent", "--runs", "2", "--results", str(path)])
+        == 0
+    )
+    out = capsys.readouterr().out
+    assert "blackhole/absent: trace not present, skipped" in out
+    entry = bench.load_results(path)["revisions"]["feedface"]["workloads"][SMALL]
+    assert len(entry["wall_s"]) == 2
+    assert "self_time" not in entry
+
+    assert bench.main(["--compare", "feed", "--results", str(path)]) == 0
+    assert "NOISE" in capsys.readouterr().out
+    assert bench.main(["--compare", "cafe", "--results", str(path)]) == 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
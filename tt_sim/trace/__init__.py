@@ -32,8 +32,10 @@ from tt_sim.trace.invariants import (
     PCAlignmentInvariant,
     Violation,
 )
+from tt_sim.trace.sampling import PCSampler
 from tt_sim.trace.state_dump import StateDumpWriter, dump_device_state
 from tt_sim.trace.writers.cachegrind import MemoryTraceWriter
+from tt_sim.trace.writers.columnar import ColumnarRecorder
 from tt_sim.trace.writers.commitlog import SpikeCommitlogWriter
 from tt_sim.trace.writers.jsonl import JSONLLogger
 from tt_sim.trace.writers.lcov import LCOVWriter
@@ -47,6 +49,7 @@ __all__ = [
     "MATRIX_BOOKKEEPING_OPS",
     "MATRIX_DATAPATH_OPS",
     "STALL_REASONS",
+    "ColumnarRecorder",
     "ComputeEvent",
     "CounterAggregator",
     "CounterSnapshot",
@@ -73,6 +76,7 @@ __all__ = [
     "NoCParquetWriter",
     "NoCRequestResponseInvariant",
     "PCAlignmentInvariant",
+    "PCSampler",
     "ParquetCounterWriter",
     "PerfettoWriter",
     "SourceLoc",
@@ -36,6 +36,16 @@ Supported env vars (all optional, all default-off):
   ordering, NoC request/response pairing) to a JSONL file. Set
   ``TT_SIM_TRACE_INVARIANTS_STRICT=1`` to additionally raise on
   first violation.
+- ``TT_SIM_TRACE_BACKGROUND=1`` — run the JSONL, Perfetto, commitlog and
+  memory writers above in a child process each
+  (``tt_sim.trace.writers.background``), so their formatting and
+  compression leave the simulation thread. Same output.
+- ``TT_SIM_TRACE_COLUMNAR`` — record instruction and stall events into
+  preallocated NumPy columns, written out as chunked Parquet
+  (``instr-NNNNN.parquet`` / ``stall-NNNNN.parquet``). The cheap way to
+  trace a long run; the text writers can be fed from it afterwards with
+  ``tt_sim.trace.writers.columnar.replay``. Chunk size is
+  ``TT_SIM_TRACE_COLUMNAR_CHUNK`` rows (default 65536).
 - ``TT_SIM_TRACE_STATE_DUMP`` — capture a JSON state dump at each
   lifecycle boundary (kernel start/done) for cross-run / cross-sim
   diffing via ``python3 -m tt_sim.trace.diff_state``.
@@ -58,6 +68,13 @@ without choosing between them. Companion knobs:
   auto-discovery entirely.
 - ``TT_SIM_PROFILE_INTERVAL`` — counter flush cadence in cycles.
 - ``TT_SIM_PROFILE_LABEL`` — a name for the run, printed in the report.
+- ``TT_SIM_PROFILE_SAMPLE`` — ``<cycles>`` (or ``on`` for the default, 97)
+  to build the hotspot table by sampling every core's PC and
+  stall state that often (``tt_sim.trace.sampling``) instead of from every
+  retired instruction. The event bus stays off, so the run goes at untraced
+  speed; the report's hotspot rows become estimates with 95 % intervals, and
+  the counter dataset is not collected unless ``TT_SIM_TRACE_COUNTERS`` asks
+  for it.
 """
 
 import atexit
@@ -73,8 +90,14 @@ from tt_sim.trace.elfdisc import REJECTED, discover, session_start
 from tt_sim.trace.hotspots import HotspotAggregator
 from tt_sim.trace.ids import get_registry
 from tt_sim.trace.invariants import InvariantRunner
+from tt_sim.trace.sampling import PCSampler, sample_interval_from_env
 from tt_sim.trace.state_dump import StateDumpWriter
+from tt_sim.trace.writers.background import (
+    BackgroundSink,
+    background_writers_enabled_from_env,
+)
 from tt_sim.trace.writers.cachegrind import MemoryTraceWriter
+from tt_sim.trace.writers.columnar import DEFAULT_CHUNK_ROWS, ColumnarRecorder
 from tt_sim.trace.writers.commitlog import SpikeCommitlogWriter
 from tt_sim.trace.writers.jsonl import JSONLLogger
 from tt_sim.trace.writers.lcov import LCOVWriter
@@ -82,17 +105,18 @@ from tt_sim.trace.writers.noc_parquet import NoCParquetWriter
 from tt_sim.trace.writers.parquet import ParquetCounterWriter
 from tt_sim.trace.writers.perfetto import PerfettoWriter
 
-_JSONL: JSONLLogger | None = None
-_PERFETTO: PerfettoWriter | None = None
-_COMMITLOG: SpikeCommitlogWriter | None = None
+_JSONL: JSONLLogger | BackgroundSink | None = None
+_PERFETTO: PerfettoWriter | BackgroundSink | None = None
+_COMMITLOG: SpikeCommitlogWriter | BackgroundSink | None = None
 _COUNTERS_AGG: CounterAggregator | None = None
 _COUNTERS_WRITER: ParquetCounterWriter | None = None
 _NOC_WRITER: NoCParquetWriter | None = None
-_MEMORY_WRITER: MemoryTraceWriter | None = None
+_MEMORY_WRITER: MemoryTraceWriter | BackgroundSink | None = None
 _LCOV_WRITER: LCOVWriter | None = None
+_COLUMNAR: ColumnarRecorder | None = None
 _INVARIANTS: InvariantRunner | None = None
 _STATE_WRITER: StateDumpWriter | None = None
-_HOTSPOTS: HotspotAggregator | None = None
+_HOTSPOTS: HotspotAggregator | PCSampler | None = None
 _PROFILE: dict | None = None
 
 
@@ -107,7 +131,7 @@ def enable_from_env(device=None) -> None:
     """
     global _JSONL, _PERFETTO, _COMMITLOG, _COUNTERS_AGG, _COUNTERS_WRITER
     global _NOC_WRITER, _MEMORY_WRITER, _LCOV_WRITER, _INVARIANTS, _STATE_WRITER
-    global _HOTSPOTS, _PROFILE
+    global _HOTSPOTS, _PROFILE, _COLUMNAR
     jsonl_path = os.environ.get("TT_SIM_TRACE")
     perfetto_path = os.environ.get("TT_SIM_TRACE_PERFETTO")
     commitlog_path = os.environ.get("TT_SIM_TRACE_COMMITLOG")
@@ -117,15 +141,18 @@ def enable_from_env(device=None) -> None:
     lcov_path = os.environ.get("TT_SIM_TRACE_LCOV")
     invariants_path = os.environ.get("TT_SIM_TRACE_INVARIANTS")
     state_dump_path = os.environ.get("TT_SIM_TRACE_STATE_DUMP")
+    columnar_path = os.environ.get("TT_SIM_TRACE_COLUMNAR")
     profile_dir = os.environ.get("TT_SIM_PROFILE")
+    sample_interval = sample_interval_from_env() if profile_dir else 0
 
     # ``TT_SIM_PROFILE`` is a preset over the vars above: it owns the counter
     # dataset unless the user asked for one somewhere else, in which case that
-    # wins and the profile just reads it.
-    if profile_dir and not counters_path:
+    # wins and the profile just reads it. A sampled profile owns none, because
+    # counters are aggregated from events and the point is to publish none.
+    if profile_dir and not counters_path and not sample_interval:
         counters_path = str(Path(profile_dir) / "counters")
 
-    if not any(
+    wants_events = any(
         (
             jsonl_path,
             perfetto_path,
@@ -136,13 +163,24 @@ def enable_from_env(device=None) -> None:
             lcov_path,
             invariants_path,
             state_dump_path,
-            profile_dir,
+            columnar_path,
         )
-    ):
+    )
+    if not wants_events and not profile_dir:
         return
 
-    bus = get_bus()
-    bus.enabled = True
+    if wants_events:
+        get_bus().enabled = True
+    # The four writers that format per event, in this process or in a child.
+    if background_writers_enabled_from_env():
+
+        def open_writer(writer_type, path):
+            return BackgroundSink(writer_type, path)
+
+    else:
+
+        def open_writer(writer_type, path):
+            return writer_type(path)
 
     if profile_dir and _PROFILE is None:
         _PROFILE = {
@@ -152,21 +190,27 @@ def enable_from_env(device=None) -> None:
             "label": os.environ.get("TT_SIM_PROFILE_LABEL", ""),
             "device": device,
         }
-        if _HOTSPOTS is None:
+        if _HOTSPOTS is None and not sample_interval:
             _HOTSPOTS = HotspotAggregator()
     elif _PROFILE is not None and _PROFILE.get("device") is None:
         # ``TT_Device`` calls this once before it has a device reference and
         # once after; keep the later, usable one for byte verification.
         _PROFILE["device"] = device
 
+    if sample_interval and _HOTSPOTS is None and device is not None:
+        # The sampler reads the device and rides its pump, so it waits for
+        # the call that has one.
+        _HOTSPOTS = PCSampler(device, sample_interval)
+        _HOTSPOTS.attach(device.clocks[0])
+
     if jsonl_path and _JSONL is None:
-        _JSONL = JSONLLogger(jsonl_path)
+        _JSONL = open_writer(JSONLLogger, jsonl_path)
 
     if perfetto_path and _PERFETTO is None:
-        _PERFETTO = PerfettoWriter(perfetto_path)
+        _PERFETTO = open_writer(PerfettoWriter, perfetto_path)
 
     if commitlog_path and _COMMITLOG is None:
-        _COMMITLOG = SpikeCommitlogWriter(commitlog_path)
+        _COMMITLOG = open_writer(SpikeCommitlogWriter, commitlog_path)
 
     if counters_path and _COUNTERS_WRITER is None:
         interval_env = os.environ.get(
@@ -186,7 +230,7 @@ def enable_from_env(device=None) -> None:
         _NOC_WRITER = NoCParquetWriter(noc_path)
 
     if memory_path and _MEMORY_WRITER is None:
-        _MEMORY_WRITER = MemoryTraceWriter(memory_path)
+        _MEMORY_WRITER = open_writer(MemoryTraceWriter, memory_path)
 
     if lcov_path and _LCOV_WRITER is None:
         elfs_env = os.environ.get("TT_SIM_TRACE_LCOV_ELFS", "")
@@ -195,6 +239,13 @@ def enable_from_env(device=None) -> None:
             index.load(elf_path)
         _LCOV_WRITER = LCOVWriter(lcov_path, index)
 
+    if columnar_path and _COLUMNAR is None:
+        chunk_env = os.environ.get("TT_SIM_TRACE_COLUMNAR_CHUNK")
+        _COLUMNAR = ColumnarRecorder(
+            columnar_path,
+            chunk_rows=int(chunk_env) if chunk_env else DEFAULT_CHUNK_ROWS,
+        )
+
     if invariants_path and _INVARIANTS is None:
         strict = os.environ.get("TT_SIM_TRACE_INVARIANTS_STRICT", "").lower() in (
             "1",
@@ -228,6 +279,8 @@ def enable_from_env(device=None) -> None:
                 _MEMORY_WRITER.close()
             if _LCOV_WRITER is not None:
                 _LCOV_WRITER.close()
+            if _COLUMNAR is not None:
+                _COLUMNAR.close()
             if _INVARIANTS is not None and invariants_path is not None:
                 n = _INVARIANTS.report(invariants_path)
                 if n > 0:
@@ -7,33 +7,93 @@ per :class:`EventCategory`; the simulator publishes typed
 should check before constructing event payloads.
 
 Thread-safety: the bus is shared across all per-tile worker threads
-created by :class:`tt_sim.device.clock.MultiTileClock`. ``publish()``
-keeps the disabled-path as a single attribute read (the bool reads/writes
-are GIL-atomic) and only takes the lock to snapshot the subscriber list
-when the bus is enabled. Subscriber callbacks run unlocked — writers that
-buffer shared state are responsible for their own internal locking.
+created by :class:`tt_sim.device.clock.MultiTileClock`, and ``publish()``
+takes no lock at all. Subscriptions are copy-on-write: each category's
+subscribers are an immutable tuple, and every change builds the new
+tuple, the category's dispatch function and the per-event-type dispatch
+cache under the lock, then publishes them with plain attribute and
+dict-item stores (GIL-atomic). A publisher therefore sees either the old
+subscriber set or the new one, never half of each, and an event racing a
+``subscribe`` may miss the new subscriber -- exactly as it could when
+``publish()`` snapshotted the list under the lock. Subscriber callbacks
+run unlocked — writers that buffer shared state are responsible for
+their own internal locking.
+
+**Dispatch.** Each category has one precomputed callable: ``None`` with no
+subscribers (or the category switched off), the subscriber itself when
+there is exactly one -- the common case, one writer per category -- and a
+loop over the tuple otherwise. ``publish()`` finds it by ``type(event)``
+in a dict that is filled on first sight of each event type, so the hot
+path is one flag read, one C-level dict lookup and one call. Producers
+that emit a burst hand the whole burst to :meth:`EventBus.publish_many`,
+which reads the flag and the cache once for all of it.
+
+**Direct sinks.** A subscriber registered with :meth:`EventBus.subscribe_direct`
+also offers a second entry point that takes the event's fields positionally,
+in dataclass field order. While it is the *only* subscriber to its category,
+:meth:`EventBus.direct` hands that entry point to a hot publisher, which can
+then skip building the frozen event altogether — the construction, not the
+dispatch, is most of what a traced retire costs. The moment anything else
+subscribes to the category, ``direct`` answers ``None`` and the publisher goes
+back to :meth:`EventBus.publish`, so a second writer never misses an event.
 """
 
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from tt_sim.trace.events import Event, EventCategory
 
 Subscriber = Callable[[Event], None]
 
 
+def _dispatcher(subscribers: tuple) -> Callable | None:
+    """One callable that delivers an event to every one of ``subscribers``."""
+    if not subscribers:
+        return None
+    if len(subscribers) == 1:
+        return subscribers[0]
+
+    def dispatch(event):
+        for sub in subscribers:
+            sub(event)
+
+    return dispatch
+
+
 class EventBus:
-    __slots__ = ("_enabled", "_per_category", "_subscribers", "_lock")
+    __slots__ = (
+        "_enabled",
+        "_per_category",
+        "_subscribers",
+        "_dispatch",
+        "_by_type",
+        "_lock",
+        "_direct_offers",
+        "_direct",
+    )
 
     def __init__(self):
         self._enabled: bool = False
         self._per_category: dict[EventCategory, bool] = {
             cat: True for cat in EventCategory
         }
-        self._subscribers: dict[EventCategory, list[Subscriber]] = {
-            cat: [] for cat in EventCategory
+        self._subscribers: dict[EventCategory, tuple[Subscriber, ...]] = {
+            cat: () for cat in EventCategory
+        }
+        # What ``publish`` calls per category, and the same keyed by event
+        # type (filled lazily; rebuilt whole on any change). See the module
+        # docstring.
+        self._dispatch: dict[EventCategory, Callable | None] = {
+            cat: None for cat in EventCategory
         }
+        self._by_type: dict[type, Callable | None] = {}
         self._lock = threading.Lock()
+        # ``{category: (callback, direct)}`` as offered, and the ``direct`` to
+        # hand out now -- ``None`` unless its callback is the sole subscriber.
+        self._direct_offers: dict[EventCategory, tuple] = {}
+        self._direct: dict[EventCategory, Callable | None] = {
+            cat: None for cat in EventCategory
+        }
 
     @property
     def enabled(self) -> bool:
@@ -47,27 +107,104 @@ class EventBus:
         return self._enabled and self._per_category[category]
 
     def set_category_enabled(self, category: EventCategory, value: bool):
-        self._per_category[category] = value
+        with self._lock:
+            self._per_category[category] = value
+            self._refresh(category)
 
     def subscribe(self, category: EventCategory, callback: Subscriber):
         with self._lock:
-            self._subscribers[category].append(callback)
+            self._subscribers[category] += (callback,)
+            self._refresh(category)
+
+    def subscribed_categories(self) -> list[EventCategory]:
+        """The categories at least one callback is subscribed to."""
+        return [cat for cat, subs in self._subscribers.items() if subs]
+
+    def subscribe_direct(
+        self, category: EventCategory, callback: Subscriber, direct: Callable
+    ):
+        """Subscribe ``callback``, offering ``direct`` as its field-wise twin.
+
+        ``direct(*fields)`` must do exactly what ``callback(Event(*fields))``
+        would; see the module docstring for when publishers use it.
+        """
+        with self._lock:
+            self._subscribers[category] += (callback,)
+            self._direct_offers[category] = (callback, direct)
+            self._refresh(category)
+
+    def direct(self, category: EventCategory) -> Callable | None:
+        """The sole subscriber's field-wise entry point, or ``None``.
+
+        Does not check :meth:`is_enabled`; callers ask that first, as they do
+        before building an event for :meth:`publish`.
+        """
+        return self._direct[category]
+
+    def _refresh(self, category: EventCategory):
+        """Rebuild ``category``'s dispatch state after a change. Locked."""
+        subs = self._subscribers[category]
+        self._dispatch[category] = (
+            _dispatcher(subs) if self._per_category[category] else None
+        )
+        offer = self._direct_offers.get(category)
+        self._direct[category] = (
+            offer[1] if offer is not None and subs == (offer[0],) else None
+        )
+        # A new dict rather than ``clear()``: a publisher mid-lookup keeps
+        # the one it read, and the next lookup re-resolves.
+        self._by_type = {}
+
+    def _resolve(self, event_type: type) -> Callable | None:
+        # Cache first, dispatch second: ``_refresh`` stores them the other way
+        # round, so an answer read here can only land in a cache that is
+        # already stale itself.
+        by_type = self._by_type
+        category = event_type.CATEGORY
+        dispatch = None if category is None else self._dispatch[category]
+        by_type[event_type] = dispatch
+        return dispatch
 
     def publish(self, event: Event):
-        cat = event.CATEGORY
-        if cat is None or not self._enabled or not self._per_category[cat]:
+        if not self._enabled:
             return
-        with self._lock:
-            subs = list(self._subscribers[cat])
-        for sub in subs:
-            sub(event)
+        try:
+            dispatch = self._by_type[type(event)]
+        except KeyError:
+            dispatch = self._resolve(type(event))
+        if dispatch is not None:
+            dispatch(event)
+
+    def publish_many(self, events: Iterable[Event]):
+        """:meth:`publish` each of ``events``, in order."""
+        if not self._enabled:
+            return
+        by_type = self._by_type
+        for event in events:
+            try:
+                dispatch = by_type[type(event)]
+            except KeyError:
+                dispatch = self._resolve(type(event))
+            if dispatch is not None:
+                dispatch(event)
+
+    def __reduce_ex__(self, protocol):
+        # The process-wide bus pickles as a reference to the bus of whichever
+        # process unpickles it: a restored device (``tt_sim.device.snapshot``)
+        # must publish to the writers subscribed there, not to a copy of the
+        # subscriber list it was captured with.
+        if self is _BUS:
+            return get_bus, ()
+        return super().__reduce_ex__(protocol)
 
     def reset(self):
         with self._lock:
             self._enabled = False
+            self._direct_offers = {}
             for cat in self._subscribers:
-                self._subscribers[cat] = []
+                self._subscribers[cat] = ()
                 self._per_category[cat] = True
+                self._refresh(cat)
 
 
 _BUS: EventBus | None = None
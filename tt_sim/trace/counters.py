@@ -167,16 +167,19 @@ class CounterAggregator:
             self._counters.clear()
             self._last_flush_cycle = cycle
             return
-        for (unit_id, name), value in self._counters.items():
-            bus.publish(
+        kernel_id = self._kernel_id
+        bus.publish_many(
+            [
                 CounterSnapshot(
                     cycle=cycle,
                     unit_id=unit_id,
                     counter_name=name,
                     value=value,
-                    kernel_id=self._kernel_id,
+                    kernel_id=kernel_id,
                 )
-            )
+                for (unit_id, name), value in self._counters.items()
+            ]
+        )
         self._counters.clear()
         self._last_flush_cycle = cycle
 
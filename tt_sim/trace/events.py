@@ -22,6 +22,11 @@ class EventCategory(Enum):
     COUNTER = "counter"
     STALL = "stall"
 
+    # ``Enum.__hash__`` is a Python-level ``hash(self._name_)``, and every
+    # ``EventBus.is_enabled`` guard on the hot path pays it. Members are
+    # singletons compared by identity, so the identity hash is equivalent.
+    __hash__ = object.__hash__
+
 
 class Unit(Enum):
     BRISC = "BRISC"
@@ -20,10 +20,17 @@ change in the report. The same is true of ``instr_stalled``, the Tensix
 front-end back-pressure flag, which is counted separately because it is
 a different mechanism from an RV scoreboard stall and exists in both
 timing regimes.
+
+The same table is also built from *samples* rather than from every event
+(:class:`tt_sim.trace.sampling.PCSampler`). A sampled table carries its
+``sample_interval`` and sample counts, its cycles are estimates, and
+:meth:`HotspotTable.cycles_interval` puts a confidence interval on each row;
+an exact table's interval is the row's own count at both ends.
 """
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 
@@ -34,6 +41,28 @@ from tt_sim.trace.events import EventCategory, InstrEvent
 #: one cycle and no reason string exists.
 ISSUE = "issue"
 
+#: Two-sided 95 % normal quantile, for :func:`wilson_interval`.
+Z_95 = 1.959964
+
+
+def wilson_interval(hits: int, trials: int, z: float = Z_95) -> tuple[float, float]:
+    """Wilson score interval for a proportion of ``hits`` in ``trials``.
+
+    Chosen over the textbook ``p +/- z*sqrt(p(1-p)/n)`` because the rows that
+    matter least are the ones that break that one: a PC sampled once or never
+    gets a zero-width or negative interval from it, and a Wilson interval
+    stays inside [0, 1] with a sensible width at every count.
+    """
+    if trials <= 0:
+        return 0.0, 0.0
+    p = hits / trials
+    z2 = z * z
+    centre = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+    half = (z / (1 + z2 / trials)) * math.sqrt(
+        p * (1 - p) / trials + z2 / (4 * trials * trials)
+    )
+    return max(0.0, centre - half), min(1.0, centre + half)
+
 
 @dataclass
 class Hotspot:
@@ -48,6 +77,8 @@ class Hotspot:
     function: str = ""
     file: str = ""
     line: int = 0
+    #: Samples that landed here, when the table was sampled; 0 when exact.
+    samples: int = 0
 
     @property
     def cycles(self) -> int:
@@ -72,10 +103,30 @@ class HotspotTable:
     rows: list[Hotspot] = field(default_factory=list)
     #: Units that published instructions but had no ELF loaded for them.
     unattributed_units: list[str] = field(default_factory=list)
+    #: Cycles between samples; 0 for a table counted from every retirement.
+    sample_interval: int = 0
+    #: Samples taken, over every core that was out of reset when sampled.
+    total_samples: int = 0
+    #: Last cycle sampled. A sampled run has no counter dataset to take its
+    #: span from, so the report takes it from here.
+    span: int = 0
 
     def total_cycles(self) -> int:
         return sum(r.cycles for r in self.rows)
 
+    def cycles_interval(self, row: Hotspot) -> tuple[int, int]:
+        """95 % confidence interval on ``row.cycles``.
+
+        A sample lands on a row with probability equal to the row's share of
+        all sampled core-cycles, so the interval is on that proportion, scaled
+        back by the total. Exact tables return ``(cycles, cycles)``.
+        """
+        if not self.sample_interval:
+            return row.cycles, row.cycles
+        low, high = wilson_interval(row.samples, self.total_samples)
+        scale = self.total_samples * self.sample_interval
+        return math.floor(low * scale), math.ceil(high * scale)
+
     def resolved_cycles(self) -> int:
         return sum(r.cycles for r in self.rows if r.resolved)
 
@@ -101,9 +152,11 @@ class HotspotTable:
                     function=row.function,
                     file=row.file,
                     line=row.line,
+                    samples=row.samples,
                 )
                 continue
             head.retired += row.retired
+            head.samples += row.samples
             head.stall_cycles += row.stall_cycles
             head.frontend_stalls += row.frontend_stalls
             for reason, value in row.by_reason.items():
@@ -137,29 +190,38 @@ class HotspotAggregator:
             reasons[(unit, pc)][reason] = value
 
         table = HotspotTable()
-        units_with_elf = set(index.units()) if index is not None else set()
-        seen_units: set[str] = set()
         for (unit, pc), retired in self._retired.items():
-            seen_units.add(unit)
             by_reason = reasons.get((unit, pc), {})
-            row = Hotspot(
-                unit=unit,
-                pc=pc,
-                retired=retired,
-                stall_cycles=sum(by_reason.values()),
-                by_reason=by_reason,
-                frontend_stalls=self._frontend.get((unit, pc), 0),
+            table.rows.append(
+                Hotspot(
+                    unit=unit,
+                    pc=pc,
+                    retired=retired,
+                    stall_cycles=sum(by_reason.values()),
+                    by_reason=by_reason,
+                    frontend_stalls=self._frontend.get((unit, pc), 0),
+                )
             )
-            if index is not None:
-                loc = index.nearest(pc, unit=unit)
-                if loc is not None:
-                    row.file = loc.file
-                    row.line = loc.line
-                    # Resolved against the executed PC rather than against the
-                    # line-table row below it, so an inlined callee is named
-                    # even when its entry shares a row with its caller. Once
-                    # per distinct PC, not per retirement.
-                    row.function = loc.function or index.function_at(pc, unit=unit)
-            table.rows.append(row)
-        table.unattributed_units = sorted(seen_units - units_with_elf)
-        return table
+        return attribute(table, index)
+
+
+def attribute(table: HotspotTable, index=None) -> HotspotTable:
+    """Name every row of ``table`` through ``index`` and record which units
+    had no ELF. In place; returns ``table``."""
+    units_with_elf = set(index.units()) if index is not None else set()
+    seen_units: set[str] = set()
+    for row in table.rows:
+        seen_units.add(row.unit)
+        if index is None:
+            continue
+        loc = index.nearest(row.pc, unit=row.unit)
+        if loc is not None:
+            row.file = loc.file
+            row.line = loc.line
+            # Resolved against the executed PC rather than against the
+            # line-table row below it, so an inlined callee is named even
+            # when its entry shares a row with its caller. Once per distinct
+            # PC, not per retirement.
+            row.function = loc.function or index.function_at(row.pc, unit=row.unit)
+    table.unattributed_units = sorted(seen_units - units_with_elf)
+    return table
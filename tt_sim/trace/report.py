@@ -56,7 +56,7 @@ from pathlib import Path
 #: Bump on **any** change to a documented field: additively for a new
 #: field, breaking for a rename, a removal, or a change of meaning or
 #: unit. Either way, say which in ``docs/trace-schema.md`` §9.
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 
 #: Counters that are cycle-bearing but not named ``*_cycles``.
 _EXTRA_CYCLE_COUNTERS = {"instr_retired"}
@@ -274,6 +274,9 @@ def build(
         report.span = span
         report.contributions, report.volumes = classify(totals)
     report.hotspots = hotspots or {}
+    if not report.span:
+        # A sampled profile collects no counters; the sampler saw the span.
+        report.span = report.hotspots.get("sampled_span", 0)
     report.elfs = elfs or []
     return report
 
@@ -432,6 +435,7 @@ def render(report: Report, top: int = 25) -> str:
     lines.append("## 2. Source-level hotspots")
     lines.append("")
     rows_in = report.hotspots.get("functions") or []
+    sampled = report.hotspots.get("sample_interval", 0)
     if not rows_in:
         lines.append("_No per-PC data — the hotspot aggregator was not enabled._")
     else:
@@ -441,33 +445,49 @@ def render(report: Report, top: int = 25) -> str:
             top_reason = (
                 max(reasons.items(), key=lambda kv: kv[1])[0] if reasons else "—"
             )
-            rows.append(
-                [
-                    h["unit"],
-                    h["location"],
-                    f"{h['cycles']:,}",
-                    _pct(h["cycles"], span),
-                    f"{h['stall_cycles']:,}",
-                    top_reason,
-                ]
-            )
-        lines += _table(
-            [
-                "unit",
-                "function (file:line)",
-                "cycles",
-                "of span",
-                "of which stalled",
-                "top reason",
-            ],
-            rows,
-        )
+            row = [
+                h["unit"],
+                h["location"],
+                f"{h['cycles']:,}",
+                _pct(h["cycles"], span),
+                f"{h['stall_cycles']:,}",
+                top_reason,
+            ]
+            if sampled:
+                row[3:3] = [f"{h['cycles_low']:,} – {h['cycles_high']:,}"]
+            rows.append(row)
+        header = [
+            "unit",
+            "function (file:line)",
+            "cycles",
+            "of span",
+            "of which stalled",
+            "top reason",
+        ]
+        if sampled:
+            header[3:3] = ["95 % interval"]
+        lines += _table(header, rows)
         lines.append("")
+        if sampled:
+            prose = (
+                f"**Sampled, not counted.** Every core's PC and stall state was "
+                f"read once every {sampled:,} cycles "
+                f"({report.hotspots.get('samples', 0):,} samples), and each "
+                "sample stands for that many cycles, so `cycles` is an estimate "
+                "and the interval beside it is where the true count lies with "
+                "95 % confidence. Rank on rows whose intervals do not overlap. "
+                "Issue cycles land one instruction after the one that issued "
+                "(the sample is taken once the cycle has ticked); stalls land "
+                "on the instruction that was held. "
+            )
+        else:
+            prose = (
+                "A row's `cycles` is one per instruction retired there plus every "
+                "cycle the core was held before issuing it. "
+            )
         lines.append(
-            "A row's `cycles` is one per instruction retired there plus every cycle "
-            "the core was held before issuing it. Rows are folded per function, so "
-            "an inlined callee is named rather than the `kernel_main` it vanished "
-            "into."
+            prose + "Rows are folded per function, so an inlined callee is named "
+            "rather than the `kernel_main` it vanished into."
         )
     lines.append("")
 
@@ -562,6 +582,11 @@ def render(report: Report, top: int = 25) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _estimate(table, row) -> dict:
+    low, high = table.cycles_interval(row)
+    return {"samples": row.samples, "cycles_low": low, "cycles_high": high}
+
+
 def hotspots_to_dict(table, top: int = 200) -> dict:
     """Serialise a :class:`~tt_sim.trace.hotspots.HotspotTable`."""
     return {
@@ -572,6 +597,10 @@ def hotspots_to_dict(table, top: int = 200) -> dict:
         "total_cycles": table.total_cycles(),
         "resolved_cycles": table.resolved_cycles(),
         "unattributed_units": table.unattributed_units,
+        # 0, 0 and 0 for an exact table; see tt_sim.trace.sampling.
+        "sample_interval": table.sample_interval,
+        "samples": table.total_samples,
+        "sampled_span": table.span,
         "functions": [
             {
                 "unit": h.unit,
@@ -584,6 +613,7 @@ def hotspots_to_dict(table, top: int = 200) -> dict:
                 "stall_cycles": h.stall_cycles,
                 "frontend_stalls": h.frontend_stalls,
                 "by_reason": h.by_reason,
+                **_estimate(table, h),
             }
             for h in table.by_function()[:top]
         ],
@@ -596,6 +626,7 @@ def hotspots_to_dict(table, top: int = 200) -> dict:
                 "retired": h.retired,
                 "stall_cycles": h.stall_cycles,
                 "by_reason": h.by_reason,
+                **_estimate(table, h),
             }
             for h in table.ranked(top)
         ],
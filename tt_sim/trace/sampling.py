@@ -0,0 +1,184 @@
+"""Sampled per-PC attribution — the hotspot table without the event stream.
+
+:class:`~tt_sim.trace.hotspots.HotspotAggregator` is exact, and exactness is
+what makes it expensive: it needs an :class:`~tt_sim.trace.events.InstrEvent`
+per retired instruction, so the bus is on, every retire records its register
+write and builds an event, and a full-size kernel runs several times slower
+than it does untraced. :class:`PCSampler` takes the other trade. It never
+touches the bus. It sits on the pump's ``on_tick`` hook
+(:class:`~tt_sim.device.clock.MultiTileClock`), and every ``interval``
+simulated cycles reads, for every baby core out of soft reset, the PC it is
+at and whether the RV cost model is holding it there
+(:meth:`~tt_sim.pe.rv.cost.RiscvCostState.stall_reason_at`). The interpreter
+runs exactly as it does with tracing off, fetch fast path and all.
+
+Each sample stands for ``interval`` cycles of that core, so a PC seen ``n``
+times is charged ``n * interval`` cycles: issue cycles when the core was free,
+stall cycles under the cost model's reason when it was held. The result is a
+:class:`~tt_sim.trace.hotspots.HotspotTable` of the same shape the exact
+aggregator produces, resolved through the same DWARF index by the same report,
+plus what makes an estimate usable — the sample counts and a 95 % interval on
+every row (:meth:`HotspotTable.cycles_interval`).
+
+Two things a reader comparing the two tables should expect:
+
+- **Skid of one instruction.** The hook runs after the cycle has been ticked,
+  so a core that issued on it is already at the next PC. Cycles spent issuing
+  land one instruction late; stalls do not, because a held core has not moved.
+  Per function, which is what the report ranks, the difference is noise.
+- **No front-end back-pressure column.** ``frontend_stalls`` comes off the
+  event's ``stalled`` flag and there is no event here; a core waiting on the
+  Tensix instruction buffer shows as issue cycles at the PC it is waiting on.
+
+``interval`` should not be a multiple of any loop's period in cycles, or every
+sample lands on the same instruction of it; the default is prime for that
+reason. The pump is told when the next sample is due (``on_tick_wake``), so
+striding over a dormant device never jumps a sample — and a sampled run does
+pay for ticking one cycle in every ``interval`` it might otherwise have
+skipped.
+
+Enabled by ``TT_SIM_PROFILE_SAMPLE=<cycles>`` alongside ``TT_SIM_PROFILE``;
+see :mod:`tt_sim.trace.auto`.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+
+from tt_sim.trace.hotspots import Hotspot, HotspotTable, attribute
+from tt_sim.util.bits import get_nth_bit
+from tt_sim.util.conversion import conv_to_uint32
+
+#: Cycles between samples when ``TT_SIM_PROFILE_SAMPLE`` is set without a
+#: number. Prime, so it cannot lock onto a loop whose period divides it.
+DEFAULT_SAMPLE_INTERVAL = 97
+
+
+def sample_interval_from_env(env=None):
+    """``TT_SIM_PROFILE_SAMPLE``: cycles between samples, or 0 for the exact
+    per-retirement table.
+
+    A number is the interval; ``on`` / ``true`` / ``yes`` mean
+    :data:`DEFAULT_SAMPLE_INTERVAL`.
+    """
+    if env is None:
+        env = os.environ
+    raw = env.get("TT_SIM_PROFILE_SAMPLE")
+    if raw is None:
+        return 0
+    raw = raw.strip().lower()
+    if raw in ("", "0", "false", "no", "off"):
+        return 0
+    if raw in ("true", "yes", "on"):
+        return DEFAULT_SAMPLE_INTERVAL
+    return int(raw)
+
+
+class PCSampler:
+    """Samples every Tensix tile's baby cores every ``interval`` cycles.
+
+    ``device`` is read for its ``tensix_tiles`` at each sample rather than
+    once, so a tile added after construction is sampled from then on.
+    """
+
+    def __init__(self, device, interval: int = DEFAULT_SAMPLE_INTERVAL):
+        # Here rather than at the top: the core imports the trace package.
+        from tt_sim.pe.rv.babyriscv import BabyRISCV
+
+        self._reset_bit = BabyRISCV.CORE_TYPE_TO_SOFT_RESET_BIT
+        self.interval = max(1, int(interval))
+        self._device = device
+        self._next = 0
+        self._issue: dict[tuple[str, int], int] = defaultdict(int)
+        self._stalls: dict[tuple[str, int, str], int] = defaultdict(int)
+        self.total_samples = 0
+        self.last_cycle = 0
+        self._prev_tick = None
+        self._prev_wake = None
+
+    def attach(self, clock):
+        """Install on ``clock``'s ``on_tick`` / ``on_tick_wake``.
+
+        The slots hold one consumer each and the deadlock watchdog is usually
+        already in them, so whatever is there is kept and called first, and
+        the pump is woken for whichever of the two is due sooner.
+        """
+        self._prev_tick = clock.on_tick
+        self._prev_wake = getattr(clock, "on_tick_wake", None)
+        clock.on_tick = self.tick
+        clock.on_tick_wake = self.next_sample_cycle
+
+    def tick(self, cycle):
+        if self._prev_tick is not None:
+            self._prev_tick(cycle)
+        # The second test catches a clock that rewound (device reset), which
+        # would otherwise leave the next sample a whole run away.
+        if cycle < self._next and self._next - cycle <= self.interval:
+            return
+        self.sample(cycle)
+        self._next = cycle + self.interval
+
+    def next_sample_cycle(self, cycle):
+        """Earliest cycle :meth:`tick` must run again; never ``<= cycle``."""
+        nxt = self._next if self._next > cycle else cycle + 1
+        if self._prev_wake is not None:
+            other = self._prev_wake(cycle)
+            if other is not None and other < nxt:
+                nxt = other
+        return nxt
+
+    def sample(self, cycle):
+        """Record one sample of every core out of soft reset."""
+        self.last_cycle = cycle
+        reset_bit = self._reset_bit
+        for tile in self._device.tensix_tiles:
+            reset_val = conv_to_uint32(tile.tile_ctrl.RISCV_DEBUG_REG_SOFT_RESET_0)
+            for core in (
+                tile.brisc,
+                tile.ncrisc,
+                tile.trisc0,
+                tile.trisc1,
+                tile.trisc2,
+            ):
+                if get_nth_bit(reset_val, reset_bit[core.core_type]) == 1:
+                    continue
+                pc = conv_to_uint32(core.pc_register.read())
+                cost = core.rv_cost
+                reason = cost.stall_reason_at(cycle) if cost is not None else ""
+                if reason:
+                    self._stalls[(core.core_label, pc, reason)] += 1
+                else:
+                    self._issue[(core.core_label, pc)] += 1
+                self.total_samples += 1
+
+    def resolve(self, index=None) -> HotspotTable:
+        """The samples as a :class:`HotspotTable`, attributed through
+        ``index`` like :meth:`HotspotAggregator.resolve`."""
+        n = self.interval
+        rows: dict[tuple[str, int], Hotspot] = {}
+        for (unit, pc), count in self._issue.items():
+            rows[(unit, pc)] = Hotspot(
+                unit=unit,
+                pc=pc,
+                retired=count * n,
+                stall_cycles=0,
+                by_reason={},
+                samples=count,
+            )
+        for (unit, pc, reason), count in self._stalls.items():
+            row = rows.get((unit, pc))
+            if row is None:
+                row = rows[(unit, pc)] = Hotspot(
+                    unit=unit, pc=pc, retired=0, stall_cycles=0, by_reason={}
+                )
+            row.by_reason[reason] = count * n
+            row.stall_cycles += count * n
+            row.samples += count
+        table = HotspotTable(
+            rows=list(rows.values()),
+            sample_interval=n,
+            total_samples=self.total_samples,
+            span=self.last_cycle,
+        )
+        return attribute(table, index)
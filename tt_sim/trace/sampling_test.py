@@ -0,0 +1,153 @@
+"""Sampled hotspot attribution (``tt_sim.trace.sampling``).
+
+Runs standalone (``python3 -m tt_sim.trace.sampling_test``) or under pytest.
+
+1. On a device, the sampled table agrees with the exact one: every PC the
+   exact aggregator charged is in the sampled table, under the same stall
+   reasons, and its exact cycle count is inside the sampled row's interval.
+2. Sampling leaves the bus off and the register-write recording hook
+   uninstalled, which is what keeps the interpreter on its untraced path.
+3. The sampler shares the pump hook with whatever was on it (the deadlock
+   watchdog) rather than replacing it.
+4. A sampled table serialises and renders with its intervals.
+"""
+
+import pytest
+
+from tt_sim.trace import report as reportmod
+from tt_sim.trace.bus import get_bus
+from tt_sim.trace.hotspots import HotspotAggregator, wilson_interval
+from tt_sim.trace.sampling import (
+    DEFAULT_SAMPLE_INTERVAL,
+    PCSampler,
+    sample_interval_from_env,
+)
+
+COORD = (1, 2)
+# addi x1,x1,1; lw x2,0x100(x0); add x3,x2,x2; j -12 -- a load-use stall on
+# every trip round the loop once the cost model is on.
+PROGRAM = [0x00108093, 0x10002103, 0x002101B3, 0xFF5FF06F]
+
+
+def _run(monkeypatch, attach, cycles=20000):
+    """Run ``PROGRAM`` on a Blackhole BRISC with ``attach(device)`` wired
+    before the core leaves reset; returns what ``attach`` returned, and the
+    device."""
+    from tt_sim.device.blackhole import Blackhole
+    from tt_sim.device.tt_device import DeviceTileDiagnostics
+    from tt_sim.pe.rv.babyriscv import BabyRISCVCoreType
+    from tt_sim.util.conversion import conv_to_bytes
+
+    monkeypatch.setenv("TT_SIM_COST_MODEL", "1")
+    bus = get_bus()
+    bus.reset()
+    device = Blackhole(DeviceTileDiagnostics())
+    if COORD not in device.tile_directory:
+        device.add_tensix_tile(COORD)
+    for i, word in enumerate(PROGRAM):
+        device.write(COORD, i * 4, conv_to_bytes(word))
+    device.reset_tile(COORD)
+    try:
+        sink = attach(device)
+        device.deassert_soft_reset(COORD, BabyRISCVCoreType.BRISC)
+        device.run(cycles)
+        return sink, device
+    finally:
+        device.shutdown()
+        bus.reset()
+
+
+def _exact(device):
+    get_bus().enabled = True
+    return HotspotAggregator()
+
+
+def _sampled(device):
+    sampler = PCSampler(device, interval=7)
+    sampler.attach(device.clocks[0])
+    return sampler
+
+
+def test_the_sampled_table_brackets_the_exact_one(monkeypatch):
+    exact = _run(monkeypatch, _exact)[0].resolve()
+    sampled = _run(monkeypatch, _sampled)[0].resolve()
+
+    rows = {(r.unit, r.pc): r for r in sampled.rows}
+    assert set(rows) == {(r.unit, r.pc) for r in exact.rows}
+    for row in exact.rows:
+        estimate = rows[(row.unit, row.pc)]
+        assert set(estimate.by_reason) == set(row.by_reason)
+        low, high = sampled.cycles_interval(estimate)
+        assert low <= row.cycles <= high, (hex(row.pc), row.cycles, low, high)
+    assert sampled.sample_interval == 7
+    assert sampled.total_samples == sum(r.samples for r in sampled.rows)
+    assert abs(sampled.total_cycles() - exact.total_cycles()) <= 7
+
+
+def test_sampling_keeps_the_bus_off(monkeypatch):
+    sampler, device = _run(monkeypatch, _sampled)
+    tile = device.tile_directory[COORD]
+    assert sampler.total_samples > 0
+    assert not get_bus().enabled
+    assert not tile.brisc.register_file.write_recording
+
+
+class _Clock:
+    on_tick = None
+    on_tick_wake = None
+
+
+def test_the_sampler_chains_whatever_held_the_pump_hook():
+    seen = []
+    clock = _Clock()
+    clock.on_tick = seen.append
+    clock.on_tick_wake = lambda cycle: cycle + 3
+    sampler = PCSampler(type("Device", (), {"tensix_tiles": []})(), interval=10)
+    sampler.attach(clock)
+
+    clock.on_tick(0)
+    clock.on_tick(1)
+    assert seen == [0, 1]
+    assert clock.on_tick_wake(1) == 4  # the watchdog's wake is sooner
+    assert clock.on_tick_wake(8) == 10  # the sampler's is
+    assert sampler.last_cycle == 0
+
+
+def test_a_sampled_table_reports_its_intervals(monkeypatch):
+    table = _run(monkeypatch, _sampled)[0].resolve()
+    payload = reportmod.hotspots_to_dict(table)
+    assert payload["sample_interval"] == 7
+    assert payload["samples"] == table.total_samples
+    top = payload["functions"][0]
+    assert top["cycles_low"] <= top["cycles"] <= top["cycles_high"]
+
+    text = reportmod.render(reportmod.build(None, hotspots=payload))
+    assert "95 % interval" in text
+    assert "Sampled, not counted" in text
+    # No counter dataset in a sampled run; the span comes from the sampler.
+    assert f"| cycle span observed | {table.span:,} |" in text
+
+
+def test_wilson_interval_stays_in_range():
+    assert wilson_interval(0, 0) == (0.0, 0.0)
+    low, high = wilson_interval(0, 50)
+    assert low == pytest.approx(0.0)
+    assert 0.0 < high < 0.1
+    low, high = wilson_interval(50, 50)
+    assert 0.9 < low < high
+    assert high == pytest.approx(1.0)
+    low, high = wilson_interval(25, 100)
+    assert low < 0.25 < high
+
+
+@pytest.mark.parametrize(
+    ("raw", "interval"),
+    [(None, 0), ("0", 0), ("off", 0), ("on", DEFAULT_SAMPLE_INTERVAL), ("211", 211)],
+)
+def test_the_sample_interval_knob(raw, interval):
+    env = {} if raw is None else {"TT_SIM_PROFILE_SAMPLE": raw}
+    assert sample_interval_from_env(env) == interval
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,227 @@
+"""Run a trace writer in a separate process.
+
+``TT_SIM_TRACE``, ``TT_SIM_TRACE_PERFETTO``, ``TT_SIM_TRACE_COMMITLOG`` and
+``TT_SIM_TRACE_MEMORY`` all format and ``write()`` inside their bus callback,
+on the simulation thread, and on a per-instruction trace that formatting costs
+as much as the simulation does. :class:`BackgroundSink` moves it off: the
+writer is constructed in a child interpreter, subscribed to a private bus
+there, and this process only appends each event's fields to a batch. A full
+batch is pickled and written down a pipe; the child rebuilds the events and
+publishes them to its writer, so the JSON encoding and the gzip of a
+``.json.gz`` run on another core while the simulation carries on.
+
+The writer sees exactly the events, in exactly the order, it would have seen
+in-process. Two things differ, both by construction:
+
+- **Output lags the run by up to one batch** until :meth:`BackgroundSink.close`,
+  which flushes, waits for the child to close its writer, and reaps it.
+- **The pipe is the back-pressure.** If the writer is slower than the
+  simulation for long enough to fill the pipe, the next batch write blocks
+  until the child catches up. Memory stays bounded; the run is then as fast as
+  the slower of the two, not the sum of them.
+
+The child is a fresh interpreter running :func:`_child_main` rather than a
+``multiprocessing`` worker, because both ``spawn`` and ``forkserver`` re-import
+the parent's ``__main__`` -- a driver script that builds a device at top level
+would build another one in the child -- and ``fork`` is not safe under the
+per-tile worker threads. So the writer type, its arguments and the events must
+all pickle, which every writer in this package does.
+
+Opt-in: ``TT_SIM_TRACE_BACKGROUND=1`` wraps the four writers above when
+:func:`tt_sim.trace.auto.enable_from_env` opens them.
+"""
+
+import fcntl
+import os
+import pickle
+import struct
+import subprocess
+import sys
+import threading
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+
+import tt_sim
+from tt_sim.trace.bus import EventBus, get_bus
+from tt_sim.trace.events import EventCategory
+
+#: Events per pipe write. Large enough that the pickle and the syscall are
+#: noise per event, small enough that a crash loses little.
+DEFAULT_BATCH_EVENTS = 4096
+
+#: Pipe capacity asked for, where the platform lets us (Linux). The default
+#: 64 KiB is less than one batch, which would make every batch write wait for
+#: the child; a few batches of slack lets the two sides actually overlap.
+PIPE_BYTES = 1 << 20
+
+_LENGTH = struct.Struct("<Q")
+
+
+def _truthy(raw, default):
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def background_writers_enabled_from_env(env=None):
+    """``TT_SIM_TRACE_BACKGROUND`` (default off)."""
+    if env is None:
+        env = os.environ
+    return _truthy(env.get("TT_SIM_TRACE_BACKGROUND"), False)
+
+
+def _write_message(stream, payload: bytes):
+    stream.write(_LENGTH.pack(len(payload)))
+    stream.write(payload)
+    stream.flush()
+
+
+def _read_message(stream) -> bytes | None:
+    """The next message, or ``None`` at end of stream."""
+    header = stream.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    return stream.read(length)
+
+
+class BackgroundSink:
+    """A writer of type ``writer_type``, constructed and run in a child process.
+
+    ``writer_type(*args, bus=<child bus>, **kwargs)`` is what runs in the
+    child, so it is any writer that takes the usual ``bus`` argument. This
+    object subscribes, on ``bus``, to exactly the categories the writer
+    subscribed to there.
+    """
+
+    def __init__(
+        self,
+        writer_type,
+        *args,
+        batch_events: int = DEFAULT_BATCH_EVENTS,
+        bus: EventBus | None = None,
+        **kwargs,
+    ):
+        self._name = writer_type.__name__
+        self._batch_events = max(1, batch_events)
+        self._batch: list[tuple] = []
+        self._getters: dict[type, attrgetter] = {}
+        self._lock = threading.Lock()
+        env = dict(os.environ)
+        root = str(Path(tt_sim.__file__).resolve().parents[1])
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (root, env.get("PYTHONPATH")) if p
+        )
+        self._child = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                f"from {__name__} import _child_main; _child_main()",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+        if set_pipe_size is not None:
+            try:
+                fcntl.fcntl(self._child.stdin.fileno(), set_pipe_size, PIPE_BYTES)
+            except OSError:
+                pass  # above /proc/sys/fs/pipe-max-size; keep the default
+        self._send(pickle.dumps((writer_type, args, kwargs)))
+        categories = self._reply("open")
+        self._bus = bus if bus is not None else get_bus()
+        for cat in categories:
+            self._bus.subscribe(EventCategory(cat), self._on_event)
+
+    def _on_event(self, event):
+        kind = type(event)
+        getter = self._getters.get(kind)
+        if getter is None:
+            getter = self._getters.setdefault(
+                kind, attrgetter(*(f.name for f in fields(kind)))
+            )
+        with self._lock:
+            batch = self._batch
+            batch.append((kind, getter(event)))
+            if len(batch) >= self._batch_events:
+                self._batch = []
+                self._send(pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))
+
+    def _send(self, payload: bytes):
+        try:
+            _write_message(self._child.stdin, payload)
+        except BrokenPipeError:
+            raise RuntimeError(
+                f"background {self._name} exited with status {self._child.wait()}"
+            ) from None
+
+    def _reply(self, step: str):
+        message = _read_message(self._child.stdout)
+        if message is None:
+            raise RuntimeError(
+                f"background {self._name} exited during {step} "
+                f"with status {self._child.wait()}"
+            )
+        status, value = pickle.loads(message)
+        if status == "error":
+            raise RuntimeError(f"background {self._name} failed during {step}: {value}")
+        return value
+
+    def close(self):
+        if self._child.stdin.closed:
+            return
+        with self._lock:
+            batch, self._batch = self._batch, []
+            if batch:
+                self._send(pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))
+            self._send(b"")
+            self._reply("close")
+            self._child.stdin.close()
+            self._child.wait()
+            self._child.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _serve(requests, replies):
+    """The child: open the writer, publish every batch to it, close it."""
+    bus = EventBus()
+    bus.enabled = True
+    try:
+        writer_type, args, kwargs = pickle.loads(_read_message(requests))
+        writer = writer_type(*args, bus=bus, **kwargs)
+    except Exception as exc:
+        _write_message(replies, pickle.dumps(("error", repr(exc))))
+        return 1
+    opened = [cat.value for cat in bus.subscribed_categories()]
+    _write_message(replies, pickle.dumps(("ok", opened)))
+    publish = bus.publish
+    while True:
+        message = _read_message(requests)
+        if not message:
+            break
+        for kind, values in pickle.loads(message):
+            publish(kind(*values))
+    try:
+        writer.close()
+    except Exception as exc:
+        _write_message(replies, pickle.dumps(("error", repr(exc))))
+        return 1
+    # ``None`` is a parent gone without closing; it has nobody to tell.
+    if message is not None:
+        _write_message(replies, pickle.dumps(("ok", None)))
+    return 0
+
+
+def _child_main():
+    # Replies get the real stdout; anything the writer prints goes to stderr
+    # rather than into the middle of a reply.
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    raise SystemExit(_serve(sys.stdin.buffer, replies))
@@ -0,0 +1,108 @@
+"""Writers run in a child process (``tt_sim.trace.writers.background``).
+
+Runs standalone (``python3 -m tt_sim.trace.writers.background_test``) or
+under pytest.
+
+1. A writer behind a ``BackgroundSink`` produces byte-for-byte the output it
+   produces in-process, across batch boundaries and for a compressed
+   ``.json.gz``.
+2. The sink forwards only the categories the child writer subscribed to.
+3. A writer that cannot be opened in the child fails in the parent, at
+   construction, rather than losing the run's trace silently.
+"""
+
+import gzip
+
+import pytest
+
+from tt_sim.trace.bus import EventBus
+from tt_sim.trace.events import (
+    EventCategory,
+    InstrEvent,
+    LifecycleEvent,
+    MemEvent,
+    StallEvent,
+)
+from tt_sim.trace.writers.background import (
+    BackgroundSink,
+    background_writers_enabled_from_env,
+)
+from tt_sim.trace.writers.commitlog import SpikeCommitlogWriter
+from tt_sim.trace.writers.jsonl import JSONLLogger
+from tt_sim.trace.writers.perfetto import PerfettoWriter
+
+BRISC = (0, 2, 1, "BRISC")
+
+EVENTS = [
+    LifecycleEvent(0, BRISC, "kernel_start"),
+    *(
+        InstrEvent(c, BRISC, 0x100 + 4 * c, 0x00108093, False, 1, c)
+        for c in range(1, 40)
+    ),
+    MemEvent(40, BRISC, "write", 0x2000, 4, "L1", 0x1A0),
+    StallEvent(41, (0, 2, 1, "TRISC1"), "semaphore_empty", thread_id=1, semaphore=2),
+    LifecycleEvent(42, BRISC, "kernel_done"),
+]
+
+
+def _bus():
+    bus = EventBus()
+    bus.enabled = True
+    return bus
+
+
+def _run(open_writer):
+    bus = _bus()
+    writer = open_writer(bus)
+    for event in EVENTS:
+        bus.publish(event)
+    writer.close()
+    return bus
+
+
+@pytest.mark.parametrize(
+    ("writer_type", "name"),
+    [
+        (JSONLLogger, "trace.jsonl"),
+        (PerfettoWriter, "trace.json.gz"),
+        (SpikeCommitlogWriter, "commitlog"),
+    ],
+)
+def test_a_background_writer_writes_what_it_writes_in_process(
+    tmp_path, writer_type, name
+):
+    inline, background = tmp_path / "inline" / name, tmp_path / "bg" / name
+    inline.parent.mkdir()
+    background.parent.mkdir()
+    _run(lambda bus: writer_type(inline, bus=bus))
+    _run(lambda bus: BackgroundSink(writer_type, background, batch_events=7, bus=bus))
+
+    if name == "commitlog":
+        inline, background = inline / "brisc.commitlog", background / "brisc.commitlog"
+    read = gzip.open if name.endswith(".gz") else open
+    with read(inline, "rb") as a, read(background, "rb") as b:
+        expected = a.read()
+        assert expected
+        assert b.read() == expected
+
+
+def test_the_sink_forwards_only_what_the_writer_subscribed_to(tmp_path):
+    bus = _run(lambda bus: BackgroundSink(SpikeCommitlogWriter, tmp_path, bus=bus))
+    assert bus.subscribed_categories() == [EventCategory.INSTR]
+
+
+def test_a_writer_that_cannot_open_fails_in_the_parent(tmp_path):
+    with pytest.raises(RuntimeError, match="JSONLLogger failed during open"):
+        BackgroundSink(JSONLLogger, tmp_path / "missing" / "trace.jsonl", bus=_bus())
+
+
+@pytest.mark.parametrize(
+    ("raw", "enabled"), [(None, False), ("0", False), ("1", True), ("on", True)]
+)
+def test_background_writers_are_opt_in(raw, enabled):
+    env = {} if raw is None else {"TT_SIM_TRACE_BACKGROUND": raw}
+    assert background_writers_enabled_from_env(env) is enabled
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
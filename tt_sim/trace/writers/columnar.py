@@ -0,0 +1,306 @@
+"""Columnar recorder for instruction and stall events.
+
+The other writers turn each event into a text line or a dict as it arrives,
+which is what makes a traced run of a real kernel impractical: every retired
+instruction builds a frozen :class:`InstrEvent`, takes the bus lock, and is
+``json.dumps``-ed. This one only *records*. It appends each event's raw fields
+into a preallocated NumPy structured array per category and, when a chunk
+fills, writes it out as one Parquet file and starts again at the top of the
+same buffer. Formatting is left for afterwards: :func:`replay` feeds the
+recorded events, in their original order, to any writer subscribed to a bus of
+your choosing, so a JSONL log or a Perfetto timeline can still be had from the
+same run, offline.
+
+Two categories are recorded, the two with one row per retire or per episode:
+
+    instr: seq, cycle, chip, core_y, core_x, unit, pc, instruction, stalled,
+           reg_write_idx, reg_write_value, stall_cycles, stall_reason
+    stall: seq, cycle, chip, core_y, core_x, unit, reason, blocked_on,
+           cycles, opcode, thread_id, semaphore
+
+The rest of the categories are rare enough per cycle that their own writers
+are not what makes tracing slow, and keep them. ``seq`` is one counter shared
+by both categories, so replay interleaves them exactly as they were published.
+``unit`` and the string fields are Arrow dictionary columns, so DuckDB and
+pandas read them as strings.
+
+The RISC-V retire hook builds no event at all while this recorder is the only
+``INSTR`` subscriber: the bus hands it :meth:`ColumnarRecorder.record_instr`
+(``EventBus.direct``) and the fields go straight into the buffer. Anything else
+subscribing to ``INSTR`` puts every publisher back on the ordinary path, and
+the recorder then takes the events from :meth:`EventBus.publish` like any
+writer.
+
+Output is ``<dir>/instr-00000.parquet``, ``<dir>/stall-00000.parquet``, ...
+written in order, one per chunk; :meth:`ColumnarRecorder.close` writes the
+partial last chunk.
+"""
+
+import heapq
+import threading
+from operator import itemgetter
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tt_sim.trace.bus import EventBus, get_bus
+from tt_sim.trace.events import EventCategory, InstrEvent, StallEvent
+
+#: Rows per chunk, and so per Parquet file. 64 K rows of ``instr`` is about
+#: 2.5 MB of buffer; a chunk is the unit both of memory held and of file size.
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+#: Every column is a raw field except ``unit``, an index into the recorder's
+#: table of ``unit_id`` tuples, and the string fields (:data:`_STRING_FIELDS`),
+#: which are indices into its table of strings. Both are expanded when a chunk
+#: is written.
+INSTR_DTYPE = np.dtype(
+    [
+        ("seq", np.int64),
+        ("cycle", np.int64),
+        ("unit", np.int32),
+        ("pc", np.uint32),
+        ("instruction", np.uint32),
+        ("stalled", np.bool_),
+        ("reg_write_idx", np.int8),
+        ("reg_write_value", np.uint32),
+        ("stall_cycles", np.int64),
+        ("stall_reason", np.int32),
+    ]
+)
+STALL_DTYPE = np.dtype(
+    [
+        ("seq", np.int64),
+        ("cycle", np.int64),
+        ("unit", np.int32),
+        ("reason", np.int32),
+        ("blocked_on", np.int32),
+        ("cycles", np.int64),
+        ("opcode", np.int32),
+        ("thread_id", np.int32),
+        ("semaphore", np.int32),
+    ]
+)
+
+_STRING_FIELDS = {
+    "instr": ("stall_reason",),
+    "stall": ("reason", "blocked_on", "opcode"),
+}
+
+#: Event class and field order for each recorded category, which is also the
+#: order :func:`replay` passes the columns back in.
+_EVENTS = {
+    "instr": (
+        InstrEvent,
+        (
+            "pc",
+            "instruction",
+            "stalled",
+            "reg_write_idx",
+            "reg_write_value",
+            "stall_cycles",
+            "stall_reason",
+        ),
+    ),
+    "stall": (
+        StallEvent,
+        ("reason", "blocked_on", "cycles", "opcode", "thread_id", "semaphore"),
+    ),
+}
+
+
+class ColumnarRecorder:
+    def __init__(
+        self,
+        directory: Path | str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        bus: EventBus | None = None,
+    ):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._chunk_rows = max(1, chunk_rows)
+        self._instr = np.zeros(self._chunk_rows, INSTR_DTYPE)
+        self._stall = np.zeros(self._chunk_rows, STALL_DTYPE)
+        self._instr_rows = 0
+        self._stall_rows = 0
+        self._chunks = {"instr": 0, "stall": 0}
+        self._seq = 0
+        # ``unit_id`` tuples and strings, interned to the ints the buffers
+        # hold. Append-only, so a code means the same thing in every chunk.
+        self._units: dict[tuple, int] = {}
+        self._strings: dict[str, int] = {"": 0}
+        # Per-tile worker threads (``MultiTileClock``) retire concurrently.
+        self._lock = threading.Lock()
+        self._bus = bus if bus is not None else get_bus()
+        self._bus.subscribe_direct(
+            EventCategory.INSTR, self._on_instr, self.record_instr
+        )
+        self._bus.subscribe(EventCategory.STALL, self._on_stall)
+
+    def record_instr(
+        self,
+        cycle,
+        unit_id,
+        pc,
+        instruction,
+        stalled=False,
+        reg_write_idx=-1,
+        reg_write_value=0,
+        stall_cycles=0,
+        stall_reason="",
+    ):
+        """Append one :class:`InstrEvent`, given as its fields in order."""
+        unit = self._units.get(unit_id)
+        if unit is None:
+            unit = self._intern_unit(unit_id)
+        reason = self._strings.get(stall_reason)
+        if reason is None:
+            reason = self._intern(stall_reason)
+        with self._lock:
+            row = self._instr_rows
+            self._instr[row] = (
+                self._seq,
+                cycle,
+                unit,
+                pc,
+                instruction,
+                stalled,
+                reg_write_idx,
+                reg_write_value,
+                stall_cycles,
+                reason,
+            )
+            self._seq += 1
+            self._instr_rows = row + 1
+            if row + 1 == self._chunk_rows:
+                self._flush("instr")
+
+    def _on_instr(self, event: InstrEvent):
+        self.record_instr(
+            event.cycle,
+            event.unit_id,
+            event.pc,
+            event.instruction,
+            event.stalled,
+            event.reg_write_idx,
+            event.reg_write_value,
+            event.stall_cycles,
+            event.stall_reason,
+        )
+
+    def _on_stall(self, event: StallEvent):
+        unit = self._units.get(event.unit_id)
+        if unit is None:
+            unit = self._intern_unit(event.unit_id)
+        codes = [
+            self._intern(s) for s in (event.reason, event.blocked_on, event.opcode)
+        ]
+        with self._lock:
+            row = self._stall_rows
+            self._stall[row] = (
+                self._seq,
+                event.cycle,
+                unit,
+                codes[0],
+                codes[1],
+                event.cycles,
+                codes[2],
+                event.thread_id,
+                event.semaphore,
+            )
+            self._seq += 1
+            self._stall_rows = row + 1
+            if row + 1 == self._chunk_rows:
+                self._flush("stall")
+
+    def _intern_unit(self, unit_id: tuple) -> int:
+        with self._lock:
+            return self._units.setdefault(unit_id, len(self._units))
+
+    def _intern(self, value: str) -> int:
+        with self._lock:
+            return self._strings.setdefault(value, len(self._strings))
+
+    def _flush(self, name: str):
+        """Write the filled part of ``name``'s buffer and rewind it. Locked."""
+        rows = self._instr_rows if name == "instr" else self._stall_rows
+        if not rows:
+            return
+        chunk = (self._instr if name == "instr" else self._stall)[:rows]
+        path = self._dir / f"{name}-{self._chunks[name]:05d}.parquet"
+        pq.write_table(self._table(name, chunk), path)
+        self._chunks[name] += 1
+        if name == "instr":
+            self._instr_rows = 0
+        else:
+            self._stall_rows = 0
+
+    def _table(self, name: str, chunk: np.ndarray) -> pa.Table:
+        units = list(self._units)
+        strings = pa.array(list(self._strings))
+        unit = chunk["unit"]
+        columns = {"seq": chunk["seq"], "cycle": chunk["cycle"]}
+        for position, column in enumerate(("chip", "core_y", "core_x")):
+            table = np.array([int(u[position]) for u in units], dtype=np.int32)
+            columns[column] = table[unit]
+        columns["unit"] = pa.DictionaryArray.from_arrays(
+            pa.array(unit), pa.array([str(u[3]) for u in units])
+        )
+        for field in chunk.dtype.names[3:]:
+            if field in _STRING_FIELDS[name]:
+                columns[field] = pa.DictionaryArray.from_arrays(
+                    pa.array(chunk[field]), strings
+                )
+            else:
+                columns[field] = chunk[field]
+        return pa.table(columns)
+
+    def close(self):
+        with self._lock:
+            self._flush("instr")
+            self._flush("stall")
+
+
+def read_columns(directory: Path | str, name: str) -> pa.Table:
+    """Every recorded chunk of ``name`` (``"instr"`` or ``"stall"``), as one table."""
+    paths = sorted(Path(directory).glob(f"{name}-*.parquet"))
+    if not paths:
+        return pa.table({})
+    return pa.concat_tables(pq.read_table(p) for p in paths)
+
+
+def _rows(directory: Path, name: str):
+    """``(seq, event)`` for every row of ``name``, one chunk in memory at a time."""
+    event_type, fields = _EVENTS[name]
+    for path in sorted(directory.glob(f"{name}-*.parquet")):
+        columns = pq.read_table(path).to_pydict()
+        unit_ids = zip(
+            columns["chip"], columns["core_y"], columns["core_x"], columns["unit"]
+        )
+        for seq, cycle, unit_id, *values in zip(
+            columns["seq"],
+            columns["cycle"],
+            unit_ids,
+            *(columns[f] for f in fields),
+        ):
+            yield seq, event_type(cycle, unit_id, *values)
+
+
+def replay(directory: Path | str, bus: EventBus) -> int:
+    """Publish a recording's events on ``bus``, in the order they were recorded.
+
+    Subscribe the writers to ``bus`` first and enable it; a fresh
+    :class:`EventBus` rather than the process-wide one keeps a live run's
+    writers out of it. Returns the number of events published.
+    """
+    directory = Path(directory)
+    merged = heapq.merge(
+        *(_rows(directory, name) for name in _EVENTS), key=itemgetter(0)
+    )
+    count = 0
+    for _, event in merged:
+        bus.publish(event)
+        count += 1
+    return count
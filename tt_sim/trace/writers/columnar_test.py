@@ -0,0 +1,116 @@
+"""The columnar recorder (``tt_sim.trace.writers.columnar``).
+
+Runs standalone (``python3 -m tt_sim.trace.writers.columnar_test``) or under
+pytest.
+
+1. What a writer makes of a replayed recording is what it would have made of
+   the live events: same events, same order, across chunk boundaries and
+   across the two categories.
+2. The bus only hands out the field-wise fast path while the recorder is the
+   sole ``INSTR`` subscriber, so a second writer never misses an event.
+3. End to end on a device, the retire hook's fast path records exactly the
+   events the ordinary publish path delivers.
+"""
+
+import pytest
+
+from tt_sim.pe.rv.spin_test import _spin_device_run
+from tt_sim.trace.bus import EventBus, get_bus
+from tt_sim.trace.events import EventCategory, InstrEvent, StallEvent
+from tt_sim.trace.writers.columnar import ColumnarRecorder, read_columns, replay
+from tt_sim.trace.writers.jsonl import JSONLLogger
+
+BRISC = (0, 2, 1, "BRISC")
+TRISC1 = (0, 2, 1, "TRISC1")
+
+EVENTS = [
+    InstrEvent(10, BRISC, 0x100, 0x00108093, reg_write_idx=1, reg_write_value=7),
+    InstrEvent(11, BRISC, 0x104, 0xFFDFF06F),
+    StallEvent(
+        9, TRISC1, "resource_wait", "MATH", cycles=4, opcode="ELWADD", thread_id=1
+    ),
+    InstrEvent(12, BRISC, 0x100, 0x00108093, True, stall_cycles=3, stall_reason="x"),
+    StallEvent(12, TRISC1, "semaphore_empty", thread_id=1, semaphore=2),
+    InstrEvent(13, (0, 3, 1, "NCRISC"), 0xFFFFFFFC, 0x13),
+]
+
+
+def _bus():
+    bus = EventBus()
+    bus.enabled = True
+    return bus
+
+
+def _jsonl(path, events=None, recording=None):
+    bus = _bus()
+    with JSONLLogger(path, bus=bus):
+        if recording is not None:
+            replay(recording, bus)
+        for event in events or ():
+            bus.publish(event)
+    return path.read_text()
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 1000])
+def test_a_replayed_recording_writes_what_the_live_events_would(tmp_path, chunk_rows):
+    bus = _bus()
+    recorder = ColumnarRecorder(tmp_path / "rec", chunk_rows=chunk_rows, bus=bus)
+    for event in EVENTS:
+        bus.publish(event)
+    recorder.close()
+
+    live = _jsonl(tmp_path / "live.jsonl", events=EVENTS)
+    replayed = _jsonl(tmp_path / "replayed.jsonl", recording=tmp_path / "rec")
+    assert replayed == live
+    instr = read_columns(tmp_path / "rec", "instr")
+    assert instr.num_rows == 4
+    assert instr.column("unit").to_pylist() == ["BRISC"] * 3 + ["NCRISC"]
+    assert instr.column("stall_reason").to_pylist() == ["", "", "x", ""]
+
+
+def test_the_fast_path_is_offered_only_to_a_sole_subscriber(tmp_path):
+    bus = _bus()
+    recorder = ColumnarRecorder(tmp_path, bus=bus)
+    assert bus.direct(EventCategory.INSTR) == recorder.record_instr
+    assert bus.direct(EventCategory.STALL) is None
+
+    seen = []
+    bus.subscribe(EventCategory.INSTR, seen.append)
+    assert bus.direct(EventCategory.INSTR) is None
+    bus.publish(EVENTS[0])
+    recorder.close()
+    assert seen == [EVENTS[0]]
+    assert read_columns(tmp_path, "instr").num_rows == 1
+
+    bus.reset()
+    assert bus.direct(EventCategory.INSTR) is None
+
+
+def _spin(record):
+    """A Blackhole BRISC counting in a loop, traced by ``record(bus)``."""
+    bus = get_bus()
+    bus.reset()
+    bus.enabled = True
+    sink = record(bus)
+    try:
+        _spin_device_run(firmware_idle=False, program=[0x00108093, 0xFFDFF06F])
+    finally:
+        bus.reset()
+    return sink
+
+
+def test_the_retire_hook_records_what_it_would_publish(tmp_path):
+    recorder = _spin(lambda bus: ColumnarRecorder(tmp_path, bus=bus))
+    recorder.close()
+    published = []
+    _spin(lambda bus: bus.subscribe(EventCategory.INSTR, published.append))
+
+    replayed = []
+    bus = _bus()
+    bus.subscribe(EventCategory.INSTR, replayed.append)
+    assert replay(tmp_path, bus) == len(published) > 0
+    assert replayed == published
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))